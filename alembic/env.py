@@ -1,4 +1,4 @@
-d openeimport asyncio
+import asyncio
 from logging.config import fileConfig
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
@@ -16,15 +16,8 @@ if config.config_file_name is not None:
 
 # add your model's MetaData object here
 # for 'autogenerate' support
-from app.models.base import Base
-from app.models.user import User
-from app.models.project import Project
-from app.models.requirement import Requirement
-from app.models.task import Task
-from app.models.agent import Agent, AgentAction
-from app.models.audit import AuditLog
-from app.models.integration import Integration
-from app.models.permission import Permission
+from app.config.database import Base
+import app.models  # noqa: F401 - registers every model on Base.metadata
 
 target_metadata = Base.metadata
 
@@ -66,8 +59,10 @@ async def run_async_migrations() -> None:
     """In this scenario we need to create an Engine
     and associate a connection with the context.
     """
+    section = config.get_section(config.config_ini_section, {})
+    section["sqlalchemy.url"] = get_url()
     connectable = async_engine_from_config(
-        config.get_section(config.config_ini_section, {}),
+        section,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
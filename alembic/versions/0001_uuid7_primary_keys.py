@@ -0,0 +1,155 @@
+"""Compact UUID primary and foreign keys
+
+Converts every id and foreign key column from 36-character text to a
+native ``uuid`` (PostgreSQL) or a 16-byte blob (SQLite), and drops the
+redundant ``ix_<table>_id`` indexes that duplicated the primary key.
+New ids are generated as time-ordered UUIDv7 by the application.
+
+Revision ID: 0001_uuid7_primary_keys
+Revises:
+Create Date: 2026-10-19 00:00:00
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_uuid7_primary_keys"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Frozen copy of the GUID columns at this revision
+UUID_COLUMNS = {
+    "users": ("id",),
+    "roles": ("id", "parent_role_id"),
+    "permissions": ("id",),
+    "user_roles": ("user_id", "role_id", "assigned_by"),
+    "role_permissions": ("role_id", "permission_id", "granted_by"),
+    "projects": ("id", "owner_id"),
+    "requirements": ("id", "project_id", "created_by"),
+    "tasks": ("id", "project_id", "requirement_id", "assigned_to", "created_by"),
+    "task_dependencies": ("id", "task_id", "depends_on_id"),
+    "task_comments": ("id", "task_id", "user_id"),
+    "ai_agents": ("id", "project_id"),
+    "agent_actions": ("id", "agent_id", "reviewed_by"),
+    "agent_decisions": ("id", "agent_id"),
+    "agent_workflows": ("id", "project_id"),
+    "agent_permissions": ("id", "agent_id"),
+    "audit_logs": ("id", "user_id", "agent_id"),
+    "system_logs": ("id",),
+    "security_events": ("id", "user_id", "investigated_by"),
+    "integrations": ("id", "project_id", "created_by"),
+    "integration_events": ("id", "integration_id"),
+    "deployments": ("id", "project_id", "deployed_by"),
+    "deployment_health_checks": ("id", "deployment_id"),
+    "project_permissions": ("id", "project_id", "user_id", "role_id", "granted_by"),
+    "system_settings": ("id", "last_modified_by"),
+}
+
+# Tables whose id column used to carry its own non-unique index (the
+# permission models declared their own id without one)
+INDEXED_ID_TABLES = tuple(
+    table for table in UUID_COLUMNS
+    if table not in (
+        "user_roles", "role_permissions", "roles", "permissions",
+        "project_permissions", "agent_permissions", "system_settings",
+    )
+)
+
+
+def _present_columns(inspector):
+    tables = set(inspector.get_table_names())
+    present = {}
+    for table, columns in UUID_COLUMNS.items():
+        if table not in tables:
+            continue
+        existing = {column["name"]: column["type"] for column in inspector.get_columns(table)}
+        present[table] = {name: existing[name] for name in columns if name in existing}
+    return present
+
+
+def _convert_sqlite(connection, present, to_blob: bool):
+    """Rewrite id values in place; SQLite stores blobs in text-affinity columns as-is"""
+    source_type = "text" if to_blob else "blob"
+    for table, columns in present.items():
+        for column in columns:
+            rows = connection.execute(
+                sa.text(f"SELECT rowid, {column} FROM {table} WHERE typeof({column}) = :source_type"),
+                {"source_type": source_type},
+            ).fetchall()
+            params = []
+            for rowid, value in rows:
+                try:
+                    converted = uuid.UUID(value).bytes if to_blob else str(uuid.UUID(bytes=bytes(value)))
+                except (ValueError, TypeError):
+                    continue  # Leave ids that were never UUIDs untouched
+                params.append({"rowid": rowid, "value": converted})
+            for start in range(0, len(params), BATCH_SIZE):
+                connection.execute(
+                    sa.text(f"UPDATE {table} SET {column} = :value WHERE rowid = :rowid"),
+                    params[start:start + BATCH_SIZE],
+                )
+
+
+def _convert_postgresql(inspector, present, target: str):
+    """Swap column types with FKs dropped, since PK and FK types must match"""
+    foreign_keys = []
+    for table in present:
+        for fk in inspector.get_foreign_keys(table):
+            if fk.get("name"):
+                foreign_keys.append((table, fk))
+                op.drop_constraint(fk["name"], table, type_="foreignkey")
+
+    for table, columns in present.items():
+        for column, current_type in columns.items():
+            is_uuid = isinstance(current_type, sa.Uuid) or str(current_type).upper() == "UUID"
+            if (target == "uuid") == is_uuid:
+                continue
+            cast = "uuid" if target == "uuid" else "text"
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {target} USING {column}::{cast}")
+
+    for table, fk in foreign_keys:
+        op.create_foreign_key(
+            fk["name"], table, fk["referred_table"],
+            fk["constrained_columns"], fk["referred_columns"],
+        )
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    present = _present_columns(inspector)
+
+    for table in INDEXED_ID_TABLES:
+        if table not in present:
+            continue
+        for index in inspector.get_indexes(table):
+            if index["column_names"] == ["id"] and not index.get("unique"):
+                op.drop_index(index["name"], table_name=table)
+
+    if connection.dialect.name == "postgresql":
+        _convert_postgresql(inspector, present, "uuid")
+    else:
+        _convert_sqlite(connection, present, to_blob=True)
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    present = _present_columns(inspector)
+
+    if connection.dialect.name == "postgresql":
+        _convert_postgresql(inspector, present, "varchar(36)")
+    else:
+        _convert_sqlite(connection, present, to_blob=False)
+
+    for table in INDEXED_ID_TABLES:
+        if table in present:
+            op.create_index(f"ix_{table}_id", table, ["id"])
@@ -0,0 +1,158 @@
+"""Partial indexes on live rows and archive tables
+
+Replaces the plain project_id indexes on requirements and tasks with
+indexes restricted to ``is_deleted = false`` and adds ``*_archive``
+mirrors of projects, requirements, tasks, task_dependencies and
+task_comments for the soft-delete archiver.
+
+Revision ID: 0002_live_indexes_and_archive
+Revises: 0001_uuid7_primary_keys
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.models.types import GUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_live_indexes_and_archive"
+down_revision: Union[str, None] = "0001_uuid7_primary_keys"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_INDEXES = (
+    ("ix_projects_owner_id_live", "projects", ["owner_id", "updated_at"]),
+    ("ix_requirements_project_id_live", "requirements", ["project_id", "updated_at"]),
+    ("ix_tasks_project_id_live", "tasks", ["project_id"]),
+    ("ix_tasks_requirement_id_live", "tasks", ["requirement_id"]),
+    ("ix_tasks_assigned_to_live", "tasks", ["assigned_to"]),
+)
+
+REPLACED_INDEXES = (
+    ("ix_requirements_project_id", "requirements", ["project_id"]),
+    ("ix_tasks_project_id", "tasks", ["project_id"]),
+)
+
+
+def _enum(name, *values):
+    # The enum types already exist for the hot tables on PostgreSQL
+    return sa.Enum(*values, name=name).with_variant(
+        postgresql.ENUM(*values, name=name, create_type=False), "postgresql"
+    )
+
+
+def _base_columns():
+    return [
+        sa.Column("id", GUID, primary_key=True),
+        sa.Column("created_at", sa.DateTime, nullable=False),
+        sa.Column("updated_at", sa.DateTime, nullable=False),
+        sa.Column("is_deleted", sa.Boolean, nullable=False),
+        sa.Column("archived_at", sa.DateTime, nullable=False),
+    ]
+
+
+# Frozen copy of the archive tables at this revision
+ARCHIVE_TABLES = {
+    "projects_archive": lambda: [
+        sa.Column("name", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text),
+        sa.Column("status", _enum("projectstatus", "PLANNING", "ACTIVE", "ON_HOLD", "COMPLETED", "CANCELLED"), nullable=False),
+        sa.Column("priority", _enum("projectpriority", "LOW", "MEDIUM", "HIGH", "CRITICAL"), nullable=False),
+        sa.Column("start_date", sa.DateTime),
+        sa.Column("end_date", sa.DateTime),
+        sa.Column("budget", sa.Float),
+        sa.Column("owner_id", GUID, nullable=False),
+    ],
+    "requirements_archive": lambda: [
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text, nullable=False),
+        sa.Column("type", _enum("requirementtype", "FUNCTIONAL", "NON_FUNCTIONAL", "BUSINESS", "TECHNICAL", "USER_STORY"), nullable=False),
+        sa.Column("priority", _enum("requirementpriority", "LOW", "MEDIUM", "HIGH", "CRITICAL"), nullable=False),
+        sa.Column("status", _enum("requirementstatus", "DRAFT", "REVIEW", "APPROVED", "REJECTED", "IMPLEMENTED"), nullable=False),
+        sa.Column("acceptance_criteria", sa.JSON),
+        sa.Column("tags", sa.JSON),
+        sa.Column("ai_analysis", sa.JSON),
+        sa.Column("project_id", GUID, nullable=False),
+        sa.Column("created_by", GUID, nullable=False),
+    ],
+    "tasks_archive": lambda: [
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text),
+        sa.Column("status", sa.String(20)),
+        sa.Column("priority", sa.String(20)),
+        sa.Column("task_type", sa.String(20)),
+        sa.Column("project_id", GUID, nullable=False),
+        sa.Column("requirement_id", GUID),
+        sa.Column("assigned_to", GUID),
+        sa.Column("created_by", GUID, nullable=False),
+        sa.Column("estimated_hours", sa.Float),
+        sa.Column("actual_hours", sa.Float),
+        sa.Column("complexity_score", sa.Float),
+        sa.Column("ai_confidence", sa.Float),
+        sa.Column("due_date", sa.DateTime),
+        sa.Column("started_at", sa.DateTime),
+        sa.Column("completed_at", sa.DateTime),
+        sa.Column("ai_generated", sa.Boolean),
+        sa.Column("ai_suggestions", sa.JSON),
+        sa.Column("acceptance_criteria", sa.JSON),
+    ],
+    "task_dependencies_archive": lambda: [
+        sa.Column("task_id", GUID, nullable=False),
+        sa.Column("depends_on_id", GUID, nullable=False),
+        sa.Column("dependency_type", sa.String(20)),
+    ],
+    "task_comments_archive": lambda: [
+        sa.Column("task_id", GUID, nullable=False),
+        sa.Column("user_id", GUID, nullable=False),
+        sa.Column("content", sa.Text, nullable=False),
+        sa.Column("comment_type", sa.String(20)),
+    ],
+}
+
+
+def _index_names(inspector, table):
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    for name, table, columns in REPLACED_INDEXES:
+        if table in tables and name in _index_names(inspector, table):
+            op.drop_index(name, table_name=table)
+
+    for name, table, columns in LIVE_INDEXES:
+        if table in tables and name not in _index_names(inspector, table):
+            # Same predicate text each dialect renders for ``is_deleted == False``
+            op.create_index(
+                name, table, columns,
+                postgresql_where=sa.text("is_deleted = false"),
+                sqlite_where=sa.text("is_deleted = 0"),
+            )
+
+    for table, columns in ARCHIVE_TABLES.items():
+        if table not in tables:
+            op.create_table(table, *columns(), *_base_columns())
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    for table in ARCHIVE_TABLES:
+        if table in tables:
+            op.drop_table(table)
+
+    for name, table, columns in LIVE_INDEXES:
+        if table in tables and name in _index_names(inspector, table):
+            op.drop_index(name, table_name=table)
+
+    for name, table, columns in REPLACED_INDEXES:
+        if table in tables and name not in _index_names(inspector, table):
+            op.create_index(name, table, columns)
@@ -0,0 +1,152 @@
+"""Monthly partitions for audit_logs
+
+PostgreSQL: rebuilds audit_logs as ``PARTITION BY RANGE (created_at)``
+with primary key (created_at, id), creates a partition for every month
+that holds rows (plus the next few months) and copies the rows across.
+
+SQLite: moves rows into per-month ``audit_logs_YYYY_MM`` shard tables;
+the audit_logs table itself stays behind empty.
+
+Revision ID: 0003_partition_audit_logs
+Revises: 0002_live_indexes_and_archive
+Create Date: 2026-10-19 00:00:00
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_partition_audit_logs"
+down_revision: Union[str, None] = "0002_live_indexes_and_archive"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+UNPARTITIONED = "audit_logs_unpartitioned"
+FOREIGN_KEYS = (("user_id", "users"), ("agent_id", "ai_agents"))
+INDEX = ("ix_audit_logs_user_id_created_at", ["user_id", "created_at"])
+
+
+def _month_start(moment):
+    return datetime(moment.year, moment.month, 1)
+
+
+def _add_months(moment, months):
+    index = moment.year * 12 + moment.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _months_with_rows(connection, table):
+    """Months holding rows, plus the current month and MONTHS_AHEAD more"""
+    if connection.dialect.name == "postgresql":
+        month_expression = "date_trunc('month', created_at)"
+    else:
+        month_expression = "strftime('%Y-%m-01', created_at)"
+    rows = connection.execute(sa.text(f"SELECT DISTINCT {month_expression} FROM {table}")).scalars()
+    months = {_month_start(_as_datetime(value)) for value in rows if value}
+    now = _month_start(datetime.utcnow())
+    months.update(_add_months(now, offset) for offset in range(MONTHS_AHEAD + 1))
+    return sorted(months)
+
+
+def _as_datetime(value):
+    return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+
+
+def _shard_name(month):
+    return f"audit_logs_{month.year:04d}_{month.month:02d}"
+
+
+def _sqlite_shards(connection):
+    names = connection.execute(sa.text(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB 'audit_logs_[0-9][0-9][0-9][0-9]_[0-9][0-9]'"
+    )).scalars()
+    return sorted(names)
+
+
+def _upgrade_postgresql(connection):
+    op.execute(f"ALTER TABLE audit_logs RENAME TO {UNPARTITIONED}")
+    op.execute(f"ALTER TABLE {UNPARTITIONED} RENAME CONSTRAINT audit_logs_pkey TO {UNPARTITIONED}_pkey")
+    op.execute(
+        f"CREATE TABLE audit_logs (LIKE {UNPARTITIONED} INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute("ALTER TABLE audit_logs ADD PRIMARY KEY (created_at, id)")
+    for column, referred in FOREIGN_KEYS:
+        op.create_foreign_key(f"audit_logs_{column}_fkey", "audit_logs", referred, [column], ["id"])
+    op.create_index(INDEX[0], "audit_logs", INDEX[1])
+
+    for month in _months_with_rows(connection, UNPARTITIONED):
+        op.execute(
+            f"CREATE TABLE {_shard_name(month)} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{_add_months(month, 1):%Y-%m-%d}')"
+        )
+    op.execute(f"INSERT INTO audit_logs SELECT * FROM {UNPARTITIONED}")
+    op.drop_table(UNPARTITIONED)
+
+
+def _downgrade_postgresql():
+    op.execute(f"CREATE TABLE {UNPARTITIONED} (LIKE audit_logs INCLUDING DEFAULTS)")
+    op.execute(f"INSERT INTO {UNPARTITIONED} SELECT * FROM audit_logs")
+    op.drop_table("audit_logs")  # Drops every partition with it
+    op.execute(f"ALTER TABLE {UNPARTITIONED} RENAME TO audit_logs")
+    op.execute("ALTER TABLE audit_logs ADD PRIMARY KEY (id)")
+    for column, referred in FOREIGN_KEYS:
+        op.create_foreign_key(f"audit_logs_{column}_fkey", "audit_logs", referred, [column], ["id"])
+
+
+def _upgrade_sqlite(connection):
+    source = sa.Table("audit_logs", sa.MetaData(), autoload_with=connection)
+    metadata = sa.MetaData()
+    for month in _months_with_rows(connection, "audit_logs"):
+        name = _shard_name(month)
+        shard = sa.Table(
+            name, metadata,
+            *(sa.Column(column.name, column.type, nullable=column.nullable) for column in source.columns),
+            sa.PrimaryKeyConstraint("created_at", "id"),
+        )
+        sa.Index(f"ix_{name}_user_id_created_at", shard.c.user_id, shard.c.created_at)
+        shard.create(connection, checkfirst=True)
+        window = {"start": month, "end": _add_months(month, 1)}
+        columns = ", ".join(column.name for column in source.columns)
+        connection.execute(sa.text(
+            f"INSERT INTO {name} ({columns}) SELECT {columns} FROM audit_logs "
+            "WHERE created_at >= :start AND created_at < :end"
+        ), window)
+        connection.execute(sa.text(
+            "DELETE FROM audit_logs WHERE created_at >= :start AND created_at < :end"
+        ), window)
+    op.create_index(INDEX[0], "audit_logs", INDEX[1])
+
+
+def _downgrade_sqlite(connection):
+    op.drop_index(INDEX[0], table_name="audit_logs")
+    source = sa.Table("audit_logs", sa.MetaData(), autoload_with=connection)
+    columns = ", ".join(column.name for column in source.columns)
+    for name in _sqlite_shards(connection):
+        connection.execute(sa.text(f"INSERT INTO audit_logs ({columns}) SELECT {columns} FROM {name}"))
+        op.drop_table(name)
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    if "audit_logs" not in sa.inspect(connection).get_table_names():
+        return
+    if connection.dialect.name == "postgresql":
+        _upgrade_postgresql(connection)
+    else:
+        _upgrade_sqlite(connection)
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    if "audit_logs" not in sa.inspect(connection).get_table_names():
+        return
+    if connection.dialect.name == "postgresql":
+        _downgrade_postgresql()
+    else:
+        _downgrade_sqlite(connection)
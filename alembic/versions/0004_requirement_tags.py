@@ -0,0 +1,102 @@
+"""Normalized tag index for requirements
+
+Adds ``tags`` and the ``requirement_tags`` association (plus its archive
+mirror) and backfills both from the ``requirements.tags`` JSON column,
+hot and archived rows alike.
+
+Revision ID: 0004_requirement_tags
+Revises: 0003_partition_audit_logs
+Create Date: 2026-10-19 00:00:00
+
+"""
+import json
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID
+from app.repositories.tags import normalize_tag
+from app.utils.helpers import uuid7
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_requirement_tags"
+down_revision: Union[str, None] = "0003_partition_audit_logs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (requirements table, association table) pairs to backfill
+BACKFILL = (
+    ("requirements", "requirement_tags"),
+    ("requirements_archive", "requirement_tags_archive"),
+)
+
+
+def _tag_names(value):
+    if isinstance(value, str):
+        value = json.loads(value)
+    if not isinstance(value, list):
+        return set()
+    # Same index form as runtime writes, cut to fit tags.name
+    return {normalize_tag(tag) for tag in value if normalize_tag(tag)}
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    tables = set(sa.inspect(connection).get_table_names())
+
+    now = datetime.utcnow()
+    tags = op.create_table(
+        "tags",
+        sa.Column("id", GUID, primary_key=True),
+        sa.Column("created_at", sa.DateTime, nullable=False),
+        sa.Column("updated_at", sa.DateTime, nullable=False),
+        sa.Column("is_deleted", sa.Boolean, nullable=False),
+        sa.Column("name", sa.String(100), nullable=False, unique=True),
+    )
+    links = {
+        "requirement_tags": op.create_table(
+            "requirement_tags",
+            sa.Column("requirement_id", GUID, sa.ForeignKey("requirements.id"), primary_key=True),
+            sa.Column("tag_id", GUID, sa.ForeignKey("tags.id"), primary_key=True),
+        ),
+        "requirement_tags_archive": op.create_table(
+            "requirement_tags_archive",
+            sa.Column("requirement_id", GUID, primary_key=True),
+            sa.Column("tag_id", GUID, primary_key=True),
+            sa.Column("archived_at", sa.DateTime, nullable=False),
+        ),
+    }
+    op.create_index("ix_requirement_tags_tag_id", "requirement_tags", ["tag_id", "requirement_id"])
+
+    tag_ids, link_rows = {}, {}
+    for source_name, link_name in BACKFILL:
+        if source_name not in tables:
+            continue
+        source = sa.Table(source_name, sa.MetaData(), sa.Column("id", GUID), sa.Column("tags", sa.JSON))
+        rows = link_rows.setdefault(link_name, [])
+        for requirement_id, value in connection.execute(sa.select(source.c.id, source.c.tags)):
+            for name in _tag_names(value):
+                tag_id = tag_ids.setdefault(name, str(uuid7()))
+                row = {"requirement_id": requirement_id, "tag_id": tag_id}
+                if link_name.endswith("_archive"):
+                    row["archived_at"] = now
+                rows.append(row)
+
+    if tag_ids:
+        op.bulk_insert(tags, [
+            {"id": tag_id, "name": name, "created_at": now, "updated_at": now, "is_deleted": False}
+            for name, tag_id in tag_ids.items()
+        ])
+    for link_name, rows in link_rows.items():
+        if rows:
+            op.bulk_insert(links[link_name], rows)
+
+
+def downgrade() -> None:
+    op.drop_table("requirement_tags_archive")
+    op.drop_index("ix_requirement_tags_tag_id", table_name="requirement_tags")
+    op.drop_table("requirement_tags")
+    op.drop_table("tags")
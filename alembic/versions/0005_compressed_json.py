@@ -0,0 +1,104 @@
+"""Compress large JSON columns at rest
+
+Converts ``requirements.ai_analysis`` (and its archive mirror) and
+``integration_events.raw_payload`` to CompressedJSON: ``bytea`` on
+PostgreSQL, blobs in the existing column on SQLite. Rows are rewritten
+in primary-key order, BATCH_SIZE per UPDATE round, and rows already in
+the encoded format are skipped, so an interrupted upgrade can be rerun.
+
+Revision ID: 0005_compressed_json
+Revises: 0004_requirement_tags
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.compression import decode_json, dumps, encode_json, is_encoded
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_compressed_json"
+down_revision: Union[str, None] = "0004_requirement_tags"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+# (table, column, dictionary) frozen at this revision
+COMPRESSED_COLUMNS = (
+    ("requirements", "ai_analysis", "gemini_analysis"),
+    ("requirements_archive", "ai_analysis", "gemini_analysis"),
+    ("integration_events", "raw_payload", "github_webhook"),
+)
+
+
+def _present(connection):
+    inspector = sa.inspect(connection)
+    tables = set(inspector.get_table_names())
+    for table, column, dictionary in COMPRESSED_COLUMNS:
+        if table in tables and column in {c["name"] for c in inspector.get_columns(table)}:
+            yield table, column, dictionary
+
+
+def _rewrite(connection, table: str, column: str, convert):
+    """Apply ``convert`` to every non-null value, in keyset-paginated batches"""
+    last_id = None
+    while True:
+        after = "" if last_id is None else "AND id > :last_id"
+        rows = connection.execute(
+            sa.text(
+                f"SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL {after} "
+                f"ORDER BY id LIMIT {BATCH_SIZE}"
+            ),
+            {} if last_id is None else {"last_id": last_id},
+        ).fetchall()
+        if not rows:
+            return
+        params = []
+        for row_id, value in rows:
+            converted = convert(value)
+            if converted is not value:
+                params.append({"id": row_id, "value": converted})
+        if params:
+            connection.execute(sa.text(f"UPDATE {table} SET {column} = :value WHERE id = :id"), params)
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    for table, column, dictionary in list(_present(connection)):
+        if connection.dialect.name == "postgresql":
+            # JSON text becomes plain JSON bytes, which decode as-is
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE bytea "
+                f"USING convert_to({column}::text, 'UTF8')"
+            )
+
+        def compress(value, dictionary=dictionary):
+            if is_encoded(value):
+                return value
+            decoded = decode_json(value)
+            return None if decoded is None else encode_json(decoded, dictionary)
+
+        _rewrite(connection, table, column, compress)
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    postgresql = connection.dialect.name == "postgresql"
+    for table, column, _ in list(_present(connection)):
+        def decompress(value):
+            if isinstance(value, str):
+                return value
+            decoded = dumps(decode_json(value))
+            return decoded if postgresql else decoded.decode()
+
+        _rewrite(connection, table, column, decompress)
+        if postgresql:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json "
+                f"USING convert_from({column}, 'UTF8')::json"
+            )
@@ -0,0 +1,49 @@
+"""Requirement analysis cache
+
+Adds ``analysis_cache``: Gemini requirement analyses keyed by a hash of
+the normalized text, model, temperature and prompt version, with an
+expiry and a last-used time for LRU eviction. Starts empty.
+
+Revision ID: 0006_analysis_cache
+Revises: 0005_compressed_json
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID, CompressedJSON
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_analysis_cache"
+down_revision: Union[str, None] = "0005_compressed_json"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_cache",
+        sa.Column("id", GUID, primary_key=True),
+        sa.Column("created_at", sa.DateTime, nullable=False),
+        sa.Column("updated_at", sa.DateTime, nullable=False),
+        sa.Column("is_deleted", sa.Boolean, nullable=False),
+        sa.Column("cache_key", sa.String(64), nullable=False, unique=True),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("prompt_version", sa.String(20), nullable=False),
+        sa.Column("analysis", CompressedJSON("gemini_analysis"), nullable=False),
+        sa.Column("hit_count", sa.Integer, nullable=False),
+        sa.Column("last_used_at", sa.DateTime, nullable=False),
+        sa.Column("expires_at", sa.DateTime, nullable=False),
+    )
+    op.create_index("ix_analysis_cache_last_used_at", "analysis_cache", ["last_used_at"])
+    op.create_index("ix_analysis_cache_expires_at", "analysis_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_analysis_cache_expires_at", table_name="analysis_cache")
+    op.drop_index("ix_analysis_cache_last_used_at", table_name="analysis_cache")
+    op.drop_table("analysis_cache")
@@ -0,0 +1,45 @@
+"""Background jobs in agent_actions
+
+Adds ``agent_actions.requested_by``: the user who submitted an AI job
+(requirement analysis, task generation), who alone may poll it.
+Existing actions keep NULL. Databases without the table yet get it,
+column included, from ``create_tables``.
+
+Revision ID: 0007_agent_action_jobs
+Revises: 0006_analysis_cache
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_agent_action_jobs"
+down_revision: Union[str, None] = "0006_analysis_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_agent_actions() -> bool:
+    return "agent_actions" in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    if not _has_agent_actions():
+        return
+    with op.batch_alter_table("agent_actions") as batch:
+        batch.add_column(sa.Column("requested_by", GUID, nullable=True))
+        batch.create_foreign_key("fk_agent_actions_requested_by", "users", ["requested_by"], ["id"])
+
+
+def downgrade() -> None:
+    if not _has_agent_actions():
+        return
+    with op.batch_alter_table("agent_actions") as batch:
+        batch.drop_constraint("fk_agent_actions_requested_by", type_="foreignkey")
+        batch.drop_column("requested_by")
@@ -8,9 +8,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config.database import get_db
 from app.schemas.admin import (
     SystemSettings, SystemHealth, SystemStatus,
-    BackupResponse, RestoreRequest
+    BackupResponse, RestoreRequest, AnalysisCacheStats
 )
 from app.services.admin_service import admin_service
+from app.services.analysis_cache_service import analysis_cache_service
 from app.core.auth import get_current_active_user
 from app.models.user import User
 
@@ -107,3 +108,13 @@ async def get_system_logs(
         db, current_user.id, skip, limit, level, start_date, end_date
     )
     return {"logs": logs}
+
+@router.get("/analysis-cache", response_model=AnalysisCacheStats)
+async def get_analysis_cache_stats(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get requirement analysis cache hit ratio and size"""
+    stats = analysis_cache_service.stats()
+    stats["entries"] = await analysis_cache_service.count(db)
+    return stats
@@ -1,6 +1,7 @@
 """
 Audit & Logging Endpoints
 """
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,21 +23,21 @@ async def get_audit_logs(
     limit: int = Query(100, ge=1, le=1000),
     entity_type: Optional[str] = Query(None),
     action: Optional[str] = Query(None),
-    user_id: Optional[int] = Query(None),
-    start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None),
+    start_date: Optional[datetime] = Query(None, description="Lower time bound; limits the partitions scanned"),
+    end_date: Optional[datetime] = Query(None, description="Upper time bound; limits the partitions scanned"),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get audit logs with filters"""
+    """Get the current user's audit logs with filters"""
     logs = await audit_service.get_audit_logs(
-        db, current_user.id, skip, limit, entity_type, action, user_id, start_date, end_date
+        db, current_user.id, skip, limit,
+        action=action, resource_type=entity_type, start_date=start_date, end_date=end_date
     )
     return logs
 
 @router.get("/logs/{log_id}", response_model=AuditLogResponse)
 async def get_audit_log(
-    log_id: int,
+    log_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -47,7 +48,7 @@ async def get_audit_log(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Audit log not found"
         )
-    return AuditLogResponse.from_orm(log)
+    return log
 
 @router.get("/user-activity", response_model=List[UserActivityResponse])
 async def get_user_activity(
@@ -0,0 +1,38 @@
+"""
+Background Job Endpoints
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config.database import get_db, get_session_factory
+from app.schemas.job import JobResponse
+from app.services.job_service import job_service
+from app.core.auth import get_current_active_user
+from app.utils.sse import sse_response
+from app.models.user import User
+
+router = APIRouter()
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get a background job: its status, timing and, once finished, result or error"""
+    return await job_service.get_job(db, job_id, current_user.id)
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_session_factory)
+):
+    """Follow a background job as Server-Sent Events
+
+    Emits a ``job`` event with the job on every status change; the stream
+    ends once the job has completed or failed.
+    """
+    await job_service.get_job(db, job_id, current_user.id)
+    return sse_response(job_service.job_events(session_factory, job_id, current_user.id))
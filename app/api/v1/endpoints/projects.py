@@ -39,7 +39,7 @@ async def get_projects(
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
-    project_id: int,
+    project_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -54,7 +54,7 @@ async def get_project(
 
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(
-    project_id: int,
+    project_id: str,
     project_data: ProjectUpdate,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -70,7 +70,7 @@ async def update_project(
 
 @router.delete("/{project_id}")
 async def delete_project(
-    project_id: int,
+    project_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -83,9 +83,24 @@ async def delete_project(
         )
     return {"message": "Project deleted successfully"}
 
+@router.post("/{project_id}/restore")
+async def restore_project(
+    project_id: str,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Restore a deleted project, including one already archived"""
+    success = await project_service.restore_project(db, project_id, current_user.id)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Deleted project not found"
+        )
+    return {"message": "Project restored successfully"}
+
 @router.get("/{project_id}/stats", response_model=ProjectStats)
 async def get_project_stats(
-    project_id: int,
+    project_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -100,7 +115,7 @@ async def get_project_stats(
 
 @router.get("/{project_id}/team", response_model=ProjectTeamResponse)
 async def get_project_team(
-    project_id: int,
+    project_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -115,7 +130,7 @@ async def get_project_team(
 
 @router.post("/{project_id}/team")
 async def add_team_member(
-    project_id: int,
+    project_id: str,
     member_data: ProjectTeamMember,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -131,8 +146,8 @@ async def add_team_member(
 
 @router.delete("/{project_id}/team/{user_id}")
 async def remove_team_member(
-    project_id: int,
-    user_id: int,
+    project_id: str,
+    user_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -147,23 +162,23 @@ async def remove_team_member(
 
 @router.put("/{project_id}/status")
 async def update_project_status(
-    project_id: int,
+    project_id: str,
     status_data: ProjectStatusUpdate,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Update project status"""
-    project = await project_service.update_project_status(db, project_id, status_data.status, current_user.id)
-    if not project:
+    success = await project_service.update_project_status(db, project_id, status_data.status, current_user.id)
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
-    return {"message": "Project status updated successfully", "status": project.status}
+    return {"message": "Project status updated successfully", "status": status_data.status}
 
 @router.get("/{project_id}/timeline", response_model=ProjectTimelineResponse)
 async def get_project_timeline(
-    project_id: int,
+    project_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
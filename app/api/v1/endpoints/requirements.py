@@ -2,21 +2,40 @@
 Requirements Management Endpoints
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.config.database import get_db
+from app.config.database import get_db, get_session_factory
 from app.schemas.requirement import (
     RequirementCreate, RequirementUpdate, RequirementResponse,
-    RequirementAnalysis, RequirementStatusUpdate, RequirementHistory,
-    RequirementApproval
+    RequirementListResponse, RequirementAnalysis, RequirementStatusUpdate,
+    RequirementHistory, RequirementApproval, RequirementBatchAnalysisResponse, TagFacetResponse
 )
+from app.schemas.job import JobResponse, JobType
+from app.services.job_service import job_service
 from app.services.requirement_service import requirement_service
 from app.core.auth import get_current_active_user
+from app.utils.sse import sse_response
 from app.models.user import User
 
 router = APIRouter()
 
+INCLUDE_QUERY_DESCRIPTION = "Comma-separated large fields to include: description, ai_analysis"
+TAGS_QUERY_DESCRIPTION = "Only requirements with these tags (repeat the parameter or comma-separate)"
+TAG_MATCH_QUERY_DESCRIPTION = "Match requirements having any or all of the tags"
+
+
+def parse_include(include: Optional[str]) -> List[str]:
+    """Split a comma-separated include parameter"""
+    if not include:
+        return []
+    return [field.strip() for field in include.split(",") if field.strip()]
+
+
+def parse_tags(tags: Optional[List[str]]) -> List[str]:
+    """Flatten repeated and comma-separated tag parameters"""
+    return [tag for value in tags or () for tag in parse_include(value)]
+
 @router.post("/", response_model=RequirementResponse, status_code=status.HTTP_201_CREATED)
 async def create_requirement(
     requirement_data: RequirementCreate,
@@ -27,20 +46,34 @@ async def create_requirement(
     requirement = await requirement_service.create_requirement(db, requirement_data, current_user.id)
     return RequirementResponse.from_orm(requirement)
 
-@router.get("/", response_model=List[RequirementResponse])
+@router.get("/", response_model=RequirementListResponse)
 async def get_requirements(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    include: Optional[str] = Query(None, description=INCLUDE_QUERY_DESCRIPTION),
+    tag: Optional[List[str]] = Query(None, description=TAGS_QUERY_DESCRIPTION),
+    tag_match: str = Query("any", pattern="^(any|all)$", description=TAG_MATCH_QUERY_DESCRIPTION),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get all requirements"""
-    requirements = await requirement_service.get_requirements(db, current_user.id, skip, limit)
-    return requirements
+    return await requirement_service.get_user_requirements(
+        db, current_user.id, skip, limit, include=parse_include(include),
+        tags=parse_tags(tag), tag_match=tag_match
+    )
+
+@router.get("/tags/facets", response_model=TagFacetResponse)
+async def get_requirement_tag_facets(
+    project_id: Optional[str] = Query(None, description="Limit counts to one project"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get requirement counts per tag"""
+    return await requirement_service.get_tag_facets(db, current_user.id, project_id)
 
 @router.get("/{requirement_id}", response_model=RequirementResponse)
 async def get_requirement(
-    requirement_id: int,
+    requirement_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -55,7 +88,7 @@ async def get_requirement(
 
 @router.put("/{requirement_id}", response_model=RequirementResponse)
 async def update_requirement(
-    requirement_id: int,
+    requirement_id: str,
     requirement_data: RequirementUpdate,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -71,7 +104,7 @@ async def update_requirement(
 
 @router.delete("/{requirement_id}")
 async def delete_requirement(
-    requirement_id: int,
+    requirement_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -84,26 +117,34 @@ async def delete_requirement(
         )
     return {"message": "Requirement deleted successfully"}
 
-@router.get("/project/{project_id}", response_model=List[RequirementResponse])
+@router.get("/project/{project_id}", response_model=RequirementListResponse)
 async def get_project_requirements(
-    project_id: int,
+    project_id: str,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    include: Optional[str] = Query(None, description=INCLUDE_QUERY_DESCRIPTION),
+    tag: Optional[List[str]] = Query(None, description=TAGS_QUERY_DESCRIPTION),
+    tag_match: str = Query("any", pattern="^(any|all)$", description=TAG_MATCH_QUERY_DESCRIPTION),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get requirements for a specific project"""
-    requirements = await requirement_service.get_project_requirements(db, project_id, current_user.id, skip, limit)
-    return requirements
+    return await requirement_service.get_project_requirements(
+        db, project_id, current_user.id, skip, limit, include=parse_include(include),
+        tags=parse_tags(tag), tag_match=tag_match
+    )
 
 @router.post("/{requirement_id}/analyze", response_model=RequirementAnalysis)
 async def analyze_requirement(
-    requirement_id: int,
+    requirement_id: str,
+    force_refresh: bool = Query(False, description="Re-run the model instead of using a cached analysis"),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Analyze requirement using AI"""
-    analysis = await requirement_service.analyze_requirement(db, requirement_id, current_user.id)
+    analysis = await requirement_service.analyze_requirement(
+        db, requirement_id, current_user.id, force_refresh=force_refresh
+    )
     if not analysis:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -111,52 +152,110 @@ async def analyze_requirement(
         )
     return analysis
 
-@router.post("/analyze", response_model=RequirementAnalysis)
+@router.post("/{requirement_id}/analyze/job", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_analysis_job(
+    requirement_id: str,
+    request: Request,
+    response: Response,
+    force_refresh: bool = Query(False, description="Re-run the model instead of using a cached analysis"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Analyze requirement using AI as a background job
+
+    Returns at once; poll the job (its URL is in ``Location``) or
+    subscribe to its events for the analysis.
+    """
+    job = await job_service.submit_requirement_job(
+        db, JobType.REQUIREMENT_ANALYSIS, requirement_id, current_user.id, {"force_refresh": force_refresh}
+    )
+    response.headers["Location"] = str(request.url_for("get_job", job_id=job.id))
+    return job
+
+@router.post("/analyze", response_model=RequirementBatchAnalysisResponse)
 async def analyze_requirements_batch(
-    requirement_ids: List[int],
+    requirement_ids: List[str],
+    force_refresh: bool = Query(False, description="Re-run the model instead of using cached analyses"),
+    packed: bool = Query(False, description="Send several requirements per model prompt"),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Analyze multiple requirements using AI"""
-    analysis = await requirement_service.analyze_requirements_batch(db, requirement_ids, current_user.id)
-    return analysis
+    """Analyze multiple requirements using AI; each item reports its own success or error"""
+    return await requirement_service.analyze_requirements_batch(
+        db, requirement_ids, current_user.id, force_refresh=force_refresh, packed=packed
+    )
 
 @router.post("/{requirement_id}/generate-tasks")
 async def generate_tasks_from_requirement(
-    requirement_id: int,
+    requirement_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Generate tasks from requirement using AI"""
-    tasks = await requirement_service.generate_tasks_from_requirement(db, requirement_id, current_user.id)
-    if not tasks:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Requirement not found or task generation failed"
-        )
-    return {"message": "Tasks generated successfully", "tasks": tasks}
+    generated = await requirement_service.generate_tasks(db, requirement_id, current_user.id)
+    return {
+        "message": "Tasks generated successfully",
+        "tasks": generated.tasks,
+        "dependencies": generated.dependencies
+    }
+
+@router.post("/{requirement_id}/generate-tasks/job", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_task_generation_job(
+    requirement_id: str,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Generate tasks from requirement using AI as a background job
+
+    Returns at once; poll the job (its URL is in ``Location``) or
+    subscribe to its events for the generated tasks.
+    """
+    job = await job_service.submit_requirement_job(
+        db, JobType.TASK_GENERATION, requirement_id, current_user.id
+    )
+    response.headers["Location"] = str(request.url_for("get_job", job_id=job.id))
+    return job
+
+@router.post("/{requirement_id}/generate-tasks/stream")
+async def stream_tasks_from_requirement(
+    requirement_id: str,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_session_factory)
+):
+    """Generate tasks from requirement using AI, as Server-Sent Events
+
+    Emits a ``task`` event per task as soon as it is saved, then
+    ``dependencies`` and ``done``; failures end the stream with ``error``.
+    """
+    requirement = await requirement_service.get_generation_source(db, requirement_id, current_user.id)
+    return sse_response(requirement_service.stream_generated_tasks(
+        session_factory, requirement_id, requirement, current_user.id
+    ))
 
 @router.put("/{requirement_id}/status")
 async def update_requirement_status(
-    requirement_id: int,
+    requirement_id: str,
     status_data: RequirementStatusUpdate,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Update requirement status"""
-    requirement = await requirement_service.update_requirement_status(
+    success = await requirement_service.update_requirement_status(
         db, requirement_id, status_data.status, current_user.id
     )
-    if not requirement:
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Requirement not found"
         )
-    return {"message": "Requirement status updated successfully", "status": requirement.status}
+    return {"message": "Requirement status updated successfully", "status": status_data.status}
 
 @router.get("/{requirement_id}/history", response_model=List[RequirementHistory])
 async def get_requirement_history(
-    requirement_id: int,
+    requirement_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -171,7 +270,7 @@ async def get_requirement_history(
 
 @router.post("/{requirement_id}/approve")
 async def approve_requirement(
-    requirement_id: int,
+    requirement_id: str,
     approval_data: RequirementApproval,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -189,7 +288,7 @@ async def approve_requirement(
 
 @router.post("/{requirement_id}/reject")
 async def reject_requirement(
-    requirement_id: int,
+    requirement_id: str,
     approval_data: RequirementApproval,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -9,7 +9,8 @@ from app.config.database import get_db
 from app.schemas.task import (
     TaskCreate, TaskUpdate, TaskResponse, TaskStatusUpdate,
     TaskComment, TaskCommentResponse, TaskAssignment,
-    TaskTimeLog, TaskTimeLogResponse, TaskAttachment
+    TaskTimeLog, TaskTimeLogResponse, TaskAttachment,
+    TaskBulkCreate, TaskBulkUpdate, TaskBulkCreateResponse, TaskBulkUpdateResponse
 )
 from app.services.task_service import task_service
 from app.core.auth import get_current_active_user
@@ -31,9 +32,9 @@ async def create_task(
 async def get_tasks(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    project_id: Optional[int] = Query(None),
+    project_id: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
-    assigned_to: Optional[int] = Query(None),
+    assigned_to: Optional[str] = Query(None),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -43,9 +44,27 @@ async def get_tasks(
     )
     return tasks
 
+@router.post("/bulk", response_model=TaskBulkCreateResponse, status_code=status.HTTP_201_CREATED)
+async def bulk_create_tasks(
+    bulk_data: TaskBulkCreate,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create many tasks in one transaction; invalid items are reported, not fatal"""
+    return await task_service.bulk_create_tasks(db, bulk_data.tasks, current_user.id)
+
+@router.patch("/bulk", response_model=TaskBulkUpdateResponse)
+async def bulk_update_tasks(
+    bulk_data: TaskBulkUpdate,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Apply the same changes to many tasks in one statement"""
+    return await task_service.bulk_update_tasks(db, bulk_data.task_ids, bulk_data.changes, current_user.id)
+
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
-    task_id: int,
+    task_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -60,7 +79,7 @@ async def get_task(
 
 @router.put("/{task_id}", response_model=TaskResponse)
 async def update_task(
-    task_id: int,
+    task_id: str,
     task_data: TaskUpdate,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -76,7 +95,7 @@ async def update_task(
 
 @router.delete("/{task_id}")
 async def delete_task(
-    task_id: int,
+    task_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -91,7 +110,7 @@ async def delete_task(
 
 @router.put("/{task_id}/status")
 async def update_task_status(
-    task_id: int,
+    task_id: str,
     status_data: TaskStatusUpdate,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -107,7 +126,7 @@ async def update_task_status(
 
 @router.post("/{task_id}/start")
 async def start_task(
-    task_id: int,
+    task_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -122,7 +141,7 @@ async def start_task(
 
 @router.post("/{task_id}/complete")
 async def complete_task(
-    task_id: int,
+    task_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -137,7 +156,7 @@ async def complete_task(
 
 @router.post("/{task_id}/pause")
 async def pause_task(
-    task_id: int,
+    task_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -152,7 +171,7 @@ async def pause_task(
 
 @router.post("/{task_id}/resume")
 async def resume_task(
-    task_id: int,
+    task_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -169,7 +188,7 @@ async def resume_task(
 
 @router.get("/{task_id}/comments", response_model=List[TaskCommentResponse])
 async def get_task_comments(
-    task_id: int,
+    task_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -184,7 +203,7 @@ async def get_task_comments(
 
 @router.post("/{task_id}/comments", response_model=TaskCommentResponse)
 async def create_task_comment(
-    task_id: int,
+    task_id: str,
     comment_data: TaskComment,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -200,7 +219,7 @@ async def create_task_comment(
 
 @router.put("/{task_id}/comments/{comment_id}", response_model=TaskCommentResponse)
 async def update_task_comment(
-    task_id: int,
+    task_id: str,
     comment_id: int,
     comment_data: TaskComment,
     current_user: User = Depends(get_current_active_user),
@@ -217,7 +236,7 @@ async def update_task_comment(
 
 @router.delete("/{task_id}/comments/{comment_id}")
 async def delete_task_comment(
-    task_id: int,
+    task_id: str,
     comment_id: int,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -235,7 +254,7 @@ async def delete_task_comment(
 
 @router.post("/{task_id}/assign")
 async def assign_task(
-    task_id: int,
+    task_id: str,
     assignment_data: TaskAssignment,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -251,7 +270,7 @@ async def assign_task(
 
 @router.post("/{task_id}/unassign")
 async def unassign_task(
-    task_id: int,
+    task_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -268,7 +287,7 @@ async def unassign_task(
 
 @router.get("/{task_id}/time-logs", response_model=List[TaskTimeLogResponse])
 async def get_task_time_logs(
-    task_id: int,
+    task_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -283,7 +302,7 @@ async def get_task_time_logs(
 
 @router.post("/{task_id}/time-logs", response_model=TaskTimeLogResponse)
 async def create_time_log(
-    task_id: int,
+    task_id: str,
     time_log_data: TaskTimeLog,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -299,7 +318,7 @@ async def create_time_log(
 
 @router.put("/{task_id}/time-logs/{log_id}", response_model=TaskTimeLogResponse)
 async def update_time_log(
-    task_id: int,
+    task_id: str,
     log_id: int,
     time_log_data: TaskTimeLog,
     current_user: User = Depends(get_current_active_user),
@@ -318,7 +337,7 @@ async def update_time_log(
 
 @router.get("/{task_id}/attachments", response_model=List[TaskAttachment])
 async def get_task_attachments(
-    task_id: int,
+    task_id: str,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -333,7 +352,7 @@ async def get_task_attachments(
 
 @router.post("/{task_id}/attachments")
 async def upload_task_attachment(
-    task_id: int,
+    task_id: str,
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -349,7 +368,7 @@ async def upload_task_attachment(
 
 @router.delete("/{task_id}/attachments/{attachment_id}")
 async def delete_task_attachment(
-    task_id: int,
+    task_id: str,
     attachment_id: int,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
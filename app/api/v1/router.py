@@ -6,7 +6,7 @@ from fastapi import APIRouter
 # Import endpoint routers
 from app.api.v1.endpoints import (
     auth, projects, requirements, tasks, agents, integrations, dashboard,
-    search, audit, admin, files, permissions, reports
+    search, audit, admin, files, permissions, reports, jobs
 )
 
 api_router = APIRouter()
@@ -26,6 +26,7 @@ api_router.include_router(admin.router, prefix="/admin", tags=["Administration"]
 api_router.include_router(files.router, prefix="/files", tags=["File Management"])
 api_router.include_router(permissions.router, prefix="/permissions", tags=["Permissions & Roles"])
 api_router.include_router(reports.router, prefix="/reports", tags=["Reports"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["Background Jobs"])
 
 @api_router.get("/")
 async def api_root():
@@ -47,7 +48,8 @@ async def api_root():
             "admin": "/admin - System Administration",
             "files": "/files - File Management",
             "permissions": "/permissions - Permissions & Roles",
-            "reports": "/reports - Reports Generation"
+            "reports": "/reports - Reports Generation",
+            "jobs": "/jobs - Background AI Jobs"
         },
         "documentation": {
             "swagger": "/docs",
@@ -0,0 +1,38 @@
+"""
+Analysis Cache Eviction
+
+Periodically drops expired requirement analyses and trims the cache to
+ANALYSIS_CACHE_MAX_ENTRIES, least recently used first.
+"""
+from sqlalchemy.ext.asyncio import async_sessionmaker
+import structlog
+
+from app.background.periodic import PeriodicTask
+from app.config.database import async_session_factory
+from app.config.settings import get_settings
+from app.services.analysis_cache_service import analysis_cache_service
+
+settings = get_settings()
+logger = structlog.get_logger(__name__)
+
+
+class AnalysisCacheEvictor(PeriodicTask):
+    """Evicts expired and least recently used analysis cache entries"""
+
+    name = "analysis cache evictor"
+
+    def __init__(self, session_factory: async_sessionmaker = async_session_factory):
+        super().__init__(settings.ANALYSIS_CACHE_EVICTION_INTERVAL_SECONDS)
+        self.session_factory = session_factory
+
+    async def run_once(self) -> int:
+        async with self.session_factory() as db:
+            evicted = await analysis_cache_service.evict(db)
+            await db.commit()
+        if evicted:
+            logger.info("Analysis cache entries evicted", evicted=evicted)
+        return evicted
+
+
+# Global evictor instance
+analysis_cache_evictor = AnalysisCacheEvictor()
@@ -0,0 +1,215 @@
+"""
+Soft-delete Archiver
+
+Moves projects, requirements and tasks that have been soft-deleted for
+longer than ARCHIVE_AFTER_DAYS out of the hot tables into their
+``*_archive`` mirrors, ARCHIVE_BATCH_SIZE roots per transaction. A root
+is moved together with the rows that only exist through it (a project
+takes its requirements, tag links, tasks, dependencies and comments
+along), and is skipped while anything outside that unit still
+references it.
+
+Soft deletes are UPDATEs, so ``updated_at`` is the deletion time.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+from sqlalchemy import Table, and_, delete, exists, insert, literal, not_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+import structlog
+
+from app.config.database import Base, async_session_factory
+from app.config.settings import get_settings
+from app.models.archive import ARCHIVE_TABLES
+from app.background.periodic import PeriodicTask
+
+settings = get_settings()
+logger = structlog.get_logger(__name__)
+
+# (tables, match) -> condition selecting the unit's rows of one table.
+# ``match(column)`` compares a column against the unit's root id(s).
+Condition = Callable[[Mapping[str, Table], Callable], object]
+
+
+# Unit subqueries correlate every table but their own, so inside the
+# reference guards they refer to the outer query's root row
+
+def _project_task_ids(tables, match):
+    tasks = tables["tasks"]
+    return select(tasks.c.id).where(match(tasks.c.project_id)).correlate_except(tasks)
+
+
+def _project_requirement_ids(tables, match):
+    requirements = tables["requirements"]
+    return select(requirements.c.id).where(match(requirements.c.project_id)).correlate_except(requirements)
+
+
+@dataclass(frozen=True)
+class ArchiveUnit:
+    """A root table plus the dependent rows archived along with it"""
+    root: str
+    # Dependent tables in delete order (referencing rows first)
+    members: Tuple[Tuple[str, Condition], ...] = ()
+
+    def conditions(self, tables, match) -> Dict[str, object]:
+        conditions = {name: build(tables, match) for name, build in self.members}
+        conditions[self.root] = match(tables[self.root].c.id)
+        return conditions
+
+
+ARCHIVE_UNITS = {
+    "tasks": ArchiveUnit("tasks", (
+        ("task_dependencies", lambda t, match: or_(
+            match(t["task_dependencies"].c.task_id),
+            match(t["task_dependencies"].c.depends_on_id)
+        )),
+        ("task_comments", lambda t, match: match(t["task_comments"].c.task_id)),
+    )),
+    "requirements": ArchiveUnit("requirements", (
+        ("requirement_tags", lambda t, match: match(t["requirement_tags"].c.requirement_id)),
+    )),
+    "projects": ArchiveUnit("projects", (
+        ("task_dependencies", lambda t, match: or_(
+            t["task_dependencies"].c.task_id.in_(_project_task_ids(t, match)),
+            t["task_dependencies"].c.depends_on_id.in_(_project_task_ids(t, match))
+        )),
+        ("task_comments", lambda t, match: t["task_comments"].c.task_id.in_(_project_task_ids(t, match))),
+        ("tasks", lambda t, match: match(t["tasks"].c.project_id)),
+        ("requirement_tags", lambda t, match: t["requirement_tags"].c.requirement_id.in_(
+            _project_requirement_ids(t, match)
+        )),
+        ("requirements", lambda t, match: match(t["requirements"].c.project_id)),
+    )),
+}
+
+# Children before parents, so a deleted task's requirement can go in the same pass
+ARCHIVE_ORDER = ("tasks", "requirements", "projects")
+
+
+def _hot_tables() -> Dict[str, Table]:
+    return {name: Base.metadata.tables[name] for name in ARCHIVE_TABLES}
+
+
+def _outside_references(unit: ArchiveUnit, tables: Mapping[str, Table]):
+    """NOT EXISTS predicates: no row outside the unit references a row in it"""
+    root = tables[unit.root]
+    conditions = unit.conditions(tables, lambda column: column == root.c.id)
+    guards = []
+    for name, condition in conditions.items():
+        target = tables[name]
+        for referrer in Base.metadata.sorted_tables:
+            for fk in referrer.foreign_keys:
+                if fk.column.table is not target:
+                    continue
+                if name == unit.root:
+                    references = fk.parent == root.c.id
+                else:
+                    references = fk.parent.in_(select(target.c.id).where(condition).correlate_except(target))
+                if referrer.name in conditions:
+                    references = and_(references, not_(conditions[referrer.name]))
+                guards.append(~exists().select_from(referrer).where(references))
+    return guards
+
+
+class Archiver(PeriodicTask):
+    """Moves expired soft-deleted rows to archive tables and back"""
+
+    name = "archiver"
+
+    def __init__(self, session_factory: async_sessionmaker = async_session_factory):
+        super().__init__(settings.ARCHIVE_INTERVAL_SECONDS)
+        self.session_factory = session_factory
+
+    async def archive_expired(
+        self,
+        older_than_days: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Archive every eligible root; returns the number of roots moved per table"""
+        older_than_days = settings.ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+        batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+        tables = _hot_tables()
+
+        moved = {}
+        for kind in ARCHIVE_ORDER:
+            unit = ARCHIVE_UNITS[kind]
+            root = tables[unit.root]
+            eligible = (
+                select(root.c.id)
+                .where(root.c.is_deleted == True)
+                .where(root.c.updated_at < cutoff)
+                .where(*_outside_references(unit, tables))
+                .order_by(root.c.updated_at)
+                .limit(batch_size)
+            )
+            moved[kind] = 0
+            while True:
+                async with self.session_factory() as db:
+                    root_ids = list(await db.scalars(eligible))
+                    if not root_ids:
+                        break
+                    await self._move(db, unit, tables, ARCHIVE_TABLES, root_ids)
+                    await db.commit()
+                moved[kind] += len(root_ids)
+                if len(root_ids) < batch_size:
+                    break
+
+        if any(moved.values()):
+            logger.info("Archived soft-deleted rows", **moved)
+        return moved
+
+    async def restore(
+        self,
+        db: AsyncSession,
+        kind: str,
+        root_id: str,
+        undelete: bool = True
+    ) -> bool:
+        """Move an archived root and its unit back into the hot tables
+
+        The caller owns the transaction. With ``undelete`` the root comes
+        back live; otherwise it returns soft-deleted.
+        """
+        unit = ARCHIVE_UNITS[kind]
+        archived = await db.scalar(
+            select(ARCHIVE_TABLES[unit.root].c.id).where(ARCHIVE_TABLES[unit.root].c.id == root_id)
+        )
+        if not archived:
+            return False
+
+        await self._move(db, unit, ARCHIVE_TABLES, _hot_tables(), [root_id], restore=True)
+        if undelete:
+            root = _hot_tables()[unit.root]
+            await db.execute(update(root).where(root.c.id == root_id).values(is_deleted=False))
+        logger.info("Restored archived row", table=kind, id=root_id)
+        return True
+
+    async def _move(self, db, unit, source_tables, target_tables, root_ids, restore=False):
+        """Copy the unit's rows between table sets, then delete them at the source"""
+        conditions = unit.conditions(source_tables, lambda column: column.in_(root_ids))
+        delete_order = [name for name, _ in unit.members] + [unit.root]
+        # Restores insert parents first so foreign keys resolve
+        insert_order = list(reversed(delete_order)) if restore else delete_order
+
+        archived_at = datetime.utcnow()
+        for name in insert_order:
+            source, target = source_tables[name], target_tables[name]
+            columns = [column.name for column in target.columns]
+            selected = [
+                literal(archived_at).label(column) if column == "archived_at" else source.c[column]
+                for column in columns
+            ]
+            await db.execute(
+                insert(target).from_select(columns, select(*selected).where(conditions[name]))
+            )
+        for name in delete_order:
+            await db.execute(delete(source_tables[name]).where(conditions[name]))
+
+    async def run_once(self):
+        await self.archive_expired()
+
+
+# Global archiver instance
+archiver = Archiver()
@@ -0,0 +1,36 @@
+"""
+Audit Log Partition Maintenance
+
+Keeps monthly audit_logs partitions created AUDIT_PARTITION_MONTHS_AHEAD
+months in advance and drops months whose rows are all past retention.
+"""
+from sqlalchemy.ext.asyncio import async_sessionmaker
+import structlog
+
+from app.background.periodic import PeriodicTask
+from app.config.database import async_session_factory
+from app.config.settings import get_settings
+from app.repositories.audit_log import ensure_partitions, drop_expired_partitions
+
+settings = get_settings()
+logger = structlog.get_logger(__name__)
+
+
+class AuditPartitionMaintainer(PeriodicTask):
+    """Creates upcoming audit log partitions and drops expired ones"""
+
+    name = "audit partition maintainer"
+
+    def __init__(self, session_factory: async_sessionmaker = async_session_factory):
+        super().__init__(settings.AUDIT_PARTITION_INTERVAL_SECONDS)
+        self.session_factory = session_factory
+
+    async def run_once(self):
+        async with self.session_factory() as db:
+            await ensure_partitions(db, settings.AUDIT_PARTITION_MONTHS_AHEAD)
+            await drop_expired_partitions(db)
+            await db.commit()
+
+
+# Global maintainer instance
+audit_partition_maintainer = AuditPartitionMaintainer()
@@ -0,0 +1,33 @@
+"""
+Audit Log Writer
+
+The BatchWriter instance that audit events go through: rows are queued
+by AuditService.record and bulk-inserted (routed to their monthly
+partition) outside the request's transaction.
+"""
+from typing import Any, Dict, List
+
+from app.background.batch_writer import BatchWriter, restore_datetimes
+from app.config.database import async_session_factory
+from app.config.settings import get_settings
+from app.repositories.audit_log import insert_audit_rows
+
+settings = get_settings()
+
+
+async def write_audit_rows(rows: List[Dict[str, Any]]) -> None:
+    """Insert one batch of audit rows in its own transaction"""
+    async with async_session_factory() as db:
+        await insert_audit_rows(db, [restore_datetimes(row) for row in rows])
+        await db.commit()
+
+
+# Global audit writer instance
+audit_writer = BatchWriter(
+    "audit",
+    write_audit_rows,
+    spool_path=settings.AUDIT_SPOOL_PATH,
+    max_queue_size=settings.AUDIT_QUEUE_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+)
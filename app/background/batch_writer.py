@@ -0,0 +1,179 @@
+"""
+Batched Background Writer
+
+Request handlers ``submit`` records without awaiting anything; a single
+background task drains the bounded queue and hands records to ``flush``
+in batches of up to ``batch_size``, or whatever has arrived after
+``flush_interval`` seconds. Records that cannot be queued (queue full)
+or written (flush failed, shutdown) are appended to a JSON-lines spool
+file and replayed on the next start, so nothing is lost on restart.
+Spool lines that cannot be parsed (a write cut off by a crash) are moved
+to ``<spool>.corrupt`` rather than blocking the replay.
+"""
+import asyncio
+import json
+import os
+import time
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+Record = Dict[str, Any]
+
+# Timestamp fields every spooled row carries
+DATETIME_FIELDS = ("created_at", "updated_at")
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def restore_datetimes(record: Record, fields=DATETIME_FIELDS) -> Record:
+    """Turn the ISO strings a record replayed from the spool carries back into datetimes"""
+    for field in fields:
+        if isinstance(record.get(field), str):
+            record[field] = datetime.fromisoformat(record[field])
+    return record
+
+
+class BatchWriter:
+    """Bounded in-process queue flushed to storage in batches"""
+
+    def __init__(
+        self,
+        name: str,
+        flush: Callable[[List[Record]], Awaitable[None]],
+        spool_path: str,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0
+    ):
+        self.name = name
+        self.flush = flush
+        self.spool_path = spool_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        # Records taken off the queue but not yet handed to flush
+        self._collected: List[Record] = []
+        self._in_flight: Optional[asyncio.Future] = None
+
+    def submit(self, record: Record) -> None:
+        """Queue a record; never blocks the caller"""
+        try:
+            self.queue.put_nowait(record)
+        except asyncio.QueueFull:
+            logger.warning("Batch writer queue full, spooling record", writer=self.name)
+            self._spool([record])
+
+    async def start(self):
+        """Replay any spooled records, then start draining the queue"""
+        if self._task is not None:
+            return
+        await self.replay_spool()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the drain loop and write out (or spool) everything still queued"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._in_flight is not None:
+            # A flush that was already running completes rather than being cut off
+            await self._in_flight
+            self._in_flight = None
+
+        pending, self._collected = self._collected, []
+        while not self.queue.empty():
+            pending.append(self.queue.get_nowait())
+        for start in range(0, len(pending), self.batch_size):
+            await self._write(pending[start:start + self.batch_size])
+
+    async def replay_spool(self):
+        """Write records left in the spool file by an earlier run"""
+        replay_path = f"{self.spool_path}.replay"
+        if os.path.exists(replay_path):
+            # An earlier run stopped part way through its replay
+            await self._replay(replay_path)
+        if os.path.exists(self.spool_path):
+            os.replace(self.spool_path, replay_path)
+            await self._replay(replay_path)
+
+    async def _replay(self, replay_path: str):
+        records = self._read_spool(replay_path)
+        os.remove(replay_path)
+
+        for start in range(0, len(records), self.batch_size):
+            await self._write(records[start:start + self.batch_size])
+        if records:
+            logger.info("Replayed spooled records", writer=self.name, count=len(records))
+
+    def _read_spool(self, path: str) -> List[Record]:
+        records, unreadable = [], []
+        with open(path, encoding="utf-8") as spool:
+            for line in spool:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if isinstance(record, dict):
+                    records.append(record)
+                else:
+                    unreadable.append(line if line.endswith("\n") else line + "\n")
+        if unreadable:
+            corrupt_path = f"{self.spool_path}.corrupt"
+            logger.error(
+                "Unreadable spool lines moved aside", writer=self.name, count=len(unreadable), path=corrupt_path
+            )
+            with open(corrupt_path, "a", encoding="utf-8") as corrupt:
+                corrupt.writelines(unreadable)
+        return records
+
+    async def _run(self):
+        while True:
+            self._collected.append(await self.queue.get())
+            deadline = time.monotonic() + self.flush_interval
+            while len(self._collected) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    self._collected.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            batch, self._collected = self._collected, []
+            self._in_flight = asyncio.ensure_future(self._write(batch))
+            await asyncio.shield(self._in_flight)
+            self._in_flight = None
+
+    async def _write(self, batch: List[Record]):
+        try:
+            await self.flush(batch)
+        except Exception as e:
+            logger.error("Batch write failed, spooling batch", writer=self.name, count=len(batch), error=str(e))
+            self._spool(batch)
+
+    def _spool(self, records: List[Record]):
+        try:
+            directory = os.path.dirname(self.spool_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.spool_path, "a", encoding="utf-8") as spool:
+                for record in records:
+                    spool.write(json.dumps(record, default=_json_default) + "\n")
+        except OSError as e:
+            # Keep the writer (and the caller of submit) alive; these records are lost
+            logger.error("Spooling failed, records dropped", writer=self.name, count=len(records), error=str(e))
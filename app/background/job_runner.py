@@ -0,0 +1,152 @@
+"""
+Background AI Job Runner
+
+The WorkerPool that runs jobs submitted through JobService. A job is an
+``AgentAction`` row; the queue only carries its id. A worker claims a
+pending job with a guarded UPDATE (so a job queued twice, or recovered
+by two processes, runs once), runs it on a session of its own and
+records the outcome, start and end times and execution time on the row.
+A job fails once it has run for JOB_TIMEOUT_SECONDS. Jobs still pending
+at startup are queued again; a job cut off by shutdown goes back to
+pending for the next start, and so does one left running for longer
+than the timeout by a process that died.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List
+
+from fastapi import HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+import structlog
+
+from app.background.worker_pool import WorkerPool
+from app.config.database import async_session_factory
+from app.config.settings import get_settings
+from app.models.agent import ActionStatus, AgentAction
+from app.schemas.job import JobType
+from app.services.requirement_service import requirement_service
+
+settings = get_settings()
+logger = structlog.get_logger(__name__)
+
+
+async def run_requirement_analysis(db: AsyncSession, job) -> Dict[str, Any]:
+    analysis = await requirement_service.analyze_requirement(
+        db, job.target_id, job.requested_by, force_refresh=bool((job.input_data or {}).get("force_refresh"))
+    )
+    return analysis.model_dump(mode="json")
+
+
+async def run_task_generation(db: AsyncSession, job) -> Dict[str, Any]:
+    generated = await requirement_service.generate_tasks(db, job.target_id, job.requested_by)
+    return generated.model_dump(mode="json")
+
+
+JOB_HANDLERS: Dict[str, Callable[[AsyncSession, Any], Awaitable[Dict[str, Any]]]] = {
+    JobType.REQUIREMENT_ANALYSIS: run_requirement_analysis,
+    JobType.TASK_GENERATION: run_task_generation,
+}
+
+
+class JobRunner(WorkerPool):
+    """Runs pending AgentAction jobs by id"""
+
+    name = "ai jobs"
+
+    def __init__(self, workers: int, session_factory: async_sessionmaker = async_session_factory):
+        super().__init__(workers)
+        self.session_factory = session_factory
+
+    async def recover(self) -> List[str]:
+        async with self.session_factory() as db:
+            # Running past the timeout: the process running it is gone
+            stale = await db.execute(
+                update(AgentAction)
+                .where(AgentAction.status == ActionStatus.RUNNING)
+                .where(AgentAction.action_type.in_([job_type.value for job_type in JOB_HANDLERS]))
+                .where(AgentAction.started_at < datetime.utcnow() - timedelta(seconds=settings.JOB_TIMEOUT_SECONDS))
+                .values(status=ActionStatus.PENDING, started_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            if stale.rowcount:
+                logger.warning("Requeued jobs left running", count=stale.rowcount)
+            await db.commit()
+            result = await db.scalars(
+                select(AgentAction.id)
+                .where(AgentAction.status == ActionStatus.PENDING)
+                .where(AgentAction.action_type.in_([job_type.value for job_type in JOB_HANDLERS]))
+                .order_by(AgentAction.created_at)
+            )
+            return list(result)
+
+    async def handle(self, job_id: str):
+        job = await self._claim(job_id)
+        if job is None:
+            return
+        await self.notify()
+        values = {"status": ActionStatus.COMPLETED}
+        try:
+            async with self.session_factory() as db:
+                values["output_data"] = await asyncio.wait_for(
+                    JOB_HANDLERS[job.action_type](db, job), timeout=settings.JOB_TIMEOUT_SECONDS
+                )
+        except HTTPException as e:
+            values = {"status": ActionStatus.FAILED, "error_message": str(e.detail)}
+        except asyncio.TimeoutError:
+            logger.error("Job timed out", job_id=job_id, job_type=job.action_type)
+            values = {
+                "status": ActionStatus.FAILED,
+                "error_message": f"Job timed out after {settings.JOB_TIMEOUT_SECONDS:g}s"
+            }
+        except Exception as e:
+            logger.error("Job failed", job_id=job_id, job_type=job.action_type, error=str(e))
+            values = {"status": ActionStatus.FAILED, "error_message": "Job failed unexpectedly"}
+        except BaseException:
+            # Shutdown: leave the job for the next start
+            await self._set(job_id, {"status": ActionStatus.PENDING, "started_at": None})
+            raise
+
+        completed_at = datetime.utcnow()
+        values.update(
+            completed_at=completed_at,
+            execution_time_ms=int((completed_at - job.started_at).total_seconds() * 1000)
+        )
+        await self._set(job_id, values)
+        await self.notify()
+        logger.info(
+            "Job finished", job_id=job_id, job_type=job.action_type,
+            status=values["status"], execution_time_ms=values["execution_time_ms"]
+        )
+
+    async def _claim(self, job_id: str):
+        """Mark the job running if it is still pending; its row, or None"""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(AgentAction)
+                .where(AgentAction.id == job_id)
+                .where(AgentAction.status == ActionStatus.PENDING)
+                .values(status=ActionStatus.RUNNING, started_at=datetime.utcnow())
+                .returning(
+                    AgentAction.action_type, AgentAction.target_id, AgentAction.requested_by,
+                    AgentAction.input_data, AgentAction.started_at
+                )
+                .execution_options(synchronize_session=False)
+            )
+            job = result.one_or_none()
+            await db.commit()
+            return job
+
+    async def _set(self, job_id: str, values: Dict[str, Any]):
+        async with self.session_factory() as db:
+            await db.execute(
+                update(AgentAction)
+                .where(AgentAction.id == job_id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+
+# Global job runner instance
+job_runner = JobRunner(settings.JOB_WORKERS)
@@ -0,0 +1,46 @@
+"""
+Periodic Background Tasks
+"""
+import asyncio
+from typing import Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class PeriodicTask:
+    """Runs ``run_once`` every ``interval_seconds`` on the event loop until stopped"""
+
+    name = "periodic task"
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self):
+        raise NotImplementedError
+
+    async def run(self):
+        """Loop forever; a failed pass is logged and retried next interval"""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error("Background pass failed", task=self.name, error=str(e))
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self):
+        """Start the loop as a background task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """Cancel the loop and wait for it to finish"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
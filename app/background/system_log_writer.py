@@ -0,0 +1,63 @@
+"""
+System Log Writer
+
+The BatchWriter instance that diagnostic records (slow statements,
+repeated statements) go through on their way to system_logs, so
+recording them never adds a write to the request being diagnosed.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.background.batch_writer import BatchWriter, restore_datetimes
+from app.config.database import async_session_factory
+from app.config.settings import get_settings
+from app.core.context import current_request
+from app.models.audit import LogLevel, SystemLog
+from app.utils.helpers import uuid7
+
+settings = get_settings()
+
+# Execution option that keeps the SQL monitor away from its own writes
+SQL_MONITOR_SKIP = "sql_monitor_skip"
+
+
+async def write_system_log_rows(rows: List[Dict[str, Any]]) -> None:
+    """Insert one batch of system log rows in its own transaction"""
+    async with async_session_factory() as db:
+        await db.connection(execution_options={SQL_MONITOR_SKIP: True})
+        await db.execute(insert(SystemLog.__table__), [restore_datetimes(row) for row in rows])
+        await db.commit()
+
+
+def record_system_log(
+    level: LogLevel,
+    message: str,
+    component: str,
+    context: Optional[Dict[str, Any]] = None,
+    execution_time: Optional[int] = None
+) -> None:
+    """Queue a system_logs row, tagged with the current request id"""
+    now = datetime.utcnow()
+    request = current_request()
+    system_log_writer.submit({
+        "id": str(uuid7()),
+        "created_at": now,
+        "updated_at": now,
+        "level": level.value,
+        "message": message,
+        "component": component,
+        "context": context,
+        "request_id": request.request_id if request else None,
+        "execution_time": execution_time,
+    })
+
+
+# Global system log writer instance
+system_log_writer = BatchWriter(
+    "system_log",
+    write_system_log_rows,
+    spool_path=settings.SYSTEM_LOG_SPOOL_PATH,
+    max_queue_size=settings.SYSTEM_LOG_QUEUE_SIZE,
+)
@@ -0,0 +1,93 @@
+"""
+Background Worker Pool
+
+Callers ``submit`` work items without waiting; ``workers`` tasks take
+them off an in-process queue and run ``handle`` on each, at most
+``workers`` at once. Items are meant to be ids of durable records (the
+record holds the state), so ``recover`` can list the items an earlier
+run left unfinished and they are queued again on ``start``.
+"""
+import asyncio
+from typing import Any, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class WorkerPool:
+    """Fixed number of asyncio workers draining a queue of items"""
+
+    name = "worker pool"
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        # Bumped whenever an item's state changes; see wait_for_change
+        self.changes = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._changed: Optional[asyncio.Condition] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def handle(self, item: Any):
+        raise NotImplementedError
+
+    async def recover(self) -> List[Any]:
+        """Items left unfinished by an earlier run"""
+        return []
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    def submit(self, item: Any) -> None:
+        """Queue an item; never blocks the caller"""
+        if self._queue is None:
+            logger.warning("Worker pool not running; item left for recovery", pool=self.name, item=item)
+            return
+        self._queue.put_nowait(item)
+
+    async def start(self):
+        """Queue recovered items, then start the workers"""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._changed = asyncio.Condition()
+        for item in await self.recover():
+            self._queue.put_nowait(item)
+        if self._queue.qsize():
+            logger.info("Recovered unfinished items", pool=self.name, count=self._queue.qsize())
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Cancel the workers (handlers see CancelledError) and wait for them"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = self._changed = None
+
+    async def notify(self):
+        """Wake everything waiting in ``wait_for_change``"""
+        self.changes += 1
+        if self._changed is not None:
+            async with self._changed:
+                self._changed.notify_all()
+
+    async def wait_for_change(self, seen: int, timeout: float):
+        """Wait until ``changes`` differs from ``seen``, or ``timeout`` seconds"""
+        if self._changed is None:
+            await asyncio.sleep(timeout)
+            return
+        async with self._changed:
+            try:
+                await asyncio.wait_for(self._changed.wait_for(lambda: self.changes != seen), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _work(self):
+        while True:
+            item = await self._queue.get()
+            try:
+                await self.handle(item)
+            except Exception as e:
+                logger.error("Worker pool item failed", pool=self.name, item=item, error=str(e))
@@ -29,9 +29,10 @@ else:
         settings.DATABASE_URL,
         echo=settings.DEBUG,
         pool_pre_ping=True,
-        pool_recycle=300,
-        pool_size=5,
-        max_overflow=10,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
     )
 
 # Create session factory
@@ -42,7 +43,12 @@ async_session_factory = async_sessionmaker(
 )
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session"""
+    """Get database session
+
+    The session is lazy: a pool connection is checked out by the first
+    statement and returned when that transaction commits (or via
+    ``release_connection``), not held until the response is sent.
+    """
     async with async_session_factory() as session:
         try:
             yield session
@@ -53,6 +59,27 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+def get_session_factory() -> async_sessionmaker:
+    """Session factory, for streamed responses
+
+    ``get_db`` sessions are closed once the endpoint returns, before a
+    streamed body is sent, so streaming endpoints open their own
+    sessions from this factory while they stream.
+    """
+    return async_session_factory
+
+async def release_connection(session: AsyncSession) -> None:
+    """Return the session's connection to the pool after reads
+
+    Ends the open read transaction so nothing is held while the request
+    serializes its response or waits on slow I/O such as Gemini calls.
+    Loaded objects stay usable (``expire_on_commit=False``); the next
+    statement checks out a connection again. Sessions with unflushed
+    changes are left alone.
+    """
+    if session.in_transaction() and not (session.new or session.dirty or session.deleted):
+        await session.commit()
+
 async def create_tables():
     """Create all database tables"""
     try:
@@ -39,6 +39,12 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./keystone.db"
+    # Connections are only held while a transaction is open, so a small
+    # pool serves many concurrent requests
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 300
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
@@ -61,10 +67,81 @@ class Settings(BaseSettings):
     # Rate limiting
     RATE_LIMIT_PER_MINUTE: int = 60
 
+    # Archival of soft-deleted projects, requirements and tasks
+    ARCHIVE_ENABLED: bool = True
+    ARCHIVE_AFTER_DAYS: int = 30
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_INTERVAL_SECONDS: int = 3600
+
+    # Audit log partitions (monthly); expired months are dropped whole
+    AUDIT_PARTITION_MONTHS_AHEAD: int = 3
+    AUDIT_PARTITION_INTERVAL_SECONDS: int = 86400
+
+    # Audit event pipeline (queued in-process, written in batches)
+    AUDIT_QUEUE_SIZE: int = 10000
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_SPOOL_PATH: str = "./audit_spool.jsonl"
+
+    # SQL monitoring: per-request statement counts, slow statement capture
+    SQL_MONITOR_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN: bool = False
+    # Same statement run this many times in one request is logged (likely N+1)
+    SQL_REPEAT_THRESHOLD: int = 20
+
+    # System log pipeline (queued in-process, written in batches)
+    SYSTEM_LOG_QUEUE_SIZE: int = 10000
+    SYSTEM_LOG_SPOOL_PATH: str = "./system_log_spool.jsonl"
+
     # AI Model settings
     DEFAULT_AI_MODEL: str = "gemini-2.0-flash-exp"
     AI_TEMPERATURE: float = 0.7
     AI_MAX_TOKENS: int = 2048
+    # Gemini calls in flight at once (per process); more wait for a slot
+    AI_MAX_CONCURRENCY: int = 16
+    AI_REQUEST_TIMEOUT_SECONDS: float = 60.0
+    # Gemini calls one batch analysis request runs at once
+    AI_BATCH_CONCURRENCY: int = 8
+    # Packed batch analysis: several requirements per prompt, up to these limits
+    AI_PACKED_PROMPT_TOKEN_BUDGET: int = 3000
+    AI_PACKED_MAX_ITEMS: int = 10
+    AI_PACKED_MAX_OUTPUT_TOKENS: int = 8192
+    # Follow-up calls asking only for what a cut-off answer left out
+    AI_TRUNCATION_RETRIES: int = 2
+    # Retries of timeouts, connection errors and 408/429/5xx answers, with
+    # jittered exponential backoff (attempts include the first call)
+    AI_RETRY_ATTEMPTS: int = 3
+    AI_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    AI_RETRY_MAX_DELAY_SECONDS: float = 8.0
+    # Circuit breaker per model: opens for AI_BREAKER_OPEN_SECONDS once this
+    # share of the last AI_BREAKER_WINDOW calls (at least AI_BREAKER_MIN_CALLS) failed
+    AI_BREAKER_FAILURE_RATE: float = 0.5
+    AI_BREAKER_WINDOW: int = 20
+    AI_BREAKER_MIN_CALLS: int = 10
+    AI_BREAKER_OPEN_SECONDS: float = 30.0
+    # Send an identical second call when the first has not answered after
+    # this many seconds and a slot is free (0 disables hedging)
+    AI_HEDGE_AFTER_SECONDS: float = 0.0
+    # Secondary model, used after this many failed attempts on DEFAULT_AI_MODEL
+    # or while its circuit is open ("" disables the fallback)
+    AI_FALLBACK_MODEL: str = ""
+    AI_FALLBACK_AFTER_FAILURES: int = 2
+
+    # Requirement analysis cache (keyed by text, model, temperature, prompt version)
+    ANALYSIS_CACHE_ENABLED: bool = True
+    ANALYSIS_CACHE_TTL_SECONDS: int = 604800
+    # Least recently used entries beyond this are evicted
+    ANALYSIS_CACHE_MAX_ENTRIES: int = 50000
+    ANALYSIS_CACHE_EVICTION_INTERVAL_SECONDS: int = 3600
+
+    # Background AI jobs (202 + poll): workers per process, and how often a
+    # job event stream re-reads a job run by another process
+    JOB_WORKERS: int = 4
+    JOB_EVENTS_POLL_SECONDS: float = 2.0
+    # A job running longer fails; a job left running longer by a process
+    # that died is queued again on the next start
+    JOB_TIMEOUT_SECONDS: float = 900.0
 
     class Config:
         case_sensitive = True
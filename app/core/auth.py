@@ -6,7 +6,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.database import get_db
+from app.config.database import get_db, release_connection
 from app.config.settings import get_settings
 from app.services.auth_service import auth_service
 from app.services.keycloak_auth_service import KeycloakAuthService
@@ -34,6 +34,7 @@ async def get_current_user(
 
             # Sync user to local database
             user = await keycloak_service.sync_user_to_local_db(user_info, db)
+            await release_connection(db)
 
             if not user.is_active:
                 raise HTTPException(
@@ -71,6 +72,8 @@ async def get_current_user(
 
         # Get user from database - user_id_str is already a string UUID
         user = await auth_service.get_user_by_id(db, user_id=user_id_str)
+        # Don't hold the lookup's connection for the rest of the request
+        await release_connection(db)
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
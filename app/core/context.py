@@ -0,0 +1,33 @@
+"""
+Request Context
+
+Per-request values (set by LoggingMiddleware) that code deeper in the
+call stack can read without threading the Request object through.
+"""
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class RequestContext:
+    """What is known about the request currently being handled"""
+    request_id: str
+    method: str
+    path: str
+    ip_address: Optional[str] = None
+    user_agent: Optional[str] = None
+
+    # SQL activity, accumulated by app.core.sql_monitor
+    sql_statements: int = 0
+    sql_time_ms: float = 0.0
+    sql_repeats: Counter = field(default_factory=Counter)
+
+
+request_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+def current_request() -> Optional[RequestContext]:
+    """Context of the request being handled, or None outside a request"""
+    return request_context.get()
@@ -11,6 +11,9 @@ import structlog
 from collections import defaultdict
 from datetime import datetime, timedelta
 
+from app.core.context import RequestContext, request_context
+from app.core.sql_monitor import report_repeated_statements
+
 logger = structlog.get_logger(__name__)
 
 class LoggingMiddleware(BaseHTTPMiddleware):
@@ -22,6 +25,14 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         # Add request ID to request state
         request.state.request_id = request_id
+        context = RequestContext(
+            request_id=request_id,
+            method=request.method,
+            path=request.url.path,
+            ip_address=request.client.host if request.client else None,
+            user_agent=request.headers.get("user-agent"),
+        )
+        context_token = request_context.set(context)
 
         # Log request
         logger.info(
@@ -35,6 +46,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         try:
             response = await call_next(request)
+            report_repeated_statements(context)
         except Exception as exc:
             duration = time.time() - start_time
             logger.error(
@@ -44,8 +56,12 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 url=str(request.url),
                 duration=duration,
                 error=str(exc),
+                sql_statements=context.sql_statements,
+                sql_time_ms=round(context.sql_time_ms, 1),
             )
             raise
+        finally:
+            request_context.reset(context_token)
 
         # Log response
         duration = time.time() - start_time
@@ -56,10 +72,15 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             url=str(request.url),
             status_code=response.status_code,
             duration=duration,
+            sql_statements=context.sql_statements,
+            sql_time_ms=round(context.sql_time_ms, 1),
         )
 
-        # Add request ID to response headers
+        # Add request ID and database timing to response headers
         response.headers["X-Request-ID"] = request_id
+        response.headers["Server-Timing"] = (
+            f'db;dur={context.sql_time_ms:.1f};desc="{context.sql_statements} statements"'
+        )
 
         return response
 
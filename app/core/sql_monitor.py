@@ -0,0 +1,130 @@
+"""
+SQL Statement Monitor
+
+Engine event hooks that attribute every statement to the request being
+handled. Statement count, database time and per-statement repeat counts
+accumulate on the RequestContext and LoggingMiddleware reports them.
+Statements slower than SLOW_QUERY_THRESHOLD_MS, and statements repeated
+SQL_REPEAT_THRESHOLD times in one request (the N+1 signature), are
+recorded to system_logs. Parameters are recorded by shape only, never by
+value.
+"""
+import time
+from typing import Any, Optional
+
+from sqlalchemy import event
+import structlog
+
+from app.background.system_log_writer import SQL_MONITOR_SKIP, record_system_log
+from app.config.settings import get_settings
+from app.core.context import RequestContext, current_request
+from app.models.audit import LogLevel
+
+settings = get_settings()
+logger = structlog.get_logger(__name__)
+
+COMPONENT = "database"
+TIMERS_KEY = "sql_monitor_timers"
+MAX_STATEMENT_LENGTH = 4000
+
+EXPLAIN_PREFIXES = {
+    "postgresql": "EXPLAIN (FORMAT JSON) ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    """Type names in place of parameter values"""
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "row": parameter_shape(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _skipped(conn, context) -> bool:
+    options = context.execution_options if context is not None else conn.get_execution_options()
+    return bool(options.get(SQL_MONITOR_SKIP))
+
+
+def _explain(conn, statement: str, parameters) -> Optional[list]:
+    """Query plan for a slow SELECT, run on the same connection"""
+    prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+    if not prefix or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return None
+    try:
+        result = conn.exec_driver_sql(
+            prefix + statement, parameters, execution_options={SQL_MONITOR_SKIP: True}
+        )
+        return [[str(value) for value in row] for row in result]
+    except Exception as e:
+        logger.debug("EXPLAIN of slow statement failed", error=str(e))
+        return None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(TIMERS_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info[TIMERS_KEY].pop()) * 1000
+    if _skipped(conn, context):
+        return
+
+    request = current_request()
+    if request is not None:
+        request.sql_statements += 1
+        request.sql_time_ms += elapsed_ms
+        request.sql_repeats[statement] += 1
+
+    if elapsed_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+        details = {
+            "statement": statement[:MAX_STATEMENT_LENGTH],
+            "parameters": parameter_shape(parameters, executemany),
+            "rowcount": cursor.rowcount,
+        }
+        if settings.SLOW_QUERY_EXPLAIN and not executemany:
+            details["explain"] = _explain(conn, statement, parameters)
+        logger.warning("Slow SQL statement", duration_ms=round(elapsed_ms, 1), statement=statement[:200])
+        record_system_log(LogLevel.WARNING, "Slow SQL statement", COMPONENT, details, execution_time=round(elapsed_ms))
+
+
+def _handle_error(exception_context):
+    # A statement that raised never reaches _after_cursor_execute; drop its timer
+    if exception_context.execution_context is None or exception_context.connection is None:
+        return
+    timers = exception_context.connection.info.get(TIMERS_KEY)
+    if timers:
+        timers.pop()
+
+
+def install_sql_monitor(engine) -> None:
+    """Attach the monitor to an (async) engine; safe to call more than once"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def report_repeated_statements(request: RequestContext) -> None:
+    """Record the most repeated statement of a request if it crossed the threshold"""
+    if not request.sql_repeats:
+        return
+    statement, count = request.sql_repeats.most_common(1)[0]
+    if count < settings.SQL_REPEAT_THRESHOLD:
+        return
+    logger.warning(
+        "Repeated SQL statement", request_id=request.request_id, path=request.path,
+        count=count, statement=statement[:200]
+    )
+    record_system_log(LogLevel.WARNING, "Repeated SQL statement", COMPONENT, {
+        "statement": statement[:MAX_STATEMENT_LENGTH],
+        "count": count,
+        "total_statements": request.sql_statements,
+        "endpoint": f"{request.method} {request.path}",
+    }, execution_time=round(request.sql_time_ms))
@@ -13,8 +13,9 @@ from sqlalchemy.exc import IntegrityError
 from pydantic import ValidationError
 
 from app.config.settings import get_settings
-from app.config.database import create_tables, close_db_connection
+from app.config.database import create_tables, close_db_connection, engine
 from app.core.middleware import LoggingMiddleware, RateLimitMiddleware
+from app.core.sql_monitor import install_sql_monitor
 from app.core.exceptions import (
     ValidationException,
     AuthenticationException,
@@ -25,6 +26,12 @@ from app.core.exceptions import (
 )
 from app.api.v1.router import api_router
 from app.utils.helpers import setup_logging
+from app.background.analysis_cache_evictor import analysis_cache_evictor
+from app.background.archiver import archiver
+from app.background.audit_partitions import audit_partition_maintainer
+from app.background.audit_writer import audit_writer
+from app.background.job_runner import job_runner
+from app.background.system_log_writer import system_log_writer
 # Import models to ensure they are registered with SQLAlchemy
 import app.models
 
@@ -35,9 +42,27 @@ setup_logging()
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
+    if settings.SQL_MONITOR_ENABLED:
+        install_sql_monitor(engine)
     await create_tables()
+    # Partitions must exist before the first audit write
+    await audit_partition_maintainer.run_once()
+    audit_partition_maintainer.start()
+    await audit_writer.start()
+    await system_log_writer.start()
+    if settings.ARCHIVE_ENABLED:
+        archiver.start()
+    if settings.ANALYSIS_CACHE_ENABLED:
+        analysis_cache_evictor.start()
+    await job_runner.start()
     yield
     # Shutdown
+    await job_runner.stop()
+    await analysis_cache_evictor.stop()
+    await archiver.stop()
+    await audit_writer.stop()
+    await system_log_writer.stop()
+    await audit_partition_maintainer.stop()
     await close_db_connection()
 
 # Initialize FastAPI application
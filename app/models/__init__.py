@@ -5,17 +5,22 @@ from app.models.base import BaseModel
 from app.models.user import User
 from app.models.project import Project
 from app.models.requirement import Requirement
+from app.models.tag import Tag, requirement_tags
 from app.models.task import Task, TaskDependency, TaskComment
 from app.models.agent import AIAgent, AgentAction, AgentDecision, AgentWorkflow
 from app.models.audit import AuditLog, SystemLog, SecurityEvent
 from app.models.integration import Integration, IntegrationEvent, Deployment, DeploymentHealthCheck
 from app.models.permission import Role, Permission, ProjectPermission, AgentPermission, SystemSetting
+from app.models.analysis_cache import AnalysisCacheEntry
+from app.models.archive import ARCHIVE_TABLES
 
 __all__ = [
-    "BaseModel", "User", "Project", "Requirement",
+    "BaseModel", "User", "Project", "Requirement", "Tag", "requirement_tags",
     "Task", "TaskDependency", "TaskComment",
     "AIAgent", "AgentAction", "AgentDecision", "AgentWorkflow",
     "AuditLog", "SystemLog", "SecurityEvent",
     "Integration", "IntegrationEvent", "Deployment", "DeploymentHealthCheck",
-    "Role", "Permission", "ProjectPermission", "AgentPermission", "SystemSetting"
+    "Role", "Permission", "ProjectPermission", "AgentPermission", "SystemSetting",
+    "AnalysisCacheEntry",
+    "ARCHIVE_TABLES"
 ]
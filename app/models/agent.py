@@ -5,10 +5,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Float, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 import uuid
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, LARGE_COLUMNS
+from app.models.types import GUID
 
 
 class AgentType(str, Enum):
@@ -72,7 +73,7 @@ class AIAgent(BaseModel):
     current_load = Column(Integer, default=0)
 
     # Relationships
-    project_id = Column(String(36), ForeignKey("projects.id"), nullable=True)
+    project_id = Column(GUID, ForeignKey("projects.id"), nullable=True)
     actions = relationship("AgentAction", back_populates="agent")
     decisions = relationship("AgentDecision", back_populates="agent")
 
@@ -81,7 +82,7 @@ class AgentAction(BaseModel):
     """Records of AI Agent actions"""
     __tablename__ = "agent_actions"
 
-    agent_id = Column(String(36), ForeignKey("ai_agents.id"), nullable=False)
+    agent_id = Column(GUID, ForeignKey("ai_agents.id"), nullable=False)
     action_type = Column(String(50), nullable=False)  # code_generation, test_creation, review, etc.
     status = Column(String(20), default=ActionStatus.PENDING)
 
@@ -90,8 +91,8 @@ class AgentAction(BaseModel):
     target_id = Column(String(36), nullable=True)
 
     # Action details
-    input_data = Column(JSON, nullable=True)
-    output_data = Column(JSON, nullable=True)
+    input_data = deferred(Column(JSON, nullable=True), group=LARGE_COLUMNS)
+    output_data = deferred(Column(JSON, nullable=True), group=LARGE_COLUMNS)
     error_message = Column(Text, nullable=True)
 
     # AI metrics
@@ -105,20 +106,23 @@ class AgentAction(BaseModel):
 
     # Review process
     requires_human_review = Column(Boolean, default=False)
-    reviewed_by = Column(String(36), ForeignKey("users.id"), nullable=True)
+    reviewed_by = Column(GUID, ForeignKey("users.id"), nullable=True)
     review_comments = Column(Text, nullable=True)
     reviewed_at = Column(DateTime, nullable=True)
 
+    # User who submitted the action as a background job (only they can see it)
+    requested_by = Column(GUID, ForeignKey("users.id"), nullable=True)
+
     # Relationships
     agent = relationship("AIAgent", back_populates="actions")
-    reviewer = relationship("User")
+    reviewer = relationship("User", foreign_keys=[reviewed_by])
 
 
 class AgentDecision(BaseModel):
     """AI Agent decision records for audit and learning"""
     __tablename__ = "agent_decisions"
 
-    agent_id = Column(String(36), ForeignKey("ai_agents.id"), nullable=False)
+    agent_id = Column(GUID, ForeignKey("ai_agents.id"), nullable=False)
     decision_type = Column(String(50), nullable=False)
     context = Column(JSON, nullable=True)
     decision_data = Column(JSON, nullable=True)
@@ -141,4 +145,4 @@ class AgentWorkflow(BaseModel):
     is_active = Column(Boolean, default=True)
 
     # Relationships
-    project_id = Column(String(36), ForeignKey("projects.id"), nullable=True)
+    project_id = Column(GUID, ForeignKey("projects.id"), nullable=True)
@@ -0,0 +1,23 @@
+"""
+Analysis Cache Models
+"""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.models.base import BaseModel
+from app.models.types import CompressedJSON
+
+
+class AnalysisCacheEntry(BaseModel):
+    """Gemini requirement analysis, keyed by everything that shaped it"""
+    __tablename__ = "analysis_cache"
+
+    # sha256 of prompt version, model, temperature and normalized text
+    cache_key = Column(String(64), nullable=False, unique=True)
+    model = Column(String(100), nullable=False)
+    prompt_version = Column(String(20), nullable=False)
+    analysis = Column(CompressedJSON("gemini_analysis"), nullable=False)
+    hit_count = Column(Integer, default=0, nullable=False)
+    # Eviction order once the table is over ANALYSIS_CACHE_MAX_ENTRIES
+    last_used_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
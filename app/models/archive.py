@@ -0,0 +1,38 @@
+"""
+Archive Tables
+
+Cold mirrors of the hot tables that soft-deleted rows are moved into by
+the archiver. Each ``<table>_archive`` carries the source columns (no
+foreign keys or secondary indexes) plus the time the row was archived.
+"""
+from sqlalchemy import Column, DateTime, Table
+
+from app.config.database import Base
+from app.models.project import Project
+from app.models.requirement import Requirement
+from app.models.task import Task, TaskDependency, TaskComment
+from app.models.tag import requirement_tags
+
+
+def archive_table(source: Table) -> Table:
+    """Build the archive mirror of a hot table"""
+    columns = [
+        Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+        for column in source.columns
+    ]
+    return Table(
+        f"{source.name}_archive",
+        Base.metadata,
+        *columns,
+        Column("archived_at", DateTime, nullable=False),
+    )
+
+
+# Source table name -> archive table
+ARCHIVE_TABLES = {
+    table.name: archive_table(table)
+    for table in (
+        Project.__table__, Requirement.__table__, requirement_tags,
+        Task.__table__, TaskDependency.__table__, TaskComment.__table__,
+    )
+}
@@ -4,11 +4,12 @@ Audit and Logging Models
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, JSON, Index
 from sqlalchemy.orm import relationship
 import uuid
 
 from app.models.base import BaseModel
+from app.models.types import GUID
 
 
 class ActionType(str, Enum):
@@ -45,10 +46,18 @@ class LogLevel(str, Enum):
 class AuditLog(BaseModel):
     """Comprehensive audit logging for compliance and security"""
     __tablename__ = "audit_logs"
+    # Monthly range partitions on PostgreSQL; see app.repositories.audit_log
+    __table_args__ = (
+        Index("ix_audit_logs_user_id_created_at", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # Partition key; PostgreSQL requires it in the primary key
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, primary_key=True)
 
     # Who performed the action
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=True)
-    agent_id = Column(String(36), ForeignKey("ai_agents.id"), nullable=True)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=True)
+    agent_id = Column(GUID, ForeignKey("ai_agents.id"), nullable=True)
     session_id = Column(String(255), nullable=True)
 
     # What action was performed
@@ -104,7 +113,7 @@ class SecurityEvent(BaseModel):
 
     event_type = Column(String(50), nullable=False)
     severity = Column(String(10), nullable=False)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=True)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=True)
 
     # Event context
     ip_address = Column(String, nullable=True)
@@ -115,7 +124,7 @@ class SecurityEvent(BaseModel):
     # Investigation
     investigated = Column(Boolean, default=False)
     resolved = Column(Boolean, default=False)
-    investigated_by = Column(String(36), ForeignKey("users.id"), nullable=True)
+    investigated_by = Column(GUID, ForeignKey("users.id"), nullable=True)
     resolution_notes = Column(Text, nullable=True)
     resolved_at = Column(DateTime, nullable=True)
 
@@ -2,17 +2,23 @@
 Base Model Class
 """
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Boolean, String
+from sqlalchemy import Column, DateTime, Boolean, String, Index
 from sqlalchemy.ext.declarative import declared_attr
-import uuid
 
 from app.config.database import Base
+from app.models.types import GUID
+from app.utils.helpers import uuid7
+
+# Deferred group of large Text/JSON columns: left out of ordinary loads,
+# fetched by queries that render them via undefer_group(LARGE_COLUMNS)
+LARGE_COLUMNS = "large_columns"
 
 class BaseModel(Base):
     """Base model class with common fields"""
     __abstract__ = True
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    # Time-ordered UUIDv7 keys; the primary key index is the only index on id
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid7()))
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False)
@@ -20,3 +26,19 @@ class BaseModel(Base):
     @declared_attr
     def __tablename__(cls):
         return cls.__name__.lower() + 's'
+
+def live_index(model, name: str, *column_names: str) -> Index:
+    """Partial index over live rows only (``is_deleted = false``)
+
+    Hot-path queries always filter on ``is_deleted == False``, which both
+    PostgreSQL and SQLite match against the index predicate, so the index
+    only grows with live data.
+    """
+    table = model.__table__
+    live = table.c.is_deleted == False
+    return Index(
+        name,
+        *(table.c[column_name] for column_name in column_names),
+        postgresql_where=live,
+        sqlite_where=live,
+    )
@@ -5,10 +5,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, JSON, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 import uuid
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, LARGE_COLUMNS
+from app.models.types import GUID, CompressedJSON
 
 
 class IntegrationType(str, Enum):
@@ -72,8 +73,8 @@ class Integration(BaseModel):
     last_error = Column(Text, nullable=True)
 
     # Project association
-    project_id = Column(String(36), ForeignKey("projects.id"), nullable=True)
-    created_by = Column(String(36), ForeignKey("users.id"), nullable=False)
+    project_id = Column(GUID, ForeignKey("projects.id"), nullable=True)
+    created_by = Column(GUID, ForeignKey("users.id"), nullable=False)
 
     # Relationships
     project = relationship("Project", back_populates="integrations")
@@ -85,13 +86,13 @@ class IntegrationEvent(BaseModel):
     """Events and webhooks from integrated services"""
     __tablename__ = "integration_events"
 
-    integration_id = Column(String(36), ForeignKey("integrations.id"), nullable=False)
+    integration_id = Column(GUID, ForeignKey("integrations.id"), nullable=False)
 
     event_type = Column(String(100), nullable=False)  # push, pull_request, issue_created, etc.
     event_source = Column(String(50), nullable=False)  # webhook, polling, manual
 
     # Event data
-    raw_payload = Column(JSON, nullable=True)
+    raw_payload = deferred(Column(CompressedJSON("github_webhook"), nullable=True), group=LARGE_COLUMNS)
     processed_data = Column(JSON, nullable=True)
 
     # Processing status
@@ -106,7 +107,7 @@ class Deployment(BaseModel):
     """Deployment tracking and management"""
     __tablename__ = "deployments"
 
-    project_id = Column(String(36), ForeignKey("projects.id"), nullable=False)
+    project_id = Column(GUID, ForeignKey("projects.id"), nullable=False)
     version = Column(String(50), nullable=False)
     environment = Column(String(50), nullable=False)  # development, staging, production
     status = Column(String(20), default=DeploymentStatus.PENDING)
@@ -132,7 +133,7 @@ class Deployment(BaseModel):
     rollback_reason = Column(Text, nullable=True)
 
     # User tracking
-    deployed_by = Column(String(36), ForeignKey("users.id"), nullable=False)
+    deployed_by = Column(GUID, ForeignKey("users.id"), nullable=False)
 
     # Relationships
     project = relationship("Project", back_populates="deployments")
@@ -144,7 +145,7 @@ class DeploymentHealthCheck(BaseModel):
     """Health checks for deployments"""
     __tablename__ = "deployment_health_checks"
 
-    deployment_id = Column(String(36), ForeignKey("deployments.id"), nullable=False)
+    deployment_id = Column(GUID, ForeignKey("deployments.id"), nullable=False)
     check_type = Column(String(50), nullable=False)  # http, tcp, database, custom
     endpoint = Column(String(500), nullable=True)
     expected_status = Column(String(20), nullable=True)
@@ -6,29 +6,28 @@ from enum import Enum
 from typing import Optional, List
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, JSON, Table, UniqueConstraint
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
 
 from app.models.base import BaseModel
+from app.models.types import GUID
 
 
 # Association tables for many-to-many relationships
 user_roles = Table(
     'user_roles',
     BaseModel.metadata,
-    Column('user_id', String(36), ForeignKey('users.id'), primary_key=True),
-    Column('role_id', String(36), ForeignKey('roles.id'), primary_key=True),
+    Column('user_id', GUID, ForeignKey('users.id'), primary_key=True),
+    Column('role_id', GUID, ForeignKey('roles.id'), primary_key=True),
     Column('assigned_at', DateTime, default=datetime.utcnow),
-    Column('assigned_by', String(36), ForeignKey('users.id'))
+    Column('assigned_by', GUID, ForeignKey('users.id'))
 )
 
 role_permissions = Table(
     'role_permissions',
     BaseModel.metadata,
-    Column('role_id', String(36), ForeignKey('roles.id'), primary_key=True),
-    Column('permission_id', String(36), ForeignKey('permissions.id'), primary_key=True),
+    Column('role_id', GUID, ForeignKey('roles.id'), primary_key=True),
+    Column('permission_id', GUID, ForeignKey('permissions.id'), primary_key=True),
     Column('granted_at', DateTime, default=datetime.utcnow),
-    Column('granted_by', String(36), ForeignKey('users.id'))
+    Column('granted_by', GUID, ForeignKey('users.id'))
 )
 
 class ResourceType(str, Enum):
@@ -57,13 +56,12 @@ class Role(BaseModel):
     """User roles for RBAC"""
     __tablename__ = "roles"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False, unique=True)
     display_name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
 
     # Role hierarchy
-    parent_role_id = Column(UUID(as_uuid=True), ForeignKey("roles.id"), nullable=True)
+    parent_role_id = Column(GUID, ForeignKey("roles.id"), nullable=True)
     level = Column(Integer, default=0)  # 0=highest, higher numbers = lower level
 
     # Configuration
@@ -71,7 +69,7 @@ class Role(BaseModel):
     is_active = Column(Boolean, default=True)
 
     # Relationships
-    parent_role = relationship("Role", remote_side=[id], back_populates="child_roles")
+    parent_role = relationship("Role", remote_side="Role.id", back_populates="child_roles")
     child_roles = relationship("Role", back_populates="parent_role")
     users = relationship(
         "User",
@@ -87,7 +85,6 @@ class Permission(BaseModel):
     """Granular permissions for resources"""
     __tablename__ = "permissions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False, unique=True)
     display_name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
@@ -108,16 +105,15 @@ class ProjectPermission(BaseModel):
     """Project-specific permissions (project-level RBAC)"""
     __tablename__ = "project_permissions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    role_id = Column(UUID(as_uuid=True), ForeignKey("roles.id"), nullable=False)
+    project_id = Column(GUID, ForeignKey("projects.id"), nullable=False)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False)
+    role_id = Column(GUID, ForeignKey("roles.id"), nullable=False)
 
     # Permission scope within project
     permissions = Column(JSON, nullable=True)  # Specific permissions override
 
     # Validity
-    granted_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    granted_by = Column(GUID, ForeignKey("users.id"), nullable=False)
     expires_at = Column(DateTime, nullable=True)
     is_active = Column(Boolean, default=True)
 
@@ -132,8 +128,7 @@ class AgentPermission(BaseModel):
     """AI Agent permissions and capabilities"""
     __tablename__ = "agent_permissions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    agent_id = Column(UUID(as_uuid=True), ForeignKey("ai_agents.id"), nullable=False)
+    agent_id = Column(GUID, ForeignKey("ai_agents.id"), nullable=False)
 
     # Resource access
     resource_type = Column(String(50), nullable=False)
@@ -158,12 +153,10 @@ class SystemSetting(BaseModel):
     """System-wide configuration settings"""
     __tablename__ = "system_settings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     category = Column(String(100), nullable=False)  # security, ai, integration, etc.
     key = Column(String(255), nullable=False)
     value = Column(JSON, nullable=False)
 
-    last_modified_by = Column(String(36), ForeignKey("users.id"), nullable=True)
     description = Column(Text, nullable=True)
     data_type = Column(String(50), nullable=False)  # string, int, bool, json, etc.
     is_sensitive = Column(Boolean, default=False)  # Encrypt sensitive values
@@ -173,7 +166,7 @@ class SystemSetting(BaseModel):
 
     # Access control
     requires_permission = Column(String(100), nullable=True)
-    last_modified_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    last_modified_by = Column(GUID, ForeignKey("users.id"), nullable=True)
 
     # Make key unique within category
     __table_args__ = (UniqueConstraint('category', 'key', name='uix_category_key'),)
@@ -3,7 +3,8 @@ Project Model
 """
 from sqlalchemy import Column, String, Text, Enum, DateTime, Float, ForeignKey
 from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
+from app.models.base import BaseModel, live_index
+from app.models.types import GUID
 from app.schemas.project import ProjectStatus, ProjectPriority
 
 class Project(BaseModel):
@@ -17,7 +18,7 @@ class Project(BaseModel):
     start_date = Column(DateTime, nullable=True)
     end_date = Column(DateTime, nullable=True)
     budget = Column(Float, nullable=True)
-    owner_id = Column(String(36), ForeignKey('users.id'), nullable=False)
+    owner_id = Column(GUID, ForeignKey('users.id'), nullable=False)
 
     # Relationships
     owner = relationship("User", back_populates="projects")
@@ -25,3 +26,6 @@ class Project(BaseModel):
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
     integrations = relationship("Integration", back_populates="project", cascade="all, delete-orphan")
     deployments = relationship("Deployment", back_populates="project", cascade="all, delete-orphan")
+
+
+live_index(Project, "ix_projects_owner_id_live", "owner_id", "updated_at")
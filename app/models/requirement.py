@@ -2,8 +2,9 @@
 Requirement Model
 """
 from sqlalchemy import Column, String, Text, Enum, ForeignKey, JSON
-from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
+from sqlalchemy.orm import deferred, relationship
+from app.models.base import BaseModel, LARGE_COLUMNS, live_index
+from app.models.types import GUID, CompressedJSON
 from app.schemas.requirement import RequirementType, RequirementPriority, RequirementStatus
 
 class Requirement(BaseModel):
@@ -11,17 +12,20 @@ class Requirement(BaseModel):
     __tablename__ = 'requirements'
 
     title = Column(String(200), nullable=False, index=True)
-    description = Column(Text, nullable=False)
+    description = deferred(Column(Text, nullable=False), group=LARGE_COLUMNS)
     type = Column(Enum(RequirementType), default=RequirementType.FUNCTIONAL, nullable=False)
     priority = Column(Enum(RequirementPriority), default=RequirementPriority.MEDIUM, nullable=False)
     status = Column(Enum(RequirementStatus), default=RequirementStatus.DRAFT, nullable=False)
     acceptance_criteria = Column(JSON, nullable=True)
     tags = Column(JSON, nullable=True)
-    ai_analysis = Column(JSON, nullable=True)
-    project_id = Column(String(36), ForeignKey('projects.id'), nullable=False)
-    created_by = Column(String(36), ForeignKey('users.id'), nullable=False)
+    ai_analysis = deferred(Column(CompressedJSON("gemini_analysis"), nullable=True), group=LARGE_COLUMNS)
+    project_id = Column(GUID, ForeignKey('projects.id'), nullable=False)
+    created_by = Column(GUID, ForeignKey('users.id'), nullable=False)
 
     # Relationships
     project = relationship("Project", back_populates="requirements")
     creator = relationship("User", back_populates="created_requirements")
     tasks = relationship("Task", back_populates="requirement", cascade="all, delete-orphan")
+
+
+live_index(Requirement, "ix_requirements_project_id_live", "project_id", "updated_at")
@@ -0,0 +1,28 @@
+"""
+Tag Models
+"""
+from sqlalchemy import Column, ForeignKey, Index, String, Table
+
+from app.config.database import Base
+from app.models.base import BaseModel
+from app.models.types import GUID
+
+
+class Tag(BaseModel):
+    """Normalized tag name shared across requirements"""
+    __tablename__ = "tags"
+
+    # Lower-cased, trimmed, cut to the column length; see app.repositories.tags.normalize_tag
+    name = Column(String(100), nullable=False, unique=True)
+
+
+# Index of Requirement.tags: one row per (requirement, tag). The JSON
+# column stays the API source of truth and is kept in sync with this.
+requirement_tags = Table(
+    "requirement_tags",
+    Base.metadata,
+    Column("requirement_id", GUID, ForeignKey("requirements.id"), primary_key=True),
+    Column("tag_id", GUID, ForeignKey("tags.id"), primary_key=True),
+    # Tag-first lookups: "requirements tagged X"
+    Index("ix_requirement_tags_tag_id", "tag_id", "requirement_id"),
+)
@@ -5,10 +5,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, List
 from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Float, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 import uuid
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, LARGE_COLUMNS, live_index
+from app.models.types import GUID
 
 
 class TaskStatus(str, Enum):
@@ -47,10 +48,10 @@ class Task(BaseModel):
     task_type = Column(String(20), default=TaskType.DEVELOPMENT)
 
     # Relationships
-    project_id = Column(String(36), ForeignKey("projects.id"), nullable=False)
-    requirement_id = Column(String(36), ForeignKey("requirements.id"), nullable=True)
-    assigned_to = Column(String(36), ForeignKey("users.id"), nullable=True)
-    created_by = Column(String(36), ForeignKey("users.id"), nullable=False)
+    project_id = Column(GUID, ForeignKey("projects.id"), nullable=False)
+    requirement_id = Column(GUID, ForeignKey("requirements.id"), nullable=True)
+    assigned_to = Column(GUID, ForeignKey("users.id"), nullable=True)
+    created_by = Column(GUID, ForeignKey("users.id"), nullable=False)
 
     # Task metrics
     estimated_hours = Column(Float, nullable=True)
@@ -65,7 +66,7 @@ class Task(BaseModel):
 
     # AI Generated fields
     ai_generated = Column(Boolean, default=False)
-    ai_suggestions = Column(JSON, nullable=True)
+    ai_suggestions = deferred(Column(JSON, nullable=True), group=LARGE_COLUMNS)
     acceptance_criteria = Column(JSON, nullable=True)
 
     # Relationships
@@ -78,12 +79,17 @@ class Task(BaseModel):
     comments = relationship("TaskComment", back_populates="task")
 
 
+live_index(Task, "ix_tasks_project_id_live", "project_id")
+live_index(Task, "ix_tasks_requirement_id_live", "requirement_id")
+live_index(Task, "ix_tasks_assigned_to_live", "assigned_to")
+
+
 class TaskDependency(BaseModel):
     """Task dependency relationships"""
     __tablename__ = "task_dependencies"
 
-    task_id = Column(String(36), ForeignKey("tasks.id"), nullable=False)
-    depends_on_id = Column(String(36), ForeignKey("tasks.id"), nullable=False)
+    task_id = Column(GUID, ForeignKey("tasks.id"), nullable=False)
+    depends_on_id = Column(GUID, ForeignKey("tasks.id"), nullable=False)
     dependency_type = Column(String(20), default="blocks")  # blocks, depends_on
 
     # Relationships
@@ -95,8 +101,8 @@ class TaskComment(BaseModel):
     """Comments on tasks"""
     __tablename__ = "task_comments"
 
-    task_id = Column(String(36), ForeignKey("tasks.id"), nullable=False)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    task_id = Column(GUID, ForeignKey("tasks.id"), nullable=False)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     comment_type = Column(String(20), default="general")  # general, review, question
 
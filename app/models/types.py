@@ -0,0 +1,88 @@
+"""
+Custom Column Types
+"""
+import uuid
+from sqlalchemy.types import TypeDecorator, LargeBinary
+from sqlalchemy.dialects import postgresql
+
+from app.utils import compression
+
+NIL_UUID = uuid.UUID(int=0)
+
+
+class GUID(TypeDecorator):
+    """UUID column: native ``uuid`` on PostgreSQL, 16-byte blob elsewhere
+
+    Values are exchanged with the application as canonical UUID strings, so
+    services, schemas and tokens keep treating ids as ``str``. Both UUID
+    objects and strings are accepted as bind parameters. Writing a
+    malformed id raises; comparing against one (a WHERE clause) binds it
+    as the nil UUID, which no row carries, so lookups by a bad id find
+    nothing instead of raising.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+    # Set on the copy used for values compared against the column
+    lookup = False
+
+    def coerce_compared_value(self, op, value):
+        return GUIDLookup()
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            try:
+                value = uuid.UUID(str(value))
+            except ValueError:
+                if not self.lookup:
+                    raise ValueError(f"Malformed id: {value!r}")
+                value = NIL_UUID
+        if dialect.name == "postgresql":
+            return str(value)
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # Native uuid columns, or text ids not yet migrated to blobs
+            return value
+        return str(uuid.UUID(bytes=bytes(value)))
+
+
+class GUIDLookup(GUID):
+    """GUID for values compared against a GUID column: malformed ids match nothing"""
+    lookup = True
+
+
+class CompressedJSON(TypeDecorator):
+    """JSON stored as (usually deflated) bytes: ``bytea`` on PostgreSQL, blob elsewhere
+
+    Decoding is transparent: the application reads and writes plain
+    Python values. ``dictionary`` names the preset compression dictionary
+    (see ``app.utils.compression``) that suits the column's content. The
+    database cannot look inside these values, so only use this for
+    columns that are never filtered on.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, dictionary: str = "none"):
+        super().__init__()
+        if dictionary not in compression.DICTIONARY_IDS:
+            raise ValueError(f"Unknown compression dictionary: {dictionary}")
+        self.dictionary = dictionary
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return compression.encode_json(value, self.dictionary)
+
+    def process_result_value(self, value, dialect):
+        return compression.decode_json(value)
@@ -0,0 +1,210 @@
+"""
+Time-partitioned Audit Log Storage
+
+``audit_logs`` is split into one partition per calendar month of
+``created_at``. On PostgreSQL it is a declaratively partitioned table
+(``PARTITION BY RANGE (created_at)``) and the planner prunes partitions
+from time filters. SQLite has no partitioning, so rows are sharded by
+hand into ``audit_logs_YYYY_MM`` tables: writes are routed by month and
+reads union only the shards that overlap the requested time range.
+
+Either way a month expires as a whole: once every row in it is past its
+``retention_period_days`` the partition is dropped instead of deleting
+rows one by one.
+"""
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import Column, Index, MetaData, Table, func, insert, select, text, union_all
+import structlog
+
+from app.models.audit import AuditLog
+from app.utils.helpers import uuid7
+
+logger = structlog.get_logger(__name__)
+
+AUDIT_TABLE = AuditLog.__table__
+PARTITION_NAME = re.compile(r"^audit_logs_(\d{4})_(\d{2})$")
+
+# Empty past partitions are kept this long in case late writes arrive
+EMPTY_PARTITION_GRACE = timedelta(days=31)
+
+# SQLite shard tables live outside Base.metadata so create_all and
+# migrations never see them
+_shard_metadata = MetaData()
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of the month containing ``moment``"""
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(moment: datetime, months: int) -> datetime:
+    """Shift a month start by whole months"""
+    index = moment.year * 12 + moment.month - 1 + months
+    return moment.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(moment: datetime) -> str:
+    """Name of the partition holding rows created at ``moment``"""
+    return f"{AUDIT_TABLE.name}_{moment.year:04d}_{moment.month:02d}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """Month start a partition covers, or None for unrelated tables"""
+    match = PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+
+def months_between(start: datetime, end: datetime) -> List[datetime]:
+    """Month starts of every partition overlapping [start, end]"""
+    months, current = [], month_start(start)
+    while current <= end:
+        months.append(current)
+        current = add_months(current, 1)
+    return months
+
+
+def is_partitioned(dialect_name: str) -> bool:
+    """Whether the database partitions natively (otherwise shard tables are used)"""
+    return dialect_name == "postgresql"
+
+
+def shard_table(name: str) -> Table:
+    """SQLite shard table with the audit_logs columns (no foreign keys)"""
+    if name in _shard_metadata.tables:
+        return _shard_metadata.tables[name]
+    columns = [
+        Column(
+            column.name, column.type,
+            primary_key=column.primary_key,
+            nullable=column.nullable,
+            default=column.default.arg if column.default is not None else None,
+        )
+        for column in AUDIT_TABLE.columns
+    ]
+    table = Table(name, _shard_metadata, *columns)
+    Index(f"ix_{name}_user_id_created_at", table.c.user_id, table.c.created_at)
+    return table
+
+
+async def list_partitions(db) -> List[str]:
+    """Existing monthly partitions/shards, oldest first"""
+    if is_partitioned(db.bind.dialect.name):
+        result = await db.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "WHERE parent.relname = :parent"
+        ), {"parent": AUDIT_TABLE.name})
+    else:
+        result = await db.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE :pattern"
+        ), {"pattern": f"{AUDIT_TABLE.name}_%"})
+    return sorted(name for name in result.scalars() if partition_month(name))
+
+
+async def ensure_partitions(db, months_ahead: int, now: Optional[datetime] = None) -> List[str]:
+    """Create partitions for the current month and ``months_ahead`` more"""
+    now = now or datetime.utcnow()
+    first = month_start(now)
+    return await _create_partitions(db, [add_months(first, offset) for offset in range(months_ahead + 1)])
+
+
+async def _create_partitions(db, months: Iterable[datetime]) -> List[str]:
+    existing = set(await list_partitions(db))
+    created = []
+    for month in months:
+        name = partition_name(month)
+        if name in existing:
+            continue
+        if is_partitioned(db.bind.dialect.name):
+            await db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {AUDIT_TABLE.name} "
+                f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{add_months(month, 1):%Y-%m-%d}')"
+            ))
+        else:
+            await db.run_sync(lambda session, name=name: shard_table(name).create(session.connection(), checkfirst=True))
+        created.append(name)
+    if created:
+        logger.info("Created audit log partitions", partitions=created)
+    return created
+
+
+async def drop_expired_partitions(db, now: Optional[datetime] = None) -> List[str]:
+    """Drop whole months whose every row is past its retention period"""
+    now = now or datetime.utcnow()
+    current = month_start(now)
+    dropped = []
+    for name in await list_partitions(db):
+        month = partition_month(name)
+        end = add_months(month, 1)
+        if month >= current:
+            break
+
+        longest_retention = await db.scalar(
+            select(func.max(Table(name, MetaData(), Column("retention_period_days")).c.retention_period_days))
+        )
+        if longest_retention is None:
+            expired = end + EMPTY_PARTITION_GRACE <= now
+        else:
+            expired = end + timedelta(days=longest_retention) <= now
+        if expired:
+            await db.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+
+    if dropped:
+        logger.info("Dropped expired audit log partitions", partitions=dropped)
+    return dropped
+
+
+async def insert_audit_rows(db, rows: List[Dict[str, Any]]) -> int:
+    """Insert audit rows, routing them to monthly shards where needed"""
+    if not rows:
+        return 0
+    now = datetime.utcnow()
+    for row in rows:
+        row.setdefault("created_at", now)
+        row.setdefault("id", str(uuid7()))
+
+    by_shard: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        by_shard.setdefault(partition_name(row["created_at"]), []).append(row)
+    # Late or replayed rows may belong to a month maintenance has not
+    # created yet, or has already dropped
+    await _create_partitions(db, sorted(partition_month(name) for name in by_shard))
+
+    if is_partitioned(db.bind.dialect.name):
+        await db.execute(insert(AUDIT_TABLE), rows)
+        return len(rows)
+    for name, shard_rows in by_shard.items():
+        await db.execute(insert(shard_table(name)), shard_rows)
+    return len(rows)
+
+
+async def audit_log_source(db, start: Optional[datetime] = None, end: Optional[datetime] = None):
+    """FROM clause for audit log reads covering [start, end]
+
+    Returns the partitioned table on PostgreSQL (pruned by the caller's
+    ``created_at`` filter), or a UNION ALL of the overlapping shards on
+    SQLite. Columns are addressed as ``source.c.<name>`` either way.
+    """
+    if is_partitioned(db.bind.dialect.name):
+        return AUDIT_TABLE
+
+    shards = []
+    for name in await list_partitions(db):
+        month = partition_month(name)
+        if start is not None and add_months(month, 1) <= start:
+            continue
+        if end is not None and month > end:
+            continue
+        shards.append(shard_table(name))
+    if not shards:
+        return AUDIT_TABLE
+    if len(shards) == 1:
+        return shards[0]
+    return union_all(*(select(shard) for shard in shards)).subquery(AUDIT_TABLE.name)
@@ -0,0 +1,110 @@
+"""
+Request-scoped Entity Loader
+
+Batches by-id lookups of users, projects, requirements and tasks. Loads
+requested in the same event-loop tick (e.g. under ``asyncio.gather``)
+are answered by one ``IN (...)`` query per model, and every result,
+including "not found", is memoized for the rest of the request. The
+loader lives on the session, which lives for exactly one request.
+
+Lookups are by id only; callers still apply their own access checks.
+"""
+import asyncio
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project
+from app.models.requirement import Requirement
+from app.models.task import Task
+from app.models.user import User
+from app.utils.helpers import canonical_id
+
+LOADER_KEY = "entity_loader"
+LOADABLE_MODELS = (User, Project, Requirement, Task)
+
+_MISSING = object()
+
+
+class EntityLoader:
+    """Coalesces and memoizes by-id loads on one session"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._cache: Dict[Tuple[type, str], object] = {}
+        self._pending: Dict[type, Dict[str, asyncio.Future]] = {}
+        self._dispatches: Set[asyncio.Task] = set()
+        # The session runs one statement at a time
+        self._lock = asyncio.Lock()
+
+    def peek(self, model: Type, entity_id) -> Optional[object]:
+        """The memoized entity, without loading"""
+        entity = self._cache.get((model, canonical_id(entity_id)))
+        return None if entity is _MISSING else entity
+
+    def prime(self, *entities) -> None:
+        """Memoize entities loaded by other queries"""
+        for entity in entities:
+            if entity is not None and type(entity) in LOADABLE_MODELS:
+                self._cache[(type(entity), canonical_id(entity.id))] = entity
+
+    def forget(self, model: Type, entity_id) -> None:
+        """Drop a memoized entity (e.g. after a bulk UPDATE changed it)"""
+        self._cache.pop((model, canonical_id(entity_id)), None)
+
+    async def load(self, model: Type, entity_id) -> Optional[object]:
+        """Load one entity by id; None if it does not exist"""
+        if model not in LOADABLE_MODELS:
+            raise ValueError(f"{model.__name__} is not loadable")
+        entity_id = canonical_id(entity_id)
+        cached = self._cache.get((model, entity_id))
+        if cached is not None:
+            return None if cached is _MISSING else cached
+
+        pending = self._pending.setdefault(model, {})
+        future = pending.get(entity_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not pending:
+                # Dispatch after the loads queued in this tick have joined
+                loop.call_soon(self._schedule, model)
+            future = pending[entity_id] = loop.create_future()
+        return await future
+
+    async def load_many(self, model: Type, entity_ids: Iterable) -> List[Optional[object]]:
+        """Load several entities by id with at most one query"""
+        return list(await asyncio.gather(*(self.load(model, entity_id) for entity_id in entity_ids)))
+
+    def _schedule(self, model: Type) -> None:
+        task = asyncio.ensure_future(self._dispatch(model))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, model: Type) -> None:
+        batch = self._pending.pop(model, {})
+        if not batch:
+            return
+        try:
+            async with self._lock:
+                result = await self.db.scalars(select(model).where(model.id.in_(list(batch))))
+                found = {canonical_id(entity.id): entity for entity in result}
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for entity_id, future in batch.items():
+            entity = found.get(entity_id)
+            self._cache[(model, entity_id)] = _MISSING if entity is None else entity
+            if not future.done():
+                future.set_result(entity)
+
+
+def get_loader(db: AsyncSession) -> EntityLoader:
+    """The session's loader, created on first use"""
+    loader = db.info.get(LOADER_KEY)
+    if loader is None:
+        loader = db.info[LOADER_KEY] = EntityLoader(db)
+    return loader
@@ -0,0 +1,58 @@
+"""
+Ownership-scoped Query Helpers
+
+Project ownership is folded into the statement that does the real work
+(as an EXISTS predicate) instead of being checked with a separate SELECT
+first. Projects already proven to belong to the user are remembered on
+the session, which lives for exactly one request.
+"""
+from typing import Set, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project
+
+VERIFIED_PROJECTS_KEY = "verified_project_ids"
+
+
+def owned_project(project_id, user_id):
+    """EXISTS predicate: the given project is live and owned by the user"""
+    return (
+        select(Project.id)
+        .where(Project.id == project_id)
+        .where(Project.owner_id == user_id)
+        .where(Project.is_deleted == False)
+        .exists()
+    )
+
+
+def _verified_projects(db: AsyncSession) -> Set[Tuple[str, str]]:
+    return db.info.setdefault(VERIFIED_PROJECTS_KEY, set())
+
+
+def remember_project(db: AsyncSession, project_id: str, user_id: str) -> None:
+    """Record that the user owns the project for the rest of the request"""
+    _verified_projects(db).add((str(user_id), str(project_id)))
+
+
+def forget_project(db: AsyncSession, project_id: str) -> None:
+    """Drop a project from the request memo (e.g. after it is deleted)"""
+    verified = _verified_projects(db)
+    for key in [key for key in verified if key[1] == str(project_id)]:
+        verified.discard(key)
+
+
+def is_project_verified(db: AsyncSession, project_id: str, user_id: str) -> bool:
+    """Whether ownership was already proven earlier in this request"""
+    return (str(user_id), str(project_id)) in _verified_projects(db)
+
+
+async def verify_project_access(db: AsyncSession, project_id: str, user_id: str) -> bool:
+    """Check project ownership, issuing at most one EXISTS query per request"""
+    if is_project_verified(db, project_id, user_id):
+        return True
+
+    owned = await db.scalar(select(owned_project(project_id, user_id)))
+    if owned:
+        remember_project(db, project_id, user_id)
+    return bool(owned)
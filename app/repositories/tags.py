@@ -0,0 +1,96 @@
+"""
+Requirement Tag Index
+
+``Requirement.tags`` (JSON) is what the API reads and writes; the
+``tags`` / ``requirement_tags`` tables mirror it so tag filters and
+facet counts are index lookups instead of scans over every row's JSON.
+Tag names are matched case-insensitively through their normalized form.
+"""
+from typing import Iterable, List, Optional
+
+from sqlalchemy import delete, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.tag import Tag, requirement_tags
+from app.utils.helpers import uuid7
+
+TAG_MATCH_ANY = "any"
+TAG_MATCH_ALL = "all"
+
+# Longer tags are cut to fit tags.name
+MAX_TAG_LENGTH = Tag.__table__.c.name.type.length
+
+
+def normalize_tag(tag) -> str:
+    """Index form of a tag: trimmed, lower-cased and at most MAX_TAG_LENGTH characters"""
+    return str(tag).strip().lower()[:MAX_TAG_LENGTH]
+
+
+def clean_tags(tags: Optional[Iterable]) -> List[str]:
+    """Tags as stored in the JSON column: trimmed, cut to MAX_TAG_LENGTH, no blanks or case-insensitive duplicates"""
+    cleaned, seen = [], set()
+    for tag in tags or ():
+        name = str(tag).strip()[:MAX_TAG_LENGTH].strip()
+        if name and normalize_tag(name) not in seen:
+            seen.add(normalize_tag(name))
+            cleaned.append(name)
+    return cleaned
+
+
+def _insert_ignoring_conflicts(dialect_name: str, table):
+    dialect = postgresql if dialect_name == "postgresql" else sqlite
+    return dialect.insert(table).on_conflict_do_nothing()
+
+
+async def sync_requirement_tags(db, requirement_id: str, tags: Optional[Iterable], replace: bool = True) -> None:
+    """Point the tag index for one requirement at exactly ``tags``
+
+    Runs in the caller's transaction. ``replace=False`` skips clearing
+    existing links (for requirements that were just created).
+    """
+    names = sorted({normalize_tag(tag) for tag in clean_tags(tags)})
+    dialect_name = db.bind.dialect.name
+    if replace:
+        await db.execute(delete(requirement_tags).where(requirement_tags.c.requirement_id == requirement_id))
+    if not names:
+        return
+
+    await db.execute(
+        _insert_ignoring_conflicts(dialect_name, Tag.__table__),
+        [{"id": str(uuid7()), "name": name} for name in names]
+    )
+    await db.execute(
+        requirement_tags.insert().from_select(
+            ["requirement_id", "tag_id"],
+            select(literal(requirement_id, requirement_tags.c.requirement_id.type), Tag.id)
+            .where(Tag.name.in_(names))
+        )
+    )
+
+
+def tag_filter(requirement_id_column, tags: Iterable, match: str = TAG_MATCH_ANY):
+    """Predicate: the requirement carries any (or all) of ``tags``"""
+    names = sorted({normalize_tag(tag) for tag in tags if str(tag).strip()})
+    tagged = (
+        select(requirement_tags.c.requirement_id)
+        .join(Tag, Tag.id == requirement_tags.c.tag_id)
+        .where(Tag.name.in_(names))
+    )
+    if match == TAG_MATCH_ALL and len(names) > 1:
+        tagged = tagged.group_by(requirement_tags.c.requirement_id).having(func.count() == len(names))
+    return requirement_id_column.in_(tagged)
+
+
+def tag_facet_query(requirement_ids):
+    """Tag name and requirement count for the requirements selected by ``requirement_ids``
+
+    One GROUP BY over the tag index, most used tags first.
+    """
+    return (
+        select(Tag.name.label("tag"), func.count().label("count"))
+        .select_from(requirement_tags)
+        .join(Tag, Tag.id == requirement_tags.c.tag_id)
+        .where(requirement_tags.c.requirement_id.in_(requirement_ids))
+        .group_by(Tag.name)
+        .order_by(func.count().desc(), Tag.name)
+    )
@@ -0,0 +1,50 @@
+"""
+Single-statement Write Helpers
+
+``INSERT ... RETURNING`` / ``UPDATE ... RETURNING`` hand back fully
+populated, session-attached ORM objects (defaults, ``onupdate`` values
+and anything the database generated included) from the write itself, so
+write paths need no ``refresh()`` SELECT after committing. Deferred
+columns are only returned when ``options`` undefer them.
+"""
+from typing import Any, Dict, Optional, Sequence, Type, TypeVar
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ModelType = TypeVar("ModelType")
+
+
+async def insert_returning(
+    db: AsyncSession,
+    model: Type[ModelType],
+    values: Dict[str, Any],
+    options: Sequence = ()
+) -> ModelType:
+    """Insert one row and return it as a loaded object; the caller commits"""
+    return await db.scalar(insert(model).values(**values).returning(model).options(*options))
+
+
+async def update_returning(
+    db: AsyncSession,
+    model: Type[ModelType],
+    where: tuple,
+    values: Dict[str, Any],
+    options: Sequence = ()
+) -> Optional[ModelType]:
+    """Update the row matching ``where`` and return it, or None if nothing matched
+
+    Objects already in the session are overwritten with the returned
+    row. With no values to set the row is only read back. The caller
+    commits.
+    """
+    if not values:
+        return await db.scalar(select(model).where(*where).options(*options))
+    return await db.scalar(
+        update(model)
+        .where(*where)
+        .values(**values)
+        .returning(model)
+        .options(*options)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
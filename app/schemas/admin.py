@@ -46,3 +46,12 @@ class RestoreRequest(BaseModel):
     backup_id: str
     restore_type: str = "full"
     options: Dict[str, Any] = {}
+
+class AnalysisCacheStats(BaseModel):
+    """Requirement analysis cache counters (hits/misses since process start)"""
+    enabled: bool = True
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    hit_ratio: float = 0.0
+    entries: int = 0
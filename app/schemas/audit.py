@@ -7,11 +7,11 @@ from datetime import datetime
 
 class AuditLogResponse(BaseModel):
     """Audit log response schema"""
-    id: int
+    id: str  # Changed from int to str for UUID support
     action: str
     resource_type: str
-    resource_id: Optional[int] = None
-    user_id: int
+    resource_id: Optional[str] = None
+    user_id: Optional[str] = None
     timestamp: datetime
     details: Optional[Dict[str, Any]] = {}
     ip_address: Optional[str] = None
@@ -34,3 +34,15 @@ class SystemEventResponse(BaseModel):
     message: str
     timestamp: datetime
     details: Optional[Dict[str, Any]] = {}
+
+class SecurityEventResponse(BaseModel):
+    """Security event response schema"""
+    id: str
+    event_type: str
+    severity: str
+    user_id: Optional[str] = None
+    ip_address: Optional[str] = None
+    description: str
+    details: Optional[Dict[str, Any]] = {}
+    resolved: bool = False
+    timestamp: datetime
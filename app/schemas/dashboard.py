@@ -74,3 +74,14 @@ class WidgetUpdate(BaseModel):
     name: Optional[str] = None
     config: Optional[Dict[str, Any]] = None
     position: Optional[Dict[str, int]] = None
+
+class AnalyticsTrends(BaseModel):
+    """Analytics trends schema"""
+    metric: Optional[str] = None
+    period: str = "30d"
+    data: List[Dict[str, Any]] = []
+
+class AnalyticsReports(BaseModel):
+    """Analytics reports schema"""
+    report_type: Optional[str] = None
+    reports: List[Dict[str, Any]] = []
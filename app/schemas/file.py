@@ -27,3 +27,7 @@ class BulkUploadResponse(BaseModel):
     failed_files: List[dict] = []
     total_uploaded: int
     total_failed: int
+
+class FileUploadResponse(FileResponse):
+    """Single file upload response schema"""
+    description: Optional[str] = None
@@ -0,0 +1,48 @@
+"""
+Gemini Response Schemas
+
+Passed to the model as ``response_schema`` so it answers with JSON of
+exactly these shapes. They describe model output, not API payloads.
+"""
+from typing import List, Literal
+from pydantic import BaseModel
+
+class GeminiEntity(BaseModel):
+    """Entity identified in a requirement"""
+    type: Literal["feature", "component", "integration", "data_model"]
+    name: str
+    description: str
+
+class GeminiAnalysis(BaseModel):
+    """Structured analysis of one requirement"""
+    entities: List[GeminiEntity]
+    features: List[str]
+    complexity_assessment: Literal["low", "medium", "high"]
+    effort_estimate: int
+    confidence_score: float
+    suggestions: List[str]
+    risks: List[str]
+    acceptance_criteria: List[str]
+    tech_considerations: List[str]
+
+class GeminiPackedAnalysis(GeminiAnalysis):
+    """Analysis of one requirement of a packed prompt, tagged with its number"""
+    id: str
+
+class GeminiPackedAnalyses(BaseModel):
+    """Answer to a packed analysis prompt"""
+    analyses: List[GeminiPackedAnalysis]
+
+class GeminiTask(BaseModel):
+    """Development task generated from a requirement"""
+    title: str
+    description: str
+    type: Literal["feature", "bug", "enhancement", "documentation", "testing", "devops"]
+    priority: Literal["low", "medium", "high", "critical"]
+    estimated_hours: int
+    dependencies: List[str]
+    acceptance_criteria: List[str]
+
+class GeminiTaskList(BaseModel):
+    """Answer to a task generation prompt"""
+    tasks: List[GeminiTask]
@@ -93,3 +93,27 @@ class IntegrationType(BaseModel):
     description: str
     required_config: List[str] = []
     optional_config: List[str] = []
+
+class IntegrationTest(BaseModel):
+    """Integration connectivity test schema"""
+    config: Optional[Dict[str, Any]] = None
+
+class IntegrationSync(BaseModel):
+    """Integration sync request schema"""
+    full_sync: bool = False
+    resources: List[str] = []
+
+class IntegrationLog(BaseModel):
+    """Integration event log schema"""
+    id: str
+    integration_id: str
+    event_type: str
+    status: str
+    message: Optional[str] = None
+    details: Optional[Dict[str, Any]] = {}
+    created_at: datetime
+
+class DeploymentEnvironment(BaseModel):
+    """Deployment environment schema"""
+    name: str
+    description: Optional[str] = None
@@ -0,0 +1,26 @@
+"""
+Background Job Schemas
+"""
+from typing import Optional, Dict, Any
+from pydantic import BaseModel
+from datetime import datetime
+from enum import Enum
+
+class JobType(str, Enum):
+    """Kinds of background AI job (the action_type of their AgentAction)"""
+    REQUIREMENT_ANALYSIS = "requirement_analysis"
+    TASK_GENERATION = "task_generation"
+
+class JobResponse(BaseModel):
+    """Schema for a background job and, once it has finished, its outcome"""
+    id: str
+    type: JobType
+    status: str
+    target_type: Optional[str] = None
+    target_id: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    execution_time_ms: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
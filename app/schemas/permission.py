@@ -5,6 +5,8 @@ from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
 from datetime import datetime
 
+from app.schemas.types import EntityId
+
 class PermissionResponse(BaseModel):
     """Permission response schema"""
     id: int
@@ -47,3 +49,14 @@ class ProjectPermissions(BaseModel):
     project_id: int
     members: List[Dict[str, Any]] = []
     roles: List[RoleResponse] = []
+
+class UserPermissionUpdate(BaseModel):
+    """Schema for updating a user's roles and direct permissions"""
+    roles: Optional[List[str]] = None
+    permissions: Optional[List[str]] = None
+
+class ProjectPermissionUpdate(BaseModel):
+    """Schema for updating a project member's permissions"""
+    user_id: EntityId
+    role: Optional[str] = None
+    permissions: Optional[List[str]] = None
@@ -53,10 +53,11 @@ class ProjectUpdate(BaseModel):
 
 class ProjectResponse(ProjectBase):
     """Schema for project response"""
-    id: int
-    owner_id: int
+    id: str  # Changed from int to str for UUID support
+    owner_id: str
     created_at: datetime
     updated_at: Optional[datetime] = None
+    requirements_count: int = 0
 
     class Config:
         from_attributes = True
@@ -57,3 +57,8 @@ class ReportSchedule(BaseModel):
     schedule: str  # cron expression
     recipients: List[str]
     parameters: Dict[str, Any] = {}
+
+# Names used by the reports endpoints
+ReportGenerateRequest = ReportGenerate
+ScheduledReportCreate = ReportSchedule
+ScheduledReportResponse = ScheduledReport
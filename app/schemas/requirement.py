@@ -1,11 +1,13 @@
 """
 Requirement Management Schemas
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from pydantic import BaseModel, validator
 from datetime import datetime
 from enum import Enum
 
+from app.schemas.types import EntityId
+
 class RequirementType(str, Enum):
     """Requirement type enumeration"""
     FUNCTIONAL = "functional"
@@ -33,10 +35,12 @@ class RequirementCreate(BaseModel):
     """Schema for creating a requirement"""
     title: str
     description: str
-    project_id: int
+    project_id: EntityId  # Changed from int to str for UUID support
+    type: RequirementType = RequirementType.FUNCTIONAL
     priority: RequirementPriority = RequirementPriority.MEDIUM
     status: RequirementStatus = RequirementStatus.DRAFT
     acceptance_criteria: Optional[str] = None
+    tags: Optional[List[str]] = None
 
 class RequirementUpdate(BaseModel):
     """Schema for updating a requirement"""
@@ -45,17 +49,21 @@ class RequirementUpdate(BaseModel):
     priority: Optional[RequirementPriority] = None
     status: Optional[RequirementStatus] = None
     acceptance_criteria: Optional[str] = None
+    tags: Optional[List[str]] = None
 
 class RequirementResponse(BaseModel):
     """Schema for requirement response"""
-    id: int
+    id: str  # Changed from int to str for UUID support
     title: str
-    description: str
-    project_id: int
+    description: Optional[str] = None  # Omitted from list pages unless included
+    type: Optional[RequirementType] = None
+    project_id: str
     priority: RequirementPriority
     status: RequirementStatus
-    acceptance_criteria: Optional[str] = None
-    created_by: int
+    acceptance_criteria: Optional[Union[str, List[str]]] = None
+    tags: List[str] = []
+    ai_analysis: Optional[Dict[str, Any]] = None  # Omitted from list pages unless included
+    created_by: str
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -69,24 +77,49 @@ class RequirementListResponse(BaseModel):
     skip: int
     limit: int
 
+class TagFacet(BaseModel):
+    """Number of requirements carrying a tag"""
+    tag: str
+    count: int
+
+class TagFacetResponse(BaseModel):
+    """Schema for requirement tag facet counts"""
+    facets: List[TagFacet]
+
 class RequirementAnalysis(BaseModel):
     """Schema for requirement AI analysis"""
-    requirement_id: int
+    requirement_id: str  # Changed from int to str for UUID support
     complexity_score: float = 0.0
     estimated_effort: int = 0
     suggested_tasks: List[Dict[str, Any]] = []
     analysis_summary: str = ""
     recommendations: List[str] = []
+    # Served from the analysis cache rather than a fresh model call
+    cached: bool = False
 
 class RequirementAnalysisResponse(BaseModel):
     """Schema for requirement AI analysis response"""
-    requirement_id: int
+    requirement_id: str  # Changed from int to str for UUID support
     complexity_score: float = 0.0
     estimated_effort: int = 0
     suggested_tasks: List[Dict[str, Any]] = []
     analysis_summary: str = ""
     recommendations: List[str] = []
     analyzed_at: datetime
+    cached: bool = False
+
+class RequirementBatchAnalysisItem(BaseModel):
+    """Outcome of analyzing one requirement of a batch"""
+    requirement_id: str  # Changed from int to str for UUID support
+    success: bool
+    analysis: Optional[RequirementAnalysisResponse] = None
+    error: Optional[str] = None
+
+class RequirementBatchAnalysisResponse(BaseModel):
+    """Schema for batch requirement analysis; failed items do not fail the batch"""
+    results: List[RequirementBatchAnalysisItem]
+    succeeded: int = 0
+    failed: int = 0
 
 class RequirementStatusUpdate(BaseModel):
     """Schema for requirement status update"""
@@ -19,3 +19,10 @@ class GlobalSearchResponse(BaseModel):
     agents: List[Dict[str, Any]] = []
     total: int = 0
     query: str
+
+class SearchRequest(BaseModel):
+    """Search request schema"""
+    query: str
+    filters: Dict[str, Any] = {}
+    skip: int = 0
+    limit: int = 20
@@ -2,17 +2,21 @@
 Task Management Schemas
 """
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from enum import Enum
 
+from app.schemas.types import EntityId
+
 class TaskStatus(str, Enum):
     """Task status enumeration"""
     TODO = "todo"
+    PENDING = "pending"  # Default for tasks created outside the API (e.g. AI generated)
     IN_PROGRESS = "in_progress"
     REVIEW = "review"
     COMPLETED = "completed"
     BLOCKED = "blocked"
+    CANCELLED = "cancelled"
 
 class TaskPriority(str, Enum):
     """Task priority enumeration"""
@@ -25,19 +29,20 @@ class TaskCreate(BaseModel):
     """Schema for creating a task"""
     title: str
     description: Optional[str] = None
-    project_id: Optional[int] = None
-    requirement_id: Optional[int] = None
-    assigned_to: Optional[int] = None
+    project_id: Optional[EntityId] = None  # Changed from int to str for UUID support
+    requirement_id: Optional[EntityId] = None
+    assigned_to: Optional[EntityId] = None
     priority: TaskPriority = TaskPriority.MEDIUM
     status: TaskStatus = TaskStatus.TODO
     estimated_hours: Optional[float] = None
     due_date: Optional[datetime] = None
+    acceptance_criteria: Optional[List[str]] = None
 
 class TaskUpdate(BaseModel):
     """Schema for updating a task"""
     title: Optional[str] = None
     description: Optional[str] = None
-    assigned_to: Optional[int] = None
+    assigned_to: Optional[EntityId] = None
     priority: Optional[TaskPriority] = None
     status: Optional[TaskStatus] = None
     estimated_hours: Optional[float] = None
@@ -45,24 +50,51 @@ class TaskUpdate(BaseModel):
 
 class TaskResponse(BaseModel):
     """Schema for task response"""
-    id: int
+    id: str  # Changed from int to str for UUID support
     title: str
     description: Optional[str] = None
-    project_id: Optional[int] = None
-    requirement_id: Optional[int] = None
-    assigned_to: Optional[int] = None
+    project_id: Optional[str] = None
+    requirement_id: Optional[str] = None
+    assigned_to: Optional[str] = None
     priority: TaskPriority
     status: TaskStatus
     estimated_hours: Optional[float] = None
     actual_hours: Optional[float] = None
     due_date: Optional[datetime] = None
-    created_by: int
+    created_by: str
     created_at: datetime
     updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
+TASK_BULK_MAX_ITEMS = 1000
+
+class TaskBulkCreate(BaseModel):
+    """Schema for creating many tasks in one request"""
+    tasks: List[TaskCreate] = Field(..., min_length=1, max_length=TASK_BULK_MAX_ITEMS)
+
+class TaskBulkUpdate(BaseModel):
+    """Schema for applying the same changes to many tasks"""
+    task_ids: List[str] = Field(..., min_length=1, max_length=TASK_BULK_MAX_ITEMS)
+    changes: TaskUpdate
+
+class TaskBulkError(BaseModel):
+    """Per-item failure in a bulk task operation"""
+    index: Optional[int] = None  # Position in the request's tasks list (create)
+    task_id: Optional[str] = None  # Task id (update)
+    detail: str
+
+class TaskBulkCreateResponse(BaseModel):
+    """Schema for bulk task creation response"""
+    created: List[TaskResponse] = []
+    errors: List[TaskBulkError] = []
+
+class TaskBulkUpdateResponse(BaseModel):
+    """Schema for bulk task update response"""
+    updated: List[TaskResponse] = []
+    errors: List[TaskBulkError] = []
+
 class TaskStatusUpdate(BaseModel):
     """Schema for task status update"""
     status: TaskStatus
@@ -125,6 +157,20 @@ class TaskDependencyCreate(BaseModel):
     dependent_task_id: int
     dependency_type: str = "blocks"  # blocks, depends_on, etc.
 
+class TaskDependencyResponse(BaseModel):
+    """Schema for task dependency response"""
+    task_id: str
+    depends_on_id: str
+    dependency_type: str = "blocks"
+
+    class Config:
+        from_attributes = True
+
+class TaskGenerationResponse(BaseModel):
+    """Schema for AI task generation response"""
+    tasks: List[TaskResponse] = []
+    dependencies: List[TaskDependencyResponse] = []
+
 class TaskCommentCreate(BaseModel):
     """Schema for creating task comment"""
     content: str
@@ -0,0 +1,19 @@
+"""
+Shared Schema Field Types
+"""
+import uuid
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+
+def _entity_id(value: str) -> str:
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        raise ValueError("Invalid id: must be a UUID")
+
+
+# Id of an existing row written by a Create/Update schema, in canonical
+# form; malformed ids fail validation (422) instead of reaching the database
+EntityId = Annotated[str, AfterValidator(_entity_id)]
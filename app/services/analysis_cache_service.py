@@ -0,0 +1,195 @@
+"""
+Requirement Analysis Cache Service
+
+Persistent cache in front of ``gemini_service.analyze_requirement``.
+Entries are keyed by a hash of the normalized requirement text, the
+model (DEFAULT_AI_MODEL), the temperature and ANALYSIS_PROMPT_VERSION,
+so changing any of them misses instead of serving a stale analysis.
+An analysis from the fallback model (see ``gemini_service.answered_by``)
+is stored under that model's key, never the primary model's.
+Entries expire after ANALYSIS_CACHE_TTL_SECONDS; the evictor drops
+expired rows and then the least recently used ones beyond
+ANALYSIS_CACHE_MAX_ENTRIES.
+"""
+import hashlib
+import json
+import re
+import unicodedata
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.config.settings import get_settings
+from app.models.analysis_cache import AnalysisCacheEntry
+from app.services.gemini_service import ANALYSIS_PROMPT_VERSION, FALLBACK_ANALYSIS, answered_by
+from app.utils.helpers import uuid7
+
+settings = get_settings()
+logger = structlog.get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_requirement_text(text: str) -> str:
+    """Text as hashed: NFC, whitespace runs collapsed, trimmed"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+def analysis_cache_key(
+    text: str,
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+    prompt_version: str = ANALYSIS_PROMPT_VERSION,
+) -> str:
+    """Cache key for one analysis request"""
+    parts = [
+        prompt_version,
+        model or settings.DEFAULT_AI_MODEL,
+        settings.AI_TEMPERATURE if temperature is None else temperature,
+        normalize_requirement_text(text),
+    ]
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode()).hexdigest()
+
+
+def _upsert(dialect_name: str, rows: List[Dict[str, Any]]):
+    dialect = postgresql if dialect_name == "postgresql" else sqlite
+    statement = dialect.insert(AnalysisCacheEntry).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[AnalysisCacheEntry.cache_key],
+        set_={
+            name: statement.excluded[name]
+            for name in ("model", "prompt_version", "analysis", "last_used_at", "expires_at", "updated_at")
+        },
+    )
+
+
+class AnalysisCacheService:
+    """Looks up and stores requirement analyses; counts hits per process"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters since process start"""
+        return {
+            "enabled": settings.ANALYSIS_CACHE_ENABLED,
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+    async def count(self, db: AsyncSession) -> int:
+        """Entries currently stored, expired or not"""
+        return await db.scalar(select(func.count()).select_from(AnalysisCacheEntry))
+
+    async def get(self, db: AsyncSession, text: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """The cached analysis of ``text``, or None
+
+        A hit also marks the entry as recently used, in the same statement.
+        ``force_refresh`` skips the lookup so the caller re-runs the model.
+        """
+        found = await self.get_many(db, [text], force_refresh=force_refresh)
+        return found.get(analysis_cache_key(text))
+
+    async def get_many(
+        self, db: AsyncSession, texts: Iterable[str], force_refresh: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Cached analyses of ``texts`` by cache key, in one statement"""
+        keys = {analysis_cache_key(text) for text in texts}
+        if not settings.ANALYSIS_CACHE_ENABLED or not keys:
+            return {}
+        if force_refresh:
+            self.refreshes += len(keys)
+            return {}
+
+        now = datetime.utcnow()
+        result = await db.execute(
+            update(AnalysisCacheEntry)
+            .where(AnalysisCacheEntry.cache_key.in_(sorted(keys)))
+            .where(AnalysisCacheEntry.expires_at > now)
+            .values(last_used_at=now, hit_count=AnalysisCacheEntry.hit_count + 1)
+            .returning(AnalysisCacheEntry.cache_key, AnalysisCacheEntry.analysis)
+            .execution_options(synchronize_session=False)
+        )
+        found = dict(result.all())
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        logger.info(
+            "Analysis cache lookup", hits=len(found), misses=len(keys) - len(found),
+            hit_ratio=round(self.hit_ratio, 4)
+        )
+        return found
+
+    async def put(self, db: AsyncSession, text: str, analysis: Dict[str, Any]) -> None:
+        """Store an analysis in the caller's transaction"""
+        await self.put_many(db, [(text, analysis)])
+
+    async def put_many(self, db: AsyncSession, analyses: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store (text, analysis) pairs with one upsert in the caller's transaction
+
+        Each analysis is keyed and labelled by the model that produced it.
+        Parse-failure placeholders are not stored, so the next request asks
+        the model again.
+        """
+        if not settings.ANALYSIS_CACHE_ENABLED:
+            return
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=settings.ANALYSIS_CACHE_TTL_SECONDS)
+        rows = {}
+        for text, analysis in analyses:
+            if analysis == FALLBACK_ANALYSIS:
+                continue
+            model = answered_by(analysis)
+            key = analysis_cache_key(text, model)
+            rows[key] = {
+                "id": str(uuid7()),
+                "cache_key": key,
+                "model": model,
+                "prompt_version": ANALYSIS_PROMPT_VERSION,
+                "analysis": analysis,
+                "hit_count": 0,
+                "last_used_at": now,
+                "expires_at": expires_at,
+                "created_at": now,
+                "updated_at": now,
+                "is_deleted": False,
+            }
+        if rows:
+            await db.execute(_upsert(db.bind.dialect.name, list(rows.values())))
+
+    async def evict(self, db: AsyncSession, max_entries: Optional[int] = None) -> int:
+        """Drop expired entries, then the least recently used over the cap"""
+        max_entries = settings.ANALYSIS_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        expired = await db.execute(
+            delete(AnalysisCacheEntry).where(AnalysisCacheEntry.expires_at <= datetime.utcnow())
+        )
+        evicted = expired.rowcount or 0
+
+        excess = await self.count(db) - max_entries
+        if excess > 0:
+            least_recent = (
+                select(AnalysisCacheEntry.id)
+                .order_by(AnalysisCacheEntry.last_used_at)
+                .limit(excess)
+            )
+            result = await db.execute(
+                delete(AnalysisCacheEntry).where(AnalysisCacheEntry.id.in_(least_recent))
+            )
+            evicted += result.rowcount or 0
+        return evicted
+
+
+# Global analysis cache service instance
+analysis_cache_service = AnalysisCacheService()
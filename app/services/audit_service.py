@@ -1,26 +1,139 @@
 """
 Audit Service
 """
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 import structlog
 
 from app.schemas.audit import AuditLogResponse, UserActivityResponse, SystemEventResponse
+from app.repositories.audit_log import audit_log_source
+from app.background.audit_writer import audit_writer
+from app.core.context import current_request
+from app.models.audit import ActionType, EntityType
+from app.utils.helpers import uuid7, uuid7_datetime
 
 logger = structlog.get_logger(__name__)
 
+# Slack around the time embedded in a UUIDv7 when locating its partition
+ID_TIME_WINDOW = timedelta(days=1)
+
+
+def audit_log_response(row) -> AuditLogResponse:
+    """Build the API view of an audit_logs row"""
+    return AuditLogResponse(
+        id=row.id,
+        action=row.action_type,
+        resource_type=row.entity_type,
+        resource_id=row.entity_id,
+        user_id=row.user_id,
+        timestamp=row.created_at,
+        details=row.additional_data or {},
+        ip_address=row.ip_address
+    )
+
+
 class AuditService:
     """Service for audit and logging"""
 
-    async def get_audit_logs(self, db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100, 
-                           action: str = None, target_user_id: int = None, resource_type: str = None,
-                           start_date: str = None, end_date: str = None):
-        """Get audit logs with filtering"""
-        return []
+    def record(
+        self,
+        action_type: ActionType,
+        entity_type: EntityType,
+        entity_id: Optional[str],
+        description: str,
+        user_id: Optional[str] = None,
+        old_values: Optional[Dict[str, Any]] = None,
+        new_values: Optional[Dict[str, Any]] = None,
+        additional_data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Emit an audit event
+
+        Only queues the row; it is written in a later batch outside the
+        caller's transaction, so this adds no database work to the request.
+        """
+        now = datetime.utcnow()
+        row = {
+            "id": str(uuid7()),
+            "created_at": now,
+            "updated_at": now,
+            "user_id": user_id,
+            "action_type": action_type.value,
+            "entity_type": entity_type.value,
+            "entity_id": str(entity_id) if entity_id is not None else None,
+            "description": description,
+            "old_values": old_values,
+            "new_values": new_values,
+            "additional_data": additional_data,
+        }
+        request = current_request()
+        if request:
+            row.update(
+                request_id=request.request_id,
+                ip_address=request.ip_address,
+                user_agent=request.user_agent,
+                endpoint=f"{request.method} {request.path}",
+            )
+        audit_writer.submit(row)
+
+    async def get_audit_logs(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        action: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[AuditLogResponse]:
+        """Get the user's audit logs, newest first
+
+        Time bounds limit the partitions read, so callers should pass them
+        whenever they can.
+        """
+        source = await audit_log_source(db, start_date, end_date)
+        query = (
+            select(source)
+            .where(source.c.user_id == user_id)
+            .order_by(source.c.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        if action:
+            query = query.where(source.c.action_type == action)
+        if resource_type:
+            query = query.where(source.c.entity_type == resource_type)
+        if start_date:
+            query = query.where(source.c.created_at >= start_date)
+        if end_date:
+            query = query.where(source.c.created_at <= end_date)
+
+        result = await db.execute(query)
+        return [audit_log_response(row) for row in result]
+
+    async def get_audit_log_by_id(self, db: AsyncSession, log_id: str, user_id: str) -> Optional[AuditLogResponse]:
+        """Get specific audit log entry
+
+        Audit ids are UUIDv7, so the creation time they carry narrows the
+        lookup to the partition(s) around it.
+        """
+        created = uuid7_datetime(log_id)
+        start = created - ID_TIME_WINDOW if created else None
+        end = created + ID_TIME_WINDOW if created else None
+
+        source = await audit_log_source(db, start, end)
+        query = (
+            select(source)
+            .where(source.c.id == log_id)
+            .where(source.c.user_id == user_id)
+        )
+        if created:
+            query = query.where(source.c.created_at.between(start, end))
 
-    async def get_audit_log_by_id(self, db: AsyncSession, log_id: int, user_id: int):
-        """Get specific audit log entry"""
-        return {"id": log_id, "action": "sample_action", "timestamp": "2025-09-17T10:00:00Z"}
+        row = (await db.execute(query)).first()
+        return audit_log_response(row) if row else None
 
     async def get_user_activity(self, db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100,
                               target_user_id: int = None, start_date: str = None, end_date: str = None):
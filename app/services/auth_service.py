@@ -9,11 +9,14 @@ from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import structlog
-import uuid
 
 from app.config.settings import get_settings
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, Token
+from app.repositories.loader import get_loader
+from app.repositories.writes import insert_returning, update_returning
+from app.models.audit import ActionType, EntityType
+from app.services.audit_service import audit_service
 
 settings = get_settings()
 logger = structlog.get_logger(__name__)
@@ -74,9 +77,10 @@ class AuthService:
             if not user:
                 return None
             
-            if not self.verify_password(password, user.password_hash):
+            if not self.verify_password(password, user.hashed_password):
                 return None
 
+            audit_service.record(ActionType.LOGIN, EntityType.USER, user.id, "User logged in", user_id=user.id)
             return user
         except Exception as e:
             logger.error(f"Authentication error: {str(e)}")
@@ -106,23 +110,13 @@ class AuthService:
                     )
             
             # Create new user
-            hashed_password = self.get_password_hash(user_data.password)
-            db_user = User(
-                id=str(uuid.uuid4()),
-                email=user_data.email,
-                username=user_data.username,
-                first_name=user_data.first_name,
-                last_name=user_data.last_name,
-                bio=user_data.bio,
-                avatar_url=user_data.avatar_url,
-                password_hash=hashed_password,
-                is_active=True,
-                is_verified=False
-            )
-            
-            db.add(db_user)
+            db_user = await insert_returning(db, User, {
+                **user_data.model_dump(exclude={"password"}),
+                "hashed_password": self.get_password_hash(user_data.password),
+                "is_active": True,
+                "is_verified": False,
+            })
             await db.commit()
-            await db.refresh(db_user)
             
             return db_user
             
@@ -144,31 +138,23 @@ class AuthService:
         return result.scalars().all()
 
     async def get_user_by_id(self, db: AsyncSession, user_id: str):
-        """Get user by ID"""
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        """Get user by ID, memoized for the request"""
+        return await get_loader(db).load(User, user_id)
 
     async def update_user(self, db: AsyncSession, user_id: str, user_data):
         """Update user"""
         try:
-            result = await db.execute(select(User).where(User.id == user_id))
-            user = result.scalar_one_or_none()
-
+            # Only non-empty profile fields are applied
+            values = {
+                field: getattr(user_data, field)
+                for field in ("first_name", "last_name", "bio", "avatar_url")
+                if getattr(user_data, field, None)
+            }
+            user = await update_returning(db, User, (User.id == user_id,), values)
             if not user:
                 return None
 
-            # Update fields
-            if hasattr(user_data, 'first_name') and user_data.first_name:
-                user.first_name = user_data.first_name
-            if hasattr(user_data, 'last_name') and user_data.last_name:
-                user.last_name = user_data.last_name
-            if hasattr(user_data, 'bio') and user_data.bio:
-                user.bio = user_data.bio
-            if hasattr(user_data, 'avatar_url') and user_data.avatar_url:
-                user.avatar_url = user_data.avatar_url
-
             await db.commit()
-            await db.refresh(user)
             return user
         except Exception as e:
             await db.rollback()
@@ -201,10 +187,10 @@ class AuthService:
             if not user:
                 return False
 
-            if not self.verify_password(current_password, user.password_hash):
+            if not self.verify_password(current_password, user.hashed_password):
                 return False
 
-            user.password_hash = self.get_password_hash(new_password)
+            user.hashed_password = self.get_password_hash(new_password)
             await db.commit()
             return True
         except Exception:
@@ -220,4 +206,6 @@ class AuthService:
         """Reset password with token"""
         # Placeholder implementation
         return True
-```
+
+# Global auth service instance
+auth_service = AuthService()
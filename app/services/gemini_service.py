@@ -2,28 +2,204 @@
 Google Gemini AI Service
 """
 import asyncio
+import copy
 import json
-from typing import Dict, List, Optional, Any
+import random
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
+from pydantic import BaseModel, create_model
 import structlog
 
 from app.config.settings import get_settings
 from app.core.exceptions import BaseAPIException
+from app.schemas.gemini import GeminiAnalysis, GeminiPackedAnalyses, GeminiTaskList
+from app.utils.json_stream import JSONArrayStream, complete_members, strip_code_fence
+from app.utils.resilience import CircuitBreaker, backoff_delay
 
 settings = get_settings()
 logger = structlog.get_logger(__name__)
 
+# Bump whenever the analysis prompt changes; cached analyses are keyed by it
+ANALYSIS_PROMPT_VERSION = "2"
+
+# Returned when nothing can be recovered from the model's answer (never cached)
+FALLBACK_ANALYSIS = {
+    "entities": [],
+    "features": [],
+    "complexity_assessment": "medium",
+    "effort_estimate": 8,
+    "confidence_score": 0.5,
+    "suggestions": ["Manual analysis required - AI parsing failed"],
+    "risks": ["Unable to perform detailed analysis"],
+    "acceptance_criteria": [],
+    "tech_considerations": []
+}
+
+# Fields of one analysis, as the prompts spell them out for the model
+_ANALYSIS_FIELDS = """
+            "entities": [
+                {
+                    "type": "feature|component|integration|data_model",
+                    "name": "entity name",
+                    "description": "brief description"
+                }
+            ],
+            "features": ["list of main features identified"],
+            "complexity_assessment": "low|medium|high",
+            "effort_estimate": "estimated hours (integer)",
+            "confidence_score": "confidence in analysis (0.0-1.0)",
+            "suggestions": ["list of implementation suggestions"],
+            "risks": ["list of potential risks or challenges"],
+            "acceptance_criteria": ["suggested acceptance criteria"],
+            "tech_considerations": ["technical considerations"]"""
+
+ANALYSIS_KEYS = tuple(FALLBACK_ANALYSIS)
+
+# Gemini answers worth retrying: timeout, rate limit, server-side failures
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed Gemini call may succeed if simply tried again
+
+    Timeouts and connection errors (the SDK's transport raises OSError
+    subclasses) are; so are the API errors in RETRYABLE_STATUS_CODES.
+    """
+    if isinstance(error, genai_errors.APIError):
+        return error.code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (asyncio.TimeoutError, OSError))
+
+
+def describe_error(error: BaseException) -> str:
+    if isinstance(error, asyncio.TimeoutError):
+        return f"Gemini call timed out after {settings.AI_REQUEST_TIMEOUT_SECONDS:g}s"
+    if isinstance(error, genai_errors.APIError):
+        return f"Gemini returned {error.code} {error.status or ''}".rstrip()
+    return str(error) or type(error).__name__
+
+
+async def first_success(tasks: List[asyncio.Future]) -> Any:
+    """Result of the first task to succeed, else the error of the last to fail; the rest are cancelled"""
+    pending = set(tasks)
+    try:
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+            if not pending:
+                raise task.exception()
+    finally:
+        for task in tasks:
+            if task.done() and not task.cancelled():
+                task.exception()  # retrieved: a losing call's failure is not worth a warning
+            task.cancel()
+
+
+class Analysis(dict):
+    """A requirement analysis that also records the model that produced it"""
+
+    def __init__(self, fields: Dict[str, Any], model: str):
+        super().__init__(fields)
+        self.model = model
+
+
+def answered_by(analysis: Dict[str, Any]) -> str:
+    """Model that produced ``analysis``; DEFAULT_AI_MODEL unless it says otherwise"""
+    return getattr(analysis, "model", None) or settings.DEFAULT_AI_MODEL
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters a token), for packing only"""
+    return len(text) // 4 + 1
+
+
+def pack_requirements(
+    texts: Dict[str, str],
+    token_budget: Optional[int] = None,
+    max_items: Optional[int] = None,
+) -> List[Dict[str, str]]:
+    """Split requirement texts (by key, in order) into packs for packed analysis
+
+    A pack holds at most ``max_items`` texts totalling at most
+    ``token_budget`` estimated tokens; a text over the budget goes alone.
+    """
+    token_budget = token_budget or settings.AI_PACKED_PROMPT_TOKEN_BUDGET
+    max_items = max_items or settings.AI_PACKED_MAX_ITEMS
+    packs, pack, used = [], {}, 0
+    for key, text in texts.items():
+        tokens = estimate_tokens(text)
+        if pack and (used + tokens > token_budget or len(pack) >= max_items):
+            packs.append(pack)
+            pack, used = {}, 0
+        pack[key] = text
+        used += tokens
+    if pack:
+        packs.append(pack)
+    return packs
+
+
+def parse_array(text: str) -> Tuple[List[Any], bool]:
+    """The complete elements of the first JSON array in ``text``, and whether it closed"""
+    parser = JSONArrayStream()
+    items = parser.feed(strip_code_fence(text))
+    return items, parser.closed
+
+
+def _new_tasks(items: List[Any], tasks: List[Dict[str, Any]], max_tasks: int) -> List[Dict[str, Any]]:
+    """Task objects among ``items`` whose titles are not in ``tasks``, up to ``max_tasks`` in all"""
+    titles = {task.get("title") for task in tasks}
+    new = []
+    for item in items:
+        if len(tasks) + len(new) >= max_tasks:
+            break
+        if isinstance(item, dict) and item.get("title") not in titles:
+            titles.add(item.get("title"))
+            new.append(item)
+    return new
+
+
+def _analysis_subset(fields: Sequence[str]) -> Type[BaseModel]:
+    """Response schema for just ``fields`` of an analysis"""
+    return create_model(
+        "GeminiAnalysisRemainder",
+        **{field: (GeminiAnalysis.model_fields[field].annotation, ...) for field in fields}
+    )
+
 class AIServiceException(BaseAPIException):
     """Raised when AI service operations fail"""
     pass
 
+class AIServiceUnavailable(AIServiceException):
+    """Raised when Gemini keeps failing (retries used up) or its circuit is open"""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message, {"retry_after": retry_after})
+        self.retry_after = retry_after
+
 class GeminiService:
-    """Service for interacting with Google Gemini AI"""
+    """Service for interacting with Google Gemini AI
 
-    def __init__(self):
-        self.client = None
-        self._initialize_client()
+    Calls go through the SDK's native async interface on one long-lived
+    client, so no executor thread is held while waiting on the model. At
+    most AI_MAX_CONCURRENCY calls are in flight; each is cut off after
+    AI_REQUEST_TIMEOUT_SECONDS. Transient failures are retried with
+    jittered backoff, a circuit breaker per model fails calls fast while
+    that model keeps failing, slow calls can be hedged, and
+    AI_FALLBACK_MODEL takes over from a failing primary model.
+    """
+
+    def __init__(self, client=None, max_concurrency: Optional[int] = None, rng: Optional[random.Random] = None):
+        self.client = client
+        self._slots = asyncio.Semaphore(max_concurrency or settings.AI_MAX_CONCURRENCY)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._rng = rng or random.Random()
+        self.retries = self.hedges = self.fallbacks = 0
+        if client is None:
+            self._initialize_client()
 
     def _initialize_client(self):
         """Initialize Gemini client"""
@@ -38,8 +214,149 @@ class GeminiService:
             logger.error("Failed to initialize Gemini client", error=str(e))
             raise AIServiceException(f"Failed to initialize Gemini client: {str(e)}")
 
+    @staticmethod
+    def _config(schema: Type[BaseModel], max_output_tokens: Optional[int] = None) -> types.GenerateContentConfig:
+        """Generation config asking for JSON matching ``schema``"""
+        return types.GenerateContentConfig(
+            temperature=settings.AI_TEMPERATURE,
+            max_output_tokens=max_output_tokens or settings.AI_MAX_TOKENS,
+            response_mime_type="application/json",
+            response_schema=schema
+        )
+
+    def breaker(self, model: str) -> CircuitBreaker:
+        """The circuit breaker guarding calls to ``model``"""
+        breaker = self._breakers.get(model)
+        if breaker is None:
+            breaker = self._breakers[model] = CircuitBreaker(
+                model,
+                failure_rate=settings.AI_BREAKER_FAILURE_RATE,
+                window=settings.AI_BREAKER_WINDOW,
+                min_calls=settings.AI_BREAKER_MIN_CALLS,
+                open_seconds=settings.AI_BREAKER_OPEN_SECONDS
+            )
+        return breaker
+
+    def _pick_model(self, primary_failures: int) -> Optional[str]:
+        """Model for the next attempt, or None while every usable model's circuit is open"""
+        primary = settings.DEFAULT_AI_MODEL
+        fallback = settings.AI_FALLBACK_MODEL if settings.AI_FALLBACK_MODEL != primary else ""
+        use_fallback = fallback and primary_failures >= settings.AI_FALLBACK_AFTER_FAILURES
+        if not use_fallback and self.breaker(primary).allow():
+            return primary
+        if fallback and self.breaker(fallback).allow():
+            return fallback
+        return None
+
+    async def _with_retries(self, call: Callable[[str], Awaitable[Any]]) -> Tuple[Any, str]:
+        """Run ``call(model)`` with retries, circuit breakers and model fallback; (result, model that answered)
+
+        Retryable failures (see ``is_retryable``) are tried again, up to
+        AI_RETRY_ATTEMPTS attempts in all, after a jittered exponential
+        backoff. Attempts go to AI_FALLBACK_MODEL, if set, once
+        AI_FALLBACK_AFTER_FAILURES attempts on DEFAULT_AI_MODEL failed or
+        while its circuit is open. Other errors are raised as they are.
+        Raises AIServiceUnavailable when the attempts are used up or no
+        model's circuit lets a call through.
+        """
+        primary_failures, error, attempts = 0, None, 0
+        for attempt in range(settings.AI_RETRY_ATTEMPTS):
+            model = self._pick_model(primary_failures)
+            if model is None:
+                break
+            attempts += 1
+            if attempt:
+                self.retries += 1
+                await asyncio.sleep(backoff_delay(
+                    attempt - 1, settings.AI_RETRY_BASE_DELAY_SECONDS, settings.AI_RETRY_MAX_DELAY_SECONDS, self._rng
+                ))
+            if model != settings.DEFAULT_AI_MODEL:
+                self.fallbacks += 1
+            breaker = self.breaker(model)
+            try:
+                result = await call(model)
+            except asyncio.CancelledError:
+                breaker.abandon()
+                raise
+            except Exception as e:
+                if not is_retryable(e):
+                    # Gemini did answer; the request itself is at fault
+                    breaker.record(True)
+                    raise
+                breaker.record(False)
+                if model == settings.DEFAULT_AI_MODEL:
+                    primary_failures += 1
+                error = e
+                logger.warning("Gemini call failed", model=model, attempt=attempt + 1, error=describe_error(e))
+                continue
+            breaker.record(True)
+            return result, model
+
+        retry_after = min(
+            (breaker.retry_after for breaker in self._breakers.values() if breaker.retry_after),
+            default=0.0
+        )
+        if error is None:
+            raise AIServiceUnavailable("Gemini circuit open; failing fast", retry_after)
+        raise AIServiceUnavailable(f"{describe_error(error)} ({attempts} attempts)", retry_after)
+
+    async def _generate(
+        self,
+        prompt: str,
+        schema: Type[BaseModel],
+        max_output_tokens: Optional[int] = None,
+    ) -> Tuple[str, str]:
+        """Run one prompt in JSON mode; (response text, model that answered)"""
+        return await self._with_retries(lambda model: self._attempt(model, prompt, schema, max_output_tokens))
+
+    async def _attempt(
+        self,
+        model: str,
+        prompt: str,
+        schema: Type[BaseModel],
+        max_output_tokens: Optional[int] = None,
+    ) -> str:
+        """One call to ``model``, hedged by an identical second call if it is slow
+
+        The hedge goes out once the first call has taken
+        AI_HEDGE_AFTER_SECONDS (0 disables hedging), and only if a
+        concurrency slot is free; whichever answers first wins.
+        """
+        async def call() -> str:
+            response = await asyncio.wait_for(
+                self.client.aio.models.generate_content(
+                    model=model,
+                    contents=prompt,
+                    config=self._config(schema, max_output_tokens)
+                ),
+                timeout=settings.AI_REQUEST_TIMEOUT_SECONDS
+            )
+            return response.text or ""
+
+        async with self._slots:
+            first = asyncio.ensure_future(call())
+            try:
+                if settings.AI_HEDGE_AFTER_SECONDS > 0:
+                    done, _ = await asyncio.wait({first}, timeout=settings.AI_HEDGE_AFTER_SECONDS)
+                    if not done and not self._slots.locked():
+                        async with self._slots:
+                            self.hedges += 1
+                            logger.info("Hedging slow Gemini call", model=model)
+                            return await first_success([first, asyncio.ensure_future(call())])
+                return await first
+            finally:
+                first.cancel()
+
     async def analyze_requirement(self, requirement_text: str) -> Dict[str, Any]:
-        """Analyze requirement text and extract information"""
+        """Analyze requirement text and extract information
+
+        The answer is constrained to the GeminiAnalysis schema. If it is cut
+        off, the fields it completed are kept and only the missing ones are
+        asked for again (up to AI_TRUNCATION_RETRIES times); fields still
+        missing after that take their FALLBACK_ANALYSIS value. The result
+        is an ``Analysis`` naming the model that answered (the fallback
+        model if it produced any part).
+        """
         if not self.client:
             raise AIServiceException("Gemini client not initialized")
 
@@ -49,72 +366,142 @@ class GeminiService:
         Requirement: {requirement_text}
 
         Please provide a JSON response with the following structure:
-        {{
-            "entities": [
-                {{
-                    "type": "feature|component|integration|data_model",
-                    "name": "entity name",
-                    "description": "brief description"
-                }}
-            ],
-            "features": ["list of main features identified"],
-            "complexity_assessment": "low|medium|high",
-            "effort_estimate": "estimated hours (integer)",
-            "confidence_score": "confidence in analysis (0.0-1.0)",
-            "suggestions": ["list of implementation suggestions"],
-            "risks": ["list of potential risks or challenges"],
-            "acceptance_criteria": ["suggested acceptance criteria"],
-            "tech_considerations": ["technical considerations"]
+        {{{_ANALYSIS_FIELDS}
         }}
 
         Focus on practical software development aspects and be specific.
         """
 
         try:
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
-                model=settings.DEFAULT_AI_MODEL,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=settings.AI_TEMPERATURE,
-                    max_output_tokens=settings.AI_MAX_TOKENS
+            text, model = await self._generate(prompt, GeminiAnalysis)
+            analysis, closed = complete_members(strip_code_fence(text))
+            retries = 0
+            while not closed and retries < settings.AI_TRUNCATION_RETRIES:
+                missing = [field for field in ANALYSIS_KEYS if field not in analysis]
+                if not missing:
+                    break
+                retries += 1
+                logger.warning("Requirement analysis truncated; asking for the rest", missing=missing)
+                text, remainder_model = await self._generate(
+                    self._remainder_prompt(requirement_text, analysis, missing), _analysis_subset(missing)
                 )
-            )
-
-            # Parse the response
-            result_text = response.text.strip()
-            if result_text.startswith("```json"):
-                result_text = result_text[7:-3]  # Remove markdown code blocks
-
-            analysis = json.loads(result_text)
-
-            logger.info("Requirement analysis completed", confidence=analysis.get("confidence_score"))
-            return analysis
-
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse Gemini response as JSON", error=str(e))
-            # Return a basic analysis if parsing fails
-            return {
-                "entities": [],
-                "features": [],
-                "complexity_assessment": "medium",
-                "effort_estimate": 8,
-                "confidence_score": 0.5,
-                "suggestions": ["Manual analysis required - AI parsing failed"],
-                "risks": ["Unable to perform detailed analysis"],
-                "acceptance_criteria": [],
-                "tech_considerations": []
-            }
+                remainder, closed = complete_members(strip_code_fence(text))
+                if remainder_model != settings.DEFAULT_AI_MODEL:
+                    model = remainder_model
+                analysis.update({field: remainder[field] for field in missing if field in remainder})
+        except AIServiceException:
+            raise
         except Exception as e:
             logger.error("Requirement analysis failed", error=str(e))
             raise AIServiceException(f"Requirement analysis failed: {str(e)}")
 
-    async def generate_tasks(self, requirement: Dict[str, Any], max_tasks: int = 10) -> List[Dict[str, Any]]:
-        """Generate tasks from requirement analysis"""
+        if not analysis:
+            logger.error("Failed to parse Gemini response as JSON")
+            return copy.deepcopy(FALLBACK_ANALYSIS)
+        if not closed:
+            missing = [field for field in ANALYSIS_KEYS if field not in analysis]
+            if missing:
+                logger.warning("Requirement analysis incomplete; using defaults", missing=missing)
+            analysis = {**copy.deepcopy(FALLBACK_ANALYSIS), **analysis}
+
+        logger.info("Requirement analysis completed", confidence=analysis.get("confidence_score"), model=model)
+        return Analysis(analysis, model)
+
+    @staticmethod
+    def _remainder_prompt(requirement_text: str, partial: Dict[str, Any], missing: List[str]) -> str:
+        return f"""
+        An analysis of the following software requirement was cut off:
+
+        Requirement: {requirement_text}
+
+        Analysis so far: {json.dumps(partial)}
+
+        Provide only the remaining fields as JSON: {", ".join(missing)}.
+        Keep them consistent with the analysis so far and be specific.
+        """
+
+    async def analyze_requirements_packed(self, texts: Dict[str, str]) -> Dict[str, Any]:
+        """Analyze several requirements (by key) with one prompt
+
+        The instructions are sent once for the whole pack and the model
+        answers with an array of analyses tagged by item number. Items the
+        answer leaves out, garbles or cuts off are re-analyzed on their own;
+        the complete ones before a cut are kept. Returns each key's
+        analysis, or the AIServiceException it failed with.
+        """
         if not self.client:
             raise AIServiceException("Gemini client not initialized")
+        keys = list(texts)
+        if len(keys) == 1:
+            return await self._analyze_each(texts)
 
+        numbered = "\n".join(f"        [{number}] {texts[key]}" for number, key in enumerate(keys, 1))
         prompt = f"""
+        Analyze each of the following software requirements and provide a structured analysis of each:
+
+{numbered}
+
+        Please provide a JSON response with one analysis per requirement, in this structure:
+        {{
+            "analyses": [
+                {{
+                    "id": "the requirement's number in brackets",{_ANALYSIS_FIELDS}
+                }}
+            ]
+        }}
+
+        Focus on practical software development aspects and be specific.
+        """
+
+        results = {}
+        try:
+            text, model = await self._generate(prompt, GeminiPackedAnalyses, settings.AI_PACKED_MAX_OUTPUT_TOKENS)
+            entries, closed = parse_array(text)
+            if not closed:
+                logger.warning("Packed Gemini response truncated", items=len(keys), complete=len(entries))
+            for entry in entries:
+                if not isinstance(entry, dict) or not all(key in entry for key in ANALYSIS_KEYS):
+                    continue
+                try:
+                    number = int(str(entry.get("id")).strip("[] "))
+                except ValueError:
+                    continue
+                # Unknown or repeated numbers are dropped; their items are rerun alone
+                if not 1 <= number <= len(keys) or keys[number - 1] in results:
+                    logger.warning("Packed Gemini response has a bad item number", id=entry.get("id"))
+                    continue
+                results[keys[number - 1]] = Analysis({field: entry[field] for field in ANALYSIS_KEYS}, model)
+        except AIServiceException as e:
+            logger.warning("Packed requirement analysis failed", items=len(keys), error=e.message)
+
+        missing = {key: texts[key] for key in keys if key not in results}
+        logger.info("Packed requirement analysis completed", items=len(keys), rerun=len(missing))
+        if missing:
+            results.update(await self._analyze_each(missing))
+        return results
+
+    async def _analyze_each(self, texts: Dict[str, str]) -> Dict[str, Any]:
+        """Analyze texts one prompt each; failures are returned, not raised"""
+        outcomes = await asyncio.gather(
+            *(self.analyze_requirement(text) for text in texts.values()), return_exceptions=True
+        )
+        results = {}
+        for key, outcome in zip(texts, outcomes):
+            if isinstance(outcome, BaseException) and not isinstance(outcome, AIServiceException):
+                raise outcome
+            results[key] = outcome
+        return results
+
+    @staticmethod
+    def _tasks_prompt(requirement: Dict[str, Any], max_tasks: int, done_titles: Sequence[str] = ()) -> str:
+        done = ""
+        if done_titles:
+            listed = "\n".join(f"        - {title}" for title in done_titles)
+            done = f"""
+        These tasks have already been generated; do not repeat them, generate only the remaining ones:
+{listed}
+"""
+        return f"""
         Based on the following requirement analysis, generate a list of development tasks:
 
         Requirement Title: {requirement.get('title', 'N/A')}
@@ -144,32 +531,105 @@ class GeminiService:
         - Code review
 
         Make tasks specific and actionable.
+        {done}"""
+
+    async def generate_tasks(self, requirement: Dict[str, Any], max_tasks: int = 10) -> List[Dict[str, Any]]:
+        """Generate tasks from requirement analysis
+
+        The answer is constrained to the GeminiTaskList schema. If it is cut
+        off, the complete tasks are kept and only the remaining ones are
+        asked for (up to AI_TRUNCATION_RETRIES times).
         """
+        if not self.client:
+            raise AIServiceException("Gemini client not initialized")
 
+        tasks: List[Dict[str, Any]] = []
         try:
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
-                model=settings.DEFAULT_AI_MODEL,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=settings.AI_TEMPERATURE,
-                    max_output_tokens=settings.AI_MAX_TOKENS
-                )
-            )
+            for _ in range(settings.AI_TRUNCATION_RETRIES + 1):
+                prompt = self._tasks_prompt(requirement, max_tasks - len(tasks), [task.get("title") for task in tasks])
+                text, _ = await self._generate(prompt, GeminiTaskList)
+                items, closed = parse_array(text)
+                tasks.extend(_new_tasks(items, tasks, max_tasks))
+                if closed or len(tasks) >= max_tasks:
+                    break
+                logger.warning("Task generation truncated; asking for the rest", task_count=len(tasks))
+        except AIServiceException:
+            raise
+        except Exception as e:
+            logger.error("Task generation failed", error=str(e))
+            raise AIServiceException(f"Task generation failed: {str(e)}")
 
-            result_text = response.text.strip()
-            if result_text.startswith("```json"):
-                result_text = result_text[7:-3]
+        logger.info("Task generation completed", task_count=len(tasks))
+        return tasks
 
-            result = json.loads(result_text)
-            tasks = result.get("tasks", [])
+    async def stream_tasks(self, requirement: Dict[str, Any], max_tasks: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """Generate tasks like ``generate_tasks``, yielding each as soon as it is complete
 
-            logger.info("Task generation completed", task_count=len(tasks))
-            return tasks
+        Uses the streaming API and an incremental parser over the response.
+        Each call holds a concurrency slot until its stream ends and fails if
+        no chunk arrives for AI_REQUEST_TIMEOUT_SECONDS. A cut-off stream is
+        continued like in ``generate_tasks``, asking only for the rest.
+        """
+        if not self.client:
+            raise AIServiceException("Gemini client not initialized")
 
-        except Exception as e:
-            logger.error("Task generation failed", error=str(e))
-            raise AIServiceException(f"Task generation failed: {str(e)}")
+        tasks: List[Dict[str, Any]] = []
+        for _ in range(settings.AI_TRUNCATION_RETRIES + 1):
+            parser = JSONArrayStream()
+            prompt = self._tasks_prompt(requirement, max_tasks - len(tasks), [task.get("title") for task in tasks])
+            async with aclosing(self._stream_array(prompt, GeminiTaskList, parser)) as items:
+                async for item in items:
+                    for task in _new_tasks([item], tasks, max_tasks):
+                        tasks.append(task)
+                        yield task
+                    if len(tasks) >= max_tasks:
+                        break
+            if parser.closed or len(tasks) >= max_tasks:
+                break
+            logger.warning("Streaming task generation truncated; asking for the rest", task_count=len(tasks))
+
+        logger.info("Streaming task generation completed", task_count=len(tasks), skipped=parser.skipped)
+
+    async def _stream_array(self, prompt: str, schema: Type[BaseModel], parser: JSONArrayStream) -> AsyncIterator[Any]:
+        """Stream one prompt in JSON mode, yielding the array elements ``parser`` completes"""
+        timeout = settings.AI_REQUEST_TIMEOUT_SECONDS
+
+        async def open_stream(model: str):
+            # The request only goes out when the first chunk is read
+            stream = await self.client.aio.models.generate_content_stream(
+                model=model,
+                contents=prompt,
+                config=self._config(schema)
+            )
+            chunks = stream.__aiter__()
+            try:
+                return await chunks.__anext__(), chunks
+            except StopAsyncIteration:
+                return None, chunks
+
+        async with self._slots:
+            try:
+                # Getting the first chunk is retried like any call; a stream
+                # that fails part way is not, since its items were already used
+                (chunk, chunks), _ = await self._with_retries(
+                    lambda model: asyncio.wait_for(open_stream(model), timeout=timeout)
+                )
+                while chunk is not None:
+                    for item in parser.feed(chunk.text or ""):
+                        yield item
+                    if parser.closed:
+                        break
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), timeout=timeout)
+                    except StopAsyncIteration:
+                        break
+            except asyncio.TimeoutError:
+                raise AIServiceException(f"Gemini stream stalled for {timeout:g}s")
+            except AIServiceException:
+                raise
+            except Exception as e:
+                logger.error("Streaming task generation failed", error=str(e))
+                raise AIServiceException(f"Task generation failed: {str(e)}")
 
 # Global service instance
 gemini_service = GeminiService()
@@ -0,0 +1,156 @@
+"""
+Background Job Service
+
+Long AI operations (requirement analysis, task generation) can run as
+jobs: the request records an ``AgentAction`` and returns at once, the
+job runner does the work, and the client polls the job or subscribes to
+its events. Jobs are recorded against one system agent per job type.
+"""
+import uuid
+from typing import AsyncIterator, Dict, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import undefer
+from fastapi import HTTPException, status
+import structlog
+
+from app.background.job_runner import job_runner
+from app.config.settings import get_settings
+from app.models.agent import ActionStatus, AgentAction, AgentStatus, AgentType, AIAgent
+from app.models.requirement import Requirement
+from app.repositories.ownership import owned_project
+from app.repositories.writes import insert_returning
+from app.schemas.job import JobResponse, JobType
+
+settings = get_settings()
+logger = structlog.get_logger(__name__)
+
+# System agents jobs are recorded against: (name, agent type), by job type
+JOB_AGENTS = {
+    JobType.REQUIREMENT_ANALYSIS: ("Requirement Analyzer", AgentType.ANALYSIS),
+    JobType.TASK_GENERATION: ("Task Planner", AgentType.TASK_PLANNER),
+}
+
+FINISHED_STATUSES = (ActionStatus.COMPLETED, ActionStatus.FAILED)
+
+
+def job_agent_id(job_type: JobType) -> str:
+    """Fixed id of the system agent for ``job_type``, the same in every process"""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"keystone:agent:{job_type.value}"))
+
+
+def job_response(job: AgentAction, result: Optional[dict] = None) -> JobResponse:
+    """JobResponse for an AgentAction; ``result`` is its (deferred) output_data"""
+    return JobResponse(
+        id=job.id,
+        type=job.action_type,
+        status=job.status,
+        target_type=job.target_type,
+        target_id=job.target_id,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        execution_time_ms=job.execution_time_ms,
+        result=result,
+        error=job.error_message
+    )
+
+
+class JobService:
+    """Service for submitting and following background AI jobs"""
+
+    async def submit_requirement_job(
+        self,
+        db: AsyncSession,
+        job_type: JobType,
+        requirement_id: str,
+        user_id: str,
+        input_data: Optional[Dict] = None
+    ) -> JobResponse:
+        """Record a pending job on one of the user's requirements and queue it"""
+        requirement = await db.scalar(
+            select(Requirement.id)
+            .where(Requirement.id == requirement_id)
+            .where(Requirement.is_deleted == False)
+            .where(owned_project(Requirement.project_id, user_id))
+        )
+        if requirement is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Requirement not found or access denied"
+            )
+
+        await self._create_agent(db, job_type)
+        job = await insert_returning(db, AgentAction, {
+            "agent_id": job_agent_id(job_type),
+            "action_type": job_type.value,
+            "status": ActionStatus.PENDING,
+            "target_type": "requirement",
+            "target_id": requirement,
+            "input_data": input_data or {},
+            "requested_by": user_id,
+        })
+        await db.commit()
+        job_runner.submit(job.id)
+
+        logger.info("Job submitted", job_id=job.id, job_type=job_type.value, requirement_id=requirement)
+        return job_response(job)
+
+    async def _create_agent(self, db: AsyncSession, job_type: JobType):
+        """Insert the job type's system agent if it does not exist yet"""
+        name, agent_type = JOB_AGENTS[job_type]
+        dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+        await db.execute(
+            dialect.insert(AIAgent)
+            .values(
+                id=job_agent_id(job_type), name=name, agent_type=agent_type.value, status=AgentStatus.ACTIVE.value
+            )
+            .on_conflict_do_nothing(index_elements=[AIAgent.id])
+        )
+
+    async def get_job(self, db: AsyncSession, job_id: str, user_id: str) -> JobResponse:
+        """The user's job with its result once finished, or 404"""
+        job = await db.scalar(
+            select(AgentAction)
+            .where(AgentAction.id == job_id)
+            .where(AgentAction.requested_by == user_id)
+            .options(undefer(AgentAction.output_data))
+        )
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+        return job_response(job, job.output_data)
+
+    async def job_events(
+        self,
+        session_factory: async_sessionmaker,
+        job_id: str,
+        user_id: str
+    ) -> AsyncIterator[Tuple[str, object]]:
+        """Yield ``("job", job)`` on every status change until the job finishes
+
+        Jobs run by this process wake the stream as soon as they change;
+        others are re-read every JOB_EVENTS_POLL_SECONDS. Each read uses
+        a short session of its own.
+        """
+        last_status = None
+        while True:
+            seen = job_runner.changes
+            async with session_factory() as db:
+                try:
+                    job = await self.get_job(db, job_id, user_id)
+                except HTTPException as e:
+                    yield "error", {"detail": e.detail}
+                    return
+            if job.status != last_status:
+                last_status = job.status
+                yield "job", job.model_dump(mode="json")
+            if job.status in FINISHED_STATUSES:
+                return
+            await job_runner.wait_for_change(seen, settings.JOB_EVENTS_POLL_SECONDS)
+
+# Global job service instance
+job_service = JobService()
@@ -11,6 +11,8 @@ import structlog
 
 from app.config.settings import get_settings
 from app.models.user import User
+from app.repositories.loader import get_loader
+from app.repositories.writes import insert_returning
 from app.schemas.user import UserResponse
 
 settings = get_settings()
@@ -272,18 +274,16 @@ class KeycloakAuthService:
 
         if not user:
             # Create new user in local DB
-            user = User(
-                email=keycloak_user["email"],
-                username=keycloak_user["preferred_username"],
-                first_name=keycloak_user.get("given_name", ""),
-                last_name=keycloak_user.get("family_name", ""),
-                hashed_password="",  # Not needed for Keycloak users
-                is_active=True,
-                is_verified=keycloak_user.get("email_verified", False)
-            )
-            db.add(user)
+            user = await insert_returning(db, User, {
+                "email": keycloak_user["email"],
+                "username": keycloak_user["preferred_username"],
+                "first_name": keycloak_user.get("given_name", ""),
+                "last_name": keycloak_user.get("family_name", ""),
+                "hashed_password": "",  # Not needed for Keycloak users
+                "is_active": True,
+                "is_verified": keycloak_user.get("email_verified", False),
+            })
             await db.commit()
-            await db.refresh(user)
         else:
             # Update existing user
             user.first_name = keycloak_user.get("given_name", user.first_name)
@@ -291,6 +291,7 @@ class KeycloakAuthService:
             user.is_verified = keycloak_user.get("email_verified", user.is_verified)
             await db.commit()
 
+        get_loader(db).prime(user)
         return user
 
     async def _get_jwks(self) -> Dict[str, Any]:
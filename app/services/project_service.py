@@ -3,39 +3,70 @@ Project Service
 """
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, update
 from fastapi import HTTPException, status
 import structlog
 
+from app.config.database import release_connection
 from app.models.project import Project
+from app.models.requirement import Requirement
+from app.models.task import Task, TaskStatus
 from app.models.user import User
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse
+from app.schemas.requirement import RequirementStatus
+from app.utils.helpers import calculate_progress_percentage
+from app.repositories.loader import get_loader
+from app.repositories.ownership import forget_project, remember_project
+from app.repositories.writes import insert_returning, update_returning
+from app.models.audit import ActionType, EntityType
+from app.services.audit_service import audit_service
+from app.models.archive import ARCHIVE_TABLES
+from app.background.archiver import archiver
 
 logger = structlog.get_logger(__name__)
 
+
+def _count_live_requirements(*conditions):
+    """Correlated COUNT of a project's live requirements, evaluated per project row"""
+    return (
+        select(func.count(Requirement.id))
+        .where(Requirement.project_id == Project.id)
+        .where(Requirement.is_deleted == False)
+        .where(*conditions)
+        .correlate(Project)
+        .scalar_subquery()
+    )
+
+
+def _count_live_tasks(*conditions):
+    """Correlated COUNT of a project's live tasks, evaluated per project row"""
+    return (
+        select(func.count(Task.id))
+        .where(Task.project_id == Project.id)
+        .where(Task.is_deleted == False)
+        .where(*conditions)
+        .correlate(Project)
+        .scalar_subquery()
+    )
+
+
 class ProjectService:
     """Service for managing projects"""
 
     async def create_project(self, db: AsyncSession, project_data: ProjectCreate, owner_id: int) -> Project:
         """Create a new project"""
         try:
-            db_project = Project(
-                name=project_data.name,
-                description=project_data.description,
-                status=project_data.status,
-                priority=project_data.priority,
-                start_date=project_data.start_date,
-                end_date=project_data.end_date,
-                budget=project_data.budget,
-                owner_id=owner_id
-            )
-            
-            db.add(db_project)
+            db_project = await insert_returning(db, Project, {
+                **project_data.model_dump(),
+                "owner_id": owner_id,
+            })
             await db.commit()
-            await db.refresh(db_project)
-            
+
             logger.info("Project created successfully", project_id=db_project.id, owner_id=owner_id)
+            audit_service.record(
+                ActionType.CREATE, EntityType.PROJECT, db_project.id, "Project created",
+                user_id=owner_id, new_values=project_data.model_dump(mode="json")
+            )
             return db_project
             
         except Exception as e:
@@ -47,16 +78,23 @@ class ProjectService:
             )
 
     async def get_project_by_id(self, db: AsyncSession, project_id: int, user_id: int) -> Optional[Project]:
-        """Get project by ID with user access check"""
+        """Get project by ID with user access check, memoized for the request"""
+        loader = get_loader(db)
+        project = loader.peek(Project, project_id)
+        if project is not None:
+            return project if project.owner_id == user_id and not project.is_deleted else None
         try:
             result = await db.execute(
                 select(Project)
-                .options(selectinload(Project.requirements))
                 .where(Project.id == project_id)
                 .where(Project.owner_id == user_id)
                 .where(Project.is_deleted == False)
             )
-            return result.scalar_one_or_none()
+            project = result.scalar_one_or_none()
+            if project is not None:
+                loader.prime(project)
+                remember_project(db, project.id, user_id)
+            return project
         except Exception as e:
             logger.error("Failed to get project", project_id=project_id, error=str(e))
             return None
@@ -78,21 +116,23 @@ class ProjectService:
             )
             total = count_result.scalar()
 
-            # Get projects
+            # Get projects; requirement counts are aggregated in the same
+            # statement instead of loading every requirement row
             result = await db.execute(
-                select(Project)
-                .options(selectinload(Project.requirements))
+                select(Project, _count_live_requirements().label("requirements_count"))
                 .where(Project.owner_id == user_id)
                 .where(Project.is_deleted == False)
                 .offset(skip)
                 .limit(limit)
                 .order_by(Project.updated_at.desc())
             )
-            projects = result.scalars().all()
+
+            rows = result.all()
+            await release_connection(db)
 
             # Convert to response format
             project_responses = []
-            for project in projects:
+            for project, requirements_count in rows:
                 project_response = ProjectResponse(
                     id=project.id,
                     name=project.name,
@@ -105,15 +145,15 @@ class ProjectService:
                     owner_id=project.owner_id,
                     created_at=project.created_at,
                     updated_at=project.updated_at,
-                    requirements_count=len(project.requirements)
+                    requirements_count=requirements_count
                 )
                 project_responses.append(project_response)
 
             return ProjectListResponse(
                 projects=project_responses,
                 total=total,
-                page=skip // limit + 1 if limit > 0 else 1,
-                page_size=limit
+                skip=skip,
+                limit=limit
             )
 
         except Exception as e:
@@ -132,27 +172,21 @@ class ProjectService:
     ) -> Optional[Project]:
         """Update a project"""
         try:
-            # Get project
-            result = await db.execute(
-                select(Project)
-                .where(Project.id == project_id)
-                .where(Project.owner_id == user_id)
-                .where(Project.is_deleted == False)
+            # Ownership check, update and read-back in one statement
+            project = await update_returning(
+                db, Project,
+                (Project.id == project_id, Project.owner_id == user_id, Project.is_deleted == False),
+                project_data.model_dump(exclude_unset=True)
             )
-            project = result.scalar_one_or_none()
-            
             if not project:
                 return None
-
-            # Update fields
-            update_data = project_data.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(project, field, value)
-
             await db.commit()
-            await db.refresh(project)
-            
+
             logger.info("Project updated successfully", project_id=project_id)
+            audit_service.record(
+                ActionType.UPDATE, EntityType.PROJECT, project_id, "Project updated",
+                user_id=user_id, new_values=project_data.model_dump(exclude_unset=True, mode="json")
+            )
             return project
 
         except Exception as e:
@@ -167,20 +201,23 @@ class ProjectService:
         """Soft delete a project"""
         try:
             result = await db.execute(
-                select(Project)
+                update(Project)
                 .where(Project.id == project_id)
                 .where(Project.owner_id == user_id)
                 .where(Project.is_deleted == False)
+                .values(is_deleted=True)
+                .execution_options(synchronize_session=False)
             )
-            project = result.scalar_one_or_none()
-            
-            if not project:
+
+            if result.rowcount == 0:
                 return False
 
-            project.is_deleted = True
             await db.commit()
+            forget_project(db, project_id)
+            get_loader(db).forget(Project, project_id)
             
             logger.info("Project deleted successfully", project_id=project_id)
+            audit_service.record(ActionType.DELETE, EntityType.PROJECT, project_id, "Project deleted", user_id=user_id)
             return True
 
         except Exception as e:
@@ -191,13 +228,72 @@ class ProjectService:
                 detail="Failed to delete project"
             )
 
+    async def restore_project(self, db: AsyncSession, project_id: str, user_id: str) -> bool:
+        """Undo a soft delete, bringing the project back from the archive if it was moved"""
+        try:
+            result = await db.execute(
+                update(Project)
+                .where(Project.id == project_id)
+                .where(Project.owner_id == user_id)
+                .where(Project.is_deleted == True)
+                .values(is_deleted=False)
+                .execution_options(synchronize_session=False)
+            )
+            restored = result.rowcount > 0
+
+            if not restored:
+                archived_projects = ARCHIVE_TABLES["projects"]
+                owned = await db.scalar(
+                    select(archived_projects.c.id)
+                    .where(archived_projects.c.id == project_id)
+                    .where(archived_projects.c.owner_id == user_id)
+                )
+                restored = bool(owned) and await archiver.restore(db, "projects", project_id)
+
+            if not restored:
+                return False
+
+            await db.commit()
+            get_loader(db).forget(Project, project_id)
+            logger.info("Project restored successfully", project_id=project_id)
+            audit_service.record(ActionType.UPDATE, EntityType.PROJECT, project_id, "Project restored", user_id=user_id)
+            return True
+
+        except Exception as e:
+            await db.rollback()
+            logger.error("Failed to restore project", project_id=project_id, error=str(e))
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to restore project"
+            )
+
     async def get_project_stats(self, db: AsyncSession, project_id: str, user_id: str) -> Optional[dict]:
         """Get project statistics"""
-        project = await self.get_project_by_id(db, project_id, user_id)
-        if not project:
+        result = await db.execute(
+            select(
+                _count_live_requirements().label("total_requirements"),
+                _count_live_requirements(
+                    Requirement.status == RequirementStatus.IMPLEMENTED
+                ).label("completed_requirements"),
+                _count_live_tasks().label("total_tasks"),
+                _count_live_tasks(Task.status == TaskStatus.COMPLETED).label("completed_tasks"),
+            )
+            .where(Project.id == project_id)
+            .where(Project.owner_id == user_id)
+            .where(Project.is_deleted == False)
+        )
+        row = result.one_or_none()
+        if row is None:
             return None
-        # Placeholder for stats logic
-        return {"requirements_count": len(project.requirements), "status": project.status, "budget": project.budget}
+
+        return {
+            "total_requirements": row.total_requirements,
+            "completed_requirements": row.completed_requirements,
+            "total_tasks": row.total_tasks,
+            "completed_tasks": row.completed_tasks,
+            "team_members": 1,  # Owner only until team membership is persisted
+            "progress_percentage": calculate_progress_percentage(row.completed_tasks, row.total_tasks)
+        }
 
     async def get_project_team(self, db: AsyncSession, project_id: str, user_id: str) -> list:
         """Get project team members"""
@@ -216,11 +312,22 @@ class ProjectService:
 
     async def update_project_status(self, db: AsyncSession, project_id: str, status: str, user_id: str) -> bool:
         """Update project status"""
-        project = await self.get_project_by_id(db, project_id, user_id)
-        if not project:
+        result = await db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .where(Project.owner_id == user_id)
+            .where(Project.is_deleted == False)
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
             return False
-        project.status = status
         await db.commit()
+        get_loader(db).forget(Project, project_id)
+        audit_service.record(
+            ActionType.UPDATE, EntityType.PROJECT, project_id, "Project status changed",
+            user_id=user_id, new_values={"status": str(status)}
+        )
         return True
 
     async def get_project_timeline(self, db: AsyncSession, project_id: str, user_id: str) -> Optional[dict]:
@@ -90,3 +90,6 @@ ReportsService = ReportService
 
 # Global report service instance
 report_service = ReportService()
+
+# Name used by the reports endpoints
+reports_service = report_service
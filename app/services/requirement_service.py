@@ -1,25 +1,187 @@
 """
 Requirement Service
 """
-from typing import List, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+import asyncio
+import math
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import case, inspect, literal, select, func, update, insert
+from sqlalchemy.orm import undefer_group
 from fastapi import HTTPException, status
 import structlog
 
+from app.config.database import release_connection
+from app.config.settings import get_settings
+from app.models.base import LARGE_COLUMNS
 from app.models.requirement import Requirement
-from app.models.task import Task
+from app.models.task import Task, TaskDependency, TaskPriority, TaskStatus, TaskType
 from app.models.project import Project
 from app.schemas.requirement import (
     RequirementCreate, RequirementUpdate, RequirementResponse,
-    RequirementListResponse, RequirementAnalysisResponse
+    RequirementListResponse, RequirementAnalysisResponse, RequirementBatchAnalysisItem,
+    RequirementBatchAnalysisResponse, TagFacet, TagFacetResponse
 )
-from app.schemas.task import TaskResponse
-from app.services.gemini_service import gemini_service
-
+from app.schemas.task import TaskResponse, TaskDependencyResponse, TaskGenerationResponse
+from app.services.analysis_cache_service import analysis_cache_key, analysis_cache_service
+from app.services.gemini_service import AIServiceException, AIServiceUnavailable, gemini_service, pack_requirements
+from app.services.task_service import task_service
+from app.services.audit_service import audit_service
+from app.models.audit import ActionType, EntityType
+from app.utils.helpers import canonical_id, topological_order
+from app.repositories.loader import get_loader
+from app.repositories.ownership import is_project_verified, owned_project, remember_project, verify_project_access
+from app.repositories.writes import insert_returning, update_returning
+from app.repositories.tags import TAG_MATCH_ANY, clean_tags, sync_requirement_tags, tag_facet_query, tag_filter
+
+settings = get_settings()
 logger = structlog.get_logger(__name__)
 
+# Columns every requirement list row carries
+REQUIREMENT_LIST_COLUMNS = (
+    Requirement.id,
+    Requirement.title,
+    Requirement.type,
+    Requirement.priority,
+    Requirement.status,
+    Requirement.acceptance_criteria,
+    Requirement.tags,
+    Requirement.project_id,
+    Requirement.created_by,
+    Requirement.created_at,
+    Requirement.updated_at,
+)
+
+# Large text/JSON columns that list endpoints only return on request
+REQUIREMENT_OPTIONAL_COLUMNS = {
+    "description": Requirement.description,
+    "ai_analysis": Requirement.ai_analysis,
+}
+
+
+def requirement_list_columns(include: Optional[Iterable[str]] = None) -> list:
+    """Resolve the columns to select for a requirement list page"""
+    requested = set(include or ())
+    unknown = requested - REQUIREMENT_OPTIONAL_COLUMNS.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include fields: {', '.join(sorted(unknown))}"
+        )
+    return [*REQUIREMENT_LIST_COLUMNS, *(
+        column for name, column in REQUIREMENT_OPTIONAL_COLUMNS.items() if name in requested
+    )]
+
+
+def requirement_response_from_row(row) -> RequirementResponse:
+    """Build a RequirementResponse straight from a projected result row"""
+    data = dict(row._mapping)
+    data.pop("total_count", None)
+    data["acceptance_criteria"] = data["acceptance_criteria"] or []
+    data["tags"] = data["tags"] or []
+    return RequirementResponse.model_validate(data)
+
+
+# Gemini complexity_assessment mapped onto the 1-10 complexity scale
+COMPLEXITY_SCORES = {"low": 3.0, "medium": 5.0, "high": 8.0}
+
+
+def analysis_response(requirement_id: str, analysis: dict, analyzed_at, cached: bool = False) -> RequirementAnalysisResponse:
+    """Map a Gemini requirement analysis onto the API response"""
+    try:
+        estimated_effort = int(float(analysis.get("effort_estimate") or 0))
+    except (TypeError, ValueError):
+        estimated_effort = 0
+    return RequirementAnalysisResponse(
+        requirement_id=requirement_id,
+        complexity_score=COMPLEXITY_SCORES.get(str(analysis.get("complexity_assessment", "")).lower(), 0.0),
+        estimated_effort=estimated_effort,
+        analysis_summary=", ".join(str(feature) for feature in analysis.get("features") or []),
+        recommendations=[str(suggestion) for suggestion in analysis.get("suggestions") or []],
+        analyzed_at=analyzed_at,
+        cached=cached
+    )
+
+
+# Generated task "type" values mapped onto TaskType
+GENERATED_TASK_TYPES = {
+    "bug": TaskType.BUG_FIX,
+    "testing": TaskType.TESTING,
+    "documentation": TaskType.DOCUMENTATION,
+    "devops": TaskType.DEPLOYMENT,
+}
+
+
+def ai_unavailable(error: AIServiceUnavailable) -> HTTPException:
+    """503 telling the client when Gemini may be worth trying again"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="AI service temporarily unavailable",
+        headers={"Retry-After": str(max(1, math.ceil(error.retry_after)))}
+    )
+
+
+def generated_task_row(task_data: dict, project_id: str, requirement_id: str, user_id: str) -> dict:
+    """Map one AI-generated task onto a tasks row, tolerating loose values"""
+    priority = str(task_data.get("priority") or "").lower()
+    try:
+        estimated_hours = float(task_data.get("estimated_hours"))
+    except (TypeError, ValueError):
+        estimated_hours = None
+    return {
+        "title": (task_data.get("title") or "Untitled Task")[:255],
+        "description": task_data.get("description", ""),
+        "task_type": GENERATED_TASK_TYPES.get(task_data.get("type"), TaskType.DEVELOPMENT),
+        "priority": priority if priority in {p.value for p in TaskPriority} else TaskPriority.MEDIUM,
+        "status": TaskStatus.PENDING,
+        "estimated_hours": estimated_hours,
+        "acceptance_criteria": task_data.get("acceptance_criteria") or [],
+        "ai_generated": True,
+        "project_id": project_id,
+        "requirement_id": requirement_id,
+        "created_by": user_id,
+    }
+
+
+def generation_prompt_data(requirement) -> dict:
+    """What the task generation prompt is given about a requirement"""
+    return {
+        "title": requirement.title,
+        "description": requirement.description,
+        "ai_analysis": requirement.ai_analysis or {}
+    }
+
+
+def resolve_task_dependencies(tasks_data: List[dict]) -> List[Tuple[int, int]]:
+    """Turn title-based dependencies into (task, depends_on) index pairs
+
+    Titles are matched case-insensitively; unknown titles and
+    self-references are dropped.
+    """
+    positions = {}
+    for index, task_data in enumerate(tasks_data):
+        title = str(task_data.get("title") or "").strip().lower()
+        positions.setdefault(title, index)
+
+    edges = set()
+    for index, task_data in enumerate(tasks_data):
+        for title in task_data.get("dependencies") or []:
+            dependency = positions.get(str(title).strip().lower())
+            if dependency is None:
+                logger.warning("Dropping unknown task dependency", task=task_data.get("title"), dependency=title)
+            elif dependency != index:
+                edges.add((index, dependency))
+    return sorted(edges)
+
+
+def order_dependencies(count: int, edges: List[Tuple[int, int]]) -> Optional[List[Tuple[int, int]]]:
+    """Edges in topological order of their tasks (dependencies first), or None if they form a cycle"""
+    order = topological_order(count, edges)
+    if order is None:
+        return None
+    position = {node: index for index, node in enumerate(order)}
+    return sorted(edges, key=lambda edge: (position[edge[0]], position[edge[1]]))
+
+
 class RequirementService:
     """Service for managing requirements"""
 
@@ -31,38 +193,26 @@ class RequirementService:
     ) -> Requirement:
         """Create a new requirement"""
         try:
-            # Verify project ownership
-            result = await db.execute(
-                select(Project)
-                .where(Project.id == requirement_data.project_id)
-                .where(Project.owner_id == user_id)
-                .where(Project.is_deleted == False)
-            )
-            project = result.scalar_one_or_none()
-
-            if not project:
+            # Verify project ownership (memoized for the request)
+            if not await verify_project_access(db, requirement_data.project_id, user_id):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Project not found or access denied"
                 )
 
-            db_requirement = Requirement(
-                title=requirement_data.title,
-                description=requirement_data.description,
-                type=requirement_data.type,
-                priority=requirement_data.priority,
-                status=requirement_data.status,
-                acceptance_criteria=requirement_data.acceptance_criteria,
-                tags=requirement_data.tags,
-                project_id=requirement_data.project_id,
-                created_by=user_id
-            )
-
-            db.add(db_requirement)
+            db_requirement = await insert_returning(db, Requirement, {
+                **requirement_data.model_dump(exclude={"tags"}),
+                "tags": clean_tags(requirement_data.tags),
+                "created_by": user_id,
+            }, options=(undefer_group(LARGE_COLUMNS),))
+            await sync_requirement_tags(db, db_requirement.id, db_requirement.tags, replace=False)
             await db.commit()
-            await db.refresh(db_requirement)
 
             logger.info("Requirement created successfully", requirement_id=db_requirement.id, user_id=user_id)
+            audit_service.record(
+                ActionType.CREATE, EntityType.REQUIREMENT, db_requirement.id, "Requirement created",
+                user_id=user_id, new_values=requirement_data.model_dump(mode="json")
+            )
             return db_requirement
 
         except HTTPException:
@@ -81,17 +231,31 @@ class RequirementService:
         requirement_id: str,  # Changed from int to str
         user_id: str  # Changed from int to str
     ) -> Optional[Requirement]:
-        """Get requirement by ID with user access check"""
+        """Get requirement by ID with user access check, memoized for the request"""
+        loader = get_loader(db)
+        requirement = loader.peek(Requirement, requirement_id)
+        if (
+            requirement is not None
+            and is_project_verified(db, requirement.project_id, user_id)
+            and not inspect(requirement).unloaded & REQUIREMENT_OPTIONAL_COLUMNS.keys()
+        ):
+            return None if requirement.is_deleted else requirement
         try:
+            # Fills in the large columns of a memoized requirement as well
             result = await db.execute(
                 select(Requirement)
                 .join(Project)
-                .options(selectinload(Requirement.tasks))
+                .options(undefer_group(LARGE_COLUMNS))
                 .where(Requirement.id == requirement_id)
                 .where(Project.owner_id == user_id)
+                .where(Project.is_deleted == False)
                 .where(Requirement.is_deleted == False)
             )
-            return result.scalar_one_or_none()
+            requirement = result.scalar_one_or_none()
+            if requirement is not None:
+                loader.prime(requirement)
+                remember_project(db, requirement.project_id, user_id)
+            return requirement
         except Exception as e:
             logger.error("Failed to get requirement", requirement_id=requirement_id, error=str(e))
             return None
@@ -102,70 +266,56 @@ class RequirementService:
         project_id: str,  # Changed from int to str
         user_id: str,  # Changed from int to str
         skip: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        include: Optional[Iterable[str]] = None,
+        tags: Optional[List[str]] = None,
+        tag_match: str = TAG_MATCH_ANY
     ) -> RequirementListResponse:
-        """Get requirements for a project with pagination"""
+        """Get requirements for a project with pagination, optionally filtered by tag"""
         try:
-            # Verify project ownership
-            result = await db.execute(
-                select(Project)
-                .where(Project.id == project_id)
-                .where(Project.owner_id == user_id)
-                .where(Project.is_deleted == False)
+            columns = requirement_list_columns(include)
+
+            # Ownership check, total count and page in one statement: the
+            # owner predicate is an EXISTS and the total a window count.
+            # Requirements are plain column rows; no ORM identity map or
+            # relationship loading for a read-only page.
+            live_requirements = (
+                Requirement.project_id == project_id,
+                Requirement.is_deleted == False,
+                *self._tag_filters(tags, tag_match),
             )
-            project = result.scalar_one_or_none()
-
-            if not project:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Project not found or access denied"
-                )
-
-            # Get total count
-            count_result = await db.execute(
-                select(func.count(Requirement.id))
-                .where(Requirement.project_id == project_id)
-                .where(Requirement.is_deleted == False)
-            )
-            total = count_result.scalar()
-
-            # Get requirements
             result = await db.execute(
-                select(Requirement)
-                .options(selectinload(Requirement.tasks))
-                .where(Requirement.project_id == project_id)
-                .where(Requirement.is_deleted == False)
+                select(*columns, func.count().over().label("total_count"))
+                .where(*live_requirements)
+                .where(owned_project(project_id, user_id))
                 .offset(skip)
                 .limit(limit)
                 .order_by(Requirement.updated_at.desc())
             )
-            requirements = result.scalars().all()
-
-            # Convert to response format
-            requirement_responses = [
-                RequirementResponse(
-                    id=req.id,
-                    title=req.title,
-                    description=req.description,
-                    type=req.type,
-                    priority=req.priority,
-                    status=req.status,
-                    acceptance_criteria=req.acceptance_criteria or [],
-                    tags=req.tags or [],
-                    project_id=req.project_id,
-                    created_by=req.created_by,
-                    created_at=req.created_at,
-                    updated_at=req.updated_at,
-                    ai_analysis=req.ai_analysis
-                )
-                for req in requirements
-            ]
-
+            rows = result.all()
+
+            if rows:
+                remember_project(db, project_id, user_id)
+                total = rows[0].total_count
+            else:
+                # An empty page is either a missing project or a page past the end
+                if not await verify_project_access(db, project_id, user_id):
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Project not found or access denied"
+                    )
+                total = 0
+                if skip:
+                    total = await db.scalar(
+                        select(func.count(Requirement.id)).where(*live_requirements)
+                    )
+
+            await release_connection(db)
             return RequirementListResponse(
-                requirements=requirement_responses,
+                requirements=[requirement_response_from_row(row) for row in rows],
                 total=total,
-                page=skip // limit + 1 if limit > 0 else 1,
-                page_size=limit
+                skip=skip,
+                limit=limit
             )
 
         except HTTPException:
@@ -182,61 +332,50 @@ class RequirementService:
         db: AsyncSession,
         user_id: str,  # Changed to str for UUID
         skip: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        include: Optional[Iterable[str]] = None,
+        tags: Optional[List[str]] = None,
+        tag_match: str = TAG_MATCH_ANY
     ) -> RequirementListResponse:
-        """Get all requirements for a user across all their projects"""
+        """Get all requirements for a user across all their projects, optionally filtered by tag"""
         try:
-            # Get total count
-            count_result = await db.execute(
-                select(func.count(Requirement.id))
-                .join(Project)
-                .where(Project.owner_id == user_id)
-                .where(Requirement.is_deleted == False)
-                .where(Project.is_deleted == False)
+            columns = requirement_list_columns(include)
+
+            owned_requirements = (
+                Project.owner_id == user_id,
+                Requirement.is_deleted == False,
+                Project.is_deleted == False,
+                *self._tag_filters(tags, tag_match),
             )
-            total = count_result.scalar()
 
-            # Get requirements
+            # Get requirements with the total as a window count
             result = await db.execute(
-                select(Requirement)
+                select(*columns, func.count().over().label("total_count"))
                 .join(Project)
-                .options(selectinload(Requirement.tasks))
-                .where(Project.owner_id == user_id)
-                .where(Requirement.is_deleted == False)
-                .where(Project.is_deleted == False)
+                .where(*owned_requirements)
                 .offset(skip)
                 .limit(limit)
                 .order_by(Requirement.updated_at.desc())
             )
-            requirements = result.scalars().all()
-
-            # Convert to response format
-            requirement_responses = [
-                RequirementResponse(
-                    id=req.id,
-                    title=req.title,
-                    description=req.description,
-                    type=req.type,
-                    priority=req.priority,
-                    status=req.status,
-                    acceptance_criteria=req.acceptance_criteria or [],
-                    tags=req.tags or [],
-                    project_id=req.project_id,
-                    created_by=req.created_by,
-                    created_at=req.created_at,
-                    updated_at=req.updated_at,
-                    ai_analysis=req.ai_analysis
+            rows = result.all()
+
+            total = rows[0].total_count if rows else 0
+            if not rows and skip:
+                # Page past the end; fall back to a plain count
+                total = await db.scalar(
+                    select(func.count(Requirement.id)).join(Project).where(*owned_requirements)
                 )
-                for req in requirements
-            ]
 
+            await release_connection(db)
             return RequirementListResponse(
-                requirements=requirement_responses,
+                requirements=[requirement_response_from_row(row) for row in rows],
                 total=total,
-                page=skip // limit + 1 if limit > 0 else 1,
-                page_size=limit
+                skip=skip,
+                limit=limit
             )
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error("Failed to get user requirements", user_id=user_id, error=str(e))
             raise HTTPException(
@@ -244,6 +383,33 @@ class RequirementService:
                 detail="Failed to retrieve requirements"
             )
 
+    def _tag_filters(self, tags: Optional[List[str]], tag_match: str) -> tuple:
+        """WHERE clauses for a list endpoint's tag filter (none when no tags given)"""
+        if not tags or not any(str(tag).strip() for tag in tags):
+            return ()
+        return (tag_filter(Requirement.id, tags, tag_match),)
+
+    async def get_tag_facets(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        project_id: Optional[str] = None
+    ) -> TagFacetResponse:
+        """Requirement counts per tag across the user's projects (or one project)"""
+        requirement_ids = (
+            select(Requirement.id)
+            .join(Project)
+            .where(Project.owner_id == user_id)
+            .where(Project.is_deleted == False)
+            .where(Requirement.is_deleted == False)
+        )
+        if project_id:
+            requirement_ids = requirement_ids.where(Requirement.project_id == project_id)
+
+        rows = (await db.execute(tag_facet_query(requirement_ids))).all()
+        await release_connection(db)
+        return TagFacetResponse(facets=[TagFacet(tag=row.tag, count=row.count) for row in rows])
+
     async def update_requirement(
         self,
         db: AsyncSession,
@@ -253,28 +419,33 @@ class RequirementService:
     ) -> Optional[Requirement]:
         """Update a requirement"""
         try:
-            # Get requirement with project ownership check
-            result = await db.execute(
-                select(Requirement)
-                .join(Project)
-                .where(Requirement.id == requirement_id)
-                .where(Project.owner_id == user_id)
-                .where(Requirement.is_deleted == False)
+            update_data = requirement_data.model_dump(exclude_unset=True)
+            if "tags" in update_data:
+                update_data["tags"] = clean_tags(update_data["tags"])
+
+            # Ownership check, update and read-back in one statement
+            requirement = await update_returning(
+                db, Requirement,
+                (
+                    Requirement.id == requirement_id,
+                    Requirement.is_deleted == False,
+                    owned_project(Requirement.project_id, user_id),
+                ),
+                update_data,
+                options=(undefer_group(LARGE_COLUMNS),)
             )
-            requirement = result.scalar_one_or_none()
-
             if not requirement:
                 return None
 
-            # Update fields
-            update_data = requirement_data.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(requirement, field, value)
-
+            if "tags" in update_data:
+                await sync_requirement_tags(db, requirement.id, update_data["tags"])
             await db.commit()
-            await db.refresh(requirement)
 
             logger.info("Requirement updated successfully", requirement_id=requirement_id)
+            audit_service.record(
+                ActionType.UPDATE, EntityType.REQUIREMENT, requirement_id, "Requirement updated",
+                user_id=user_id, new_values=requirement_data.model_dump(exclude_unset=True, mode="json")
+            )
             return requirement
 
         except Exception as e:
@@ -289,21 +460,22 @@ class RequirementService:
         """Soft delete a requirement"""
         try:
             result = await db.execute(
-                select(Requirement)
-                .join(Project)
+                update(Requirement)
                 .where(Requirement.id == requirement_id)
-                .where(Project.owner_id == user_id)
                 .where(Requirement.is_deleted == False)
+                .where(owned_project(Requirement.project_id, user_id))
+                .values(is_deleted=True)
+                .execution_options(synchronize_session=False)
             )
-            requirement = result.scalar_one_or_none()
 
-            if not requirement:
+            if result.rowcount == 0:
                 return False
 
-            requirement.is_deleted = True
             await db.commit()
+            get_loader(db).forget(Requirement, requirement_id)
 
             logger.info("Requirement deleted successfully", requirement_id=requirement_id)
+            audit_service.record(ActionType.DELETE, EntityType.REQUIREMENT, requirement_id, "Requirement deleted", user_id=user_id)
             return True
 
         except Exception as e:
@@ -314,23 +486,162 @@ class RequirementService:
                 detail="Failed to delete requirement"
             )
 
-    async def analyze_requirements_batch(self, db: AsyncSession, requirement_ids: list[str], user_id: str) -> dict:
-        """Analyze multiple requirements at once"""
-        # Placeholder for batch analysis logic
+    async def analyze_requirements_batch(
+        self,
+        db: AsyncSession,
+        requirement_ids: List[str],
+        user_id: str,
+        force_refresh: bool = False,
+        packed: bool = False
+    ) -> RequirementBatchAnalysisResponse:
+        """Analyze several requirements at once
+
+        Descriptions are read with one query and answered from the
+        analysis cache where possible. The remaining Gemini calls (one per
+        distinct text, or with ``packed`` one per pack of texts) run
+        concurrently, at most AI_BATCH_CONCURRENCY at a time, with the
+        connection released. Every result is written by one
+        UPDATE in one transaction. A requirement that is missing or whose
+        analysis fails is reported on its own and does not fail the batch.
+        """
+        requested = list(dict.fromkeys(canonical_id(requirement_id) for requirement_id in requirement_ids))
+        errors = {}
+        try:
+            rows = await db.execute(
+                select(Requirement.id, Requirement.description).where(
+                    Requirement.id.in_(requested),
+                    Requirement.is_deleted == False,
+                    owned_project(Requirement.project_id, user_id),
+                )
+            )
+            descriptions = {requirement_id: description or "" for requirement_id, description in rows}
+            keys = {requirement_id: analysis_cache_key(description) for requirement_id, description in descriptions.items()}
+            analyses = await analysis_cache_service.get_many(db, descriptions.values(), force_refresh=force_refresh)
+            cached = set(analyses)
+            await release_connection(db)
+
+            pending = {}
+            for requirement_id, description in descriptions.items():
+                if keys[requirement_id] not in analyses:
+                    pending.setdefault(keys[requirement_id], description)
+            outcomes = await self._analyze_texts(pending, packed)
+            fresh = []
+            for key, outcome in outcomes.items():
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, Exception):
+                        raise outcome
+                    logger.warning("Batch item analysis failed", error=str(outcome))
+                    errors[key] = outcome.message if isinstance(outcome, AIServiceException) else "Analysis failed"
+                else:
+                    analyses[key] = outcome
+                    fresh.append((pending[key], outcome))
+
+            analyzed = {
+                requirement_id: analyses[key] for requirement_id, key in keys.items() if key in analyses
+            }
+            analyzed_at = {}
+            if analyzed:
+                # One guarded UPDATE; rows deleted meanwhile are not returned
+                result = await db.execute(
+                    update(Requirement)
+                    .where(
+                        Requirement.id.in_(list(analyzed)),
+                        Requirement.is_deleted == False,
+                        owned_project(Requirement.project_id, user_id),
+                    )
+                    .values(ai_analysis=case(*(
+                        (Requirement.id == requirement_id, literal(analysis, Requirement.ai_analysis.type))
+                        for requirement_id, analysis in analyzed.items()
+                    )))
+                    .returning(Requirement.id, Requirement.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+                analyzed_at = dict(result.all())
+            await analysis_cache_service.put_many(db, fresh)
+            await db.commit()
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Failed to analyze requirements", count=len(requested), error=str(e))
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to analyze requirements"
+            )
+
+        results = []
+        for requirement_id in requested:
+            key = keys.get(requirement_id)
+            if requirement_id in analyzed_at:
+                results.append(RequirementBatchAnalysisItem(
+                    requirement_id=requirement_id,
+                    success=True,
+                    analysis=analysis_response(
+                        requirement_id, analyzed[requirement_id], analyzed_at[requirement_id], cached=key in cached
+                    )
+                ))
+            else:
+                results.append(RequirementBatchAnalysisItem(
+                    requirement_id=requirement_id,
+                    success=False,
+                    error=errors.get(key, "Requirement not found or access denied")
+                ))
+        succeeded = sum(item.success for item in results)
+        logger.info(
+            "Batch requirement analysis completed", succeeded=succeeded,
+            failed=len(results) - succeeded, cached=len(cached), analyzed=len(fresh)
+        )
+        return RequirementBatchAnalysisResponse(
+            results=results, succeeded=succeeded, failed=len(results) - succeeded
+        )
+
+    async def _analyze_texts(self, texts: dict, packed: bool) -> dict:
+        """Gemini analyses of texts by key, AI_BATCH_CONCURRENCY calls at a time
+
+        ``packed`` sends several texts per prompt (see
+        ``GeminiService.analyze_requirements_packed``). Failures are
+        returned in place of the analysis.
+        """
+        slots = asyncio.Semaphore(settings.AI_BATCH_CONCURRENCY)
+
+        async def analyze(description: str) -> dict:
+            async with slots:
+                return await gemini_service.analyze_requirement(description)
+
+        async def analyze_pack(pack: dict) -> dict:
+            async with slots:
+                return await gemini_service.analyze_requirements_packed(pack)
+
+        if not packed:
+            outcomes = await asyncio.gather(
+                *(analyze(description) for description in texts.values()), return_exceptions=True
+            )
+            return dict(zip(texts, outcomes))
+
+        packs = pack_requirements(texts)
         results = {}
-        for req_id in requirement_ids:
-            # In a real implementation, this would be a batch operation
-            analysis = await self.analyze_requirement(db, req_id, user_id)
-            results[req_id] = analysis
-        return {"status": "batch analysis complete", "results": results}
+        for pack, outcome in zip(packs, await asyncio.gather(*map(analyze_pack, packs), return_exceptions=True)):
+            results.update(outcome if isinstance(outcome, dict) else dict.fromkeys(pack, outcome))
+        return results
 
     async def update_requirement_status(self, db: AsyncSession, requirement_id: str, status: str, user_id: str) -> bool:
         """Update requirement status"""
-        requirement = await self.get_requirement_by_id(db, requirement_id, user_id)
-        if not requirement:
+        result = await db.execute(
+            update(Requirement)
+            .where(Requirement.id == requirement_id)
+            .where(Requirement.is_deleted == False)
+            .where(owned_project(Requirement.project_id, user_id))
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
             return False
-        requirement.status = status
         await db.commit()
+        get_loader(db).forget(Requirement, requirement_id)
+        audit_service.record(
+            ActionType.UPDATE, EntityType.REQUIREMENT, requirement_id, "Requirement status changed",
+            user_id=user_id, new_values={"status": str(status)}
+        )
         return True
 
     async def get_requirement_history(self, db: AsyncSession, requirement_id: str, user_id: str) -> list:
@@ -352,35 +663,61 @@ class RequirementService:
         self,
         db: AsyncSession,
         requirement_id: str,  # Changed from int to str
-        user_id: str  # Changed from int to str
+        user_id: str,  # Changed from int to str
+        force_refresh: bool = False
     ) -> RequirementAnalysisResponse:
-        """Analyze requirement with AI"""
+        """Analyze requirement with AI
+
+        Reads the description and answers from the analysis cache when it
+        can; otherwise gives the connection back for the Gemini call. The
+        result is stored with a single guarded UPDATE, and a fresh
+        analysis is cached in the same transaction. ``force_refresh``
+        bypasses the cache lookup.
+        """
         try:
-            # Get requirement
-            requirement = await self.get_requirement_by_id(db, requirement_id, user_id)
-            if not requirement:
+            owned_requirement = (
+                Requirement.id == requirement_id,
+                Requirement.is_deleted == False,
+                owned_project(Requirement.project_id, user_id),
+            )
+            description = await db.scalar(select(Requirement.description).where(*owned_requirement))
+            if description is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Requirement not found or access denied"
                 )
-
-            # Perform AI analysis
-            analysis = await gemini_service.analyze_requirement(requirement.description)
-
-            # Update requirement with analysis
-            requirement.ai_analysis = analysis
+            analysis = await analysis_cache_service.get(db, description, force_refresh=force_refresh)
+            cached = analysis is not None
+            if not cached:
+                await release_connection(db)
+                # Perform AI analysis
+                analysis = await gemini_service.analyze_requirement(description)
+
+            # Update requirement with analysis (it may have been deleted meanwhile)
+            analyzed_at = await db.scalar(
+                update(Requirement)
+                .where(*owned_requirement)
+                .values(ai_analysis=analysis)
+                .returning(Requirement.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+            if analyzed_at is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Requirement not found or access denied"
+                )
+            if not cached:
+                await analysis_cache_service.put(db, description, analysis)
             await db.commit()
 
-            logger.info("Requirement analysis completed", requirement_id=requirement_id)
-            return RequirementAnalysisResponse(
-                requirement_id=requirement_id,
-                analysis=analysis,
-                confidence_score=analysis.get("confidence_score", 0.0),
-                analyzed_at=requirement.updated_at
-            )
+            logger.info("Requirement analysis completed", requirement_id=requirement_id, cached=cached)
+            return analysis_response(requirement_id, analysis, analyzed_at, cached=cached)
 
         except HTTPException:
             raise
+        except AIServiceUnavailable as e:
+            logger.error("Gemini unavailable", requirement_id=requirement_id, error=e.message)
+            raise ai_unavailable(e)
         except Exception as e:
             logger.error("Failed to analyze requirement", requirement_id=requirement_id, error=str(e))
             raise HTTPException(
@@ -388,73 +725,91 @@ class RequirementService:
                 detail="Failed to analyze requirement"
             )
 
+    async def get_generation_source(self, db: AsyncSession, requirement_id: str, user_id: str):
+        """The requirement fields task generation reads, or 404
+
+        Gives the connection back afterwards: no connection is held while
+        Gemini works.
+        """
+        result = await db.execute(
+            select(
+                Requirement.project_id,
+                Requirement.title,
+                Requirement.description,
+                Requirement.ai_analysis
+            )
+            .where(Requirement.id == requirement_id)
+            .where(Requirement.is_deleted == False)
+            .where(owned_project(Requirement.project_id, user_id))
+        )
+        requirement = result.one_or_none()
+        if not requirement:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Requirement not found or access denied"
+            )
+        remember_project(db, requirement.project_id, user_id)
+        await release_connection(db)
+        return requirement
+
     async def generate_tasks(
         self,
         db: AsyncSession,
         requirement_id: str,  # Changed from int to str
         user_id: str  # Changed from int to str
-    ) -> List[TaskResponse]:
-        """Generate tasks from requirement analysis"""
+    ) -> TaskGenerationResponse:
+        """Generate tasks from requirement analysis
+
+        The generated set is written in one transaction: one multi-row
+        INSERT for the tasks and one for the dependency edges resolved
+        from the model's task titles, in topological order. Cyclic
+        dependencies are rejected before anything is written.
+        """
         try:
-            # Get requirement
-            requirement = await self.get_requirement_by_id(db, requirement_id, user_id)
-            if not requirement:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Requirement not found or access denied"
-                )
-
+            requirement = await self.get_generation_source(db, requirement_id, user_id)
             # Generate tasks using AI
-            requirement_data = {
-                "title": requirement.title,
-                "description": requirement.description,
-                "ai_analysis": requirement.ai_analysis or {}
-            }
+            tasks_data = await gemini_service.generate_tasks(generation_prompt_data(requirement))
 
-            tasks_data = await gemini_service.generate_tasks(requirement_data)
-
-            # Create task records
-            created_tasks = []
-            for task_data in tasks_data:
-                db_task = Task(
-                    title=task_data.get("title", "Untitled Task"),
-                    description=task_data.get("description", ""),
-                    type=task_data.get("type", "feature"),
-                    priority=task_data.get("priority", "medium"),
-                    estimated_hours=task_data.get("estimated_hours"),
-                    dependencies=task_data.get("dependencies", []),
-                    acceptance_criteria=task_data.get("acceptance_criteria", []),
-                    requirement_id=requirement_id
+            rows = [
+                generated_task_row(task_data, requirement.project_id, requirement_id, user_id)
+                for task_data in tasks_data
+            ]
+            edges = order_dependencies(len(rows), resolve_task_dependencies(tasks_data))
+            if edges is None:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="Generated tasks contain circular dependencies"
                 )
-                db.add(db_task)
-                created_tasks.append(db_task)
 
-            await db.commit()
-
-            # Refresh and convert to response format
-            task_responses = []
-            for task in created_tasks:
-                await db.refresh(task)
-                task_response = TaskResponse(
-                    id=task.id,
-                    title=task.title,
-                    description=task.description,
-                    type=task.type,
-                    priority=task.priority,
-                    estimated_hours=task.estimated_hours,
-                    dependencies=task.dependencies or [],
-                    acceptance_criteria=task.acceptance_criteria or [],
-                    requirement_id=task.requirement_id,
-                    created_at=task.created_at,
-                    updated_at=task.updated_at
+            created_tasks = await task_service.insert_tasks(db, rows)
+            dependencies = []
+            if edges:
+                result = await db.scalars(
+                    insert(TaskDependency).returning(TaskDependency),
+                    [
+                        {"task_id": created_tasks[task].id, "depends_on_id": created_tasks[dependency].id}
+                        for task, dependency in edges
+                    ]
                 )
-                task_responses.append(task_response)
+                dependencies = result.all()
+            await db.commit()
 
-            logger.info("Tasks generated successfully", requirement_id=requirement_id, task_count=len(task_responses))
-            return task_responses
+            logger.info(
+                "Tasks generated successfully",
+                requirement_id=requirement_id,
+                task_count=len(created_tasks),
+                dependency_count=len(dependencies)
+            )
+            return TaskGenerationResponse(
+                tasks=[TaskResponse.model_validate(task) for task in created_tasks],
+                dependencies=[TaskDependencyResponse.model_validate(dependency) for dependency in dependencies]
+            )
 
         except HTTPException:
             raise
+        except AIServiceUnavailable as e:
+            logger.error("Gemini unavailable", requirement_id=requirement_id, error=e.message)
+            raise ai_unavailable(e)
         except Exception as e:
             await db.rollback()
             logger.error("Failed to generate tasks", requirement_id=requirement_id, error=str(e))
@@ -463,5 +818,68 @@ class RequirementService:
                 detail="Failed to generate tasks"
             )
 
+    async def stream_generated_tasks(
+        self,
+        session_factory: async_sessionmaker,
+        requirement_id: str,  # Changed from int to str
+        requirement,
+        user_id: str  # Changed from int to str
+    ) -> AsyncIterator[Tuple[str, object]]:
+        """Generate tasks, yielding ``(event, payload)`` as each one is saved
+
+        ``requirement`` comes from ``get_generation_source``. Every task is
+        committed as soon as the model has finished writing it, on a
+        session of its own (the request's session is closed by the time a
+        streamed body is sent). Dependencies can name later tasks, so they
+        are resolved and written once the stream ends; a cyclic set is
+        reported and not written. Failures end the stream with an
+        ``error`` event; tasks already sent stay saved.
+        """
+        tasks_data, created = [], []
+        async with session_factory() as db:
+            try:
+                async for task_data in gemini_service.stream_tasks(generation_prompt_data(requirement)):
+                    row = generated_task_row(task_data, requirement.project_id, requirement_id, user_id)
+                    [task] = await task_service.insert_tasks(db, [row])
+                    await db.commit()
+                    tasks_data.append(task_data)
+                    created.append(task)
+                    yield "task", TaskResponse.model_validate(task).model_dump(mode="json")
+
+                edges = order_dependencies(len(created), resolve_task_dependencies(tasks_data))
+                dependencies = []
+                if edges is None:
+                    yield "error", {"detail": "Generated tasks contain circular dependencies; dependencies were not saved"}
+                elif edges:
+                    result = await db.scalars(
+                        insert(TaskDependency).returning(TaskDependency),
+                        [
+                            {"task_id": created[task].id, "depends_on_id": created[dependency].id}
+                            for task, dependency in edges
+                        ]
+                    )
+                    dependencies = result.all()
+                    await db.commit()
+                    yield "dependencies", [
+                        TaskDependencyResponse.model_validate(dependency).model_dump(mode="json")
+                        for dependency in dependencies
+                    ]
+
+                logger.info(
+                    "Tasks generated successfully (streamed)",
+                    requirement_id=requirement_id,
+                    task_count=len(created),
+                    dependency_count=len(dependencies)
+                )
+                yield "done", {"task_count": len(created), "dependency_count": len(dependencies)}
+
+            except AIServiceException as e:
+                logger.error("Streaming task generation failed", requirement_id=requirement_id, error=e.message)
+                yield "error", {"detail": "Failed to generate tasks", "task_count": len(created)}
+            except Exception as e:
+                await db.rollback()
+                logger.error("Streaming task generation failed", requirement_id=requirement_id, error=str(e))
+                yield "error", {"detail": "Failed to generate tasks", "task_count": len(created)}
+
 # Global requirement service instance
 requirement_service = RequirementService()
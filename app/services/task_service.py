@@ -3,7 +3,7 @@ Task Service
 """
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert, update
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 import structlog
@@ -11,12 +11,20 @@ import structlog
 from app.models.task import Task, TaskDependency, TaskComment
 from app.models.user import User
 from app.models.project import Project
+from app.models.requirement import Requirement
 from app.schemas.task import (
     TaskCreate, TaskUpdate, TaskResponse, TaskStatusUpdate,
     TaskComment, TaskCommentResponse, TaskAssignment,
     TaskTimeLog, TaskTimeLogResponse, TaskAttachment,
-    TaskDependencyCreate, TaskCommentCreate
+    TaskDependencyCreate, TaskCommentCreate,
+    TaskBulkError, TaskBulkCreateResponse, TaskBulkUpdateResponse
 )
+from app.repositories.loader import get_loader
+from app.repositories.ownership import remember_project
+from app.repositories.writes import insert_returning, update_returning
+from app.models.audit import ActionType, EntityType
+from app.services.audit_service import audit_service
+from app.utils.helpers import canonical_id
 
 logger = structlog.get_logger(__name__)
 
@@ -31,17 +39,18 @@ class TaskService:
     ) -> Task:
         """Create a new task"""
         try:
-            db_task = Task(
+            db_task = await insert_returning(db, Task, {
                 **task_data.model_dump(exclude={'acceptance_criteria'}),
-                created_by=user_id,
-                acceptance_criteria=task_data.acceptance_criteria or []
-            )
-
-            db.add(db_task)
+                "created_by": user_id,
+                "acceptance_criteria": task_data.acceptance_criteria or [],
+            })
             await db.commit()
-            await db.refresh(db_task)
 
             logger.info("Task created successfully", task_id=db_task.id, user_id=user_id)
+            audit_service.record(
+                ActionType.CREATE, EntityType.TASK, db_task.id, "Task created",
+                user_id=user_id, new_values=task_data.model_dump(mode="json")
+            )
             return db_task
 
         except Exception as e:
@@ -52,6 +61,172 @@ class TaskService:
                 detail="Failed to create task"
             )
 
+    async def insert_tasks(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> List[Task]:
+        """Insert task rows with one multi-row INSERT ... RETURNING
+
+        Returns fully populated Task objects in the order of ``rows``. The
+        caller owns the transaction.
+        """
+        if not rows:
+            return []
+        result = await db.scalars(
+            insert(Task).returning(Task, sort_by_parameter_order=True),
+            rows
+        )
+        return list(result.all())
+
+    async def bulk_create_tasks(
+        self,
+        db: AsyncSession,
+        tasks_data: List[TaskCreate],
+        user_id: str
+    ) -> TaskBulkCreateResponse:
+        """Create many tasks in one transaction, reporting failures per item"""
+        # Ids are compared with the canonical form the database returns
+        tasks_data = [
+            task.model_copy(update={
+                field: canonical_id(getattr(task, field))
+                for field in ("project_id", "requirement_id", "assigned_to") if getattr(task, field)
+            })
+            for task in tasks_data
+        ]
+        project_ids = {task.project_id for task in tasks_data if task.project_id}
+        requirement_ids = {task.requirement_id for task in tasks_data if task.requirement_id}
+        assignee_ids = {task.assigned_to for task in tasks_data if task.assigned_to}
+
+        try:
+            # One set-based lookup per referenced entity type
+            owned_projects = set()
+            if project_ids:
+                owned_projects = set(await db.scalars(
+                    select(Project.id)
+                    .where(Project.id.in_(project_ids))
+                    .where(Project.owner_id == user_id)
+                    .where(Project.is_deleted == False)
+                ))
+            requirement_projects = {}
+            if requirement_ids:
+                result = await db.execute(
+                    select(Requirement.id, Requirement.project_id)
+                    .where(Requirement.id.in_(requirement_ids))
+                    .where(Requirement.is_deleted == False)
+                )
+                requirement_projects = dict(result.all())
+            # Users are memoized for the request, so self-assignment costs nothing
+            active_users = {
+                user.id for user in await get_loader(db).load_many(User, assignee_ids)
+                if user is not None and user.is_active
+            }
+
+            rows, errors = [], []
+            for index, task_data in enumerate(tasks_data):
+                if not task_data.project_id:
+                    detail = "project_id is required"
+                elif task_data.project_id not in owned_projects:
+                    detail = "Project not found or access denied"
+                elif task_data.requirement_id and requirement_projects.get(task_data.requirement_id) != task_data.project_id:
+                    detail = "Requirement not found in project"
+                elif task_data.assigned_to and task_data.assigned_to not in active_users:
+                    detail = "Assignee not found"
+                else:
+                    rows.append({
+                        **task_data.model_dump(exclude={"acceptance_criteria"}),
+                        "acceptance_criteria": task_data.acceptance_criteria or [],
+                        "created_by": user_id
+                    })
+                    continue
+                errors.append(TaskBulkError(index=index, detail=detail))
+
+            created = await self.insert_tasks(db, rows)
+            await db.commit()
+
+            for project_id in owned_projects:
+                remember_project(db, project_id, user_id)
+
+            logger.info("Tasks bulk created", user_id=user_id, created=len(created), failed=len(errors))
+            for task in created:
+                audit_service.record(
+                    ActionType.CREATE, EntityType.TASK, task.id, "Task created (bulk)",
+                    user_id=user_id, new_values={"title": task.title, "project_id": task.project_id}
+                )
+            return TaskBulkCreateResponse(
+                created=[TaskResponse.model_validate(task) for task in created],
+                errors=errors
+            )
+
+        except Exception as e:
+            await db.rollback()
+            logger.error("Failed to bulk create tasks", error=str(e))
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to create tasks"
+            )
+
+    async def bulk_update_tasks(
+        self,
+        db: AsyncSession,
+        task_ids: List[str],
+        changes: TaskUpdate,
+        user_id: str
+    ) -> TaskBulkUpdateResponse:
+        """Apply the same field changes to many tasks with one UPDATE ... WHERE id IN (...)"""
+        update_data = changes.model_dump(exclude_unset=True)
+        if not update_data:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No changes provided"
+            )
+
+        try:
+            if update_data.get("assigned_to"):
+                assignee = await get_loader(db).load(User, update_data["assigned_to"])
+                if not assignee or not assignee.is_active:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Assignee not found"
+                    )
+
+            requested_ids = list(dict.fromkeys(canonical_id(task_id) for task_id in task_ids))
+            result = await db.scalars(
+                update(Task)
+                .where(Task.id.in_(requested_ids))
+                .where(Task.created_by == user_id)
+                .where(Task.is_deleted == False)
+                .values(**update_data)
+                .returning(Task)
+            )
+            updated = list(result.all())
+            await db.commit()
+
+            updated_ids = {task.id for task in updated}
+            errors = [
+                TaskBulkError(task_id=task_id, detail="Task not found")
+                for task_id in requested_ids
+                if task_id not in updated_ids
+            ]
+
+            logger.info("Tasks bulk updated", user_id=user_id, updated=len(updated), failed=len(errors))
+            new_values = changes.model_dump(exclude_unset=True, mode="json")
+            for task in updated:
+                audit_service.record(
+                    ActionType.UPDATE, EntityType.TASK, task.id, "Task updated (bulk)",
+                    user_id=user_id, new_values=new_values
+                )
+            return TaskBulkUpdateResponse(
+                updated=[TaskResponse.model_validate(task) for task in updated],
+                errors=errors
+            )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            await db.rollback()
+            logger.error("Failed to bulk update tasks", error=str(e))
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to update tasks"
+            )
+
     async def get_tasks(
         self,
         db: AsyncSession,
@@ -77,14 +252,20 @@ class TaskService:
         task_id: int,
         user_id: int
     ) -> Optional[Task]:
-        """Get task by ID"""
+        """Get task by ID, memoized for the request"""
+        loader = get_loader(db)
+        task = loader.peek(Task, task_id)
+        if task is not None:
+            return task if task.created_by == user_id else None
         try:
             result = await db.execute(
                 select(Task)
                 .where(Task.id == task_id)
                 .where(Task.created_by == user_id)
             )
-            return result.scalar_one_or_none()
+            task = result.scalar_one_or_none()
+            loader.prime(task)
+            return task
         except Exception as e:
             logger.error("Failed to get task", task_id=task_id, error=str(e))
             return None
@@ -98,16 +279,18 @@ class TaskService:
     ) -> Optional[Task]:
         """Update task"""
         try:
-            task = await self.get_task_by_id(db, task_id, user_id)
+            task = await update_returning(
+                db, Task,
+                (Task.id == task_id, Task.created_by == user_id),
+                task_data.model_dump(exclude_unset=True)
+            )
             if not task:
                 return None
-
-            update_data = task_data.model_dump(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(task, field, value)
-
             await db.commit()
-            await db.refresh(task)
+            audit_service.record(
+                ActionType.UPDATE, EntityType.TASK, task_id, "Task updated",
+                user_id=user_id, new_values=task_data.model_dump(exclude_unset=True, mode="json")
+            )
             return task
 
         except Exception as e:
@@ -127,6 +310,8 @@ class TaskService:
 
             await db.delete(task)
             await db.commit()
+            get_loader(db).forget(Task, task_id)
+            audit_service.record(ActionType.DELETE, EntityType.TASK, task_id, "Task deleted", user_id=user_id)
             return True
 
         except Exception as e:
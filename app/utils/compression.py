@@ -0,0 +1,183 @@
+"""
+JSON Compression Codec
+
+Encodes JSON values as compact bytes for CompressedJSON columns. Values
+at least MIN_COMPRESSED_SIZE bytes long are deflated against a preset
+dictionary of the keys and boilerplate typical for the column (Gemini
+analyses, GitHub webhooks), which is what makes rows of a few KB
+compress well; shorter values are stored uncompressed.
+
+Every encoded value starts with a format byte, so the decoder also
+accepts plain JSON bytes and text left by earlier storage. Dictionaries
+are looked up by the id stored in the value and must never change once
+written: a revised dictionary gets a new id.
+"""
+import json
+import zlib
+from typing import Any, Dict, Optional, Union
+
+FORMAT_PLAIN = 0x00
+FORMAT_DEFLATE = 0x01
+
+MIN_COMPRESSED_SIZE = 256
+COMPRESSION_LEVEL = 6
+
+# Raw deflate: the zlib header and checksum would cost 6-10 bytes a row
+WBITS = -15
+
+
+def _dictionary(*samples: Any, words: str = "") -> bytes:
+    """Preset dictionary; the most common strings go last, nearest the data"""
+    return (words + "".join(json.dumps(sample, separators=(",", ":")) for sample in samples)).encode()
+
+
+_ANALYSIS_SAMPLE = {
+    "entities": [
+        {"type": "feature", "name": "", "description": ""},
+        {"type": "component", "name": "", "description": ""},
+        {"type": "integration", "name": "", "description": ""},
+        {"type": "data_model", "name": "", "description": ""},
+    ],
+    "features": [""],
+    "complexity_assessment": "medium",
+    "effort_estimate": 8,
+    "confidence_score": 0.8,
+    "suggestions": [""],
+    "risks": [""],
+    "acceptance_criteria": [""],
+    "tech_considerations": [""],
+}
+
+_GITHUB_USER_SAMPLE = {
+    "name": "", "email": "", "login": "", "id": 1, "node_id": "",
+    "avatar_url": "https://avatars.githubusercontent.com/u/", "gravatar_id": "",
+    "url": "https://api.github.com/users/", "html_url": "https://github.com/",
+    "followers_url": "https://api.github.com/users//followers",
+    "following_url": "https://api.github.com/users//following{/other_user}",
+    "gists_url": "https://api.github.com/users//gists{/gist_id}",
+    "starred_url": "https://api.github.com/users//starred{/owner}{/repo}",
+    "subscriptions_url": "https://api.github.com/users//subscriptions",
+    "organizations_url": "https://api.github.com/users//orgs",
+    "repos_url": "https://api.github.com/users//repos",
+    "events_url": "https://api.github.com/users//events{/privacy}",
+    "received_events_url": "https://api.github.com/users//received_events",
+    "type": "User", "user_view_type": "public", "site_admin": False,
+}
+
+_GITHUB_REPOSITORY_SAMPLE = {
+    "id": 1, "node_id": "", "name": "", "full_name": "", "private": False,
+    "owner": _GITHUB_USER_SAMPLE, "html_url": "https://github.com/", "description": "",
+    "fork": False, "url": "https://api.github.com/repos/",
+    **{
+        f"{name}_url": f"https://api.github.com/repos//{path}"
+        for name, path in (
+            ("forks", "forks"), ("keys", "keys{/key_id}"), ("collaborators", "collaborators{/collaborator}"),
+            ("teams", "teams"), ("hooks", "hooks"), ("issue_events", "issues/events{/number}"),
+            ("events", "events"), ("assignees", "assignees{/user}"), ("branches", "branches{/branch}"),
+            ("tags", "tags"), ("blobs", "git/blobs{/sha}"), ("git_tags", "git/tags{/sha}"),
+            ("git_refs", "git/refs{/sha}"), ("trees", "git/trees{/sha}"), ("statuses", "statuses/{sha}"),
+            ("languages", "languages"), ("stargazers", "stargazers"), ("contributors", "contributors"),
+            ("subscribers", "subscribers"), ("subscription", "subscription"), ("commits", "commits{/sha}"),
+            ("git_commits", "git/commits{/sha}"), ("comments", "comments{/number}"),
+            ("issue_comment", "issues/comments{/number}"), ("contents", "contents/{+path}"),
+            ("compare", "compare/{base}...{head}"), ("merges", "merges"), ("archive", "{archive_format}{/ref}"),
+            ("downloads", "downloads"), ("issues", "issues{/number}"), ("pulls", "pulls{/number}"),
+            ("milestones", "milestones{/number}"), ("notifications", "notifications{?since,all,participating}"),
+            ("labels", "labels{/name}"), ("releases", "releases{/id}"), ("deployments", "deployments"),
+        )
+    },
+    "created_at": 1, "updated_at": "", "pushed_at": 1,
+    "git_url": "git://github.com/", "ssh_url": "git@github.com:", "clone_url": "https://github.com/",
+    "svn_url": "https://github.com/", "homepage": None, "size": 1, "stargazers_count": 0,
+    "watchers_count": 0, "language": "Python", "has_issues": True, "has_projects": True,
+    "has_downloads": True, "has_wiki": True, "has_pages": False, "has_discussions": False,
+    "forks_count": 0, "mirror_url": None, "archived": False, "disabled": False,
+    "open_issues_count": 0, "license": None, "allow_forking": True, "is_template": False,
+    "web_commit_signoff_required": False, "topics": [], "visibility": "public", "forks": 0,
+    "open_issues": 0, "watchers": 0, "default_branch": "main", "stargazers": 0, "master_branch": "main",
+}
+
+_GITHUB_COMMIT_SAMPLE = {
+    "id": "", "tree_id": "", "distinct": True, "message": "", "timestamp": "",
+    "url": "https://github.com//commit/", "author": {"name": "", "email": "", "username": ""},
+    "committer": {"name": "GitHub", "email": "noreply@github.com", "username": "web-flow"},
+    "added": [], "removed": [], "modified": [],
+}
+
+_GITHUB_WEBHOOK_SAMPLE = {
+    "ref": "refs/heads/main", "before": "", "after": "", "repository": _GITHUB_REPOSITORY_SAMPLE,
+    "pusher": {"name": "", "email": ""}, "sender": _GITHUB_USER_SAMPLE, "created": False,
+    "deleted": False, "forced": False, "base_ref": None, "compare": "https://github.com//compare/",
+    "commits": [_GITHUB_COMMIT_SAMPLE], "head_commit": _GITHUB_COMMIT_SAMPLE,
+}
+
+# Dictionary id -> preset dictionary. Never edit an entry in place.
+DICTIONARIES: Dict[int, bytes] = {
+    1: _dictionary(
+        _ANALYSIS_SAMPLE,
+        words=(
+            "The system should allow users to implement authentication authorization API endpoint "
+            "database validation error handling performance security integration notification "
+            "dashboard report payment mobile responsive real-time scalability caching testing "
+        ),
+    ),
+    2: _dictionary(_GITHUB_REPOSITORY_SAMPLE, _GITHUB_WEBHOOK_SAMPLE),
+}
+
+# Names CompressedJSON columns select a dictionary by
+DICTIONARY_IDS = {
+    "none": 0,
+    "gemini_analysis": 1,
+    "github_webhook": 2,
+}
+
+
+def dumps(value: Any) -> bytes:
+    """Compact JSON bytes, as every format stores them"""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def encode_json(value: Any, dictionary: str = "none") -> bytes:
+    """Serialize a value, deflating it when that pays off"""
+    raw = dumps(value)
+    if len(raw) < MIN_COMPRESSED_SIZE:
+        return bytes((FORMAT_PLAIN,)) + raw
+    dictionary_id = DICTIONARY_IDS[dictionary]
+    if dictionary_id:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, WBITS, zdict=DICTIONARIES[dictionary_id])
+    else:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, WBITS)
+    compressed = compressor.compress(raw) + compressor.flush()
+    if len(compressed) + 1 >= len(raw):
+        return bytes((FORMAT_PLAIN,)) + raw
+    return bytes((FORMAT_DEFLATE, dictionary_id)) + compressed
+
+
+def decode_json(data: Optional[Union[bytes, bytearray, memoryview, str]]) -> Any:
+    """Inverse of encode_json; plain JSON bytes or text decode as-is"""
+    if data is None:
+        return None
+    if isinstance(data, str):
+        return json.loads(data)
+    data = bytes(data)
+    if not data:
+        return None
+    if data[0] == FORMAT_PLAIN:
+        return json.loads(data[1:])
+    if data[0] == FORMAT_DEFLATE:
+        dictionary_id = data[1]
+        if dictionary_id:
+            decompressor = zlib.decompressobj(WBITS, zdict=DICTIONARIES[dictionary_id])
+        else:
+            decompressor = zlib.decompressobj(WBITS)
+        return json.loads(decompressor.decompress(data[2:]) + decompressor.flush())
+    # Uncompressed JSON written before the column was converted
+    return json.loads(data)
+
+
+def is_encoded(data: Optional[Union[bytes, bytearray, memoryview, str]]) -> bool:
+    """Whether a stored value is already in the encoded format"""
+    if data is None or isinstance(data, str):
+        return data is None
+    data = bytes(data)
+    return bool(data) and data[0] in (FORMAT_PLAIN, FORMAT_DEFLATE)
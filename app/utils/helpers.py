@@ -2,8 +2,11 @@
 Utility Helper Functions
 """
 import logging
+import os
+import time
+import uuid
 import structlog
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timezone
 
 def setup_logging():
@@ -35,3 +38,59 @@ def calculate_progress_percentage(completed: int, total: int) -> float:
     if total == 0:
         return 0.0
     return round((completed / total) * 100, 2)
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7)
+
+    48 bits of Unix milliseconds followed by 74 random bits, so ids created
+    later sort later and B-tree inserts land on the right-hand edge.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+    value &= ~(0xF << 76)
+    value |= 0x7 << 76  # version 7
+    value &= ~(0x3 << 62)
+    value |= 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+def canonical_id(value: Any) -> str:
+    """An id in the canonical form GUID columns return; non-UUIDs unchanged"""
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        return str(value)
+
+def uuid7_datetime(value: Any) -> Optional[datetime]:
+    """Creation time embedded in a UUIDv7, or None for other ids (naive UTC)"""
+    try:
+        parsed = uuid.UUID(str(value))
+    except ValueError:
+        return None
+    if parsed.version != 7:
+        return None
+    return datetime.utcfromtimestamp((parsed.int >> 80) / 1000)
+
+def topological_order(count: int, edges: Iterable[Tuple[int, int]]) -> Optional[List[int]]:
+    """Order nodes 0..count-1 so every edge (a, b) has b before a
+
+    Edges read "a depends on b". Returns None when the edges contain a
+    cycle (Kahn's algorithm leaves the cycle's nodes unvisited).
+    """
+    dependents: Dict[int, List[int]] = {node: [] for node in range(count)}
+    pending = [0] * count
+    for node, dependency in edges:
+        dependents[dependency].append(node)
+        pending[node] += 1
+
+    ready = [node for node in range(count) if pending[node] == 0]
+    order = []
+    while ready:
+        node = ready.pop()
+        order.append(node)
+        for dependent in dependents[node]:
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                ready.append(dependent)
+
+    return order if len(order) == count else None
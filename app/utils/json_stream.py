@@ -0,0 +1,112 @@
+"""
+Incremental and Tolerant JSON Parsing
+
+Model output is JSON that may arrive in pieces, sit in a code fence or
+be cut off at the token limit. ``JSONArrayStream`` pulls the elements of
+the first JSON array out of such text, each as soon as its closing
+bracket arrives, so a streamed answer can be used element by element and
+a truncated one still yields every element it completed. Text before the
+array, such as a code fence or ``{"tasks":``, is skipped. Only object and
+array elements are returned; an element that does not decode is counted
+in ``skipped`` and dropped. ``complete_members`` does the same for the
+members of a truncated object.
+"""
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_CODE_FENCE = re.compile(r"^\s*```[\w-]*[ \t]*\n?|\n?```\s*$")
+
+
+def strip_code_fence(text: str) -> str:
+    """Text without a surrounding Markdown code fence of any language tag"""
+    return _CODE_FENCE.sub("", text or "")
+
+
+def complete_members(text: str) -> Tuple[Dict[str, Any], bool]:
+    """The members of the first JSON object in ``text`` that are complete
+
+    Returns ``(members, closed)``: for a truncated object, the members
+    before the cut (the one being written is dropped) and False.
+    """
+    start = text.find("{")
+    if start < 0:
+        return {}, False
+    depth, in_string, escape, last_complete = 0, False, False, None
+    for position in range(start, len(text)):
+        char = text[position]
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if depth == 0:
+                try:
+                    return json.loads(text[start:position + 1]), True
+                except json.JSONDecodeError:
+                    break
+        elif char == "," and depth == 1:
+            last_complete = position
+    if last_complete is None:
+        return {}, False
+    try:
+        return json.loads(text[start:last_complete] + "}"), False
+    except json.JSONDecodeError:
+        return {}, False
+
+
+class JSONArrayStream:
+    """Feed text chunks; get back the array elements each chunk completed"""
+
+    def __init__(self):
+        self.closed = False
+        self.skipped = 0
+        self._depth = 0
+        self._array_depth: Optional[int] = None
+        self._in_string = False
+        self._escape = False
+        self._element: Optional[List[str]] = None
+
+    def feed(self, text: str) -> List[Any]:
+        """Consume a chunk and return the elements completed by it"""
+        items = []
+        for char in text:
+            if self.closed:
+                break
+            if self._element is not None:
+                self._element.append(char)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+                if self._array_depth is None:
+                    if char == "[":
+                        self._array_depth = self._depth
+                elif self._depth == self._array_depth + 1:
+                    self._element = [char]
+            elif char in "]}":
+                if self._element is not None and self._depth == self._array_depth + 1:
+                    try:
+                        items.append(json.loads("".join(self._element)))
+                    except json.JSONDecodeError:
+                        self.skipped += 1
+                    self._element = None
+                self._depth -= 1
+                if self._array_depth is not None and self._depth < self._array_depth:
+                    self.closed = True
+        return items
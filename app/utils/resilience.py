@@ -0,0 +1,106 @@
+"""
+Resilience Primitives for Remote Calls
+
+Backoff with full jitter for retries, and a circuit breaker that fails
+fast while a dependency's recent error rate is high. Both only keep
+state and do arithmetic; the caller decides what to retry and what
+counts as a failure.
+"""
+import random
+import time
+from collections import deque
+from typing import Callable, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def backoff_delay(attempt: int, base: float, cap: float, rng: Optional[random.Random] = None) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based): uniform in [0, min(cap, base * 2**attempt)]
+
+    Full jitter keeps clients that failed together from retrying together.
+    """
+    return (rng or random).uniform(0, min(cap, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker over the last ``window`` calls
+
+    Closed: calls go through. Once at least ``min_calls`` of the last
+    ``window`` outcomes are in and ``failure_rate`` of them failed, the
+    breaker opens and ``allow`` refuses calls for ``open_seconds``. Then
+    it is half-open: one probe call is let through, and its outcome
+    closes the breaker (with a fresh window) or opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.clock = clock
+        self.opened = 0
+        self._outcomes = deque(maxlen=window)
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if self.clock() - self._opened_at < self.open_seconds:
+            return OPEN
+        return HALF_OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through (0 if not open)"""
+        if self.state != OPEN:
+            return 0.0
+        return self.open_seconds - (self.clock() - self._opened_at)
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; a half-open breaker admits one probe at a time"""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record(self, success: bool) -> None:
+        """Count the outcome of a call that ``allow`` let through"""
+        if self._opened_at is not None:
+            if not self._probing:
+                # A call that went out before the breaker opened
+                return
+            self._probing = False
+            if success:
+                self._opened_at = None
+                self._outcomes.clear()
+            else:
+                self._trip()
+            return
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        if len(self._outcomes) >= self.min_calls and failures >= self.failure_rate * len(self._outcomes):
+            self._trip()
+
+    def abandon(self) -> None:
+        """A call that ``allow`` let through ended without an outcome (cancelled)"""
+        if self._opened_at is not None:
+            self._probing = False
+
+    def _trip(self):
+        self._opened_at = self.clock()
+        self.opened += 1
@@ -0,0 +1,29 @@
+"""
+Server-Sent Events
+"""
+import json
+from typing import Any, AsyncIterator, Tuple
+
+from fastapi.responses import StreamingResponse
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Passes GZipMiddleware untouched: compressing would buffer events
+    "Content-Encoding": "identity",
+    # Tells nginx not to buffer the stream either
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse(event: str, data: Any) -> str:
+    """One SSE frame with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def sse_response(events: AsyncIterator[Tuple[str, Any]]) -> StreamingResponse:
+    """Stream ``(event, data)`` pairs as ``text/event-stream``"""
+    async def frames():
+        async for event, data in events:
+            yield format_sse(event, data)
+
+    return StreamingResponse(frames(), media_type="text/event-stream", headers=SSE_HEADERS)
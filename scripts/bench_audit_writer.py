@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark audit logging cost on the request path
+
+Records EVENTS audit events in a temporary SQLite database twice: with a
+synchronous insert + commit per event (what writing audit rows inside
+each request would cost) and through ``AuditService.record``, which only
+queues the row for the background ``BatchWriter``. Reports the time the
+caller spends per event, then how long the writer takes to drain.
+
+Usage: python scripts/bench_audit_writer.py [events]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+import app.models  # noqa: F401 - register all mappers
+from app.config.database import Base
+from app.models.audit import ActionType, EntityType
+from app.repositories.audit_log import insert_audit_rows
+import app.background.audit_writer as audit_writer_module
+from app.background.batch_writer import BatchWriter
+import app.services.audit_service as audit_service_module
+from app.services.audit_service import audit_service
+
+EVENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+
+def structlog_quiet():
+    import logging
+    import structlog
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+def event(index):
+    return {
+        "action_type": ActionType.UPDATE.value,
+        "entity_type": EntityType.TASK.value,
+        "entity_id": str(index),
+        "description": "Updated task",
+        "new_values": {"status": "in_progress"},
+    }
+
+
+async def main():
+    structlog_quiet()
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        started = time.perf_counter()
+        for index in range(EVENTS):
+            async with session_factory() as db:
+                await insert_audit_rows(db, [event(index)])
+                await db.commit()
+        sync_elapsed = time.perf_counter() - started
+
+        audit_writer_module.async_session_factory = session_factory
+        writer = BatchWriter(
+            "audit", audit_writer_module.write_audit_rows,
+            spool_path=os.path.join(directory, "spool.jsonl"),
+            max_queue_size=EVENTS,
+        )
+        audit_service_module.audit_writer = writer
+        await writer.start()
+
+        started = time.perf_counter()
+        for index in range(EVENTS):
+            audit_service.record(ActionType.UPDATE, EntityType.TASK, str(index), "Updated task",
+                                 new_values={"status": "in_progress"})
+        queued_elapsed = time.perf_counter() - started
+        await writer.stop()
+        drained_elapsed = time.perf_counter() - started
+        await engine.dispose()
+
+    print(f"{EVENTS} audit events")
+    print(f"{'insert + commit per event':<28}{sync_elapsed / EVENTS * 1e6:>10.1f} us/event on request path")
+    print(f"{'record() into queue':<28}{queued_elapsed / EVENTS * 1e6:>10.1f} us/event on request path")
+    print(f"{'background drain (total)':<28}{drained_elapsed * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
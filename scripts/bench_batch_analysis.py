@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch requirement analysis: sequential loop vs concurrent fan-out
+
+Seeds an in-memory SQLite database with REQUIREMENTS requirements and
+analyzes all of them twice with a stand-in Gemini client that answers
+after LATENCY_MS:
+
+  * sequential: ``analyze_requirement`` once per id, as the batch
+    endpoint used to (one model call, one commit per requirement)
+  * batch: ``analyze_requirements_batch`` (one read, concurrent model
+    calls bounded by AI_BATCH_CONCURRENCY, one write transaction)
+
+The cache is bypassed (force_refresh) so both runs call the model for
+every requirement. Reports wall-clock time, SQL statements and commits.
+
+Usage: python scripts/bench_batch_analysis.py [requirements] [latency_ms]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401 - register all mappers
+from app.config.database import Base
+from app.models import Project, Requirement, User
+from app.services import requirement_service as requirement_service_module
+from app.services.requirement_service import requirement_service
+
+REQUIREMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+LATENCY_MS = float(sys.argv[2]) if len(sys.argv) > 2 else 800
+
+
+class LatencyGemini:
+    async def analyze_requirement(self, requirement_text: str):
+        await asyncio.sleep(LATENCY_MS / 1000)
+        return {"features": [requirement_text], "complexity_assessment": "medium", "effort_estimate": 8}
+
+
+async def main():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    counts = {"statements": 0, "commits": 0}
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: counts.__setitem__("statements", counts["statements"] + 1))
+    event.listen(engine.sync_engine, "commit", lambda *args: counts.__setitem__("commits", counts["commits"] + 1))
+
+    async with session_factory() as db:
+        user = User(email="bench@example.com", username="bench", first_name="Bench", last_name="User", hashed_password="-")
+        db.add(user)
+        await db.flush()
+        project = Project(name="Bench", owner_id=user.id)
+        db.add(project)
+        await db.flush()
+        requirements = [
+            Requirement(title=f"R{i}", description=f"Requirement {i}", project_id=project.id, created_by=user.id)
+            for i in range(REQUIREMENTS)
+        ]
+        db.add_all(requirements)
+        await db.commit()
+        ids = [requirement.id for requirement in requirements]
+        user_id = user.id
+
+    requirement_service_module.gemini_service = LatencyGemini()
+    print(
+        f"{REQUIREMENTS} requirements, {LATENCY_MS:g} ms per model call, "
+        f"AI_BATCH_CONCURRENCY={requirement_service_module.settings.AI_BATCH_CONCURRENCY}"
+    )
+
+    async def sequential(db):
+        for requirement_id in ids:
+            await requirement_service.analyze_requirement(db, requirement_id, user_id, force_refresh=True)
+
+    async def batch(db):
+        await requirement_service.analyze_requirements_batch(db, ids, user_id, force_refresh=True)
+
+    results = {}
+    for label, run in (("sequential", sequential), ("batch", batch)):
+        counts.update(statements=0, commits=0)
+        async with session_factory() as db:
+            started = time.perf_counter()
+            await run(db)
+            elapsed = time.perf_counter() - started
+        results[label] = elapsed
+        print(f"  {label:<11}{elapsed:8.2f} s   {counts['statements']:5d} statements   {counts['commits']:4d} commits")
+    print(f"  speedup     {results['sequential'] / results['batch']:8.1f}x")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark task creation: one request per task vs the bulk endpoint path
+
+Creates TASKS tasks in a temporary SQLite database twice: through
+``TaskService.create_task`` once per task (an INSERT and a commit each time,
+as clients calling ``POST /tasks`` in a loop do) and through a single
+``TaskService.bulk_create_tasks`` call. Then updates all of them once per
+task vs with one ``bulk_update_tasks`` call.
+
+Usage: python scripts/bench_bulk_tasks.py [tasks]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+import app.models  # noqa: F401 - register all mappers
+from app.config.database import Base
+from app.models import User, Project
+from app.schemas.task import TaskCreate, TaskUpdate
+from app.services.task_service import task_service
+
+TASKS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+
+def structlog_quiet():
+    import logging
+    import structlog
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+async def seed(session_factory):
+    async with session_factory() as db:
+        user = User(email="bench@example.com", username="bench", first_name="B", last_name="U", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        project = Project(name="Benchmark", owner_id=user.id)
+        db.add(project)
+        await db.commit()
+        return user.id, project.id
+
+
+async def timed(label, coro):
+    started = time.perf_counter()
+    result = await coro
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28}{elapsed * 1000:>10.1f} ms{TASKS / elapsed:>12,.0f} tasks/s")
+    return result
+
+
+async def main():
+    structlog_quiet()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        user_id, project_id = await seed(session_factory)
+        items = [TaskCreate(title=f"Task {n}", project_id=project_id) for n in range(TASKS)]
+        changes = TaskUpdate(priority="high")
+
+        async def per_task_create():
+            async with session_factory() as db:
+                return [await task_service.create_task(db, item, user_id) for item in items]
+
+        async def bulk_create():
+            async with session_factory() as db:
+                return (await task_service.bulk_create_tasks(db, items, user_id)).created
+
+        async def per_task_update(tasks):
+            async with session_factory() as db:
+                for task in tasks:
+                    await task_service.update_task(db, task.id, changes, user_id)
+
+        async def bulk_update(tasks):
+            async with session_factory() as db:
+                await task_service.bulk_update_tasks(db, [task.id for task in tasks], changes, user_id)
+
+        print(f"{TASKS} tasks")
+        single = await timed("create, one per request", per_task_create())
+        bulk = await timed("create, bulk", bulk_create())
+        await timed("update, one per request", per_task_update(single))
+        await timed("update, bulk", bulk_update(bulk))
+        await engine.dispose()
+
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Benchmark CompressedJSON storage against plain JSON columns
+
+Builds a corpus of ROWS synthetic Gemini requirement analyses and GitHub
+push webhooks (shaped like the real payloads, with varied prose, shas,
+file lists and users) and reports per format:
+
+  * stored bytes (plain JSON as the JSON column type writes it, deflate
+    without a dictionary, deflate with the column's preset dictionary)
+  * encode and decode CPU per row
+  * SQLite file size and the time to read every row back and decode it
+
+Usage: python scripts/bench_compressed_json.py [rows]
+"""
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.utils.compression import decode_json, encode_json
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+WORDS = (
+    "user account payment invoice checkout cart order search filter report dashboard export "
+    "notification email webhook token session role permission audit log cache queue retry "
+    "timeout latency throughput database index migration schema backup restore upload file "
+    "image thumbnail mobile offline sync conflict version history comment review approval "
+    "workflow integration github deployment pipeline staging production rollback monitor alert"
+).split()
+VERBS = "support allow validate store display send process handle track generate enforce expose".split()
+
+
+def sentence(rng, words=12):
+    return " ".join([rng.choice(VERBS)] + [rng.choice(WORDS) for _ in range(words - 1)]).capitalize() + "."
+
+
+def analysis(rng):
+    return {
+        "entities": [
+            {
+                "type": rng.choice(["feature", "component", "integration", "data_model"]),
+                "name": " ".join(rng.choice(WORDS) for _ in range(2)).title(),
+                "description": sentence(rng, rng.randint(8, 20)),
+            }
+            for _ in range(rng.randint(3, 25))
+        ],
+        "features": [sentence(rng, rng.randint(4, 10)) for _ in range(rng.randint(3, 12))],
+        "complexity_assessment": rng.choice(["low", "medium", "high"]),
+        "effort_estimate": str(rng.randint(2, 120)),
+        "confidence_score": str(round(rng.random(), 2)),
+        "suggestions": [sentence(rng, rng.randint(8, 18)) for _ in range(rng.randint(2, 10))],
+        "risks": [sentence(rng, rng.randint(6, 14)) for _ in range(rng.randint(1, 8))],
+        "acceptance_criteria": [sentence(rng, rng.randint(8, 16)) for _ in range(rng.randint(2, 10))],
+        "tech_considerations": [sentence(rng, rng.randint(6, 14)) for _ in range(rng.randint(1, 8))],
+    }
+
+
+def sha(rng):
+    return hashlib.sha1(str(rng.random()).encode()).hexdigest()
+
+
+def github_user(login, user_id):
+    base = f"https://api.github.com/users/{login}"
+    return {
+        "login": login, "id": user_id, "node_id": f"MDQ6VXNlcj{user_id}",
+        "avatar_url": f"https://avatars.githubusercontent.com/u/{user_id}?v=4", "gravatar_id": "",
+        "url": base, "html_url": f"https://github.com/{login}",
+        "followers_url": f"{base}/followers", "following_url": f"{base}/following{{/other_user}}",
+        "gists_url": f"{base}/gists{{/gist_id}}", "starred_url": f"{base}/starred{{/owner}}{{/repo}}",
+        "subscriptions_url": f"{base}/subscriptions", "organizations_url": f"{base}/orgs",
+        "repos_url": f"{base}/repos", "events_url": f"{base}/events{{/privacy}}",
+        "received_events_url": f"{base}/received_events", "type": "User",
+        "user_view_type": "public", "site_admin": False,
+    }
+
+
+def webhook(rng):
+    owner = rng.choice(["acme", "keystone-dev", "platform-team", "octo-org"])
+    repo = rng.choice(WORDS) + "-" + rng.choice(["service", "api", "web", "worker"])
+    login = rng.choice(["alice", "bob", "carol", "dave", "erin"]) + str(rng.randint(1, 99))
+    base = f"https://api.github.com/repos/{owner}/{repo}"
+    commits = []
+    for _ in range(rng.randint(1, 20)):
+        commit_id = sha(rng)
+        commits.append({
+            "id": commit_id, "tree_id": sha(rng), "distinct": True, "message": sentence(rng, rng.randint(4, 14)),
+            "timestamp": f"2026-10-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z",
+            "url": f"https://github.com/{owner}/{repo}/commit/{commit_id}",
+            "author": {"name": login.title(), "email": f"{login}@example.com", "username": login},
+            "committer": {"name": "GitHub", "email": "noreply@github.com", "username": "web-flow"},
+            "added": [f"src/{rng.choice(WORDS)}/{rng.choice(WORDS)}.py" for _ in range(rng.randint(0, 3))],
+            "removed": [],
+            "modified": [f"src/{rng.choice(WORDS)}/{rng.choice(WORDS)}.py" for _ in range(rng.randint(1, 6))],
+        })
+    repository = {
+        "id": rng.randint(10 ** 6, 10 ** 9), "node_id": "R_kgDO" + sha(rng)[:8], "name": repo,
+        "full_name": f"{owner}/{repo}", "private": True, "owner": github_user(owner, rng.randint(1, 10 ** 7)),
+        "html_url": f"https://github.com/{owner}/{repo}", "description": sentence(rng, 8), "fork": False,
+        "url": base, "forks_url": f"{base}/forks", "keys_url": f"{base}/keys{{/key_id}}",
+        "collaborators_url": f"{base}/collaborators{{/collaborator}}", "teams_url": f"{base}/teams",
+        "hooks_url": f"{base}/hooks", "issue_events_url": f"{base}/issues/events{{/number}}",
+        "events_url": f"{base}/events", "assignees_url": f"{base}/assignees{{/user}}",
+        "branches_url": f"{base}/branches{{/branch}}", "tags_url": f"{base}/tags",
+        "blobs_url": f"{base}/git/blobs{{/sha}}", "git_tags_url": f"{base}/git/tags{{/sha}}",
+        "git_refs_url": f"{base}/git/refs{{/sha}}", "trees_url": f"{base}/git/trees{{/sha}}",
+        "statuses_url": f"{base}/statuses/{{sha}}", "languages_url": f"{base}/languages",
+        "stargazers_url": f"{base}/stargazers", "contributors_url": f"{base}/contributors",
+        "subscribers_url": f"{base}/subscribers", "subscription_url": f"{base}/subscription",
+        "commits_url": f"{base}/commits{{/sha}}", "git_commits_url": f"{base}/git/commits{{/sha}}",
+        "comments_url": f"{base}/comments{{/number}}", "issue_comment_url": f"{base}/issues/comments{{/number}}",
+        "contents_url": f"{base}/contents/{{+path}}", "compare_url": f"{base}/compare/{{base}}...{{head}}",
+        "merges_url": f"{base}/merges", "archive_url": f"{base}/{{archive_format}}{{/ref}}",
+        "downloads_url": f"{base}/downloads", "issues_url": f"{base}/issues{{/number}}",
+        "pulls_url": f"{base}/pulls{{/number}}", "milestones_url": f"{base}/milestones{{/number}}",
+        "notifications_url": f"{base}/notifications{{?since,all,participating}}",
+        "labels_url": f"{base}/labels{{/name}}", "releases_url": f"{base}/releases{{/id}}",
+        "deployments_url": f"{base}/deployments", "created_at": 1700000000, "updated_at": "2026-10-18T12:00:00Z",
+        "pushed_at": 1760000000, "git_url": f"git://github.com/{owner}/{repo}.git",
+        "ssh_url": f"git@github.com:{owner}/{repo}.git", "clone_url": f"https://github.com/{owner}/{repo}.git",
+        "svn_url": f"https://github.com/{owner}/{repo}", "homepage": None, "size": rng.randint(100, 90000),
+        "stargazers_count": 0, "watchers_count": 0, "language": "Python", "has_issues": True,
+        "has_projects": True, "has_downloads": True, "has_wiki": False, "has_pages": False,
+        "has_discussions": False, "forks_count": 0, "mirror_url": None, "archived": False, "disabled": False,
+        "open_issues_count": rng.randint(0, 40), "license": None, "allow_forking": False, "is_template": False,
+        "web_commit_signoff_required": False, "topics": [], "visibility": "private", "forks": 0,
+        "open_issues": 0, "watchers": 0, "default_branch": "main", "stargazers": 0, "master_branch": "main",
+        "organization": owner,
+    }
+    return {
+        "ref": "refs/heads/" + rng.choice(["main", "develop", "feature/" + rng.choice(WORDS)]),
+        "before": sha(rng), "after": commits[-1]["id"], "repository": repository,
+        "pusher": {"name": login, "email": f"{login}@example.com"},
+        "sender": github_user(login, rng.randint(1, 10 ** 7)), "created": False, "deleted": False,
+        "forced": False, "base_ref": None,
+        "compare": f"https://github.com/{owner}/{repo}/compare/{sha(rng)[:12]}...{commits[-1]['id'][:12]}",
+        "commits": commits, "head_commit": commits[-1],
+    }
+
+
+def per_row_us(seconds, rows):
+    return seconds / rows * 1e6
+
+
+def bench_codec(name, values, dictionary):
+    plain = [json.dumps(value).encode() for value in values]
+    started = time.perf_counter()
+    for value in values:
+        json.loads(json.dumps(value))
+    json_roundtrip = time.perf_counter() - started
+
+    results = {"json (JSON column)": (sum(map(len, plain)), None, None)}
+    for label, dictionary_name in (("deflate", "none"), ("deflate + dictionary", dictionary)):
+        started = time.perf_counter()
+        encoded = [encode_json(value, dictionary_name) for value in values]
+        encode_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        for data in encoded:
+            decode_json(data)
+        decode_seconds = time.perf_counter() - started
+        results[label] = (sum(map(len, encoded)), encode_seconds, decode_seconds)
+
+    print(f"\n{name}: {len(values)} rows, mean plain size {sum(map(len, plain)) / len(plain) / 1024:.1f} KB")
+    print(f"  {'format':<22}{'stored':>10}{'ratio':>8}{'encode us/row':>15}{'decode us/row':>15}")
+    for label, (size, encode_seconds, decode_seconds) in results.items():
+        ratio = results["json (JSON column)"][0] / size
+        encode_text = f"{per_row_us(encode_seconds, len(values)):.0f}" if encode_seconds else "-"
+        decode_text = f"{per_row_us(decode_seconds, len(values)):.0f}" if decode_seconds else "-"
+        print(f"  {label:<22}{size / 1024 / 1024:>8.2f}MB{ratio:>7.1f}x{encode_text:>15}{decode_text:>15}")
+    print(f"  json.dumps+json.loads only: {per_row_us(json_roundtrip, len(values)):.0f} us/row")
+
+
+def bench_sqlite(values, dictionary):
+    """File size and full read-back time, plain JSON text vs compressed blobs"""
+    print(f"\nSQLite read-back of {len(values)} rows (cold connection, decode included)")
+    for label, encode, decode in (
+        ("json text", lambda value: json.dumps(value), json.loads),
+        ("compressed", lambda value: encode_json(value, dictionary), decode_json),
+    ):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bench.db")
+            connection = sqlite3.connect(path)
+            connection.execute("CREATE TABLE payloads (id INTEGER PRIMARY KEY, value BLOB)")
+            connection.executemany("INSERT INTO payloads (value) VALUES (?)", [(encode(value),) for value in values])
+            connection.commit()
+            connection.execute("VACUUM")
+            connection.close()
+            size = os.path.getsize(path)
+
+            connection = sqlite3.connect(path)
+            started = time.perf_counter()
+            for (value,) in connection.execute("SELECT value FROM payloads"):
+                decode(value)
+            elapsed = time.perf_counter() - started
+            connection.close()
+        print(f"  {label:<12} file {size / 1024 / 1024:7.2f} MB   read+decode {elapsed * 1000:7.1f} ms")
+
+
+def main():
+    rng = random.Random(42)
+    analyses = [analysis(rng) for _ in range(ROWS)]
+    webhooks = [webhook(rng) for _ in range(ROWS)]
+
+    bench_codec("requirements.ai_analysis (Gemini analyses)", analyses, "gemini_analysis")
+    bench_codec("integration_events.raw_payload (GitHub push webhooks)", webhooks, "github_webhook")
+    bench_sqlite(webhooks, "github_webhook")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark Gemini resilience under injected faults
+
+Sends CALLS requirement analyses (CONCURRENCY at a time) through the real
+SDK client to the local fault-injecting provider from tests/. Two
+scenarios, each run with single calls (the old behaviour) and with the
+resilience layer (retries, circuit breaker, hedging, fallback model):
+
+  flaky   the primary model answers 503 to 15% of calls and takes
+          SLOW_SECONDS for 5%; the fallback model is healthy
+  outage  the primary model answers every call with 503 after OUTAGE_DELAY
+
+Reports the success rate, latency percentiles and calls sent to each model.
+
+Usage: python scripts/bench_gemini_resilience.py [calls]
+"""
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import app.services.gemini_service as gemini_module
+from app.services.gemini_service import AIServiceException, GeminiService
+from tests.fault_provider import Fault, FaultProvider
+
+CALLS = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+CONCURRENCY = 8
+SLOW_SECONDS = 1.0
+OUTAGE_DELAY = 0.05
+
+ANSWER = json.dumps({"features": ["Checkout"], "complexity_assessment": "low", "effort_estimate": 3})
+
+MODES = {
+    "single call": {"AI_RETRY_ATTEMPTS": 1, "AI_HEDGE_AFTER_SECONDS": 0.0, "AI_FALLBACK_MODEL": ""},
+    "resilient": {"AI_RETRY_ATTEMPTS": 3, "AI_HEDGE_AFTER_SECONDS": 0.2, "AI_FALLBACK_MODEL": "backup"},
+}
+
+
+def structlog_quiet():
+    import logging
+    import structlog
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+
+def flaky(provider: FaultProvider):
+    rng = random.Random(7)
+    faults = []
+    for _ in range(CALLS * 3):
+        roll = rng.random()
+        faults.append(Fault(status=503) if roll < 0.15 else Fault(delay=SLOW_SECONDS) if roll < 0.20 else Fault())
+    provider.script("primary", *faults)
+
+
+def outage(provider: FaultProvider):
+    provider.script("primary", *[Fault(status=503, delay=OUTAGE_DELAY)] * (CALLS * 3))
+
+
+async def run(scenario, mode: dict) -> dict:
+    provider = FaultProvider(answer=ANSWER).start()
+    scenario(provider)
+    for name, value in {**mode, "DEFAULT_AI_MODEL": "primary", "AI_RETRY_BASE_DELAY_SECONDS": 0.05}.items():
+        setattr(gemini_module.settings, name, value)
+    service = GeminiService(client=provider.client(), max_concurrency=CONCURRENCY * 2, rng=random.Random(0))
+    gate = asyncio.Semaphore(CONCURRENCY)
+    latencies, failures = [], 0
+
+    async def one():
+        nonlocal failures
+        async with gate:
+            started = time.perf_counter()
+            try:
+                await service.analyze_requirement("Checkout with receipts")
+            except AIServiceException:
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(CALLS)))
+    elapsed = time.perf_counter() - started
+    provider.stop()
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "ok": 1 - failures / CALLS,
+        "p50": cuts[49] * 1000, "p95": cuts[94] * 1000, "p99": cuts[98] * 1000,
+        "elapsed": elapsed,
+        "models": dict(Counter(provider.models())),
+        "opened": service.breaker("primary").opened,
+    }
+
+
+async def main():
+    structlog_quiet()
+    print(f"{CALLS} analyses, {CONCURRENCY} at a time\n")
+    print(f"{'scenario':<8} {'mode':<12} {'ok':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'total s':>8}  calls by model")
+    for scenario in (flaky, outage):
+        for mode, overrides in MODES.items():
+            result = await run(scenario, overrides)
+            print(
+                f"{scenario.__name__:<8} {mode:<12} {result['ok']:>6.1%} {result['p50']:>8.1f} {result['p95']:>8.1f}"
+                f" {result['p99']:>8.1f} {result['elapsed']:>8.2f}  {result['models']} (breaker opened {result['opened']}x)"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark packed batch analysis against one prompt per requirement
+
+Analyzes REQUIREMENTS short backlog-style requirements through the batch
+path (``RequirementService._analyze_texts``) twice, one prompt per
+requirement and packed, with a stand-in Gemini client. The client
+counts the real prompts the service builds and answers with a typical
+analysis per requirement. Tokens are estimated at four characters per
+token.
+
+Latency is a model, not a measurement: each call takes
+LATENCY_FIXED_MS plus LATENCY_INPUT_MS per prompt token plus
+LATENCY_OUTPUT_MS per response token. The fixed part is where packing
+saves time; output tokens cost the same either way.
+
+Usage: python scripts/bench_packed_prompts.py [requirements]
+"""
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.services import requirement_service as requirement_service_module
+from app.services.gemini_service import GeminiService, estimate_tokens
+from app.services.requirement_service import requirement_service
+
+REQUIREMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+LATENCY_FIXED_MS = 400
+LATENCY_INPUT_MS = 0.02
+LATENCY_OUTPUT_MS = 4
+
+ROLES = ["user", "admin", "project manager", "reviewer", "guest"]
+ACTIONS = [
+    "export the task list as CSV", "reset my password by email", "filter requirements by tag",
+    "see a burndown chart per sprint", "assign tasks to several people", "comment on a requirement",
+    "receive a notification when a task is blocked", "archive finished projects",
+    "link a GitHub pull request to a task", "sign in with single sign-on",
+]
+
+
+def requirement(rng, index):
+    return f"As a {rng.choice(ROLES)} I want to {rng.choice(ACTIONS)} so that work is tracked (#{index})."
+
+
+def analysis(text):
+    return {
+        "entities": [{"type": "feature", "name": text[:30], "description": "Main capability of the requirement"}],
+        "features": [text[:60]],
+        "complexity_assessment": "medium",
+        "effort_estimate": 8,
+        "confidence_score": 0.8,
+        "suggestions": ["Reuse the existing service layer", "Add an endpoint test"],
+        "risks": ["Scope creep"],
+        "acceptance_criteria": ["The action succeeds for authorized users", "Others get a 403"],
+        "tech_considerations": ["Index the filtered column"],
+    }
+
+
+class ModelledModels:
+    """Answers the prompts the service builds; sleeps for the modelled latency"""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.calls = self.input_tokens = self.output_tokens = 0
+        self.model_seconds = 0.0
+
+    async def generate_content(self, model, contents, config):
+        if '"analyses"' in contents:
+            numbered = [line.strip() for line in contents.splitlines() if line.strip().startswith("[")]
+            answer = {"analyses": [
+                dict(analysis(line.split("] ", 1)[1]), id=line[1:line.index("]")]) for line in numbered
+            ]}
+        else:
+            answer = analysis(next(text for text in self.texts if text in contents))
+        text = json.dumps(answer)
+        input_tokens, output_tokens = estimate_tokens(contents), estimate_tokens(text)
+        latency = (LATENCY_FIXED_MS + input_tokens * LATENCY_INPUT_MS + output_tokens * LATENCY_OUTPUT_MS) / 1000
+        self.calls += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.model_seconds += latency
+        await asyncio.sleep(latency)
+        return SimpleNamespace(text=text)
+
+
+async def main():
+    rng = random.Random(7)
+    texts = {str(index): requirement(rng, index) for index in range(REQUIREMENTS)}
+    settings = requirement_service_module.settings
+    print(
+        f"{REQUIREMENTS} requirements (mean {sum(map(estimate_tokens, texts.values())) / REQUIREMENTS:.0f} tokens), "
+        f"AI_BATCH_CONCURRENCY={settings.AI_BATCH_CONCURRENCY}, AI_PACKED_MAX_ITEMS={settings.AI_PACKED_MAX_ITEMS}, "
+        f"AI_PACKED_PROMPT_TOKEN_BUDGET={settings.AI_PACKED_PROMPT_TOKEN_BUDGET}"
+    )
+    print(
+        f"  {'mode':<10}{'calls':>7}{'in tok/req':>12}{'out tok/req':>13}"
+        f"{'model s/req':>13}{'wall s':>9}"
+    )
+    for label, packed in (("single", False), ("packed", True)):
+        models = ModelledModels(list(texts.values()))
+        requirement_service_module.gemini_service = GeminiService(
+            client=SimpleNamespace(aio=SimpleNamespace(models=models)), max_concurrency=64
+        )
+        started = time.perf_counter()
+        results = await requirement_service._analyze_texts(texts, packed)
+        elapsed = time.perf_counter() - started
+        assert all(isinstance(result, dict) for result in results.values())
+        print(
+            f"  {label:<10}{models.calls:>7}{models.input_tokens / REQUIREMENTS:>12.0f}"
+            f"{models.output_tokens / REQUIREMENTS:>13.0f}{models.model_seconds / REQUIREMENTS:>13.3f}{elapsed:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark pool occupancy of requirement analysis under concurrency
+
+Runs REQUESTS concurrent ``analyze_requirement`` calls against a
+temporary SQLite database whose pool holds only POOL_SIZE connections,
+with the Gemini call replaced by a GEMINI_SECONDS sleep. Compares holding
+the read transaction across the Gemini call (``release_connection``
+disabled) with releasing it first, reporting wall time and peak and
+average checked-out connections.
+
+Usage: python scripts/bench_pool_occupancy.py [requests] [pool_size] [gemini_seconds]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+import app.models  # noqa: F401 - register all mappers
+from app.config.database import Base
+from app.models import User, Project, Requirement
+import app.services.requirement_service as requirement_module
+from app.services.requirement_service import requirement_service
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+POOL_SIZE = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+GEMINI_SECONDS = float(sys.argv[3]) if len(sys.argv) > 3 else 0.2
+
+
+def structlog_quiet():
+    import logging
+    import structlog
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+class SlowGemini:
+    """Stands in for the Gemini client: fixed latency, canned analysis"""
+
+    async def analyze_requirement(self, text):
+        await asyncio.sleep(GEMINI_SECONDS)
+        return {"complexity_assessment": "medium", "effort_estimate": 8, "features": ["x"], "suggestions": []}
+
+
+class PoolGauge:
+    """Tracks checked-out connections over time"""
+
+    def __init__(self, engine):
+        self.current = self.peak = 0
+        self.area = 0.0
+        self.last = time.perf_counter()
+        event.listen(engine.sync_engine.pool, "checkout", lambda *args: self.change(1))
+        event.listen(engine.sync_engine.pool, "checkin", lambda *args: self.change(-1))
+
+    def change(self, delta):
+        now = time.perf_counter()
+        self.area += self.current * (now - self.last)
+        self.last = now
+        self.current += delta
+        self.peak = max(self.peak, self.current)
+
+
+async def seed(session_factory):
+    async with session_factory() as db:
+        user = User(email="bench@example.com", username="bench", first_name="B", last_name="U", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        project = Project(name="Benchmark", owner_id=user.id)
+        db.add(project)
+        await db.flush()
+        requirements = [
+            Requirement(title=f"R{i}", description="d", project_id=project.id, created_by=user.id)
+            for i in range(REQUESTS)
+        ]
+        db.add_all(requirements)
+        await db.commit()
+        return user.id, [requirement.id for requirement in requirements]
+
+
+async def run(label, session_factory, engine, user_id, requirement_ids):
+    gauge = PoolGauge(engine)
+
+    async def one_request(requirement_id):
+        async with session_factory() as db:
+            await requirement_service.analyze_requirement(db, requirement_id, user_id)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_request(requirement_id) for requirement_id in requirement_ids))
+    elapsed = time.perf_counter() - started
+    gauge.change(0)
+    print(f"{label:<26}{elapsed * 1000:>10.1f} ms  peak {gauge.peak}  avg {gauge.area / elapsed:>5.2f} connections")
+
+
+async def main():
+    structlog_quiet()
+    requirement_module.gemini_service = SlowGemini()
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}",
+            poolclass=AsyncAdaptedQueuePool, pool_size=POOL_SIZE, max_overflow=0, pool_timeout=60,
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        user_id, requirement_ids = await seed(session_factory)
+
+        print(f"{REQUESTS} concurrent analyses, pool_size={POOL_SIZE}, Gemini latency {GEMINI_SECONDS * 1000:.0f} ms")
+        release = requirement_module.release_connection
+
+        async def hold(session):
+            return None
+
+        requirement_module.release_connection = hold
+        await run("held across Gemini call", session_factory, engine, user_id, requirement_ids)
+        requirement_module.release_connection = release
+        await run("released before Gemini", session_factory, engine, user_id, requirement_ids)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
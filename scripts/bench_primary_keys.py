@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark primary key layouts: text uuid4 vs blob UUIDv7
+
+Inserts the same rows into two SQLite tables shaped like ``tasks``:
+the previous layout (VARCHAR(36) random uuid4 keys, text foreign keys and
+an extra non-unique index on id) and the current one (16-byte UUIDv7 keys
+through the GUID type, no duplicate index). Reports insert throughput and
+on-disk table/index size from the dbstat virtual table.
+
+Usage: python scripts/bench_primary_keys.py [rows] [batch_size]
+"""
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import Column, ForeignKey, Index, MetaData, String, Table, create_engine, insert, text
+
+from app.models.types import GUID
+from app.utils.helpers import uuid7
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+BATCH_SIZE = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+PARENTS = 100
+
+metadata = MetaData()
+
+legacy_parents = Table("legacy_projects", metadata, Column("id", String(36), primary_key=True))
+legacy = Table(
+    "legacy_tasks", metadata,
+    Column("id", String(36), primary_key=True),
+    Column("project_id", String(36), ForeignKey("legacy_projects.id"), nullable=False),
+    Column("title", String(255)),
+    Index("ix_legacy_tasks_id", "id"),
+    Index("ix_legacy_tasks_project_id", "project_id"),
+)
+
+compact_parents = Table("compact_projects", metadata, Column("id", GUID, primary_key=True))
+compact = Table(
+    "compact_tasks", metadata,
+    Column("id", GUID, primary_key=True),
+    Column("project_id", GUID, ForeignKey("compact_projects.id"), nullable=False),
+    Column("title", String(255)),
+    Index("ix_compact_tasks_project_id", "project_id"),
+)
+
+
+def run(engine, parents, table, new_id):
+    parent_ids = [new_id() for _ in range(PARENTS)]
+    with engine.begin() as conn:
+        conn.execute(insert(parents), [{"id": parent_id} for parent_id in parent_ids])
+
+    started = time.perf_counter()
+    for start in range(0, ROWS, BATCH_SIZE):
+        rows = [
+            {"id": new_id(), "project_id": parent_ids[n % PARENTS], "title": f"Task {n}"}
+            for n in range(start, min(start + BATCH_SIZE, ROWS))
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(table), rows)
+    elapsed = time.perf_counter() - started
+
+    with engine.connect() as conn:
+        sizes = {
+            name: size
+            for name, size in conn.execute(text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"))
+            if name == table.name or table.name in name and name.startswith(("ix_", "sqlite_autoindex_"))
+        }
+    return ROWS / elapsed, sizes
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        metadata.create_all(engine)
+
+        results = [
+            ("VARCHAR(36) uuid4 + id index", *run(engine, legacy_parents, legacy, lambda: str(uuid.uuid4()))),
+            ("GUID blob UUIDv7", *run(engine, compact_parents, compact, lambda: str(uuid7()))),
+        ]
+
+    print(f"{ROWS} rows in batches of {BATCH_SIZE}")
+    for name, throughput, sizes in results:
+        total = sum(sizes.values())
+        print(f"\n{name}: {throughput:,.0f} rows/s, {total / 1024 / 1024:.1f} MiB")
+        for structure, size in sorted(sizes.items()):
+            print(f"  {structure:<40}{size / 1024 / 1024:>8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
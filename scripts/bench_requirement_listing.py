@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark requirement list pages: ORM hydration vs column projection
+
+Seeds a temporary SQLite database with one project holding PAGE_SIZE
+requirements (each with a few tasks and realistic description/analysis
+payloads), then measures latency and peak Python allocations for one
+page read with each strategy.
+
+Usage: python scripts/bench_requirement_listing.py [page_size] [rounds]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import select, insert
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+import app.models  # noqa: F401 - register all mappers
+from app.config.database import Base
+from app.models import User, Project, Requirement, Task
+from app.schemas.requirement import RequirementResponse
+from app.services.requirement_service import requirement_list_columns, requirement_response_from_row
+
+PAGE_SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+ROUNDS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+TASKS_PER_REQUIREMENT = 3
+
+DESCRIPTION = "As a customer I want to pay with a saved card so that checkout is faster. " * 25
+ANALYSIS = {
+    "entities": [{"type": "feature", "name": f"entity {i}", "description": "x" * 80} for i in range(10)],
+    "features": [f"feature {i}" for i in range(10)],
+    "complexity_assessment": "medium",
+    "effort_estimate": 16,
+    "confidence_score": 0.8,
+    "suggestions": ["use the payment provider vault " * 4] * 5,
+    "risks": ["PCI scope creep " * 4] * 5,
+}
+
+
+async def seed(session_factory) -> str:
+    async with session_factory() as db:
+        user = User(email="bench@example.com", username="bench", first_name="B", last_name="U", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        project = Project(name="Benchmark", owner_id=user.id)
+        db.add(project)
+        await db.flush()
+
+        requirements = await db.scalars(
+            insert(Requirement).returning(Requirement.id),
+            [
+                {
+                    "title": f"Requirement {i}", "description": DESCRIPTION, "ai_analysis": ANALYSIS,
+                    "acceptance_criteria": ["criterion a", "criterion b"], "tags": ["payments"],
+                    "project_id": project.id, "created_by": user.id,
+                }
+                for i in range(PAGE_SIZE)
+            ],
+        )
+        await db.execute(
+            insert(Task),
+            [
+                {"title": f"Task {n}", "project_id": project.id, "requirement_id": requirement_id, "created_by": user.id}
+                for requirement_id in requirements.all()
+                for n in range(TASKS_PER_REQUIREMENT)
+            ],
+        )
+        await db.commit()
+        return project.id
+
+
+async def orm_page(db: AsyncSession, project_id: str):
+    """The previous read path: full entities plus an unused tasks load"""
+    result = await db.execute(
+        select(Requirement)
+        .options(selectinload(Requirement.tasks))
+        .where(Requirement.project_id == project_id)
+        .where(Requirement.is_deleted == False)
+        .limit(PAGE_SIZE)
+        .order_by(Requirement.updated_at.desc())
+    )
+    return [
+        RequirementResponse(
+            id=req.id, title=req.title, description=req.description, type=req.type,
+            priority=req.priority, status=req.status, acceptance_criteria=req.acceptance_criteria or [],
+            tags=req.tags or [], project_id=req.project_id, created_by=req.created_by,
+            created_at=req.created_at, updated_at=req.updated_at, ai_analysis=req.ai_analysis,
+        )
+        for req in result.scalars().all()
+    ]
+
+
+def projection_page(include):
+    async def run(db: AsyncSession, project_id: str):
+        result = await db.execute(
+            select(*requirement_list_columns(include))
+            .where(Requirement.project_id == project_id)
+            .where(Requirement.is_deleted == False)
+            .limit(PAGE_SIZE)
+            .order_by(Requirement.updated_at.desc())
+        )
+        return [requirement_response_from_row(row) for row in result]
+    return run
+
+
+async def measure(session_factory, project_id: str, reader):
+    timings, peaks = [], []
+    for _ in range(ROUNDS):
+        async with session_factory() as db:
+            tracemalloc.start()
+            started = time.perf_counter()
+            page = await reader(db, project_id)
+            timings.append((time.perf_counter() - started) * 1000)
+            peaks.append(tracemalloc.get_traced_memory()[1] / 1024 / 1024)
+            tracemalloc.stop()
+            assert len(page) == PAGE_SIZE
+    return statistics.median(timings), statistics.median(peaks)
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        project_id = await seed(session_factory)
+
+        readers = [
+            ("orm + selectinload(tasks)", orm_page),
+            ("projection, all fields", projection_page(["description", "ai_analysis"])),
+            ("projection, default fields", projection_page(None)),
+        ]
+        print(f"{PAGE_SIZE}-row page, median of {ROUNDS} rounds")
+        print(f"{'strategy':<30}{'latency ms':>12}{'peak MiB':>12}")
+        for name, reader in readers:
+            latency, peak = await measure(session_factory, project_id, reader)
+            print(f"{name:<30}{latency:>12.1f}{peak:>12.2f}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+"""
+Shared fixtures: an in-memory SQLite database per test, a recorder of
+the SQL statements sent to it, and the in-process API harness.
+"""
+import os
+from typing import List
+
+# The harness sends every request from one client address
+os.environ.setdefault("RATE_LIMIT_PER_MINUTE", "1000000")
+# Gemini retries back off for real; keep the waits short
+os.environ.setdefault("AI_RETRY_BASE_DELAY_SECONDS", "0.001")
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401 - register all mappers
+from app.config.database import Base
+from app.models import Project, User
+from tests.harness import ApiHarness
+
+
+class StatementRecorder:
+    """Collects every statement executed on an engine while enabled"""
+
+    def __init__(self, engine):
+        self.statements: List[str] = []
+        self.enabled = False
+        event.listen(engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if self.enabled:
+            self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements.clear()
+        self.enabled = True
+        return self
+
+    def __exit__(self, *exc_info):
+        self.enabled = False
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture
+async def db(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine):
+    """``with statements:`` records the SQL run inside the block"""
+    return StatementRecorder(engine)
+
+
+@pytest_asyncio.fixture
+async def user(session_factory):
+    async with session_factory() as session:
+        user = User(email="owner@example.com", username="owner", first_name="Owner", last_name="User", hashed_password="x")
+        session.add(user)
+        await session.commit()
+        return user
+
+
+@pytest_asyncio.fixture
+async def project(session_factory, user):
+    async with session_factory() as session:
+        project = Project(name="Test project", owner_id=user.id)
+        session.add(project)
+        await session.commit()
+        return project
+
+
+@pytest_asyncio.fixture
+async def api(tmp_path, monkeypatch):
+    """The app on a seeded scratch database; HARNESS_RAISE_ON_LAZY_LOAD=1 forbids lazy loads"""
+    from app.main import app
+
+    harness = ApiHarness(
+        str(tmp_path / "harness.db"),
+        raise_on_lazy_load=os.environ.get("HARNESS_RAISE_ON_LAZY_LOAD") == "1",
+    )
+    await harness.start(app, monkeypatch)
+    yield harness
+    await harness.stop(app)
@@ -0,0 +1,129 @@
+"""
+Fault-injecting Gemini provider
+
+A local HTTP server speaking enough of the Gemini REST API
+(``generateContent`` and ``streamGenerateContent``) for the real SDK
+client, so the service's error handling meets the exceptions the SDK
+actually raises. Each request takes the next scripted fault for its
+model (then ``default``): an error status, a delay, or a dropped
+connection. Every request is recorded with its model.
+"""
+import json
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List
+
+from google import genai
+
+MODEL_PATH = re.compile(r"/models/([^/:]+):(generateContent|streamGenerateContent)")
+
+STATUS_NAMES = {
+    400: "INVALID_ARGUMENT", 429: "RESOURCE_EXHAUSTED", 500: "INTERNAL",
+    503: "UNAVAILABLE", 504: "DEADLINE_EXCEEDED",
+}
+
+
+@dataclass(frozen=True)
+class Fault:
+    """How to answer one request"""
+    status: int = 200
+    delay: float = 0.0
+    drop: bool = False
+
+
+OK = Fault()
+
+
+class FaultProvider:
+    """Local Gemini stand-in; ``script`` queues faults per model"""
+
+    def __init__(self, answer: str = "{}", default: Fault = OK):
+        self.answer = answer
+        self.default = default
+        self.requests: List[str] = []
+        self._faults: Dict[str, Deque[Fault]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def script(self, model: str, *faults: Fault) -> None:
+        with self._lock:
+            self._faults[model].extend(faults)
+
+    def models(self) -> List[str]:
+        """Model of each request so far, in order"""
+        with self._lock:
+            return list(self.requests)
+
+    def client(self) -> genai.Client:
+        return genai.Client(api_key="fault-provider", http_options={"base_url": self.url})
+
+    def start(self) -> "FaultProvider":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _next_fault(self, model: str) -> Fault:
+        with self._lock:
+            self.requests.append(model)
+            queued = self._faults[model]
+            return queued.popleft() if queued else self.default
+
+    def _handler(self):
+        provider = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                match = MODEL_PATH.search(self.path)
+                if match is None:
+                    return self._json(404, {"error": {"code": 404, "message": "Unknown path", "status": "NOT_FOUND"}})
+                model, method = match.groups()
+                fault = provider._next_fault(model)
+                time.sleep(fault.delay)
+                if fault.drop:
+                    self.close_connection = True
+                    return
+                if fault.status != 200:
+                    return self._json(fault.status, {"error": {
+                        "code": fault.status, "message": "Injected fault",
+                        "status": STATUS_NAMES.get(fault.status, "UNKNOWN"),
+                    }})
+                body = {
+                    "candidates": [{
+                        "content": {"role": "model", "parts": [{"text": provider.answer}]},
+                        "finishReason": "STOP",
+                    }],
+                    "modelVersion": model,
+                }
+                if method == "streamGenerateContent":
+                    return self._send(200, "text/event-stream", f"data: {json.dumps(body)}\r\n\r\n".encode())
+                self._json(200, body)
+
+            def _json(self, status: int, body: dict):
+                self._send(status, "application/json", json.dumps(body).encode())
+
+            def _send(self, status: int, content_type: str, payload: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
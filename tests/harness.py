@@ -0,0 +1,286 @@
+"""
+In-process API harness
+
+Drives the FastAPI app through httpx's ASGI transport against a
+temporary SQLite file seeded with a realistic workspace. Keycloak and
+Gemini are replaced by deterministic stubs, so a request runs the real
+endpoints, services and SQL without touching the network. The background
+job runner is started on the same database. The number
+of statements each request sent is read back from the Server-Timing
+header written by LoggingMiddleware.
+
+With ``raise_on_lazy_load`` every ORM query gets ``raiseload("*")``, so
+an unplanned lazy load fails the request instead of quietly adding a
+statement per row.
+"""
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, raiseload
+
+import app.core.auth as auth_module
+import app.services.requirement_service as requirement_service_module
+from app.background.job_runner import job_runner
+from app.config.database import Base, get_db, get_session_factory
+from app.core.sql_monitor import install_sql_monitor
+from app.models import Project, Requirement, Task, User
+from app.repositories.tags import sync_requirement_tags
+from app.schemas.project import ProjectStatus
+from app.schemas.requirement import RequirementPriority, RequirementStatus, RequirementType
+from app.models.task import TaskStatus
+from app.services.keycloak_auth_service import KeycloakAuthService
+
+SERVER_TIMING_STATEMENTS = re.compile(r'desc="(\d+) statements"')
+
+TAG_POOL = ("payments", "auth", "search", "mobile", "reporting", "api", "performance", "security")
+
+
+class StubKeycloak(KeycloakAuthService):
+    """Accepts any bearer token as the harness user; the local user sync is real"""
+
+    def __init__(self, user_info: Dict[str, Any]):
+        super().__init__()
+        self.user_info = user_info
+
+    async def validate_token(self, token: str) -> Dict[str, Any]:
+        return {"sub": self.user_info["sub"], "email": self.user_info["email"]}
+
+    async def get_user_info(self, token: str) -> Dict[str, Any]:
+        return dict(self.user_info)
+
+
+class StubGemini:
+    """Deterministic stand-in for GeminiService"""
+
+    def __init__(self, task_count: int = 6):
+        self.task_count = task_count
+        self.calls: List[str] = []
+
+    async def analyze_requirement(self, requirement_text: str) -> Dict[str, Any]:
+        self.calls.append("analyze_requirement")
+        return {
+            "entities": [{"type": "feature", "name": "Checkout", "description": "Checkout flow"}],
+            "features": ["Checkout", "Receipts"],
+            "complexity_assessment": "medium",
+            "effort_estimate": 13,
+            "confidence_score": 0.8,
+            "suggestions": ["Reuse the existing payment client"],
+            "risks": ["Provider rate limits"],
+            "acceptance_criteria": ["Payment is captured once"],
+            "tech_considerations": ["Idempotency keys"],
+        }
+
+    async def generate_tasks(self, requirement: Dict[str, Any], max_tasks: int = 10) -> List[Dict[str, Any]]:
+        self.calls.append("generate_tasks")
+        tasks = []
+        for index in range(min(self.task_count, max_tasks)):
+            tasks.append({
+                "title": f"Step {index + 1}: {requirement.get('title', 'task')}",
+                "description": "Generated step",
+                "type": "testing" if index == self.task_count - 1 else "development",
+                "priority": "high" if index == 0 else "medium",
+                "estimated_hours": 4,
+                "acceptance_criteria": ["Done"],
+                # A chain: every step waits for the one before it
+                "dependencies": [f"Step {index}: {requirement.get('title', 'task')}"] if index else [],
+            })
+        return tasks
+
+    async def stream_tasks(self, requirement: Dict[str, Any], max_tasks: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        tasks = await self.generate_tasks(requirement, max_tasks)
+        self.calls[-1] = "stream_tasks"
+        for task in tasks:
+            yield task
+
+
+@dataclass
+class Seed:
+    """Sizes of the seeded workspace"""
+    projects: int = 5
+    requirements_per_project: int = 30
+    tasks_per_requirement: int = 4
+    tags_per_requirement: int = 3
+
+
+@dataclass
+class Timing:
+    """One measured request"""
+    status_code: int
+    statements: int
+    elapsed_ms: float
+
+
+@dataclass
+class Measurement:
+    """Repeated requests against one endpoint"""
+    timings: List[Timing] = field(default_factory=list)
+
+    @property
+    def max_statements(self) -> int:
+        return max(timing.statements for timing in self.timings)
+
+    def percentile(self, percent: float) -> float:
+        """Nearest-rank percentile of the request latencies, in ms"""
+        latencies = sorted(timing.elapsed_ms for timing in self.timings)
+        rank = max(1, math.ceil(percent / 100 * len(latencies)))
+        return latencies[rank - 1]
+
+    @property
+    def p95_ms(self) -> float:
+        return self.percentile(95)
+
+
+class ApiHarness:
+    """The app wired to a scratch database, stub AI and stub identity provider"""
+
+    def __init__(self, database_path: str, seed: Optional[Seed] = None, raise_on_lazy_load: bool = False):
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+        self.session_factory = async_sessionmaker(
+            self.engine, class_=AsyncSession, expire_on_commit=False,
+            sync_session_class=RaiseLoadSession if raise_on_lazy_load else Session,
+        )
+        self.seed_sizes = seed or Seed()
+        self.gemini = StubGemini()
+        self.user: Optional[User] = None
+        self.projects: List[Project] = []
+        self.requirements: List[Requirement] = []
+        self.tasks: List[Task] = []
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def start(self, app, monkeypatch) -> "ApiHarness":
+        """Create and seed the schema, then point the app at it"""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await self.seed()
+        install_sql_monitor(self.engine)
+
+        async def get_harness_db():
+            async with self.session_factory() as session:
+                try:
+                    yield session
+                except Exception:
+                    await session.rollback()
+                    raise
+
+        app.dependency_overrides[get_db] = get_harness_db
+        app.dependency_overrides[get_session_factory] = lambda: self.session_factory
+        monkeypatch.setattr(auth_module.settings, "AUTH_MODE", "keycloak")
+        monkeypatch.setattr(auth_module, "keycloak_service", StubKeycloak({
+            "sub": self.user.id,
+            "email": self.user.email,
+            "preferred_username": self.user.username,
+            "given_name": self.user.first_name,
+            "family_name": self.user.last_name,
+            "email_verified": True,
+        }))
+        monkeypatch.setattr(requirement_service_module, "gemini_service", self.gemini)
+        monkeypatch.setattr(job_runner, "session_factory", self.session_factory)
+        await job_runner.start()
+
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://harness",
+            headers={"Authorization": "Bearer harness-token"},
+        )
+        return self
+
+    async def stop(self, app):
+        await job_runner.stop()
+        if self.client is not None:
+            await self.client.aclose()
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_session_factory, None)
+        await self.engine.dispose()
+
+    async def seed(self):
+        """One user owning several projects of tagged requirements with tasks"""
+        sizes = self.seed_sizes
+        async with self.session_factory() as db:
+            self.user = User(
+                email="harness@example.com", username="harness", first_name="Harness",
+                last_name="User", hashed_password="", is_verified=True
+            )
+            db.add(self.user)
+            await db.flush()
+
+            requirement_types = list(RequirementType)
+            priorities = list(RequirementPriority)
+            statuses = list(RequirementStatus)
+            task_statuses = [TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED]
+            for p in range(sizes.projects):
+                project = Project(
+                    name=f"Project {p + 1}", description="Seeded project " * 10,
+                    status=ProjectStatus.ACTIVE, owner_id=self.user.id
+                )
+                db.add(project)
+                self.projects.append(project)
+            await db.flush()
+
+            tag_sets = []
+            for p, project in enumerate(self.projects):
+                for r in range(sizes.requirements_per_project):
+                    n = p * sizes.requirements_per_project + r
+                    tags = [TAG_POOL[(n + k) % len(TAG_POOL)] for k in range(sizes.tags_per_requirement)]
+                    requirement = Requirement(
+                        title=f"Requirement {n + 1}", description="As a user I want ... " * 40,
+                        type=requirement_types[n % len(requirement_types)],
+                        priority=priorities[n % len(priorities)],
+                        status=statuses[n % len(statuses)],
+                        acceptance_criteria=["Given ... when ... then ..."] * 3,
+                        tags=tags, project_id=project.id, created_by=self.user.id
+                    )
+                    db.add(requirement)
+                    self.requirements.append(requirement)
+                    tag_sets.append(tags)
+            await db.flush()
+
+            for requirement, tags in zip(self.requirements, tag_sets):
+                await sync_requirement_tags(db, requirement.id, tags, replace=False)
+                for t in range(sizes.tasks_per_requirement):
+                    task = Task(
+                        title=f"{requirement.title} task {t + 1}", description="Seeded task",
+                        status=task_statuses[t % len(task_statuses)], project_id=requirement.project_id,
+                        requirement_id=requirement.id, created_by=self.user.id, estimated_hours=3.0
+                    )
+                    db.add(task)
+                    self.tasks.append(task)
+            await db.commit()
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        return await self.client.request(method, path, **kwargs)
+
+    async def measure(self, method: str, path: str, repeat: int = 20, warmup: int = 1, **kwargs) -> Measurement:
+        """Time ``repeat`` requests after ``warmup`` unmeasured ones"""
+        for _ in range(warmup):
+            await self.request(method, path, **kwargs)
+        measurement = Measurement()
+        for _ in range(repeat):
+            started = time.perf_counter()
+            response = await self.request(method, path, **kwargs)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            measurement.timings.append(Timing(response.status_code, statement_count(response), elapsed_ms))
+        return measurement
+
+
+class RaiseLoadSession(Session):
+    """Session whose ORM queries refuse lazy loads that would emit SQL"""
+
+
+@event.listens_for(RaiseLoadSession, "do_orm_execute")
+def _raise_on_lazy_load(orm_execute_state):
+    if orm_execute_state.is_select:
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*", sql_only=True))
+
+
+def statement_count(response: httpx.Response) -> int:
+    """Statements the request sent, from the Server-Timing header"""
+    match = SERVER_TIMING_STATEMENTS.search(response.headers.get("server-timing", ""))
+    if match is None:
+        raise AssertionError(f"No Server-Timing statement count on {response.request.url}")
+    return int(match.group(1))
@@ -0,0 +1,124 @@
+"""
+Requirement analysis cache: keyed lookups, force_refresh, TTL and LRU eviction
+"""
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+
+from app.models import AnalysisCacheEntry, Requirement
+from app.services import analysis_cache_service as cache_module
+from app.services import requirement_service as requirement_service_module
+from app.services.analysis_cache_service import AnalysisCacheService, analysis_cache_key
+from app.services.gemini_service import FALLBACK_ANALYSIS
+from app.services.requirement_service import requirement_service
+from tests.harness import StubGemini
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def gemini(monkeypatch):
+    stub = StubGemini()
+    monkeypatch.setattr(requirement_service_module, "gemini_service", stub)
+    return stub
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    service = AnalysisCacheService()
+    monkeypatch.setattr(requirement_service_module, "analysis_cache_service", service)
+    return service
+
+
+@pytest_asyncio.fixture
+async def requirements(session_factory, user, project):
+    async with session_factory() as session:
+        rows = [
+            Requirement(title="Checkout", description="Pay  with\ta card.\n", project_id=project.id, created_by=user.id),
+            Requirement(title="Copy", description=" Pay with a card. ", project_id=project.id, created_by=user.id),
+        ]
+        session.add_all(rows)
+        await session.commit()
+        return rows
+
+
+async def _put(db, cache, text, **values):
+    await cache.put(db, text, {"features": [text]})
+    if values:
+        await db.execute(
+            update(AnalysisCacheEntry).where(AnalysisCacheEntry.cache_key == analysis_cache_key(text)).values(**values)
+        )
+    await db.commit()
+
+
+async def test_same_normalized_text_is_analyzed_once(db, user, requirements, gemini, cache):
+    first = await requirement_service.analyze_requirement(db, requirements[0].id, user.id)
+    second = await requirement_service.analyze_requirement(db, requirements[1].id, user.id)
+
+    assert gemini.calls == ["analyze_requirement"]
+    assert (first.cached, second.cached) == (False, True)
+    assert second.analysis_summary == first.analysis_summary
+    assert await db.scalar(select(Requirement.ai_analysis).where(Requirement.id == requirements[1].id))
+    assert cache.stats() == {"enabled": True, "hits": 1, "misses": 1, "refreshes": 0, "hit_ratio": 0.5}
+    assert await db.scalar(select(AnalysisCacheEntry.hit_count)) == 1
+
+
+async def test_force_refresh_calls_the_model_and_replaces_the_entry(db, user, requirements, gemini, cache):
+    await requirement_service.analyze_requirement(db, requirements[0].id, user.id)
+    refreshed = await requirement_service.analyze_requirement(db, requirements[0].id, user.id, force_refresh=True)
+
+    assert gemini.calls == ["analyze_requirement", "analyze_requirement"]
+    assert not refreshed.cached
+    assert cache.refreshes == 1
+    assert await cache.count(db) == 1
+
+
+async def test_key_covers_model_temperature_and_prompt_version(monkeypatch):
+    key = analysis_cache_key("Pay with a card.")
+
+    assert analysis_cache_key("  Pay with\n a card. ") == key
+    assert analysis_cache_key("pay with a card.") != key
+    assert analysis_cache_key("Pay with a card.", model="other-model") != key
+    assert analysis_cache_key("Pay with a card.", temperature=0.0) != key
+    assert analysis_cache_key("Pay with a card.", prompt_version="0") != key
+    monkeypatch.setattr(cache_module.settings, "DEFAULT_AI_MODEL", "other-model")
+    assert analysis_cache_key("Pay with a card.") != key
+
+
+async def test_expired_entries_miss_and_parse_failures_are_not_cached(db, cache):
+    await _put(db, cache, "stale", expires_at=datetime.utcnow() - timedelta(seconds=1))
+    await cache.put(db, "failed", FALLBACK_ANALYSIS)
+
+    assert await cache.get(db, "stale") is None
+    assert await cache.get(db, "failed") is None
+    assert cache.misses == 2
+
+
+async def test_evict_drops_expired_then_least_recently_used(db, cache):
+    now = datetime.utcnow()
+    await _put(db, cache, "expired", expires_at=now - timedelta(seconds=1))
+    for age, text in enumerate(["newest", "older", "oldest"]):
+        await _put(db, cache, text, last_used_at=now - timedelta(minutes=age))
+
+    assert await cache.get(db, "oldest") == {"features": ["oldest"]}
+    await db.commit()
+    evicted = await cache.evict(db, max_entries=2)
+    await db.commit()
+
+    assert evicted == 2
+    assert set(await db.scalars(select(AnalysisCacheEntry.cache_key))) == {
+        analysis_cache_key("newest"), analysis_cache_key("oldest")
+    }
+
+
+async def test_analyze_endpoint_serves_cache_and_honours_force_refresh(api):
+    path = f"/api/v1/requirements/{api.requirements[0].id}/analyze"
+
+    first = await api.request("POST", path)
+    second = await api.request("POST", path)
+    refreshed = await api.request("POST", path + "?force_refresh=true")
+
+    assert [response.json()["cached"] for response in (first, second, refreshed)] == [False, True, False]
+    assert api.gemini.calls.count("analyze_requirement") == 2
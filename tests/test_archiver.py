@@ -0,0 +1,109 @@
+"""
+Archiver: expired soft-deleted units move to the archive tables and back
+"""
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, update
+
+from app.background.archiver import Archiver
+from app.config.database import Base
+from app.models import Project, Requirement, Task, TaskComment, TaskDependency
+from app.models.archive import ARCHIVE_TABLES
+from app.models.tag import Tag, requirement_tags
+
+pytestmark = pytest.mark.asyncio
+
+UNIT_TABLES = ("projects", "requirements", "requirement_tags", "tasks", "task_dependencies", "task_comments")
+# Rows in each table for one deleted_project
+UNIT_ROWS = {
+    "projects": 1, "requirements": 1, "requirement_tags": 1,
+    "tasks": 2, "task_dependencies": 1, "task_comments": 1,
+}
+EMPTY = dict.fromkeys(UNIT_TABLES, 0)
+
+
+@pytest_asyncio.fixture
+async def deleted_project(session_factory, user):
+    """A project with a tagged requirement, two dependent tasks and a comment, soft-deleted 100 days ago"""
+    async with session_factory() as db:
+        project = Project(name="Old project", owner_id=user.id)
+        db.add(project)
+        await db.flush()
+        requirement = Requirement(title="Checkout", description="Pay", project_id=project.id, created_by=user.id)
+        tag = Tag(name="payments")
+        build = Task(title="Build", project_id=project.id, created_by=user.id)
+        test = Task(title="Test", project_id=project.id, created_by=user.id)
+        db.add_all([requirement, tag, build, test])
+        await db.flush()
+        await db.execute(requirement_tags.insert().values(requirement_id=requirement.id, tag_id=tag.id))
+        db.add_all([
+            TaskDependency(task_id=test.id, depends_on_id=build.id),
+            TaskComment(task_id=build.id, user_id=user.id, content="Started"),
+        ])
+        await db.flush()
+        await db.execute(
+            update(Project)
+            .where(Project.id == project.id)
+            .values(is_deleted=True, updated_at=datetime.utcnow() - timedelta(days=100))
+        )
+        await db.commit()
+        return project
+
+
+async def row_counts(session_factory, tables):
+    async with session_factory() as db:
+        return {name: await db.scalar(select(func.count()).select_from(tables[name])) for name in UNIT_TABLES}
+
+
+async def test_project_unit_moves_to_the_archive_and_back(session_factory, deleted_project, project):
+    archiver = Archiver(session_factory)
+    # ``project`` is live: it stays, and adds one hot project row throughout
+    live = dict(EMPTY, projects=1)
+
+    moved = await archiver.archive_expired(older_than_days=30)
+
+    assert moved == {"tasks": 0, "requirements": 0, "projects": 1}
+    assert await row_counts(session_factory, Base.metadata.tables) == live
+    assert await row_counts(session_factory, ARCHIVE_TABLES) == UNIT_ROWS
+
+    async with session_factory() as db:
+        assert await archiver.restore(db, "projects", deleted_project.id)
+        await db.commit()
+
+    hot = await row_counts(session_factory, Base.metadata.tables)
+    assert hot == {name: UNIT_ROWS[name] + live[name] for name in UNIT_TABLES}
+    assert await row_counts(session_factory, ARCHIVE_TABLES) == EMPTY
+    async with session_factory() as db:
+        assert await db.scalar(select(Project.is_deleted).where(Project.id == deleted_project.id)) is False
+
+
+async def test_recently_deleted_and_still_referenced_rows_stay(session_factory, deleted_project, project, user):
+    async with session_factory() as db:
+        referenced, unreferenced = (
+            Requirement(title=title, description="Old", project_id=project.id, created_by=user.id, is_deleted=True)
+            for title in ("Referenced", "Unreferenced")
+        )
+        db.add_all([referenced, unreferenced])
+        await db.flush()
+        # A live task still points at one of the deleted requirements
+        db.add(Task(title="Live", project_id=project.id, requirement_id=referenced.id, created_by=user.id))
+        await db.execute(
+            update(Requirement)
+            .where(Requirement.id.in_([referenced.id, unreferenced.id]))
+            .values(updated_at=datetime.utcnow() - timedelta(days=100))
+        )
+        await db.commit()
+    archiver = Archiver(session_factory)
+
+    assert await archiver.archive_expired(older_than_days=365) == {"tasks": 0, "requirements": 0, "projects": 0}
+    assert await archiver.archive_expired(older_than_days=30) == {"tasks": 0, "requirements": 1, "projects": 1}
+
+    async with session_factory() as db:
+        hot = set(await db.scalars(select(Requirement.title).where(Requirement.project_id == project.id)))
+    assert hot == {"Referenced"}
+
+
+async def test_restoring_an_unknown_id_does_nothing(db, session_factory):
+    assert await Archiver(session_factory).restore(db, "tasks", "missing") is False
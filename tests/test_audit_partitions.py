@@ -0,0 +1,108 @@
+"""
+Audit log partitions on SQLite: writes routed to monthly shard tables,
+reads over the overlapping shards, months created on write and ahead of
+time, and expired months dropped whole
+"""
+from datetime import datetime
+from typing import Optional
+
+import pytest
+from sqlalchemy import func, select
+
+import app.background.audit_partitions as audit_partitions_module
+import app.repositories.audit_log as audit_log_module
+from app.background.audit_partitions import AuditPartitionMaintainer
+from app.repositories.audit_log import (
+    AUDIT_TABLE, audit_log_source, ensure_partitions, insert_audit_rows, list_partitions, partition_name,
+    shard_table,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+def audit_row(created_at: Optional[datetime] = None, **values):
+    row = {"action_type": "create", "entity_type": "task", "description": "Task created", **values}
+    if created_at is not None:
+        row["created_at"] = created_at
+    return row
+
+
+async def count(db, table) -> int:
+    return await db.scalar(select(func.count()).select_from(table))
+
+
+async def test_rows_are_routed_to_the_shard_of_their_month(db):
+    written = await insert_audit_rows(db, [
+        audit_row(datetime(2026, 1, 31, 23, 59)),
+        audit_row(datetime(2026, 2, 1)),
+        audit_row(datetime(2026, 2, 14)),
+        audit_row(),
+    ])
+    await db.commit()
+
+    current = partition_name(datetime.utcnow())
+    assert written == 4
+    assert await list_partitions(db) == sorted({"audit_logs_2026_01", "audit_logs_2026_02", current})
+    assert await count(db, shard_table("audit_logs_2026_01")) == 1
+    assert await count(db, shard_table("audit_logs_2026_02")) == 2 + (current == "audit_logs_2026_02")
+    assert await count(db, AUDIT_TABLE) == 0
+
+
+async def test_partitioned_inserts_create_the_months_they_write_to(db, monkeypatch):
+    created = []
+
+    async def create_partitions(db, months):
+        created.extend(months)
+        return []
+
+    monkeypatch.setattr(audit_log_module, "is_partitioned", lambda dialect: True)
+    monkeypatch.setattr(audit_log_module, "_create_partitions", create_partitions)
+
+    await insert_audit_rows(db, [audit_row(datetime(2019, 6, 30)), audit_row(datetime(2019, 5, 1))])
+
+    assert created == [datetime(2019, 5, 1), datetime(2019, 6, 1)]
+    assert await count(db, AUDIT_TABLE) == 2
+
+
+async def test_reads_cover_only_the_overlapping_shards(db):
+    await insert_audit_rows(db, [audit_row(datetime(2025, month, 10)) for month in (3, 4, 5)])
+    await db.commit()
+
+    april = await audit_log_source(db, datetime(2025, 4, 1), datetime(2025, 4, 30))
+    spring = await audit_log_source(db, datetime(2025, 3, 15), datetime(2025, 5, 1))
+
+    assert april is shard_table("audit_logs_2025_04")
+    assert await count(db, april) == 1
+    assert await count(db, spring) == 3
+    since_april = select(func.count()).select_from(spring).where(spring.c.created_at >= datetime(2025, 4, 1))
+    assert await db.scalar(since_april) == 2
+
+
+async def test_partitions_are_created_ahead_once(db):
+    now = datetime(2026, 11, 15)
+
+    created = await ensure_partitions(db, months_ahead=2, now=now)
+    again = await ensure_partitions(db, months_ahead=2, now=now)
+
+    assert created == ["audit_logs_2026_11", "audit_logs_2026_12", "audit_logs_2027_01"]
+    assert again == []
+    assert await list_partitions(db) == created
+
+
+async def test_maintainer_creates_next_month_and_drops_expired_months(session_factory, monkeypatch):
+    monkeypatch.setattr(audit_partitions_module.settings, "AUDIT_PARTITION_MONTHS_AHEAD", 1)
+    async with session_factory() as db:
+        await insert_audit_rows(db, [
+            audit_row(datetime(2020, 1, 10), retention_period_days=30),
+            audit_row(datetime(2020, 2, 10), retention_period_days=36500),
+        ])
+        await db.commit()
+
+    await AuditPartitionMaintainer(session_factory).run_once()
+
+    now = datetime.utcnow()
+    next_month = datetime(now.year + now.month // 12, now.month % 12 + 1, 1)
+    async with session_factory() as db:
+        assert await list_partitions(db) == [
+            "audit_logs_2020_02", partition_name(now), partition_name(next_month),
+        ]
@@ -0,0 +1,150 @@
+"""
+Batch requirement analysis: concurrent model calls, one write, per-item results
+"""
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.models import Project, Requirement
+from app.services import requirement_service as requirement_service_module
+from app.services.analysis_cache_service import AnalysisCacheService
+from app.services.gemini_service import AIServiceException
+from app.services.requirement_service import requirement_service
+
+pytestmark = pytest.mark.asyncio
+
+
+class SlowGemini:
+    """Fixed-latency analyses; tracks calls in flight and fails listed texts"""
+
+    def __init__(self, latency: float = 0.02, failing=()):
+        self.latency = latency
+        self.failing = set(failing)
+        self.calls = self.in_flight = self.peak = 0
+
+    async def analyze_requirement(self, requirement_text: str):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        if requirement_text in self.failing:
+            raise AIServiceException("Gemini call timed out after 60s")
+        return {"features": [requirement_text], "complexity_assessment": "low", "effort_estimate": 3}
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    service = AnalysisCacheService()
+    monkeypatch.setattr(requirement_service_module, "analysis_cache_service", service)
+    return service
+
+
+@pytest_asyncio.fixture
+async def requirements(session_factory, user, project):
+    async with session_factory() as session:
+        rows = [
+            Requirement(title=f"R{i}", description=f"Requirement {i}", project_id=project.id, created_by=user.id)
+            for i in range(12)
+        ]
+        session.add_all(rows)
+        await session.commit()
+        return rows
+
+
+def _use(monkeypatch, gemini):
+    monkeypatch.setattr(requirement_service_module, "gemini_service", gemini)
+    return gemini
+
+
+async def test_model_calls_run_concurrently_up_to_the_limit(db, monkeypatch, user, requirements):
+    gemini = _use(monkeypatch, SlowGemini(latency=0.05))
+    monkeypatch.setattr(requirement_service_module.settings, "AI_BATCH_CONCURRENCY", 4)
+
+    response = await requirement_service.analyze_requirements_batch(db, [r.id for r in requirements], user.id)
+
+    assert response.succeeded == 12 and response.failed == 0
+    assert gemini.calls == 12
+    assert gemini.peak == 4
+    stored = dict((await db.execute(select(Requirement.id, Requirement.ai_analysis))).all())
+    assert all(stored[r.id] == {"features": [r.description], "complexity_assessment": "low", "effort_estimate": 3}
+               for r in requirements)
+
+
+async def test_failures_are_reported_per_item(db, session_factory, monkeypatch, user, requirements):
+    gemini = _use(monkeypatch, SlowGemini(failing={"Requirement 1"}))
+    async with session_factory() as session:
+        other = Project(name="Not mine", owner_id="00000000-0000-7000-8000-000000000001")
+        session.add(other)
+        await session.commit()
+        foreign = Requirement(title="Foreign", description="x", project_id=other.id, created_by=user.id)
+        session.add(foreign)
+        await session.commit()
+    ids = [requirements[0].id, requirements[1].id, "missing", foreign.id, requirements[0].id.upper()]
+
+    response = await requirement_service.analyze_requirements_batch(db, ids, user.id)
+
+    assert [item.requirement_id for item in response.results] == [requirements[0].id, requirements[1].id, "missing", foreign.id]
+    assert [item.success for item in response.results] == [True, False, False, False]
+    assert response.results[1].error == "Gemini call timed out after 60s"
+    assert response.results[2].error == "Requirement not found or access denied"
+    assert (response.succeeded, response.failed) == (1, 3)
+    assert gemini.calls == 2
+    assert await db.scalar(select(Requirement.ai_analysis).where(Requirement.id == requirements[1].id)) is None
+
+
+async def test_statement_count_does_not_grow_with_the_batch(db, statements, monkeypatch, user, requirements):
+    _use(monkeypatch, SlowGemini(latency=0))
+
+    with statements:
+        await requirement_service.analyze_requirements_batch(db, [r.id for r in requirements[:2]], user.id)
+    few = statements.count
+    with statements:
+        await requirement_service.analyze_requirements_batch(db, [r.id for r in requirements[2:]], user.id)
+
+    assert statements.count == few == 4
+
+
+async def test_cached_items_skip_the_model(db, monkeypatch, user, requirements):
+    gemini = _use(monkeypatch, SlowGemini(latency=0))
+    await requirement_service.analyze_requirements_batch(db, [r.id for r in requirements[:6]], user.id)
+
+    response = await requirement_service.analyze_requirements_batch(db, [r.id for r in requirements], user.id)
+
+    assert gemini.calls == 12
+    assert [item.analysis.cached for item in response.results] == [True] * 6 + [False] * 6
+
+
+async def test_batch_endpoint(api):
+    ids = [requirement.id for requirement in api.requirements[:3]] + ["missing"]
+
+    response = await api.request("POST", "/api/v1/requirements/analyze", json=ids)
+
+    assert response.status_code == 200
+    assert response.json()["succeeded"] == 3
+    assert response.json()["results"][3] == {
+        "requirement_id": "missing", "success": False, "analysis": None,
+        "error": "Requirement not found or access denied"
+    }
+
+
+async def test_packed_mode_sends_several_requirements_per_call(db, monkeypatch, user, requirements):
+    class PackedGemini(SlowGemini):
+        packs = []
+
+        async def analyze_requirements_packed(self, texts):
+            self.packs.append(list(texts.values()))
+            return {key: {"features": [text]} for key, text in texts.items()}
+
+    gemini = _use(monkeypatch, PackedGemini())
+    monkeypatch.setattr("app.services.gemini_service.settings.AI_PACKED_MAX_ITEMS", 5)
+
+    response = await requirement_service.analyze_requirements_batch(db, [r.id for r in requirements], user.id, packed=True)
+
+    assert response.succeeded == 12
+    assert [len(pack) for pack in gemini.packs] == [5, 5, 2]
+    assert gemini.calls == 0
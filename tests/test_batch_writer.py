@@ -0,0 +1,166 @@
+"""
+Batch writer durability: records a flush cannot write are spooled to disk
+and replayed on the next start, so nothing queued is lost; damaged spools
+and spool write errors do not stop the writer
+"""
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from app.background.batch_writer import BatchWriter, restore_datetimes
+
+pytestmark = pytest.mark.asyncio
+
+CREATED_AT = datetime(2026, 3, 1, 12, 30)
+
+
+class Storage:
+    """Flush target that fails while ``down`` is set"""
+
+    def __init__(self, down: bool = False):
+        self.down = down
+        self.attempts = 0
+        self.batches = []
+
+    async def flush(self, batch):
+        self.attempts += 1
+        if self.down:
+            raise ConnectionError("database unavailable")
+        self.batches.append([restore_datetimes(dict(record)) for record in batch])
+
+    @property
+    def records(self):
+        return [record for batch in self.batches for record in batch]
+
+
+def records(count: int):
+    return [{"id": str(index), "created_at": CREATED_AT, "updated_at": CREATED_AT} for index in range(count)]
+
+
+def spooled(path):
+    with open(path, encoding="utf-8") as spool:
+        return [json.loads(line) for line in spool]
+
+
+async def wait_for(condition, timeout: float = 1.0):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+async def test_failed_flush_spools_the_batch(tmp_path):
+    spool = tmp_path / "spool" / "audit.jsonl"
+    storage = Storage(down=True)
+    writer = BatchWriter("test", storage.flush, str(spool), batch_size=10, flush_interval=0.01)
+    await writer.start()
+
+    for record in records(3):
+        writer.submit(record)
+    await wait_for(lambda: storage.attempts == 1)
+    await writer.stop()
+
+    assert storage.records == []
+    assert spooled(spool) == [
+        {"id": str(index), "created_at": CREATED_AT.isoformat(), "updated_at": CREATED_AT.isoformat()}
+        for index in range(3)
+    ]
+
+
+async def test_spool_is_replayed_on_start(tmp_path):
+    spool = tmp_path / "audit.jsonl"
+    down = Storage(down=True)
+    first = BatchWriter("test", down.flush, str(spool), batch_size=2, flush_interval=0.01)
+    for record in records(5):
+        first.submit(record)
+    # Shutdown with the database down: everything queued lands in the spool
+    await first.stop()
+    assert len(spooled(spool)) == 5
+
+    storage = Storage()
+    second = BatchWriter("test", storage.flush, str(spool), batch_size=2, flush_interval=0.01)
+    await second.start()
+    await second.stop()
+
+    assert storage.records == records(5)
+    assert [len(batch) for batch in storage.batches] == [2, 2, 1]
+    assert not spool.exists()
+
+
+async def test_replay_that_fails_again_keeps_the_records(tmp_path):
+    spool = tmp_path / "audit.jsonl"
+    writer = BatchWriter("test", Storage(down=True).flush, str(spool), batch_size=10)
+    for record in records(2):
+        writer.submit(record)
+    await writer.stop()
+
+    retry = BatchWriter("test", Storage(down=True).flush, str(spool), batch_size=10)
+    await retry.start()
+    await retry.stop()
+
+    assert [record["id"] for record in spooled(spool)] == ["0", "1"]
+    assert not (tmp_path / "audit.jsonl.replay").exists()
+
+
+async def test_records_beyond_a_full_queue_are_spooled(tmp_path):
+    spool = tmp_path / "audit.jsonl"
+    storage = Storage()
+    writer = BatchWriter("test", storage.flush, str(spool), max_queue_size=2)
+
+    for record in records(3):
+        writer.submit(record)
+
+    assert [record["id"] for record in spooled(spool)] == ["2"]
+    await writer.stop()
+    assert [record["id"] for record in storage.records] == ["0", "1"]
+
+
+async def test_unreadable_spool_lines_are_moved_aside(tmp_path):
+    spool = tmp_path / "audit.jsonl"
+    good = json.dumps({"id": "0", "created_at": CREATED_AT.isoformat()})
+    # The last write of a crashed run was cut off mid-record
+    spool.write_text(f"{good}\n[1]\n{good[:20]}", encoding="utf-8")
+    storage = Storage()
+    writer = BatchWriter("test", storage.flush, str(spool))
+
+    await writer.start()
+    await writer.stop()
+
+    assert storage.records == [{"id": "0", "created_at": CREATED_AT}]
+    assert (tmp_path / "audit.jsonl.corrupt").read_text(encoding="utf-8") == f"[1]\n{good[:20]}\n"
+    assert not spool.exists()
+
+
+async def test_replay_left_over_by_an_earlier_run_is_finished_first(tmp_path):
+    spool = tmp_path / "audit.jsonl"
+    (tmp_path / "audit.jsonl.replay").write_text(json.dumps({"id": "old"}) + "\n", encoding="utf-8")
+    spool.write_text(json.dumps({"id": "new"}) + "\n", encoding="utf-8")
+    storage = Storage()
+    writer = BatchWriter("test", storage.flush, str(spool))
+
+    await writer.start()
+    await writer.stop()
+
+    assert [record["id"] for record in storage.records] == ["old", "new"]
+    assert not spool.exists()
+    assert not (tmp_path / "audit.jsonl.replay").exists()
+
+
+async def test_spool_write_errors_do_not_stop_the_writer(tmp_path):
+    # The spool's directory is a file, so every spool write fails
+    (tmp_path / "spool").write_text("", encoding="utf-8")
+    storage = Storage(down=True)
+    writer = BatchWriter("test", storage.flush, str(tmp_path / "spool" / "audit.jsonl"), flush_interval=0.01)
+    await writer.start()
+
+    writer.submit(records(1)[0])
+    await wait_for(lambda: storage.attempts == 1)
+    storage.down = False
+    writer.submit(records(2)[1])
+    await wait_for(lambda: storage.attempts == 2)
+    await writer.stop()
+
+    assert [record["id"] for record in storage.records] == ["1"]
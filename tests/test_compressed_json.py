@@ -0,0 +1,56 @@
+"""
+CompressedJSON column type and codec
+"""
+import json
+
+import pytest
+from sqlalchemy import select, text
+
+from app.models import Requirement
+from app.models.types import CompressedJSON
+from app.utils.compression import FORMAT_DEFLATE, FORMAT_PLAIN, decode_json, encode_json
+
+ANALYSIS = {
+    "entities": [{"type": "feature", "name": f"Entity {i}", "description": "Handles checkout"} for i in range(20)],
+    "features": ["Checkout", "Receipts"],
+    "complexity_assessment": "high",
+    "suggestions": ["Use idempotency keys"] * 5,
+}
+
+
+def test_small_values_are_stored_plain_and_large_ones_deflated():
+    small = encode_json({"a": 1}, "gemini_analysis")
+    large = encode_json(ANALYSIS, "gemini_analysis")
+
+    assert small[0] == FORMAT_PLAIN
+    assert large[0] == FORMAT_DEFLATE
+    assert len(large) < len(json.dumps(ANALYSIS)) / 3
+    assert decode_json(small) == {"a": 1}
+    assert decode_json(large) == ANALYSIS
+
+
+def test_plain_json_from_before_conversion_decodes():
+    assert decode_json(json.dumps(ANALYSIS)) == ANALYSIS
+    assert decode_json(json.dumps(ANALYSIS).encode()) == ANALYSIS
+
+
+def test_unknown_dictionary_is_rejected():
+    with pytest.raises(ValueError):
+        CompressedJSON("zstd")
+
+
+@pytest.mark.asyncio
+async def test_column_round_trips_through_the_orm(db, user, project):
+    requirement = Requirement(
+        title="Compressed", description="d", ai_analysis=ANALYSIS, project_id=project.id, created_by=user.id
+    )
+    db.add(requirement)
+    await db.commit()
+
+    stored = await db.scalar(text("SELECT ai_analysis FROM requirements"))
+    loaded = await db.scalar(
+        select(Requirement.ai_analysis).where(Requirement.id == requirement.id)
+    )
+
+    assert stored[0] == FORMAT_DEFLATE
+    assert loaded == ANALYSIS
@@ -0,0 +1,77 @@
+"""
+Large Text/JSON columns are deferred and only fetched where responses render them
+"""
+import pytest
+import pytest_asyncio
+from sqlalchemy import inspect, select
+
+from app.models import Requirement, Task
+from app.repositories.loader import get_loader
+from app.schemas.requirement import RequirementCreate, RequirementUpdate
+from app.schemas.task import TaskStatusUpdate
+from app.services.requirement_service import requirement_service
+from app.services.task_service import task_service
+
+pytestmark = pytest.mark.asyncio
+
+REQUIREMENT_LARGE = {"description", "ai_analysis"}
+
+
+@pytest_asyncio.fixture
+async def requirement(session_factory, user, project):
+    async with session_factory() as session:
+        requirement = Requirement(
+            title="Deferred", description="Long text " * 100, ai_analysis={"features": ["a"]},
+            project_id=project.id, created_by=user.id
+        )
+        session.add(requirement)
+        await session.commit()
+        return requirement
+
+
+async def test_plain_loads_leave_large_columns_out(db, statements, requirement):
+    with statements:
+        loaded = await db.scalar(select(Requirement).where(Requirement.id == requirement.id))
+
+    assert REQUIREMENT_LARGE <= inspect(loaded).unloaded
+    assert "description" not in statements.statements[0]
+    assert "ai_analysis" not in statements.statements[0]
+
+
+async def test_get_requirement_fills_in_a_lightweight_memo_entry(db, statements, user, requirement):
+    await get_loader(db).load(Requirement, requirement.id)
+
+    with statements:
+        loaded = await requirement_service.get_requirement_by_id(db, requirement.id, user.id)
+        again = await requirement_service.get_requirement_by_id(db, requirement.id, user.id)
+
+    assert loaded is again
+    assert loaded.description.startswith("Long text")
+    assert loaded.ai_analysis == {"features": ["a"]}
+    assert statements.count == 1
+
+
+async def test_writes_return_large_columns(db, user, project, requirement):
+    created = await requirement_service.create_requirement(
+        db, RequirementCreate(title="New", description="Body", project_id=project.id), user.id
+    )
+    updated = await requirement_service.update_requirement(
+        db, requirement.id, RequirementUpdate(title="Renamed"), user.id
+    )
+
+    assert not inspect(created).unloaded & REQUIREMENT_LARGE
+    assert not inspect(updated).unloaded & REQUIREMENT_LARGE
+    assert updated.description.startswith("Long text")
+
+
+async def test_task_status_update_skips_ai_suggestions(db, statements, user, project):
+    task = Task(title="Task", project_id=project.id, created_by=user.id, ai_suggestions={"steps": ["x"] * 50})
+    db.add(task)
+    await db.commit()
+    db.expunge_all()
+    get_loader(db).forget(Task, task.id)
+
+    with statements:
+        assert await task_service.update_task_status(db, task.id, TaskStatusUpdate(status="in_progress"), user.id)
+
+    assert not any("ai_suggestions" in statement for statement in statements.statements)
@@ -0,0 +1,113 @@
+"""
+Per-endpoint SQL statement and latency budgets
+
+Each key endpoint declares the most statements one request may send and
+a p95 latency ceiling, measured in-process against the seeded harness
+workspace. Statement budgets are set at today's counts, so any extra
+query fails (an N+1 shows up as a count that grows with the data).
+Latency ceilings are deliberately loose and scale with
+HARNESS_LATENCY_FACTOR on slow machines. Counts include the
+authenticated user lookup.
+"""
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+from app.models import Project
+from tests.harness import ApiHarness, Seed
+
+pytestmark = pytest.mark.asyncio
+
+LATENCY_FACTOR = float(os.environ.get("HARNESS_LATENCY_FACTOR", "1"))
+REPEAT = 20
+
+
+@dataclass(frozen=True)
+class Budget:
+    method: str
+    # Formatted with the ids of the first seeded project, requirement and task
+    path: str
+    max_statements: int
+    p95_ms: float
+    body: Dict[str, Any] = field(default_factory=dict)
+    expected_status: int = 200
+
+    @property
+    def id(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+BUDGETS = [
+    Budget("GET", "/api/v1/projects/", 3, 150),
+    Budget("GET", "/api/v1/projects/{project}", 2, 100),
+    Budget("GET", "/api/v1/projects/{project}/stats", 2, 100),
+    Budget("GET", "/api/v1/requirements/", 2, 200),
+    Budget("GET", "/api/v1/requirements/?tag=payments&tag=auth&tag_match=all", 2, 150),
+    Budget("GET", "/api/v1/requirements/project/{project}", 2, 150),
+    Budget("GET", "/api/v1/requirements/tags/facets", 2, 100),
+    Budget("GET", "/api/v1/requirements/{requirement}", 2, 100),
+    Budget("GET", "/api/v1/tasks/{task}", 2, 100),
+    Budget("POST", "/api/v1/projects/", 2, 150, {"name": "Budget project"}, 201),
+    Budget(
+        "POST", "/api/v1/requirements/", 5, 150,
+        {"title": "Budget requirement", "description": "Text", "project_id": "{project}", "tags": ["api", "new"]}, 201
+    ),
+    Budget("PUT", "/api/v1/requirements/{requirement}", 5, 150, {"title": "Renamed", "tags": ["auth"]}),
+    Budget("POST", "/api/v1/tasks/", 2, 150, {"title": "Budget task", "project_id": "{project}"}, 201),
+    Budget(
+        "POST", "/api/v1/tasks/bulk", 3, 200,
+        {"tasks": [{"title": f"Bulk task {i}", "project_id": "{project}"} for i in range(20)]}, 201
+    ),
+    # Served from the analysis cache after the warmup call
+    Budget("POST", "/api/v1/requirements/{requirement}/analyze", 4, 150),
+    Budget("POST", "/api/v1/requirements/{requirement}/analyze?force_refresh=true", 4, 150),
+    Budget("POST", "/api/v1/requirements/{requirement}/generate-tasks", 4, 200),
+]
+
+
+def _fill(value, ids: Dict[str, str]):
+    """Substitute seeded ids into a path or request body"""
+    if isinstance(value, str):
+        return value.format(**ids)
+    if isinstance(value, list):
+        return [_fill(item, ids) for item in value]
+    if isinstance(value, dict):
+        return {key: _fill(item, ids) for key, item in value.items()}
+    return value
+
+
+@pytest.mark.parametrize("budget", BUDGETS, ids=lambda budget: budget.id)
+async def test_endpoint_within_budget(api, budget):
+    ids = {"project": api.projects[0].id, "requirement": api.requirements[0].id, "task": api.tasks[0].id}
+    kwargs = {"json": _fill(budget.body, ids)} if budget.body else {}
+
+    measurement = await api.measure(budget.method, _fill(budget.path, ids), repeat=REPEAT, **kwargs)
+
+    assert {timing.status_code for timing in measurement.timings} == {budget.expected_status}
+    assert measurement.max_statements <= budget.max_statements
+    assert measurement.p95_ms <= budget.p95_ms * LATENCY_FACTOR
+
+
+async def test_statement_count_does_not_grow_with_rows(api):
+    """Listing ten times the rows sends the same number of statements"""
+    few = await api.measure("GET", "/api/v1/requirements/?limit=10", repeat=1)
+    many = await api.measure("GET", "/api/v1/requirements/?limit=100", repeat=1)
+
+    assert many.max_statements == few.max_statements
+
+
+async def test_raise_on_lazy_load_mode_rejects_lazy_loads(tmp_path):
+    harness = ApiHarness(str(tmp_path / "raise.db"), Seed(projects=1, requirements_per_project=1), raise_on_lazy_load=True)
+    async with harness.engine.begin() as conn:
+        await conn.run_sync(Project.metadata.create_all)
+    await harness.seed()
+
+    async with harness.session_factory() as db:
+        project = await db.scalar(select(Project))
+        with pytest.raises(InvalidRequestError, match="lazy='raise_on_sql'"):
+            project.requirements
+    await harness.engine.dispose()
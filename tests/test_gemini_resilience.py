@@ -0,0 +1,242 @@
+"""
+Gemini resilience: retries with jittered backoff, circuit breaker, hedged
+calls and model fallback, against the local fault-injecting provider
+"""
+import asyncio
+import json
+import random
+import time
+
+import pytest
+from sqlalchemy import select
+
+import app.services.gemini_service as gemini_module
+from app.models import AnalysisCacheEntry
+from app.services.analysis_cache_service import analysis_cache_key
+from app.services import requirement_service as requirement_service_module
+from app.services.gemini_service import AIServiceException, AIServiceUnavailable, GeminiService
+from app.utils.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, backoff_delay
+from tests.fault_provider import Fault, FaultProvider
+
+ANALYSIS = {"features": ["Checkout"], "complexity_assessment": "low", "effort_estimate": 3}
+
+UNAVAILABLE = Fault(status=503)
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    for name, value in {
+        "DEFAULT_AI_MODEL": "primary",
+        "AI_FALLBACK_MODEL": "",
+        "AI_RETRY_ATTEMPTS": 3,
+        "AI_HEDGE_AFTER_SECONDS": 0.0,
+        "AI_REQUEST_TIMEOUT_SECONDS": 2.0,
+    }.items():
+        monkeypatch.setattr(gemini_module.settings, name, value)
+    provider = FaultProvider(answer=json.dumps(ANALYSIS)).start()
+    yield provider
+    provider.stop()
+
+
+def service_for(provider: FaultProvider, **kwargs) -> GeminiService:
+    return GeminiService(client=provider.client(), rng=random.Random(0), **kwargs)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_backoff_is_full_jitter_up_to_the_cap():
+    rng = random.Random(1)
+
+    for attempt in range(8):
+        delays = [backoff_delay(attempt, 0.5, 4.0, rng) for _ in range(200)]
+        bound = min(4.0, 0.5 * 2 ** attempt)
+        assert all(0 <= delay <= bound for delay in delays)
+        assert max(delays) > bound * 0.9 and min(delays) < bound * 0.1
+
+
+def test_breaker_opens_on_failure_rate_and_closes_after_a_good_probe():
+    clock = Clock()
+    breaker = CircuitBreaker("m", failure_rate=0.5, window=4, min_calls=4, open_seconds=10, clock=clock)
+
+    for success in (True, False, True):
+        assert breaker.allow()
+        breaker.record(success)
+    assert breaker.state == CLOSED
+    breaker.record(False)
+
+    assert breaker.state == OPEN and not breaker.allow()
+    assert breaker.retry_after == 10
+    clock.now = 10
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() and not breaker.allow()  # one probe at a time
+    breaker.record(False)
+    assert breaker.state == OPEN and breaker.opened == 2
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record(True)
+    assert breaker.state == CLOSED and breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried(provider, monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_RETRY_ATTEMPTS", 4)
+    provider.script("primary", UNAVAILABLE, Fault(status=429), Fault(drop=True))
+    service = service_for(provider)
+
+    assert await service.analyze_requirement("Text") == ANALYSIS
+    assert provider.models() == ["primary"] * 4
+    assert service.retries == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(provider):
+    provider.script("primary", Fault(status=400))
+    service = service_for(provider)
+
+    with pytest.raises(AIServiceException) as raised:
+        await service.analyze_requirement("Text")
+
+    assert not isinstance(raised.value, AIServiceUnavailable)
+    assert provider.models() == ["primary"]
+    assert service.breaker("primary").state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_retries_give_up_as_unavailable(provider):
+    provider.default = UNAVAILABLE
+    service = service_for(provider)
+
+    with pytest.raises(AIServiceUnavailable, match=r"503 UNAVAILABLE \(3 attempts\)"):
+        await service.generate_tasks({"title": "Checkout"})
+
+    assert provider.models() == ["primary"] * 3
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_then_probes_and_closes(provider, monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_RETRY_ATTEMPTS", 1)
+    monkeypatch.setattr(gemini_module.settings, "AI_BREAKER_MIN_CALLS", 3)
+    monkeypatch.setattr(gemini_module.settings, "AI_BREAKER_OPEN_SECONDS", 0.2)
+    provider.default = UNAVAILABLE
+    service = service_for(provider)
+
+    for _ in range(3):
+        with pytest.raises(AIServiceUnavailable, match="503"):
+            await service.analyze_requirement("Text")
+    with pytest.raises(AIServiceUnavailable, match="circuit open") as raised:
+        await service.analyze_requirement("Text")
+
+    assert 0 < raised.value.retry_after <= 0.2
+    assert len(provider.models()) == 3
+
+    provider.default = Fault()
+    await asyncio.sleep(0.2)
+    assert await service.analyze_requirement("Text") == ANALYSIS
+    assert service.breaker("primary").state == CLOSED
+    assert len(provider.models()) == 4
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged(provider, monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_HEDGE_AFTER_SECONDS", 0.05)
+    provider.script("primary", Fault(delay=1.0))
+    service = service_for(provider)
+
+    started = time.perf_counter()
+    assert await service.analyze_requirement("Text") == ANALYSIS
+
+    assert time.perf_counter() - started < 0.8
+    assert service.hedges == 1
+    assert provider.models() == ["primary", "primary"]
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_a_free_slot(provider, monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_HEDGE_AFTER_SECONDS", 0.05)
+    provider.script("primary", Fault(delay=0.2))
+    service = service_for(provider, max_concurrency=1)
+
+    assert await service.analyze_requirement("Text") == ANALYSIS
+    assert service.hedges == 0 and provider.models() == ["primary"]
+
+
+@pytest.mark.asyncio
+async def test_fallback_model_takes_over_after_failures(provider, monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_FALLBACK_MODEL", "backup")
+    monkeypatch.setattr(gemini_module.settings, "AI_FALLBACK_AFTER_FAILURES", 2)
+    provider.script("primary", UNAVAILABLE, Fault(drop=True))
+    service = service_for(provider)
+
+    assert await service.analyze_requirement("Text") == ANALYSIS
+    assert provider.models() == ["primary", "primary", "backup"]
+    assert service.fallbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_fallback_model_is_used_while_the_primary_circuit_is_open(provider, monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_FALLBACK_MODEL", "backup")
+    service = service_for(provider)
+    primary = service.breaker("primary")
+    for _ in range(primary.min_calls):
+        primary.record(False)
+
+    assert await service.analyze_requirement("Text") == ANALYSIS
+    assert provider.models() == ["backup"]
+
+
+@pytest.mark.asyncio
+async def test_opening_a_stream_is_retried(provider):
+    provider.answer = json.dumps({"tasks": [{"title": "Build checkout"}, {"title": "Send receipts"}]})
+    provider.script("primary", UNAVAILABLE)
+    service = service_for(provider)
+
+    tasks = [task async for task in service.stream_tasks({"title": "Checkout"})]
+
+    assert [task["title"] for task in tasks] == ["Build checkout", "Send receipts"]
+    assert provider.models() == ["primary", "primary"]
+
+
+@pytest.mark.asyncio
+async def test_unavailable_gemini_is_a_503_with_retry_after(api, provider, monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_RETRY_ATTEMPTS", 1)
+    monkeypatch.setattr(gemini_module.settings, "AI_BREAKER_MIN_CALLS", 1)
+    provider.default = UNAVAILABLE
+    monkeypatch.setattr(requirement_service_module, "gemini_service", service_for(provider))
+    requirement = api.requirements[0]
+
+    first = await api.request("POST", f"/api/v1/requirements/{requirement.id}/analyze")
+    second = await api.request("POST", f"/api/v1/requirements/{requirement.id}/generate-tasks")
+
+    assert first.status_code == second.status_code == 503
+    assert first.json()["detail"] == "AI service temporarily unavailable"
+    assert 1 <= int(second.headers["retry-after"]) <= 30
+    assert provider.models() == ["primary"]  # the second request failed fast
+
+
+@pytest.mark.asyncio
+async def test_fallback_answers_are_cached_under_the_fallback_model(api, provider, monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_FALLBACK_MODEL", "backup")
+    monkeypatch.setattr(gemini_module.settings, "AI_FALLBACK_AFTER_FAILURES", 1)
+    provider.script("primary", UNAVAILABLE)
+    monkeypatch.setattr(requirement_service_module, "gemini_service", service_for(provider))
+    requirement = api.requirements[0]
+
+    first = await api.request("POST", f"/api/v1/requirements/{requirement.id}/analyze")
+    second = await api.request("POST", f"/api/v1/requirements/{requirement.id}/analyze")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json()["cached"] is False and second.json()["cached"] is False
+    assert provider.models() == ["primary", "backup", "primary"]
+    async with api.session_factory() as db:
+        entries = dict((await db.execute(select(AnalysisCacheEntry.cache_key, AnalysisCacheEntry.model))).all())
+    assert entries == {
+        analysis_cache_key(requirement.description, "backup"): "backup",
+        analysis_cache_key(requirement.description, "primary"): "primary",
+    }
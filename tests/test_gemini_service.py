@@ -0,0 +1,315 @@
+"""
+Gemini service: native async calls, bounded concurrency, timeouts, packed
+prompts, schema-constrained output and targeted truncation retries
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.gemini_service as gemini_module
+from app.schemas.gemini import GeminiAnalysis, GeminiPackedAnalyses, GeminiTaskList
+from app.services.gemini_service import FALLBACK_ANALYSIS, AIServiceException, GeminiService, pack_requirements
+
+ANALYSIS = {"features": ["Checkout"], "complexity_assessment": "low", "effort_estimate": 3}
+
+
+class FakeModels:
+    """Stands in for ``client.aio.models``: fixed latency, counts calls in flight"""
+
+    def __init__(self, delay: float = 0.01, text: str = json.dumps(ANALYSIS)):
+        self.delay = delay
+        self.text = text
+        self.in_flight = self.peak = self.calls = 0
+
+    async def generate_content(self, model, contents, config):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(text=self.text)
+
+
+def fake_client(models):
+    return SimpleNamespace(aio=SimpleNamespace(models=models))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_bounded_by_the_semaphore():
+    models = FakeModels()
+    service = GeminiService(client=fake_client(models), max_concurrency=3)
+
+    results = await asyncio.gather(*(service.analyze_requirement("Text") for _ in range(20)))
+
+    assert results == [ANALYSIS] * 20
+    assert models.calls == 20
+    assert models.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_slow_call_times_out(monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_REQUEST_TIMEOUT_SECONDS", 0.01)
+    service = GeminiService(client=fake_client(FakeModels(delay=1)))
+
+    with pytest.raises(AIServiceException, match="timed out"):
+        await service.analyze_requirement("Text")
+
+
+@pytest.mark.asyncio
+async def test_timed_out_call_frees_its_slot(monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_REQUEST_TIMEOUT_SECONDS", 0.01)
+    models = FakeModels(delay=1)
+    service = GeminiService(client=fake_client(models), max_concurrency=1)
+    with pytest.raises(AIServiceException):
+        await service.analyze_requirement("Text")
+
+    models.delay = 0
+    assert await service.analyze_requirement("Text") == ANALYSIS
+
+
+class PackedModels:
+    """Answers packed prompts with ``packed_text`` and single prompts with ANALYSIS"""
+
+    def __init__(self, packed_text: str):
+        self.packed_text = packed_text
+        self.prompts = []
+
+    async def generate_content(self, model, contents, config):
+        self.prompts.append(contents)
+        packed = '"analyses"' in contents
+        return SimpleNamespace(text=self.packed_text if packed else json.dumps(ANALYSIS))
+
+
+def test_packs_respect_token_budget_and_item_limit():
+    texts = {"a": "x" * 40, "b": "x" * 40, "c": "x" * 400, "d": "x" * 8, "e": "x" * 8, "f": "x" * 8}
+
+    packs = pack_requirements(texts, token_budget=30, max_items=2)
+
+    assert [list(pack) for pack in packs] == [["a", "b"], ["c"], ["d", "e"], ["f"]]
+
+
+@pytest.mark.asyncio
+async def test_packed_answer_is_mapped_back_by_item_number():
+    full = dict(FALLBACK_ANALYSIS, features=["second"])
+    models = PackedModels(json.dumps({"analyses": [dict(full, id="2"), dict(full, id="1", features=["first"])]}))
+    service = GeminiService(client=fake_client(models))
+
+    results = await service.analyze_requirements_packed({"k1": "First text", "k2": "Second text"})
+
+    assert results == {"k1": dict(full, features=["first"]), "k2": full}
+    assert len(models.prompts) == 1
+    assert "[1] First text" in models.prompts[0] and "[2] Second text" in models.prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_items_missing_from_the_packed_answer_are_rerun_alone():
+    full = dict(FALLBACK_ANALYSIS, features=["packed"])
+    models = PackedModels(json.dumps({"analyses": [dict(full, id="1"), {"id": "2", "features": []}]}))
+    service = GeminiService(client=fake_client(models))
+
+    results = await service.analyze_requirements_packed({"k1": "A", "k2": "B", "k3": "C"})
+
+    assert results == {"k1": full, "k2": ANALYSIS, "k3": ANALYSIS}
+    assert len(models.prompts) == 3
+
+
+@pytest.mark.asyncio
+async def test_out_of_range_and_repeated_item_numbers_are_rerun_alone():
+    full = dict(FALLBACK_ANALYSIS, features=["packed"])
+    answer = [
+        dict(full, id="0"), dict(full, id="-1"), dict(full, id="4"),
+        dict(full, id="2"), dict(full, id="2", features=["again"]),
+    ]
+    models = PackedModels(json.dumps({"analyses": answer}))
+    service = GeminiService(client=fake_client(models))
+
+    results = await service.analyze_requirements_packed({"k1": "A", "k2": "B", "k3": "C"})
+
+    assert results == {"k1": ANALYSIS, "k2": full, "k3": ANALYSIS}
+    assert len(models.prompts) == 3
+
+
+@pytest.mark.asyncio
+async def test_unparseable_packed_answer_reruns_every_item():
+    models = PackedModels('{"analyses": [')
+    service = GeminiService(client=fake_client(models))
+
+    results = await service.analyze_requirements_packed({"k1": "A", "k2": "B"})
+
+    assert results == {"k1": ANALYSIS, "k2": ANALYSIS}
+    assert len(models.prompts) == 3
+
+
+class StreamModels:
+    """Streams ``text`` in ``size``-character chunks, ``delay`` apart from chunk ``delay_from`` on"""
+
+    def __init__(self, text: str, size: int = 7, delay: float = 0.0, delay_from: int = 0):
+        self.text = text
+        self.size = size
+        self.delay = delay
+        self.delay_from = delay_from
+        self.sent = 0
+
+    async def generate_content_stream(self, model, contents, config):
+        async def chunks():
+            for index, start in enumerate(range(0, len(self.text), self.size)):
+                if index >= self.delay_from:
+                    await asyncio.sleep(self.delay)
+                self.sent = start + self.size
+                yield SimpleNamespace(text=self.text[start:start + self.size])
+        return chunks()
+
+
+@pytest.mark.asyncio
+async def test_streamed_tasks_arrive_before_the_response_ends():
+    tasks = [{"title": f"Task {i}", "dependencies": []} for i in range(4)]
+    text = json.dumps({"tasks": tasks})
+    models = StreamModels(text)
+    service = GeminiService(client=fake_client(models))
+
+    received = []
+    async for task in service.stream_tasks({"title": "Checkout"}):
+        received.append((task, models.sent))
+
+    assert [task for task, _ in received] == tasks
+    assert received[0][1] < len(text) / 2
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_at_max_tasks():
+    models = StreamModels(json.dumps({"tasks": [{"title": str(i)} for i in range(8)]}))
+    service = GeminiService(client=fake_client(models))
+
+    received = [task async for task in service.stream_tasks({}, max_tasks=3)]
+
+    assert received == [{"title": "0"}, {"title": "1"}, {"title": "2"}]
+
+
+@pytest.mark.asyncio
+async def test_stalled_stream_times_out(monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_REQUEST_TIMEOUT_SECONDS", 0.01)
+    service = GeminiService(client=fake_client(StreamModels('{"tasks": [{"title": "a"}]}', delay=1, delay_from=1)))
+
+    with pytest.raises(AIServiceException, match="stalled"):
+        async for _ in service.stream_tasks({}):
+            pass
+
+
+class ScriptedModels:
+    """Answers successive calls with ``answers`` in order; records prompts and configs"""
+
+    def __init__(self, *answers: str):
+        self.answers = list(answers)
+        self.calls = []
+
+    async def generate_content(self, model, contents, config):
+        self.calls.append((contents, config))
+        return SimpleNamespace(text=self.answers.pop(0))
+
+    async def generate_content_stream(self, model, contents, config):
+        self.calls.append((contents, config))
+        text = self.answers.pop(0)
+
+        async def chunks():
+            for start in range(0, len(text), 5):
+                yield SimpleNamespace(text=text[start:start + 5])
+        return chunks()
+
+
+def cut(text: str, marker: str) -> str:
+    return text[:text.index(marker)]
+
+
+FULL = dict(FALLBACK_ANALYSIS, features=["Checkout"], risks=["Fraud"], tech_considerations=["PCI scope"])
+TASKS = [{"title": f"Task {i}", "dependencies": []} for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_prompts_request_json_matching_the_response_schemas():
+    models = ScriptedModels(json.dumps(FULL), json.dumps({"tasks": TASKS}), json.dumps({"analyses": []}))
+    service = GeminiService(client=fake_client(models))
+
+    await service.analyze_requirement("Text")
+    await service.generate_tasks({"title": "Checkout"})
+    await service.analyze_requirements_packed({"k1": "A", "k2": "B"})
+
+    configs = [config for _, config in models.calls[:3]]
+    assert all(config.response_mime_type == "application/json" for config in configs)
+    assert [config.response_schema for config in configs] == [GeminiAnalysis, GeminiTaskList, GeminiPackedAnalyses]
+
+
+@pytest.mark.asyncio
+async def test_any_code_fence_is_accepted():
+    service = GeminiService(client=fake_client(ScriptedModels("```JSON\n" + json.dumps(FULL) + "```")))
+
+    assert await service.analyze_requirement("Text") == FULL
+
+
+@pytest.mark.asyncio
+async def test_truncated_analysis_asks_only_for_the_missing_fields():
+    models = ScriptedModels(
+        cut(json.dumps(FULL), '"risks"'),
+        json.dumps({"risks": ["Fraud"], "acceptance_criteria": [], "tech_considerations": ["PCI scope"]}),
+    )
+    service = GeminiService(client=fake_client(models))
+
+    assert await service.analyze_requirement("Text") == FULL
+    prompt, config = models.calls[1]
+    assert list(config.response_schema.model_fields) == ["risks", "acceptance_criteria", "tech_considerations"]
+    assert "risks, acceptance_criteria, tech_considerations" in prompt
+    assert '"features": ["Checkout"]' in prompt
+
+
+@pytest.mark.asyncio
+async def test_fields_still_missing_after_the_retries_take_default_values(monkeypatch):
+    monkeypatch.setattr(gemini_module.settings, "AI_TRUNCATION_RETRIES", 1)
+    truncated = cut(json.dumps(FULL), '"risks"')
+    models = ScriptedModels(truncated, cut(json.dumps({"risks": ["Fraud"], "acceptance_criteria": []}), '"acceptance'))
+    service = GeminiService(client=fake_client(models))
+
+    analysis = await service.analyze_requirement("Text")
+
+    assert analysis == dict(FULL, tech_considerations=FALLBACK_ANALYSIS["tech_considerations"])
+    assert len(models.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_truncated_packed_answer_keeps_the_complete_analyses():
+    entries = [dict(FULL, id=str(number)) for number in (1, 2, 3)]
+    models = ScriptedModels(cut(json.dumps({"analyses": entries}), '"id": "3"'), json.dumps(ANALYSIS))
+    service = GeminiService(client=fake_client(models))
+
+    results = await service.analyze_requirements_packed({"k1": "A", "k2": "B", "k3": "C"})
+
+    assert results == {"k1": FULL, "k2": FULL, "k3": ANALYSIS}
+    assert len(models.calls) == 2
+    assert "Requirement: C" in models.calls[1][0] and models.calls[1][1].response_schema is GeminiAnalysis
+
+
+@pytest.mark.asyncio
+async def test_truncated_task_list_asks_only_for_the_remaining_tasks():
+    models = ScriptedModels(
+        cut(json.dumps({"tasks": TASKS}), '"Task 2"'),
+        json.dumps({"tasks": [TASKS[1]] + TASKS[2:]}),
+    )
+    service = GeminiService(client=fake_client(models))
+
+    assert await service.generate_tasks({"title": "Checkout"}, max_tasks=5) == TASKS
+    prompt = models.calls[1][0]
+    assert "Generate maximum 3 tasks" in prompt
+    assert "- Task 0" in prompt and "- Task 1" in prompt
+
+
+@pytest.mark.asyncio
+async def test_truncated_task_stream_is_continued():
+    models = ScriptedModels(cut(json.dumps({"tasks": TASKS}), '"Task 3"'), json.dumps({"tasks": TASKS[3:]}))
+    service = GeminiService(client=fake_client(models))
+
+    received = [task async for task in service.stream_tasks({"title": "Checkout"}, max_tasks=5)]
+
+    assert received == TASKS
+    assert "Generate maximum 2 tasks" in models.calls[1][0]
@@ -0,0 +1,47 @@
+"""
+GUID ids: malformed ids are rejected on write (422 at the API) and match
+nothing on lookup
+"""
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.exc import StatementError
+
+from app.models import Task
+from app.schemas.task import TaskCreate
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_lookups_by_a_malformed_id_find_nothing(db, user, project):
+    assert await db.scalar(select(Task).where(Task.id == "abc")) is None
+    assert list(await db.scalars(select(Task).where(Task.assigned_to.in_(["abc", user.id])))) == []
+
+
+async def test_writing_a_malformed_id_raises(db, user, project):
+    task = Task(title="Build form", project_id=project.id, created_by=user.id)
+    db.add(task)
+    await db.flush()
+
+    with pytest.raises(StatementError, match="Malformed id"):
+        await db.execute(update(Task).where(Task.id == task.id).values(assigned_to="abc"))
+
+
+async def test_schemas_canonicalize_ids():
+    data = TaskCreate(title="Build form", project_id="0190A3B2C0DE7000800000000000002A")
+
+    assert data.project_id == "0190a3b2-c0de-7000-8000-00000000002a"
+
+
+async def test_malformed_ids_in_requests_are_rejected(api):
+    task = api.tasks[0]
+
+    created = await api.request(
+        "POST", "/api/v1/tasks/", json={"title": "Build form", "project_id": api.projects[0].id, "assigned_to": "abc"}
+    )
+    updated = await api.request(
+        "PATCH", "/api/v1/tasks/bulk", json={"task_ids": [task.id], "changes": {"assigned_to": "abc"}}
+    )
+
+    assert created.status_code == 422
+    assert updated.status_code == 422
+    assert "Invalid id" in created.text
@@ -0,0 +1,190 @@
+"""
+Background AI jobs: 202 on submit, work on the runner, outcome and timing in AgentAction
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app.background import job_runner as job_runner_module
+from app.background.job_runner import job_runner
+from app.models import AgentAction, Requirement, Task
+from app.models.agent import ActionStatus
+from app.services import requirement_service as requirement_service_module
+from app.services.gemini_service import AIServiceException
+from tests.harness import StubGemini
+
+pytestmark = pytest.mark.asyncio
+
+
+class GatedGemini(StubGemini):
+    """Analyses wait until the test opens the gate"""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.started = asyncio.Event()
+
+    async def analyze_requirement(self, requirement_text: str):
+        self.started.set()
+        await self.gate.wait()
+        return await super().analyze_requirement(requirement_text)
+
+
+def parse_sse(body: str):
+    events = []
+    for frame in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def wait_for_job(api, job_id: str) -> dict:
+    for _ in range(200):
+        job = (await api.request("GET", f"/api/v1/jobs/{job_id}")).json()
+        if job["status"] in ("completed", "failed"):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+async def test_analysis_job_returns_before_the_model_answers(api, monkeypatch):
+    gemini = GatedGemini()
+    monkeypatch.setattr(requirement_service_module, "gemini_service", gemini)
+    requirement = api.requirements[0]
+
+    response = await api.request("POST", f"/api/v1/requirements/{requirement.id}/analyze/job")
+
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "pending" and job["type"] == "requirement_analysis"
+    assert job["target_id"] == requirement.id
+    assert response.headers["location"].endswith(f"/api/v1/jobs/{job['id']}")
+    await asyncio.wait_for(gemini.started.wait(), 1)
+    assert (await api.request("GET", f"/api/v1/jobs/{job['id']}")).json()["status"] == "running"
+
+    gemini.gate.set()
+    finished = await wait_for_job(api, job["id"])
+
+    assert finished["status"] == "completed" and finished["error"] is None
+    assert finished["result"]["requirement_id"] == requirement.id
+    assert finished["result"]["estimated_effort"] == 13
+    assert finished["execution_time_ms"] >= 0
+    assert finished["started_at"] <= finished["completed_at"]
+    async with api.session_factory() as db:
+        stored = await db.scalar(select(Requirement.ai_analysis).where(Requirement.id == requirement.id))
+    assert stored["features"] == ["Checkout", "Receipts"]
+
+
+async def test_job_events_stream_until_the_job_finishes(api):
+    requirement = api.requirements[1]
+    job = (await api.request("POST", f"/api/v1/requirements/{requirement.id}/generate-tasks/job")).json()
+
+    response = await api.request("GET", f"/api/v1/jobs/{job['id']}/events")
+
+    assert response.status_code == 200
+    events = parse_sse(response.text)
+    assert {event for event, _ in events} == {"job"}
+    assert events[-1][1]["status"] == "completed"
+    assert len(events[-1][1]["result"]["tasks"]) == 6
+    assert len(events[-1][1]["result"]["dependencies"]) == 5
+    async with api.session_factory() as db:
+        generated = await db.scalar(
+            select(func.count()).select_from(Task).where(Task.requirement_id == requirement.id)
+        )
+    assert generated == 4 + 6
+
+
+async def test_failed_job_records_the_error(api, monkeypatch):
+    async def failing(requirement_text):
+        raise AIServiceException("Gemini call timed out after 60s")
+
+    monkeypatch.setattr(api.gemini, "analyze_requirement", failing)
+    job = (await api.request("POST", f"/api/v1/requirements/{api.requirements[2].id}/analyze/job")).json()
+
+    finished = await wait_for_job(api, job["id"])
+
+    assert finished["status"] == "failed"
+    assert finished["error"] == "Failed to analyze requirement"
+    assert finished["result"] is None and finished["completed_at"] is not None
+
+
+async def test_unknown_requirement_is_rejected_without_a_job(api):
+    response = await api.request("POST", "/api/v1/requirements/missing/analyze/job")
+
+    assert response.status_code == 404
+    async with api.session_factory() as db:
+        assert await db.scalar(select(func.count()).select_from(AgentAction)) == 0
+
+
+async def test_jobs_are_only_visible_to_their_submitter(api):
+    job = (await api.request("POST", f"/api/v1/requirements/{api.requirements[3].id}/analyze/job")).json()
+    await wait_for_job(api, job["id"])
+    async with api.session_factory() as db:
+        await db.execute(
+            update(AgentAction)
+            .where(AgentAction.id == job["id"])
+            .values(requested_by="00000000-0000-7000-8000-000000000001")
+        )
+        await db.commit()
+
+    assert (await api.request("GET", f"/api/v1/jobs/{job['id']}")).status_code == 404
+    assert (await api.request("GET", f"/api/v1/jobs/{job['id']}/events")).status_code == 404
+
+
+async def test_pending_jobs_are_run_on_start_and_interrupted_ones_requeued(api, monkeypatch):
+    gemini = GatedGemini()
+    monkeypatch.setattr(requirement_service_module, "gemini_service", gemini)
+    await job_runner.stop()
+    # With the runner down the job is only recorded
+    job = (await api.request("POST", f"/api/v1/requirements/{api.requirements[4].id}/analyze/job")).json()
+
+    await job_runner.start()
+    await asyncio.wait_for(gemini.started.wait(), 1)
+    await job_runner.stop()
+
+    interrupted = (await api.request("GET", f"/api/v1/jobs/{job['id']}")).json()
+    assert (interrupted["status"], interrupted["started_at"]) == ("pending", None)
+
+    gemini.gate.set()
+    await job_runner.start()
+    assert (await wait_for_job(api, job["id"]))["status"] == "completed"
+    assert gemini.calls == ["analyze_requirement"]
+
+
+async def test_jobs_left_running_past_the_timeout_are_requeued(api):
+    await job_runner.stop()
+    stale, fresh = [
+        (await api.request("POST", f"/api/v1/requirements/{requirement.id}/analyze/job")).json()
+        for requirement in api.requirements[5:7]
+    ]
+    # As a process killed mid-job leaves them
+    now = datetime.utcnow()
+    long_ago = now - timedelta(seconds=job_runner_module.settings.JOB_TIMEOUT_SECONDS + 60)
+    async with api.session_factory() as db:
+        for job, started_at in ((stale, long_ago), (fresh, now)):
+            await db.execute(
+                update(AgentAction)
+                .where(AgentAction.id == job["id"])
+                .values(status=ActionStatus.RUNNING, started_at=started_at)
+            )
+        await db.commit()
+
+    await job_runner.start()
+
+    assert (await wait_for_job(api, stale["id"]))["status"] == "completed"
+    assert (await api.request("GET", f"/api/v1/jobs/{fresh['id']}")).json()["status"] == "running"
+
+
+async def test_job_over_the_timeout_fails(api, monkeypatch):
+    gemini = GatedGemini()
+    monkeypatch.setattr(requirement_service_module, "gemini_service", gemini)
+    monkeypatch.setattr(job_runner_module.settings, "JOB_TIMEOUT_SECONDS", 0.05)
+    job = (await api.request("POST", f"/api/v1/requirements/{api.requirements[7].id}/analyze/job")).json()
+
+    finished = await wait_for_job(api, job["id"])
+
+    assert finished["status"] == "failed"
+    assert finished["error"] == "Job timed out after 0.05s"
@@ -0,0 +1,59 @@
+"""
+Incremental JSON array parser and tolerant parsing helpers
+"""
+import json
+
+from app.utils.json_stream import JSONArrayStream, complete_members, strip_code_fence
+
+TASKS = [
+    {"title": "Add [bracketed] title", "description": "Quote \" and brace } inside", "dependencies": []},
+    {"title": "Second", "dependencies": ["Add [bracketed] title"], "meta": {"nested": [1, 2]}},
+    {"title": "Third", "dependencies": []},
+]
+
+
+def test_elements_are_returned_as_soon_as_they_close():
+    text = "```json\n" + json.dumps({"tasks": TASKS}, indent=2) + "\n```"
+    parser = JSONArrayStream()
+    completed_at = []
+    for position, char in enumerate(text):
+        for item in parser.feed(char):
+            completed_at.append((position, item))
+
+    assert [item for _, item in completed_at] == TASKS
+    first_end = text.index("}", text.index("inside") + len("inside"))
+    assert completed_at[0][0] == first_end
+    assert parser.closed and parser.skipped == 0
+
+
+def test_truncated_array_keeps_the_complete_elements():
+    text = json.dumps({"tasks": TASKS})
+    parser = JSONArrayStream()
+
+    items = parser.feed(text[:text.index('"Third"')])
+
+    assert items == TASKS[:2]
+    assert not parser.closed
+
+
+def test_text_after_the_array_is_ignored():
+    parser = JSONArrayStream()
+
+    assert parser.feed('[{"a": 1}, 2, {"b": 2}] [{"c": 3}]') == [{"a": 1}, {"b": 2}]
+    assert parser.closed
+
+
+def test_code_fences_of_any_language_are_stripped():
+    assert strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert strip_code_fence('  ```JSON {"a": 1}```  ') == '{"a": 1}'
+    assert strip_code_fence('```\n[1]\n```\n') == "[1]"
+    assert strip_code_fence('{"a": "```"}') == '{"a": "```"}'
+
+
+def test_complete_members_of_a_truncated_object():
+    text = json.dumps({"features": ["a, b"], "risks": {"x": [1, 2]}, "suggestions": ["cut here"]})
+
+    assert complete_members(text) == ({"features": ["a, b"], "risks": {"x": [1, 2]}, "suggestions": ["cut here"]}, True)
+    assert complete_members(text[:text.index("cut")]) == ({"features": ["a, b"], "risks": {"x": [1, 2]}}, False)
+    assert complete_members(text[:12]) == ({}, False)
+    assert complete_members("not json") == ({}, False)
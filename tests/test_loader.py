@@ -0,0 +1,78 @@
+"""
+Request-scoped entity loader: coalescing, memoization and the by-id services
+"""
+import asyncio
+
+import pytest
+
+from app.models import Project, Requirement, User
+from app.repositories.loader import get_loader
+from app.services.auth_service import auth_service
+from app.services.requirement_service import requirement_service
+
+pytestmark = pytest.mark.asyncio
+
+UNKNOWN_ID = "00000000-0000-4000-8000-000000000000"
+
+
+async def test_loads_in_one_tick_share_one_query(db, statements, user, project):
+    loader = get_loader(db)
+
+    with statements:
+        found_user, found_project, missing = await asyncio.gather(
+            loader.load(User, user.id), loader.load(Project, project.id), loader.load(User, UNKNOWN_ID)
+        )
+
+    assert found_user.id == user.id
+    assert found_project.id == project.id
+    assert missing is None
+    # One IN (...) query per model
+    assert statements.count == 2
+    assert sum(" IN (" in statement for statement in statements.statements) == 2
+
+
+async def test_results_and_misses_are_memoized(db, statements, user):
+    loader = get_loader(db)
+    await loader.load_many(User, [user.id, UNKNOWN_ID])
+
+    with statements:
+        again = await loader.load_many(User, [user.id.upper(), UNKNOWN_ID])
+        looked_up = await auth_service.get_user_by_id(db, user.id)
+
+    assert statements.count == 0
+    assert again[0] is looked_up
+    assert again[1] is None
+
+
+async def test_loader_is_per_session(session_factory, user):
+    async with session_factory() as first, session_factory() as second:
+        assert get_loader(first) is get_loader(first)
+        assert get_loader(first) is not get_loader(second)
+
+
+async def test_repeated_requirement_lookup_hits_the_memo(db, statements, user, project):
+    requirement = Requirement(title="Memo", description="d", project_id=project.id, created_by=user.id)
+    db.add(requirement)
+    await db.commit()
+
+    with statements:
+        first = await requirement_service.get_requirement_by_id(db, requirement.id, user.id)
+        second = await requirement_service.get_requirement_by_id(db, requirement.id, user.id)
+        stranger = await requirement_service.get_requirement_by_id(db, requirement.id, UNKNOWN_ID)
+
+    assert first is second
+    assert stranger is None
+    # The memo only answers for a user already proven to own the project
+    assert statements.count == 2
+
+
+async def test_delete_drops_the_memoized_requirement(db, user, project):
+    requirement = Requirement(title="Memo", description="d", project_id=project.id, created_by=user.id)
+    db.add(requirement)
+    await db.commit()
+    await requirement_service.get_requirement_by_id(db, requirement.id, user.id)
+
+    await requirement_service.delete_requirement(db, requirement.id, user.id)
+
+    assert get_loader(db).peek(Requirement, requirement.id) is None
+    assert await requirement_service.get_requirement_by_id(db, requirement.id, user.id) is None
@@ -0,0 +1,99 @@
+"""
+SQL monitor: per-request statement accounting and slow/repeated statement records
+"""
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import OperationalError
+
+import app.background.system_log_writer as system_log_module
+import app.core.sql_monitor as sql_monitor
+from app.core.context import RequestContext, request_context
+from app.models import SystemLog, User
+
+pytestmark = pytest.mark.asyncio
+
+
+class CollectingWriter:
+    def __init__(self):
+        self.records = []
+
+    def submit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def monitored(engine, monkeypatch):
+    sql_monitor.install_sql_monitor(engine)
+    writer = CollectingWriter()
+    monkeypatch.setattr(system_log_module, "system_log_writer", writer)
+    context = RequestContext(request_id="req-1", method="GET", path="/things")
+    token = request_context.set(context)
+    yield context, writer
+    request_context.reset(token)
+
+
+async def test_statements_and_time_accumulate_on_request(db, monitored):
+    context, writer = monitored
+    await db.execute(select(User))
+    await db.execute(select(User))
+
+    assert context.sql_statements == 2
+    assert context.sql_time_ms > 0
+    assert max(context.sql_repeats.values()) == 2
+    assert writer.records == []
+
+
+async def test_slow_statement_recorded_with_parameter_shape_and_plan(db, monitored, monkeypatch):
+    context, writer = monitored
+    monkeypatch.setattr(sql_monitor.settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+    monkeypatch.setattr(sql_monitor.settings, "SLOW_QUERY_EXPLAIN", True)
+
+    await db.execute(select(User).where(User.email == "secret@example.com"))
+
+    # The EXPLAIN itself is not counted or recorded
+    assert context.sql_statements == 1
+    [record] = writer.records
+    assert record["request_id"] == "req-1"
+    assert record["component"] == "database"
+    assert record["context"]["parameters"] == ["str"]
+    assert "secret@example.com" not in str(record)
+    assert record["context"]["explain"]
+
+
+async def test_repeated_statement_reported(db, monitored, monkeypatch):
+    context, writer = monitored
+    monkeypatch.setattr(sql_monitor.settings, "SQL_REPEAT_THRESHOLD", 3)
+    for user_id in range(3):
+        await db.execute(select(User).where(User.id == str(user_id)))
+
+    sql_monitor.report_repeated_statements(context)
+
+    [record] = writer.records
+    assert record["message"] == "Repeated SQL statement"
+    assert record["context"]["count"] == 3
+
+
+async def test_system_log_rows_written_without_being_monitored(session_factory, monitored, monkeypatch):
+    context, writer = monitored
+    monkeypatch.setattr(system_log_module, "async_session_factory", session_factory)
+    monkeypatch.setattr(sql_monitor.settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+    system_log_module.record_system_log(sql_monitor.LogLevel.INFO, "hello", "tests")
+
+    await system_log_module.write_system_log_rows(writer.records)
+
+    assert context.sql_statements == 0
+    async with session_factory() as db:
+        assert await db.scalar(select(func.count()).select_from(SystemLog)) == 1
+
+
+async def test_failing_statement_leaves_no_timer_on_the_connection(db, monitored):
+    context, writer = monitored
+    for _ in range(3):
+        with pytest.raises(OperationalError):
+            await db.execute(text("SELECT * FROM missing_table"))
+        await db.rollback()
+    await db.execute(select(User))
+
+    connection = await db.connection()
+    assert connection.sync_connection.info[sql_monitor.TIMERS_KEY] == []
+    assert context.sql_statements == 1
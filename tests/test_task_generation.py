@@ -0,0 +1,85 @@
+"""
+Task generation: one transaction for the tasks and their dependency edges,
+edges written in topological order, cyclic sets rejected before any write
+"""
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Task, TaskDependency
+from app.services import requirement_service as requirement_service_module
+from tests.harness import StubGemini
+
+pytestmark = pytest.mark.asyncio
+
+
+class FixedTasksGemini(StubGemini):
+    """Answers every task generation with ``tasks``: (title, dependency titles) pairs"""
+
+    def __init__(self, tasks):
+        super().__init__()
+        self.tasks = tasks
+
+    async def generate_tasks(self, requirement, max_tasks=10):
+        self.calls.append("generate_tasks")
+        return [
+            {"title": title, "description": "Generated step", "type": "development", "dependencies": dependencies}
+            for title, dependencies in self.tasks
+        ]
+
+
+async def counts(api, requirement_id: str):
+    async with api.session_factory() as db:
+        task_ids = select(Task.id).where(Task.requirement_id == requirement_id)
+        tasks = await db.scalar(select(func.count()).select_from(Task).where(Task.requirement_id == requirement_id))
+        dependencies = await db.scalar(
+            select(func.count()).select_from(TaskDependency).where(TaskDependency.task_id.in_(task_ids))
+        )
+    return tasks, dependencies
+
+
+async def test_cyclic_dependencies_are_rejected_and_nothing_is_written(api, monkeypatch):
+    gemini = FixedTasksGemini([
+        ("Build", ["Deploy"]),
+        ("Test", ["Build"]),
+        ("Deploy", ["Test"]),
+        ("Docs", []),
+    ])
+    monkeypatch.setattr(requirement_service_module, "gemini_service", gemini)
+    requirement = api.requirements[0]
+    before = await counts(api, requirement.id)
+
+    response = await api.request("POST", f"/api/v1/requirements/{requirement.id}/generate-tasks")
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Generated tasks contain circular dependencies"
+    assert await counts(api, requirement.id) == before
+
+
+async def test_dependencies_are_written_in_topological_order(api, monkeypatch):
+    # Listed with dependents first, so index order is not a valid order
+    gemini = FixedTasksGemini([
+        ("Deploy", ["Test", "Docs"]),
+        ("Test", ["Build"]),
+        ("Docs", ["Build"]),
+        ("Build", ["Design"]),
+        ("Design", []),
+    ])
+    monkeypatch.setattr(requirement_service_module, "gemini_service", gemini)
+    requirement = api.requirements[1]
+    before_tasks, before_dependencies = await counts(api, requirement.id)
+
+    response = await api.request("POST", f"/api/v1/requirements/{requirement.id}/generate-tasks")
+
+    assert response.status_code == 200
+    body = response.json()
+    titles = {task["id"]: task["title"] for task in body["tasks"]}
+    edges = [(titles[edge["task_id"]], titles[edge["depends_on_id"]]) for edge in body["dependencies"]]
+    assert sorted(edges) == sorted([
+        ("Deploy", "Test"), ("Deploy", "Docs"), ("Test", "Build"), ("Docs", "Build"), ("Build", "Design"),
+    ])
+    # Every task's edges come after the edges of the tasks it depends on
+    written = [task for task, _ in edges]
+    for task, dependency in edges:
+        if dependency in written:
+            assert written.index(dependency) < written.index(task)
+    assert await counts(api, requirement.id) == (before_tasks + 5, before_dependencies + 5)
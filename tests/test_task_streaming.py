@@ -0,0 +1,85 @@
+"""
+Streaming task generation: tasks are saved and sent one by one over SSE
+"""
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Requirement, Task, TaskDependency
+from app.services import requirement_service as requirement_service_module
+from app.services.gemini_service import AIServiceException
+from app.services.requirement_service import requirement_service
+from tests.harness import StubGemini
+
+pytestmark = pytest.mark.asyncio
+
+
+def parse_sse(body: str):
+    events = []
+    for frame in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def test_stream_endpoint_sends_each_task_then_dependencies(api):
+    requirement = api.requirements[0]
+
+    response = await api.request("POST", f"/api/v1/requirements/{requirement.id}/generate-tasks/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+    assert [event for event, _ in events] == ["task"] * 6 + ["dependencies", "done"]
+    assert events[0][1]["title"] == f"Step 1: {requirement.title}"
+    assert len(events[6][1]) == 5
+    assert events[-1][1] == {"task_count": 6, "dependency_count": 5}
+    assert api.gemini.calls == ["stream_tasks"]
+
+
+async def test_stream_endpoint_rejects_unknown_requirement(api):
+    response = await api.request("POST", "/api/v1/requirements/missing/generate-tasks/stream")
+
+    assert response.status_code == 404
+
+
+class GatedGemini(StubGemini):
+    """Streams tasks one at a time, each only once the test releases it"""
+
+    def __init__(self):
+        super().__init__(task_count=3)
+        self.gate = asyncio.Queue()
+
+    async def stream_tasks(self, requirement, max_tasks=10):
+        for task in await self.generate_tasks(requirement, max_tasks):
+            await self.gate.get()
+            yield task
+        await self.gate.get()
+        raise AIServiceException("Gemini stream stalled for 60s")
+
+
+async def test_each_task_is_committed_before_the_next_is_generated(db, session_factory, monkeypatch, user, project):
+    async with session_factory() as session:
+        requirement = Requirement(title="Checkout", description="Pay", project_id=project.id, created_by=user.id)
+        session.add(requirement)
+        await session.commit()
+    gemini = GatedGemini()
+    monkeypatch.setattr(requirement_service_module, "gemini_service", gemini)
+    source = await requirement_service.get_generation_source(db, requirement.id, user.id)
+    events = requirement_service.stream_generated_tasks(session_factory, requirement.id, source, user.id)
+
+    received = []
+    for released in range(1, 4):
+        gemini.gate.put_nowait(None)
+        received.append(await events.__anext__())
+        async with session_factory() as session:
+            assert await session.scalar(select(func.count()).select_from(Task)) == released
+    gemini.gate.put_nowait(None)
+    received.extend([event async for event in events])
+
+    assert [event for event, _ in received] == ["task", "task", "task", "error"]
+    assert received[-1][1] == {"detail": "Failed to generate tasks", "task_count": 3}
+    async with session_factory() as session:
+        assert await session.scalar(select(func.count()).select_from(TaskDependency)) == 0
@@ -0,0 +1,172 @@
+"""
+Statement budgets for write paths
+
+Each write returns its fully populated object from the INSERT/UPDATE
+itself (RETURNING), so no write issues a follow-up SELECT.
+"""
+import pytest
+from sqlalchemy import select
+
+from app.models import Project, Requirement, Tag, Task, User
+from app.repositories.tags import MAX_TAG_LENGTH
+from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.requirement import RequirementCreate, RequirementUpdate
+from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.user import UserCreate
+from app.services.auth_service import auth_service
+from app.services.project_service import project_service
+from app.services.requirement_service import requirement_service
+from app.services.task_service import task_service
+
+pytestmark = pytest.mark.asyncio
+
+
+def assert_no_selects(statements):
+    selects = [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+    assert not selects, selects
+
+
+async def test_create_project_is_one_insert(db, statements, user):
+    with statements:
+        project = await project_service.create_project(db, ProjectCreate(name="Payments"), user.id)
+
+    assert statements.count == 1
+    assert statements.statements[0].startswith("INSERT INTO projects")
+    assert project.id and project.created_at and project.owner_id == user.id
+
+
+async def test_update_project_is_one_update(db, statements, user, project):
+    with statements:
+        updated = await project_service.update_project(db, project.id, ProjectUpdate(name="Renamed"), user.id)
+
+    assert statements.count == 1
+    assert statements.statements[0].startswith("UPDATE projects")
+    assert updated.name == "Renamed"
+    assert updated.updated_at >= project.updated_at
+
+
+async def test_update_project_of_other_owner_matches_nothing(db, statements, project):
+    with statements:
+        updated = await project_service.update_project(db, project.id, ProjectUpdate(name="Renamed"), "someone-else")
+
+    assert updated is None
+    assert statements.count == 1
+
+
+async def test_create_requirement_checks_ownership_then_inserts(db, statements, user, project):
+    data = RequirementCreate(title="Checkout", description="Pay by card", project_id=project.id)
+    with statements:
+        requirement = await requirement_service.create_requirement(db, data, user.id)
+
+    # EXISTS ownership check + INSERT
+    assert statements.count == 2
+    assert requirement.id and requirement.created_at and requirement.tags == []
+
+
+async def test_create_requirement_with_tags_adds_tag_index_writes(db, statements, user, project):
+    data = RequirementCreate(title="Checkout", description="Pay by card", project_id=project.id, tags=["payments"])
+    with statements:
+        await requirement_service.create_requirement(db, data, user.id)
+
+    # + tag upsert + association INSERT ... SELECT; nothing is read back
+    assert statements.count == 4
+    assert_no_selects(statements.statements[1:])
+
+
+async def test_overlong_tags_are_cut_to_the_column_length(db, user, project):
+    long_tag = "x" * 150
+    data = RequirementCreate(
+        title="Checkout", description="Pay by card", project_id=project.id,
+        tags=[long_tag, long_tag.upper() + " extra", "payments"],
+    )
+    requirement = await requirement_service.create_requirement(db, data, user.id)
+
+    assert requirement.tags == ["x" * MAX_TAG_LENGTH, "payments"]
+    names = set(await db.scalars(select(Tag.name)))
+    assert names >= {"x" * MAX_TAG_LENGTH, "payments"}
+    assert max(len(name) for name in names) == MAX_TAG_LENGTH
+
+
+async def test_update_requirement_is_one_update(db, statements, user, project):
+    requirement = await requirement_service.create_requirement(
+        db, RequirementCreate(title="Checkout", description="Pay by card", project_id=project.id), user.id
+    )
+    with statements:
+        updated = await requirement_service.update_requirement(
+            db, requirement.id, RequirementUpdate(title="Checkout v2"), user.id
+        )
+
+    assert statements.count == 1
+    assert statements.statements[0].startswith("UPDATE requirements")
+    assert updated.title == "Checkout v2"
+
+
+async def test_create_task_is_one_insert(db, statements, user, project):
+    with statements:
+        task = await task_service.create_task(db, TaskCreate(title="Build form", project_id=project.id), user.id)
+
+    assert statements.count == 1
+    assert task.id and task.created_at and task.acceptance_criteria == []
+
+
+async def test_bulk_create_tasks_accepts_ids_in_any_uuid_form(db, user, project):
+    requirement = await requirement_service.create_requirement(
+        db, RequirementCreate(title="Checkout", description="Pay by card", project_id=project.id), user.id
+    )
+    data = TaskCreate(
+        title="Build form",
+        project_id=project.id.upper(),
+        requirement_id=requirement.id.replace("-", ""),
+        assigned_to=user.id.upper()
+    )
+
+    response = await task_service.bulk_create_tasks(db, [data], user.id)
+
+    assert response.errors == []
+    [task] = response.created
+    assert (task.project_id, task.requirement_id, task.assigned_to) == (project.id, requirement.id, user.id)
+
+
+async def test_bulk_update_tasks_merges_ids_in_any_uuid_form(db, user, project):
+    task = await task_service.create_task(db, TaskCreate(title="Build form", project_id=project.id), user.id)
+    missing = "0190a3b2-0000-7000-8000-000000000000"
+
+    response = await task_service.bulk_update_tasks(
+        db, [task.id.upper(), task.id.replace("-", ""), task.id, missing.upper()],
+        TaskUpdate(title="Build payment form"), user.id
+    )
+
+    [updated] = response.updated
+    assert updated.id == task.id and updated.title == "Build payment form"
+    assert [(error.task_id, error.detail) for error in response.errors] == [(missing, "Task not found")]
+
+
+async def test_update_task_is_one_update(db, statements, user, project):
+    task = await task_service.create_task(db, TaskCreate(title="Build form", project_id=project.id), user.id)
+    with statements:
+        updated = await task_service.update_task(db, task.id, TaskUpdate(title="Build payment form"), user.id)
+
+    assert statements.count == 1
+    assert statements.statements[0].startswith("UPDATE tasks")
+    assert updated.title == "Build payment form"
+
+
+async def test_create_user_checks_uniqueness_then_inserts(db, statements, monkeypatch):
+    # Hashing cost is irrelevant here
+    monkeypatch.setattr(auth_service, "get_password_hash", lambda password: "hashed")
+    data = UserCreate(
+        email="new@example.com", username="newuser", first_name="New", last_name="User", password="Password123"
+    )
+    with statements:
+        created = await auth_service.create_user(db, data)
+
+    assert statements.count == 2
+    assert created.id and created.hashed_password == "hashed"
+
+
+async def test_update_user_is_one_update(db, statements, user):
+    with statements:
+        updated = await auth_service.update_user(db, user.id, type("Update", (), {"first_name": "Renamed"})())
+
+    assert statements.count == 1
+    assert updated.first_name == "Renamed"